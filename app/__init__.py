@@ -3,6 +3,7 @@ from flask_jwt_extended import JWTManager
 from flask_cors import CORS
 from flask_restx import Api
 from app.database import init_db
+from app.admission_control import init_admission_control
 from app.services.auth_service import AuthService
 from app.routes.auth import auth_bp, init_auth_routes
 from app.routes.investment_routes import investment_bp, init_investment_routes
@@ -33,9 +34,30 @@ def create_app():
     app.config["MONGODB_USERNAME"] = os.getenv("MONGODB_USERNAME")
     app.config["MONGODB_PASSWORD"] = os.getenv("MONGODB_PASSWORD")
 
+    # Admission control 설정
+    # 모든 제한은 프로세스(워커) 단위입니다 - Gunicorn 워커가 N개면 전체 한도는 N배가 됩니다.
+    app.config["ADMISSION_CONTROL_ENABLED"] = (
+        os.getenv("ADMISSION_CONTROL_ENABLED", "true").lower() == "true"
+    )
+    app.config["ADMISSION_MAX_CONCURRENCY"] = int(
+        os.getenv("ADMISSION_MAX_CONCURRENCY", 32)
+    )
+    app.config["ADMISSION_RESERVED_CONCURRENCY"] = int(
+        os.getenv("ADMISSION_RESERVED_CONCURRENCY", 4)
+    )
+    app.config["ADMISSION_RATE"] = float(os.getenv("ADMISSION_RATE", 10))
+    app.config["ADMISSION_BURST"] = float(os.getenv("ADMISSION_BURST", 20))
+    app.config["ADMISSION_MAX_QUEUE"] = int(os.getenv("ADMISSION_MAX_QUEUE", 8))
+    app.config["ADMISSION_QUEUE_TIMEOUT"] = float(
+        os.getenv("ADMISSION_QUEUE_TIMEOUT", 0.5)
+    )
+
     # 데이터베이스 초기화
     init_db(app)
 
+    # Admission control 초기화
+    init_admission_control(app)
+
     # 서비스 초기화
     auth_service = AuthService()
 
@@ -0,0 +1,239 @@
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from flask import g, jsonify, request
+from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
+
+# Requests to these routes must not be dropped - they use the reserved capacity lane
+# and are not subject to the per-identity rate limit.
+CRITICAL_ROUTES = ("/trade/callback/sell",)
+
+# Per-route concurrency limits (path prefix -> max in-flight requests)
+ROUTE_CONCURRENCY_LIMITS = {
+    "/investments": 16,
+}
+
+
+class Rejection(NamedTuple):
+    status: int
+    message: str
+    retry_after: float
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"Retry-After": str(max(1, math.ceil(self.retry_after)))}
+
+
+class TokenBucket:
+    """Classic token bucket - refilled with `rate` tokens per second up to `burst`."""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated_at = time.monotonic()
+
+    def consume(self, now: float) -> float:
+        """
+        Try to take one token.
+        Returns 0 on success, otherwise the seconds until a token is available.
+        """
+        if now > self.updated_at:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class ConcurrencyLane:
+    """
+    Bounded number of in-flight requests with a short, bounded wait queue.
+    Requests beyond `max_queue` waiters are rejected immediately.
+    """
+
+    def __init__(self, limit: int, max_queue: int, queue_timeout: float):
+        self.limit = limit
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self.waiting = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, wait: bool = True) -> bool:
+        with self._cond:
+            if self.in_flight < self.limit:
+                self.in_flight += 1
+                return True
+            if not wait or self.waiting >= self.max_queue or self.queue_timeout <= 0:
+                return False
+            self.waiting += 1
+            try:
+                if not self._cond.wait_for(
+                    lambda: self.in_flight < self.limit, timeout=self.queue_timeout
+                ):
+                    return False
+                self.in_flight += 1
+                return True
+            finally:
+                self.waiting -= 1
+
+    def release(self):
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify()
+
+
+class AdmissionController:
+    """
+    Process local admission control.
+    Limits apply per (gunicorn / uvicorn) worker process - with N workers, the effective
+    limits are N times the configured ones.
+
+    - Per-identity token buckets (JWT identity, falling back to the client address).
+    - Global concurrency limit, split into a lane for normal requests and a reserved lane
+      which is the only capacity critical routes can use.
+    - Per-route concurrency limits (ROUTE_CONCURRENCY_LIMITS).
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 32,
+        reserved_concurrency: int = 4,
+        rate: float = 10.0,
+        burst: float = 20.0,
+        max_queue: int = 8,
+        queue_timeout: float = 0.5,
+        route_limits: Optional[Dict[str, int]] = None,
+        critical_routes: Tuple[str, ...] = CRITICAL_ROUTES,
+        max_identities: int = 10000,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.max_identities = max_identities
+        self.critical_routes = critical_routes
+        # Normal requests may only use the unreserved part of the global capacity,
+        # critical requests get their own lane for the reserved part.
+        self.normal_lane = ConcurrencyLane(
+            max(max_concurrency - reserved_concurrency, 1), max_queue, queue_timeout
+        )
+        self.critical_lane = ConcurrencyLane(
+            max(reserved_concurrency, 1), max_queue, queue_timeout
+        )
+        self.route_lanes = {
+            prefix: ConcurrencyLane(limit, max_queue, queue_timeout)
+            for prefix, limit in (
+                route_limits if route_limits is not None else ROUTE_CONCURRENCY_LIMITS
+            ).items()
+        }
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def is_critical(self, path: str) -> bool:
+        return path.startswith(self.critical_routes)
+
+    def check_rate(self, identity: str) -> float:
+        """Returns 0 if the request is allowed, otherwise the seconds to wait."""
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(identity)
+            if bucket is None:
+                bucket = TokenBucket(self.rate, self.burst)
+                self._buckets[identity] = bucket
+                if len(self._buckets) > self.max_identities:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(identity)
+            return bucket.consume(now)
+
+    def route_lane(self, path: str) -> Optional[ConcurrencyLane]:
+        for prefix, lane in self.route_lanes.items():
+            if path.startswith(prefix):
+                return lane
+        return None
+
+    def admit(self, path: str, identity: str, wait: bool = True):
+        """
+        Try to admit a request.
+        :param wait: Allow waiting in the lane queues. Must be False on an event loop.
+        :return: Tuple of (acquired lanes, Rejection or None)
+        """
+        if self.is_critical(path):
+            # Critical requests are confined to the reserved lane - a flood of them
+            # (the sell callback needs no authentication) can't starve normal requests.
+            if self.critical_lane.acquire(wait):
+                return [self.critical_lane], None
+            return [], Rejection(503, "Server is busy", 1)
+
+        retry_after = self.check_rate(identity)
+        if retry_after > 0:
+            return [], Rejection(429, "Too many requests", retry_after)
+
+        acquired = []
+        route_lane = self.route_lane(path)
+        for lane in (route_lane, self.normal_lane):
+            if lane is None:
+                continue
+            if not lane.acquire(wait):
+                for held in acquired:
+                    held.release()
+                return [], Rejection(503, "Server is busy", 1)
+            acquired.append(lane)
+        return acquired, None
+
+
+def _reject(rejection: Rejection):
+    response = jsonify({"error": rejection.message})
+    response.status_code = rejection.status
+    response.headers.update(rejection.headers)
+    return response
+
+
+def request_identity(user_id: Optional[str], remote_addr: Optional[str]) -> str:
+    if user_id:
+        return f"user:{user_id}"
+    return f"addr:{remote_addr}"
+
+
+def _request_identity() -> str:
+    try:
+        verify_jwt_in_request(optional=True)
+        identity = get_jwt_identity()
+    except Exception:
+        # Invalid tokens are rejected by the route itself.
+        identity = None
+    return request_identity(identity, request.remote_addr)
+
+
+def init_admission_control(app):
+    """Register admission control hooks on the app"""
+    if not app.config.get("ADMISSION_CONTROL_ENABLED", True):
+        return None
+
+    controller = AdmissionController(
+        max_concurrency=app.config["ADMISSION_MAX_CONCURRENCY"],
+        reserved_concurrency=app.config["ADMISSION_RESERVED_CONCURRENCY"],
+        rate=app.config["ADMISSION_RATE"],
+        burst=app.config["ADMISSION_BURST"],
+        max_queue=app.config["ADMISSION_MAX_QUEUE"],
+        queue_timeout=app.config["ADMISSION_QUEUE_TIMEOUT"],
+    )
+
+    @app.before_request
+    def admit_request():
+        lanes, rejection = controller.admit(request.path, _request_identity())
+        g.admission_lanes = lanes
+        if rejection:
+            return _reject(rejection)
+
+    @app.teardown_request
+    def release_request(exc=None):
+        for lane in g.pop("admission_lanes", []):
+            lane.release()
+
+    app.extensions["admission_control"] = controller
+    return controller
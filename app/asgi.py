@@ -0,0 +1,102 @@
+"""
+ASGI deployment mode.
+
+I/O-bound routes (app.routes.asgi_routes) are served by async handlers on the event loop,
+every other route is passed through to the flask app (compatibility mode).
+"""
+
+from contextlib import asynccontextmanager
+
+import httpx
+import jwt
+from a2wsgi import WSGIMiddleware
+from starlette.applications import Starlette
+from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import JSONResponse
+from starlette.routing import Mount
+
+from app import create_app
+from app.admission_control import request_identity
+from app.async_database import get_async_db, init_async_db
+from app.routes.asgi_routes import decode_access_token, routes
+
+
+class AdmissionMiddleware:
+    """
+    Applies the flask app's admission controller to the async routes.
+    Never waits for capacity - waiting would block the event loop.
+    """
+
+    def __init__(self, app, controller, jwt_secret: str):
+        self.app = app
+        self.controller = controller
+        self.jwt_secret = jwt_secret
+        self.async_paths = {route.path for route in routes}
+
+    def _identity(self, scope) -> str:
+        user_id = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                token = value.decode("latin-1").split()[-1]
+                try:
+                    user_id = decode_access_token(token, self.jwt_secret).get("sub")
+                except jwt.InvalidTokenError:
+                    # Invalid tokens are rejected by the route itself.
+                    pass
+                break
+        client = scope.get("client")
+        return request_identity(user_id, client[0] if client else None)
+
+    async def __call__(self, scope, receive, send):
+        # Flask routes are admitted by the flask app itself
+        if scope["type"] != "http" or scope["path"] not in self.async_paths:
+            return await self.app(scope, receive, send)
+
+        lanes, rejection = self.controller.admit(
+            scope["path"], self._identity(scope), wait=False
+        )
+        if rejection:
+            response = JSONResponse(
+                {"error": rejection.message}, rejection.status, headers=rejection.headers
+            )
+            return await response(scope, receive, send)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            for lane in lanes:
+                lane.release()
+
+
+def create_asgi_app(flask_app=None) -> Starlette:
+    flask_app = flask_app or create_app()
+    config = flask_app.config
+
+    @asynccontextmanager
+    async def lifespan(app):
+        mongo_client = init_async_db(config)
+        app.state.db = get_async_db(mongo_client, config)
+        app.state.http = httpx.AsyncClient(timeout=10)
+        try:
+            yield
+        finally:
+            await app.state.http.aclose()
+            await mongo_client.close()
+
+    app = Starlette(
+        routes=[*routes, Mount("/", app=WSGIMiddleware(flask_app))],
+        lifespan=lifespan,
+    )
+    app.state.jwt_secret = config["JWT_SECRET_KEY"]
+    # Same policy as flask_cors' CORS(app) defaults
+    app.add_middleware(
+        CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"]
+    )
+
+    controller = flask_app.extensions.get("admission_control")
+    if controller is not None:
+        app.add_middleware(
+            AdmissionMiddleware,
+            controller=controller,
+            jwt_secret=config["JWT_SECRET_KEY"],
+        )
+    return app
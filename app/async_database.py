@@ -0,0 +1,16 @@
+from pymongo import AsyncMongoClient
+
+
+def init_async_db(config) -> AsyncMongoClient:
+    """Create the async database client (ASGI mode), using the same settings as init_db"""
+    return AsyncMongoClient(
+        host=config["MONGODB_HOST"],
+        port=config["MONGODB_PORT"],
+        username=config.get("MONGODB_USERNAME"),
+        password=config.get("MONGODB_PASSWORD"),
+        tz_aware=False,
+    )
+
+
+def get_async_db(client: AsyncMongoClient, config):
+    return client[config["MONGODB_DB"]]
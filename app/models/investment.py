@@ -34,7 +34,13 @@ class Investment(Document):
 
     meta = {
         "collection": "investments",
-        "indexes": ["coin_type", "name", "risk_level"],
+        "indexes": [
+            "coin_type",
+            "name",
+            "risk_level",
+            # profit attribution pools
+            ("risk_level", "coin_type"),
+        ],
         "ordering": ["-created_at"],
     }
 
@@ -0,0 +1,360 @@
+"""
+Async handlers for the I/O-bound routes (ASGI mode).
+
+Serves the same request/response contract as the flask-restx routes in this package,
+using the async Mongo client (request.app.state.db) and a shared httpx.AsyncClient
+(request.app.state.http). All other routes are served by the flask app.
+"""
+
+import asyncio
+from datetime import datetime
+from functools import wraps
+from math import ceil
+
+import jwt
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from ..services.binance_service import BinanceService
+from ..services.profit_attribution import (
+    COIN_TYPES,
+    RISK_LEVELS,
+    SellCallbackError,
+    parse_sell_event,
+    process_sell_events_async,
+)
+
+
+def jwt_required(handler):
+    """Mirrors flask_jwt_extended's jwt_required() for starlette handlers"""
+
+    @wraps(handler)
+    async def wrapper(request: Request):
+        auth_header = request.headers.get("Authorization")
+        if not auth_header:
+            return JSONResponse({"msg": "Missing Authorization Header"}, 401)
+        parts = auth_header.split()
+        if len(parts) != 2 or parts[0] != "Bearer":
+            return JSONResponse(
+                {"msg": "Bad Authorization header. Expected 'Authorization: Bearer <JWT>'"},
+                422,
+            )
+        try:
+            claims = decode_access_token(parts[1], request.app.state.jwt_secret)
+        except jwt.ExpiredSignatureError:
+            return JSONResponse({"msg": "Token has expired"}, 401)
+        except jwt.InvalidTokenError as e:
+            return JSONResponse({"msg": str(e)}, 422)
+        if claims.get("type") != "access":
+            return JSONResponse({"msg": "Only non-refresh tokens are allowed"}, 422)
+        request.state.identity = claims["sub"]
+        return await handler(request)
+
+    return wrapper
+
+
+def decode_access_token(token: str, secret: str) -> dict:
+    return jwt.decode(token, secret, algorithms=["HS256"])
+
+
+def _isoformat(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _trade_history_to_dict(doc) -> dict:
+    # InvestmentTradeHistory.to_dict
+    return {
+        "id": str(doc["_id"]),
+        "profit_amount": doc["profit_amount"],
+        "created_at": _isoformat(doc["created_at"]),
+    }
+
+
+def _investment_to_dict(doc, trade_histories: dict) -> dict:
+    # Investment.to_dict
+    transactions = []
+    for transaction in doc.get("transactions", []):
+        transaction_copy = dict(transaction)
+        if isinstance(transaction_copy.get("created_at"), datetime):
+            transaction_copy["created_at"] = transaction_copy["created_at"].isoformat()
+        transactions.append(transaction_copy)
+
+    return {
+        "id": str(doc["_id"]),
+        "name": doc["name"],
+        "coin_type": doc["coin_type"],
+        "risk_level": doc["risk_level"],
+        "initial_amount": doc["initial_amount"],
+        "entry_price_usdt": doc["entry_price_usdt"],
+        "current_profit": doc.get("current_profit", 0.0),
+        "internal_position": doc["internal_position"],
+        "created_at": _isoformat(doc["created_at"]),
+        "updated_at": _isoformat(doc["updated_at"]),
+        "transactions": transactions,
+        "trade_history": [
+            _trade_history_to_dict(trade_histories[th_id])
+            for th_id in doc.get("trade_history", [])
+            if th_id in trade_histories
+        ],
+    }
+
+
+def _transaction_to_dict(doc) -> dict:
+    # USDTTransaction.to_dict
+    return {
+        "id": str(doc["_id"]),
+        "user_id": str(doc["user"]),
+        "amount": doc["amount"],
+        "transaction_type": doc["transaction_type"],
+        "status": doc["status"],
+        "created_at": _isoformat(doc["created_at"]),
+    }
+
+
+async def _load_investments(db, investment_ids) -> list:
+    """Load investments (in the given order) including their trade history - in 2 queries"""
+    if not investment_ids:
+        return []
+    docs = {
+        doc["_id"]: doc
+        async for doc in db.investments.find({"_id": {"$in": list(investment_ids)}})
+    }
+    trade_history_ids = [th_id for doc in docs.values() for th_id in doc.get("trade_history", [])]
+    trade_histories = {}
+    if trade_history_ids:
+        trade_histories = {
+            doc["_id"]: doc
+            async for doc in db.investment_trade_histories.find(
+                {"_id": {"$in": trade_history_ids}}
+            )
+        }
+    return [
+        _investment_to_dict(docs[inv_id], trade_histories)
+        for inv_id in investment_ids
+        if inv_id in docs
+    ]
+
+
+@jwt_required
+async def user_info(request: Request):
+    """GET /auth/info"""
+    db = request.app.state.db
+    user = await db.users.find_one({"user_id": request.state.identity})
+    if not user:
+        return JSONResponse({"message": "User not found"}, 404)
+
+    investments = await _load_investments(db, user.get("investments", []))
+    return JSONResponse(
+        {
+            "message": "User details retrieved successfully",
+            "user": {
+                "id": str(user["_id"]),
+                "email": user["email"],
+                "usdt_balance": user.get("usdt_balance", 0.0),
+                "created_at": _isoformat(user.get("created_at")),
+                "updated_at": _isoformat(user.get("updated_at")),
+            },
+            "investments": investments,
+        },
+        200,
+    )
+
+
+@jwt_required
+async def list_investments(request: Request):
+    """GET /investments"""
+    db = request.app.state.db
+    user = await db.users.find_one({"user_id": request.state.identity})
+    if not user:
+        return JSONResponse({"message": "Internal Server Error"}, 500)
+    investments = await _load_investments(db, user.get("investments", []))
+    return JSONResponse(
+        {
+            "message": "Investments retrieved successfully",
+            "investments": investments,
+        }
+    )
+
+
+INVESTMENT_REQUIRED_FIELDS = ("name", "coin_type", "initial_amount", "risk_level")
+
+
+@jwt_required
+async def create_investment(request: Request):
+    """POST /investments"""
+    db = request.app.state.db
+    data = await request.json()
+    missing = {
+        field: f"'{field}' is a required property"
+        for field in INVESTMENT_REQUIRED_FIELDS
+        if field not in data
+    }
+    if missing:
+        return JSONResponse(
+            {"errors": missing, "message": "Input payload validation failed"}, 400
+        )
+    # Same checks as InvestmentService.create_investment - before the balance is touched
+    if data["coin_type"] not in COIN_TYPES:
+        return JSONResponse({"error": "Invalid coin type"}, 400)
+    risk_level = data.get("risk_level", "medium")
+    if risk_level not in RISK_LEVELS:
+        return JSONResponse({"error": "Invalid risk level"}, 400)
+    internal_position = data.get("internal_position", 0)
+    initial_amount = float(data["initial_amount"])
+
+    # Price lookup and user lookup don't depend on each other
+    user, current_price = await asyncio.gather(
+        db.users.find_one({"user_id": request.state.identity}),
+        BinanceService.get_btc_price_async(request.app.state.http),
+    )
+    if not user:
+        return JSONResponse({"message": "Internal Server Error"}, 500)
+
+    # 동일한 internal_position 을 가진 투자가 있는지 확인
+    if user.get("investments") and await db.investments.count_documents(
+        {"_id": {"$in": user["investments"]}, "internal_position": internal_position},
+        limit=1,
+    ):
+        return JSONResponse(
+            {"error": "이미 동일한 이름과 포지션을 가진 투자가 존재합니다."}, 400
+        )
+
+    if user.get("usdt_balance", 0.0) < initial_amount:
+        return JSONResponse({"error": "잔액이 부족합니다."}, 400)
+
+    if current_price is None:
+        return JSONResponse({"error": "현재 BTC 가격을 가져올 수 없습니다."}, 400)
+
+    now = datetime.utcnow()
+    # 잔액 확인 및 차감 (atomic)
+    result = await db.users.update_one(
+        {"_id": user["_id"], "usdt_balance": {"$gte": initial_amount}},
+        {"$inc": {"usdt_balance": -initial_amount}, "$set": {"updated_at": now}},
+    )
+    if result.modified_count == 0:
+        return JSONResponse({"error": "잔액이 부족합니다."}, 400)
+
+    investment = {
+        "name": data["name"],
+        "coin_type": data["coin_type"],
+        "risk_level": risk_level,
+        "initial_amount": initial_amount,
+        "entry_price_usdt": current_price,
+        "current_profit": 0.0,
+        "internal_position": internal_position,
+        "created_at": now,
+        "updated_at": now,
+        # 초기 투자를 거래 내역에 추가
+        "transactions": [
+            {
+                "type": "deposit",
+                "amount": initial_amount,
+                "created_at": now.isoformat(),
+                "description": "Initial investment",
+            }
+        ],
+        "trade_history": [],
+    }
+    inserted = await db.investments.insert_one(investment)
+    investment["_id"] = inserted.inserted_id
+    await db.users.update_one(
+        {"_id": user["_id"]}, {"$push": {"investments": inserted.inserted_id}}
+    )
+
+    return JSONResponse(
+        {
+            "message": "Investment created successfully",
+            "investment": _investment_to_dict(investment, {}),
+        },
+        201,
+    )
+
+
+@jwt_required
+async def wallet_transactions(request: Request):
+    """GET /wallet/transactions"""
+    db = request.app.state.db
+    try:
+        user = await db.users.find_one({"user_id": request.state.identity})
+        if not user:
+            raise ValueError("User matching query does not exist.")
+
+        # 페이지네이션 파라미터
+        page = int(request.query_params.get("page", 1))
+        per_page = int(request.query_params.get("per_page", 10))
+        sort = request.query_params.get("sort", "desc")  # 기본값은 최신순
+
+        query = {"user": user["_id"]}
+        cursor = (
+            db.usdt_transactions.find(query)
+            .sort("created_at", -1 if sort == "desc" else 1)
+            .skip((page - 1) * per_page)
+            .limit(per_page)
+        )
+        total_transactions, transactions = await asyncio.gather(
+            db.usdt_transactions.count_documents(query), cursor.to_list(None)
+        )
+
+        return JSONResponse(
+            {
+                "transactions": [_transaction_to_dict(t) for t in transactions],
+                "page": page,
+                "per_page": per_page,
+                "total_pages": ceil(total_transactions / per_page),
+                "total_transactions": total_transactions,
+                "sort": sort,
+            },
+            200,
+        )
+    except Exception as e:
+        return JSONResponse({"error": str(e)}, 500)
+
+
+@jwt_required
+async def wallet_balance(request: Request):
+    """GET /wallet/balance"""
+    db = request.app.state.db
+    user = await db.users.find_one(
+        {"user_id": request.state.identity}, {"usdt_balance": 1}
+    )
+    if not user:
+        return JSONResponse({"error": "User matching query does not exist."}, 500)
+    return JSONResponse({"usdt_balance": user.get("usdt_balance", 0.0)}, 200)
+
+
+async def sell_callback(request: Request):
+    """GET /trade/callback/sell"""
+    try:
+        event = parse_sell_event(request.query_params)
+    except SellCallbackError as e:
+        return JSONResponse({"message": e.message}, e.status_code)
+
+    await process_sell_events_async(request.app.state.db, [event])
+    return JSONResponse({"message": "Sell callback received"})
+
+
+async def sell_callback_batch(request: Request):
+    """POST /trade/callback/sell/batch"""
+    try:
+        data = await request.json()
+    except ValueError:
+        data = {}
+    try:
+        events = [parse_sell_event(params) for params in data.get("events", [])]
+    except SellCallbackError as e:
+        return JSONResponse({"message": e.message}, e.status_code)
+
+    await process_sell_events_async(request.app.state.db, events)
+    return JSONResponse({"message": "Sell callbacks received", "count": len(events)})
+
+
+routes = [
+    Route("/auth/info", user_info, methods=["GET"]),
+    Route("/investments", list_investments, methods=["GET"]),
+    Route("/investments", create_investment, methods=["POST"]),
+    Route("/wallet/transactions", wallet_transactions, methods=["GET"]),
+    Route("/wallet/balance", wallet_balance, methods=["GET"]),
+    Route("/trade/callback/sell", sell_callback, methods=["GET"]),
+    Route("/trade/callback/sell/batch", sell_callback_batch, methods=["POST"]),
+]
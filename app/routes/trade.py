@@ -8,6 +8,11 @@ from ..models.investment import Investment
 from ..models.investment_trade_history import InvestmentTradeHistory
 from ..services.freqtrade_provider import get_freqtrade_profit
 from ..models.freqtrade_history import FreqtradeHistory
+from ..services.profit_attribution import (
+    SellCallbackError,
+    parse_sell_event,
+    process_sell_events,
+)
 import os
 import json
 from typing import List
@@ -23,92 +28,26 @@ def init_trade_routes(api):
     class SellCallback(Resource):
         @ns.doc("Callback for sell from freqtrade")
         def get(self):
-            risk_level = request.args.get("risk_level")
-            profit_usd = request.args.get("profit_usd")
-            if risk_level not in ["low", "medium", "high"]:
-                return {"message": "Invalid risk level"}, 400
+            try:
+                event = parse_sell_event(request.args)
+            except SellCallbackError as e:
+                return {"message": e.message}, e.status_code
 
-            # Config 가져오기
-            # current_dir = os.path.dirname(os.path.abspath(__file__))
-            # config_path = os.path.join(
-            #     current_dir,
-            #     "..",
-            #     "freqtrade",
-            #     "freqtrade_configs",
-            #     f"config_{risk_level}_risk.json",
-            # )
-            # with open(config_path, "r") as f:
-            #     config = json.load(f)
-            stake_amount = request.args.get("stake_amount")
+            # 이번 거래로 인해 얻은 수익을 해당 (risk_level, pair) 투자자들에게 분배
+            process_sell_events([event])
 
-            if isinstance(stake_amount, str) and stake_amount == "unlimited":
-                print("stake_amount is unlimited!!! Please change the config file")
-                return {"message": "Stake amount is unlimited"}, 400
-            else:
-                stake_amount = float(stake_amount)
-
-            # 이번 거래로 인해 얻은 수익
-            real_profit_in_this_sell = float(profit_usd)
-
-            # Get profit data from freqtrade
-
-            # profit_json = get_freqtrade_profit(risk_level)
-
-            # # Risk level 에서 가장 최근 FreqtradeHistory 조회
-            # latest_history = (
-            #     FreqtradeHistory.objects.filter(risk_level=risk_level)
-            #     .order_by("-created_at")
-            #     .first()
-            # )
-
-            # if latest_history:
-            #     real_profit_in_this_sell = (
-            #         profit_json.get("profit_closed_fiat", 0)
-            #         - latest_history.profit_closed_fiat
-            #     )
-            # else:
-            #     real_profit_in_this_sell = profit_json.get("profit_closed_fiat", 0)
-
-            # 선택한 risk_level 에 해당하는 모든 investment 가져옴
-            investments: List[Investment] = Investment.objects.filter(
-                risk_level=risk_level,
-                coin_type="BTC",
-            )
-
-            # 각 investment 에 대해 이번 거래로 인해 얻은 수익 추가
-            for investment in investments:
-                # stake_amount 대비 실제로 얼마 투자했는지 계산
-                investment_stake_ratio = (
-                    investment.initial_amount + investment.current_profit
-                ) / stake_amount
-
-                profit_for_this_investment = (
-                    real_profit_in_this_sell * investment_stake_ratio
-                )
-                investment.current_profit += profit_for_this_investment
-
-                # 거래 이력 저장
-                trade_history = InvestmentTradeHistory(
-                    profit_amount=profit_for_this_investment
-                )
-                trade_history.save()
-
-                # investment의 trade_history에 추가
-                if not investment.trade_history:
-                    investment.trade_history = []
-                investment.trade_history.append(trade_history)
+            return {"message": "Sell callback received"}
 
-                print(
-                    f"Investment of {investment.name}:\tProfit: {investment.current_profit}, Real Profit: {profit_for_this_investment}, Investment Stake Ratio: {investment_stake_ratio}"
-                )
-                investment.save()
+    @ns.route("/callback/sell/batch")
+    class SellCallbackBatch(Resource):
+        @ns.doc("Batched sell callbacks from freqtrade (mixed risk levels / pairs)")
+        def post(self):
+            data = request.get_json(silent=True) or {}
+            try:
+                events = [parse_sell_event(params) for params in data.get("events", [])]
+            except SellCallbackError as e:
+                return {"message": e.message}, e.status_code
 
-            # Create and save freqtrade history
-            history = FreqtradeHistory(
-                risk_level=risk_level,
-                real_profit_in_this_sell=real_profit_in_this_sell,
-                # **profit_json,
-            )
-            history.save()
+            process_sell_events(events)
 
-            return {"message": "Sell callback received"}
+            return {"message": "Sell callbacks received", "count": len(events)}
@@ -1,3 +1,4 @@
+import httpx
 import requests
 from typing import Dict, Optional
 
@@ -23,3 +24,24 @@ class BinanceService:
     def get_btc_price() -> Optional[float]:
         """현재 BTC/USDT 가격을 가져옵니다."""
         return BinanceService.get_current_price("BTCUSDT")
+
+    @staticmethod
+    async def get_current_price_async(
+        symbol: str, client: httpx.AsyncClient
+    ) -> Optional[float]:
+        """get_current_price 의 async 버전 (ASGI 모드에서 사용)"""
+        try:
+            response = await client.get(
+                f"{BinanceService.BASE_URL}/ticker/price", params={"symbol": symbol}
+            )
+            response.raise_for_status()
+            data = response.json()
+            return float(data["price"])
+        except Exception as e:
+            print(f"Error getting price for {symbol}: {str(e)}")
+            return None
+
+    @staticmethod
+    async def get_btc_price_async(client: httpx.AsyncClient) -> Optional[float]:
+        """현재 BTC/USDT 가격을 가져옵니다. (async)"""
+        return await BinanceService.get_current_price_async("BTCUSDT", client)
@@ -1,4 +1,6 @@
 from .ft_rest_client import FtRestClient
+from .ft_async_rest_client import AsyncFtRestClient
+import asyncio
 import sys
 import os
 import json
@@ -29,7 +31,7 @@ def turn_on_freqtrade_bot(risk_level: str):
     )
 
 
-def get_freqtrade_bot(risk_level: str) -> FtRestClient:
+def _get_freqtrade_api_server(risk_level: str) -> tuple:
     if risk_level not in ["low", "medium", "high"]:
         raise ValueError("Invalid risk level")
     current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -46,11 +48,25 @@ def get_freqtrade_bot(risk_level: str) -> FtRestClient:
     password = config["api_server"]["password"]
 
     server_url = f"http://{server_hostname}:{server_port}"
+    return server_url, username, password
+
+
+def get_freqtrade_bot(risk_level: str) -> FtRestClient:
+    server_url, username, password = _get_freqtrade_api_server(risk_level)
 
     rest_client = FtRestClient(server_url, username, password)
     return rest_client
 
 
+def get_async_freqtrade_bot(risk_level: str, **kwargs) -> AsyncFtRestClient:
+    """
+    Async client for the bot of the given risk level.
+    Close it (or use it as async context manager) once done.
+    """
+    server_url, username, password = _get_freqtrade_api_server(risk_level)
+    return AsyncFtRestClient(server_url, username, password, **kwargs)
+
+
 def get_freqtrade_daily_profit(risk_level: str) -> dict:
     rest_client = get_freqtrade_bot(risk_level)
     return rest_client.daily()
@@ -69,3 +85,34 @@ def get_freqtrade_monthly_profit(risk_level: str) -> dict:
 def get_freqtrade_profit(risk_level: str) -> dict:
     rest_client = get_freqtrade_bot(risk_level)
     return rest_client.profit()
+
+
+async def _fetch_freqtrade_summary(risk_level: str) -> dict:
+    async with get_async_freqtrade_bot(risk_level) as rest_client:
+        status, profit, balance = await rest_client.gather(
+            rest_client.status(), rest_client.profit(), rest_client.balance()
+        )
+    summary = {}
+    for key, value in (("status", status), ("profit", profit), ("balance", balance)):
+        if isinstance(value, Exception):
+            summary[key] = None
+            summary.setdefault("errors", {})[key] = str(value)
+        else:
+            summary[key] = value
+    return summary
+
+
+async def fetch_freqtrade_summaries(risk_levels=("low", "medium", "high")) -> dict:
+    """
+    Fetch status, profit and balance of all bots concurrently.
+    Failing calls are reported under "errors" instead of failing the whole batch.
+    """
+    results = await asyncio.gather(
+        *(_fetch_freqtrade_summary(risk_level) for risk_level in risk_levels)
+    )
+    return dict(zip(risk_levels, results))
+
+
+def get_freqtrade_summaries(risk_levels=("low", "medium", "high")) -> dict:
+    """Sync entry point for fetch_freqtrade_summaries (e.g. from flask routes)."""
+    return asyncio.run(fetch_freqtrade_summaries(risk_levels))
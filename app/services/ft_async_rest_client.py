@@ -0,0 +1,272 @@
+"""
+An asyncio Rest Client for Freqtrade bot
+
+Mirrors the method surface of FtRestClient, but every API method returns a coroutine.
+Uses a single pooled keep-alive httpx.AsyncClient, so many calls (against one or many bots)
+can be batched with asyncio.gather without opening a new connection per call.
+
+Should not import anything from freqtrade,
+so it can be used as a standalone script, and can be installed independently.
+"""
+
+import asyncio
+import copy
+import json
+import logging
+import random
+from typing import Any
+
+import httpx
+
+from .ft_rest_client import (
+    ARROW_STREAM_MEDIA_TYPE,
+    FtRestClient,
+    ParamsT,
+    PostDataT,
+    arrow_to_dataframe,
+    json_to_dataframe,
+)
+
+
+logger = logging.getLogger("ft_rest_client")
+
+# Status codes which are safe to retry - the bot (or a proxy in front of it) is
+# temporarily unable to serve the request.
+RETRY_STATUS_CODES = (502, 503, 504)
+
+
+class FtRestClientError(Exception):
+    """Structured error raised by AsyncFtRestClient once retries are exhausted."""
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        method: str,
+        url: str,
+        status_code: int | None = None,
+        payload: Any = None,
+    ):
+        super().__init__(message)
+        self.method = method
+        self.url = url
+        self.status_code = status_code
+        self.payload = payload
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "error": str(self),
+            "method": self.method,
+            "url": self.url,
+            "status_code": self.status_code,
+            "payload": self.payload,
+        }
+
+
+class AsyncFtRestClient(FtRestClient):
+    """
+    Async variant of FtRestClient.
+
+    All public methods are inherited from FtRestClient - they only forward to
+    _get / _post / _delete, which in turn return the coroutine created by _call.
+    Use as async context manager (or call aclose()) to release pooled connections.
+    Use with_timeout() to call any of them with a different timeout.
+    """
+
+    def __init__(
+        self,
+        serverurl,
+        username=None,
+        password=None,
+        *,
+        pool_connections=10,
+        pool_maxsize=10,
+        timeout=10,
+        retries=3,
+        backoff=0.25,
+        max_backoff=4.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self._serverurl = serverurl
+        self._timeout = timeout
+        self._retries = retries
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+
+        # Keep-alive pool shared by all calls of this client
+        limits = httpx.Limits(
+            max_connections=pool_maxsize,
+            max_keepalive_connections=pool_connections,
+        )
+        self._session = httpx.AsyncClient(
+            auth=(username, password) if username and password else None,
+            timeout=timeout,
+            limits=limits,
+            transport=transport,
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close all pooled connections."""
+        await self._session.aclose()
+
+    def with_timeout(self, timeout: float) -> "AsyncFtRestClient":
+        """Client using the given timeout for its calls.
+
+        Example: ``await client.with_timeout(30).pair_history(...)``
+
+        Shares the connection pool with this client - closing either closes both.
+        """
+        client = copy.copy(self)
+        client._timeout = timeout
+        return client
+
+    def _backoff_delay(self, attempt: int) -> float:
+        # Exponential backoff with full jitter
+        return random.uniform(0, min(self._max_backoff, self._backoff * 2**attempt))
+
+    async def _call(
+        self,
+        method,
+        apipath,
+        params: dict | None = None,
+        data=None,
+        files=None,
+        accept="application/json",
+        *,
+        timeout: float | None = None,
+    ):
+        method = str(method).upper()
+        if method not in ("GET", "POST", "PUT", "DELETE"):
+            raise ValueError(f"invalid method <{method}>")
+        url = f"{self._serverurl}/api/v1/{apipath}"
+
+        hd = {"Accept": accept, "Content-Type": "application/json"}
+        # POST is not idempotent - only retry it if the request never reached the bot.
+        idempotent = method != "POST"
+
+        attempt = 0
+        while True:
+            try:
+                resp = await self._session.request(
+                    method,
+                    url,
+                    params=params or None,
+                    headers=hd,
+                    content=json.dumps(data),
+                    timeout=timeout if timeout is not None else self._timeout,
+                )
+            except (httpx.ConnectError, httpx.ConnectTimeout) as e:
+                error = FtRestClientError(
+                    f"Connection error - could not connect to {url}: {e}",
+                    method=method,
+                    url=url,
+                )
+            except httpx.TransportError as e:
+                error = FtRestClientError(
+                    f"Transport error calling {url}: {e!r}", method=method, url=url
+                )
+                if not idempotent:
+                    raise error from e
+            else:
+                if resp.status_code in RETRY_STATUS_CODES and idempotent:
+                    error = FtRestClientError(
+                        f"Bot unavailable ({resp.status_code})",
+                        method=method,
+                        url=url,
+                        status_code=resp.status_code,
+                        payload=_safe_json(resp),
+                    )
+                else:
+                    return self._handle_response(method, url, resp, accept)
+
+            if attempt >= self._retries:
+                raise error
+            delay = self._backoff_delay(attempt)
+            attempt += 1
+            logger.warning(f"{error} - retrying in {delay:.2f}s ({attempt}/{self._retries}).")
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _handle_response(method: str, url: str, resp: httpx.Response, accept: str):
+        if resp.is_success and resp.headers.get("Content-Type", "").startswith(
+            ARROW_STREAM_MEDIA_TYPE
+        ):
+            return arrow_to_dataframe(resp.content)
+        payload = _safe_json(resp)
+        if resp.is_error:
+            detail = payload.get("detail") if isinstance(payload, dict) else None
+            raise FtRestClientError(
+                f"{method} {url} failed with {resp.status_code}: {detail or resp.reason_phrase}",
+                method=method,
+                url=url,
+                status_code=resp.status_code,
+                payload=payload,
+            )
+        if accept == ARROW_STREAM_MEDIA_TYPE:
+            # Bot without arrow support
+            return json_to_dataframe(payload)
+        return payload
+
+    def _get(
+        self,
+        apipath,
+        params: ParamsT = None,
+        accept="application/json",
+        *,
+        timeout: float | None = None,
+    ):
+        return self._call("GET", apipath, params=params, accept=accept, timeout=timeout)
+
+    def _delete(self, apipath, params: ParamsT = None, *, timeout: float | None = None):
+        return self._call("DELETE", apipath, params=params, timeout=timeout)
+
+    def _post(
+        self,
+        apipath,
+        params: ParamsT = None,
+        data: PostDataT = None,
+        accept="application/json",
+        *,
+        timeout: float | None = None,
+    ):
+        return self._call(
+            "POST", apipath, params=params, data=data, accept=accept, timeout=timeout
+        )
+
+    async def gather(self, *calls, return_exceptions=True):
+        """Run several calls concurrently over the pooled connections.
+
+        Example: ``status, profit, balance = await client.gather(
+        client.status(), client.profit(), client.balance())``
+
+        :param calls: Coroutines returned by this client's methods.
+        :param return_exceptions: Return FtRestClientError instances instead of raising.
+        :return: list of results, in the order of the given calls
+        """
+        return await asyncio.gather(*calls, return_exceptions=return_exceptions)
+
+    async def ping(self):
+        """simple ping"""
+        try:
+            configstatus = await self.show_config()
+        except FtRestClientError:
+            configstatus = None
+        if not configstatus:
+            return {"status": "not_running"}
+        elif configstatus["state"] == "running":
+            return {"status": "pong"}
+        else:
+            return {"status": "not_running"}
+
+
+def _safe_json(resp: httpx.Response):
+    try:
+        return resp.json()
+    except ValueError:
+        return resp.text or None
@@ -17,6 +17,11 @@ from requests.exceptions import ConnectionError as RequestConnectionError
 
 logger = logging.getLogger("ft_rest_client")
 
+# Columnar transport for pair_candles / pair_history (requires pandas and pyarrow).
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+# Schema metadata key holding the non-columnar part of the response
+ARROW_METADATA_KEY = b"freqtrade"
+
 ParamsT = dict[str, Any] | None
 PostDataT = dict[str, Any] | list[dict[str, Any]] | None
 
@@ -43,12 +48,20 @@ class FtRestClient:
         if username and password:
             self._session.auth = (username, password)
 
-    def _call(self, method, apipath, params: dict | None = None, data=None, files=None):
+    def _call(
+        self,
+        method,
+        apipath,
+        params: dict | None = None,
+        data=None,
+        files=None,
+        accept="application/json",
+    ):
         if str(method).upper() not in ("GET", "POST", "PUT", "DELETE"):
             raise ValueError(f"invalid method <{method}>")
         basepath = f"{self._serverurl}/api/v1/{apipath}"
 
-        hd = {"Accept": "application/json", "Content-Type": "application/json"}
+        hd = {"Accept": accept, "Content-Type": "application/json"}
 
         # Split url
         schema, netloc, path, par, query, fragment = urlparse(basepath)
@@ -61,19 +74,26 @@ class FtRestClient:
             resp = self._session.request(
                 method, url, headers=hd, timeout=self._timeout, data=json.dumps(data)
             )
+            if resp.headers.get("Content-Type", "").startswith(ARROW_STREAM_MEDIA_TYPE):
+                return arrow_to_dataframe(resp.content)
             # return resp.text
+            if accept == ARROW_STREAM_MEDIA_TYPE:
+                # Bot without arrow support
+                return json_to_dataframe(resp.json())
             return resp.json()
         except RequestConnectionError:
             logger.warning(f"Connection error - could not connect to {netloc}.")
 
-    def _get(self, apipath, params: ParamsT = None):
-        return self._call("GET", apipath, params=params)
+    def _get(self, apipath, params: ParamsT = None, accept="application/json"):
+        return self._call("GET", apipath, params=params, accept=accept)
 
     def _delete(self, apipath, params: ParamsT = None):
         return self._call("DELETE", apipath, params=params)
 
-    def _post(self, apipath, params: ParamsT = None, data: PostDataT = None):
-        return self._call("POST", apipath, params=params, data=data)
+    def _post(
+        self, apipath, params: ParamsT = None, data: PostDataT = None, accept="application/json"
+    ):
+        return self._call("POST", apipath, params=params, data=data, accept=accept)
 
     def start(self):
         """Start the bot if it's in the stopped state.
@@ -461,14 +481,16 @@ class FtRestClient:
             },
         )
 
-    def pair_candles(self, pair, timeframe, limit=None, columns=None):
+    def pair_candles(self, pair, timeframe, limit=None, columns=None, as_dataframe=False):
         """Return live dataframe for <pair><timeframe>.
 
         :param pair: Pair to get data for
         :param timeframe: Only pairs with this timeframe available.
         :param limit: Limit result to the last n candles.
         :param columns: List of dataframe columns to return. Empty list will return OHLCV.
-        :return: json object
+        :param as_dataframe: Request the columnar (Arrow) format and return a pandas DataFrame.
+            The remaining response fields are available in `df.attrs`.
+        :return: json object (or DataFrame if as_dataframe is set)
         """
         params = {
             "pair": pair,
@@ -476,14 +498,17 @@ class FtRestClient:
         }
         if limit:
             params["limit"] = limit
+        accept = ARROW_STREAM_MEDIA_TYPE if as_dataframe else "application/json"
 
         if columns is not None:
             params["columns"] = columns
-            return self._post("pair_candles", data=params)
+            return self._post("pair_candles", data=params, accept=accept)
 
-        return self._get("pair_candles", params=params)
+        return self._get("pair_candles", params=params, accept=accept)
 
-    def pair_history(self, pair, timeframe, strategy, timerange=None, freqaimodel=None):
+    def pair_history(
+        self, pair, timeframe, strategy, timerange=None, freqaimodel=None, as_dataframe=False
+    ):
         """Return historic, analyzed dataframe
 
         :param pair: Pair to get data for
@@ -491,7 +516,9 @@ class FtRestClient:
         :param strategy: Strategy to analyze and get values for
         :param freqaimodel: FreqAI model to use for analysis
         :param timerange: Timerange to get data for (same format than --timerange endpoints)
-        :return: json object
+        :param as_dataframe: Request the columnar (Arrow) format and return a pandas DataFrame.
+            The remaining response fields are available in `df.attrs`.
+        :return: json object (or DataFrame if as_dataframe is set)
         """
         return self._get(
             "pair_history",
@@ -502,6 +529,7 @@ class FtRestClient:
                 "freqaimodel": freqaimodel,
                 "timerange": timerange if timerange else "",
             },
+            accept=ARROW_STREAM_MEDIA_TYPE if as_dataframe else "application/json",
         )
 
     def sysinfo(self):
@@ -517,3 +545,33 @@ class FtRestClient:
         :return: json object
         """
         return self._get("health")
+
+
+def arrow_to_dataframe(content: bytes):
+    """
+    Decode an Arrow IPC stream response into a pandas DataFrame.
+    Response fields other than the data are available in `df.attrs`.
+    """
+    import pyarrow as pa
+
+    table = pa.ipc.open_stream(content).read_all()
+    raw_meta = (table.schema.metadata or {}).get(ARROW_METADATA_KEY)
+    df = table.to_pandas()
+    df.attrs.update(json.loads(raw_meta) if raw_meta else {})
+    return df
+
+
+def json_to_dataframe(res):
+    """
+    Convert a json pair_candles / pair_history response into a pandas DataFrame.
+    Other responses (e.g. errors) are returned unchanged.
+    """
+    if not isinstance(res, dict) or "data" not in res:
+        return res
+    import pandas as pd
+
+    df = pd.DataFrame(res.get("data", []), columns=res.get("columns"))
+    if "date" in df.columns:
+        df["date"] = pd.to_datetime(df["date"], utc=True)
+    df.attrs.update({k: v for k, v in res.items() if k != "data"})
+    return df
@@ -3,6 +3,7 @@ from datetime import datetime
 from ..models.investment import Investment
 from ..models.user import User
 from .binance_service import BinanceService
+from .profit_attribution import COIN_TYPES, RISK_LEVELS
 
 
 class InvestmentService:
@@ -16,6 +17,12 @@ class InvestmentService:
         user: User,
     ) -> Investment:
         """새로운 투자를 생성합니다."""
+        # 잔액을 차감하기 전에 입력값 확인
+        if coin_type not in COIN_TYPES:
+            raise ValueError("Invalid coin type")
+        if risk_level not in RISK_LEVELS:
+            raise ValueError("Invalid risk level")
+
         # 동일한 name과 internal_position을 가진 투자가 있는지 확인
         existing_investment = None
 
@@ -31,15 +38,15 @@ class InvestmentService:
         if user.usdt_balance < initial_amount:
             raise ValueError("잔액이 부족합니다.")
 
-        # USDT 잔액 차감
-        user.usdt_balance -= initial_amount
-        user.save()
-
         # 현재 BTC 가격 가져오기
         current_price = BinanceService.get_btc_price()
         if current_price is None:
             raise ValueError("현재 BTC 가격을 가져올 수 없습니다.")
 
+        # USDT 잔액 차감
+        user.usdt_balance -= initial_amount
+        user.save()
+
         investment = Investment(
             name=name,
             coin_type=coin_type,
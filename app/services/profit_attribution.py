@@ -0,0 +1,226 @@
+"""
+Profit attribution for freqtrade sell callbacks.
+
+Each bot exit is attributed to one pool - the investments of the bot's risk level that hold
+the traded coin - keyed by (risk_level, pair). A burst of callbacks (possibly for different
+pairs) is processed in a single pass: one query loads every affected pool, and all writes
+are issued as bulk operations.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from pymongo import UpdateOne
+
+from ..models.freqtrade_history import FreqtradeHistory
+from ..models.investment import Investment
+from ..models.investment_trade_history import InvestmentTradeHistory
+
+logger = logging.getLogger(__name__)
+
+RISK_LEVELS = ("low", "medium", "high")
+COIN_TYPES = ("BTC", "ETH", "SOL")
+
+# Strategies that don't send the pair yet only ever traded BTC
+DEFAULT_PAIR = "BTC/USDT"
+
+
+class SellCallbackError(ValueError):
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+
+
+class SellEvent(NamedTuple):
+    risk_level: str
+    pair: str
+    profit_usd: float
+    stake_amount: float
+
+    @property
+    def pool_key(self) -> Tuple[str, str]:
+        return self.risk_level, self.pair
+
+
+class AttributionPlan(NamedTuple):
+    # investment id -> profit of every event attributed to it (in event order)
+    investment_profits: Dict[object, List[float]]
+    # pool key -> number of investments the pool's events were attributed to
+    pool_sizes: Dict[Tuple[str, str], int]
+
+
+def pair_coin_type(pair: str) -> Optional[str]:
+    """'BTC/USDT' / 'BTC/USDT:USDT' -> 'BTC'. None if the base coin can't be invested in"""
+    base = pair.split("/")[0].upper()
+    return base if base in COIN_TYPES else None
+
+
+def parse_sell_event(params) -> SellEvent:
+    """Validate the query parameters (or json body) of a single sell callback"""
+    risk_level = params.get("risk_level")
+    if risk_level not in RISK_LEVELS:
+        raise SellCallbackError("Invalid risk level")
+
+    stake_amount = params.get("stake_amount")
+    if stake_amount == "unlimited":
+        print("stake_amount is unlimited!!! Please change the config file")
+        raise SellCallbackError("Stake amount is unlimited")
+
+    try:
+        stake_amount = float(stake_amount)
+        profit_usd = float(params.get("profit_usd"))
+    except (TypeError, ValueError):
+        raise SellCallbackError("Invalid profit_usd or stake_amount")
+    if stake_amount <= 0:
+        raise SellCallbackError("Invalid profit_usd or stake_amount")
+
+    return SellEvent(
+        risk_level=risk_level,
+        pair=params.get("pair") or DEFAULT_PAIR,
+        profit_usd=profit_usd,
+        stake_amount=stake_amount,
+    )
+
+
+def pool_filter(events: Iterable[SellEvent]) -> Optional[dict]:
+    """Mongo filter matching the investments of every pool touched by the events"""
+    pools = sorted(
+        {
+            (event.risk_level, coin_type)
+            for event in events
+            if (coin_type := pair_coin_type(event.pair))
+        }
+    )
+    if not pools:
+        return None
+    return {
+        "$or": [
+            {"risk_level": risk_level, "coin_type": coin_type}
+            for risk_level, coin_type in pools
+        ]
+    }
+
+
+# Only the fields needed for attribution are loaded
+POOL_PROJECTION = {"risk_level": 1, "coin_type": 1, "initial_amount": 1, "current_profit": 1}
+
+
+def plan_attribution(events: List[SellEvent], investments: Iterable[dict]) -> AttributionPlan:
+    """
+    Attribute every event to the investments of its pool.
+
+    Events are applied in order - an investment's share of an exit is based on its
+    initial amount plus the profit it already received (including earlier events of the batch).
+    """
+    members = defaultdict(list)
+    balances = {}
+    for investment in investments:
+        members[(investment["risk_level"], investment["coin_type"])].append(investment["_id"])
+        balances[investment["_id"]] = investment["initial_amount"] + investment.get(
+            "current_profit", 0.0
+        )
+
+    investment_profits = defaultdict(list)
+    pool_sizes = {}
+    for event in events:
+        pool = members.get((event.risk_level, pair_coin_type(event.pair)), [])
+        pool_sizes[event.pool_key] = len(pool)
+        for investment_id in pool:
+            # stake_amount 대비 실제로 얼마 투자했는지 계산
+            profit = event.profit_usd * balances[investment_id] / event.stake_amount
+            balances[investment_id] += profit
+            investment_profits[investment_id].append(profit)
+
+    return AttributionPlan(dict(investment_profits), pool_sizes)
+
+
+def _history_documents(events: List[SellEvent], plan: AttributionPlan, now: datetime):
+    """History documents of a plan - shared by the sync and async paths"""
+    trade_histories = [
+        {"profit_amount": profit, "created_at": now}
+        for profits in plan.investment_profits.values()
+        for profit in profits
+    ]
+    freqtrade_histories = [
+        {
+            "risk_level": event.risk_level,
+            "pair": event.pair,
+            "real_profit_in_this_sell": event.profit_usd,
+            "created_at": now,
+        }
+        for event in events
+    ]
+    return trade_histories, freqtrade_histories
+
+
+def _investment_updates(plan: AttributionPlan, trade_history_ids: List, now: datetime):
+    updates = []
+    position = 0
+    for investment_id, profits in plan.investment_profits.items():
+        ids = trade_history_ids[position : position + len(profits)]
+        position += len(profits)
+        updates.append(
+            UpdateOne(
+                {"_id": investment_id},
+                {
+                    "$inc": {"current_profit": sum(profits)},
+                    "$push": {"trade_history": {"$each": ids}},
+                    "$set": {"updated_at": now},
+                },
+            )
+        )
+    return updates
+
+
+def _log_plan(plan: AttributionPlan):
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    for (risk_level, pair), size in plan.pool_sizes.items():
+        logger.debug("Sell callback %s/%s: attributed to %d investments", risk_level, pair, size)
+
+
+def process_sell_events(events: List[SellEvent]) -> AttributionPlan:
+    """Attribute and persist a batch of sell events (mongoengine connection)"""
+    query = pool_filter(events)
+    investments = (
+        Investment._get_collection().find(query, POOL_PROJECTION) if query else []
+    )
+    plan = plan_attribution(events, investments)
+    _log_plan(plan)
+
+    now = datetime.utcnow()
+    trade_histories, freqtrade_histories = _history_documents(events, plan, now)
+    if trade_histories:
+        # 거래 이력 저장 - 한번에
+        inserted = InvestmentTradeHistory._get_collection().insert_many(trade_histories)
+        Investment._get_collection().bulk_write(
+            _investment_updates(plan, inserted.inserted_ids, now), ordered=False
+        )
+    if freqtrade_histories:
+        FreqtradeHistory._get_collection().insert_many(freqtrade_histories)
+    return plan
+
+
+async def process_sell_events_async(db, events: List[SellEvent]) -> AttributionPlan:
+    """Attribute and persist a batch of sell events (async database)"""
+    query = pool_filter(events)
+    investments = (
+        await db.investments.find(query, POOL_PROJECTION).to_list(None) if query else []
+    )
+    plan = plan_attribution(events, investments)
+    _log_plan(plan)
+
+    now = datetime.utcnow()
+    trade_histories, freqtrade_histories = _history_documents(events, plan, now)
+    if trade_histories:
+        # 거래 이력 저장 - 한번에
+        inserted = await db.investment_trade_histories.insert_many(trade_histories)
+        await db.investments.bulk_write(
+            _investment_updates(plan, inserted.inserted_ids, now), ordered=False
+        )
+    if freqtrade_histories:
+        await db.freqtrade_history.insert_many(freqtrade_histories)
+    return plan
@@ -56,6 +56,7 @@ ARGS_BACKTEST = [
     "exportfilename",
     "backtest_breakdown",
     "backtest_cache",
+    "backtest_engine",
     "freqai_backtest_live_models",
 ]
 
@@ -67,6 +68,7 @@ ARGS_HYPEROPT = [
     "enable_protections",
     "dry_run_wallet",
     "timeframe_detail",
+    "backtest_engine",
     "epochs",
     "spaces",
     "print_all",
@@ -235,6 +235,12 @@ AVAILABLE_CLI_OPTIONS = {
         default=constants.BACKTEST_CACHE_DEFAULT,
         choices=constants.BACKTEST_CACHE_AGE,
     ),
+    "backtest_engine": Arg(
+        "--backtest-engine",
+        help="Candle storage used by the backtesting loop. "
+        "`arrays` uses typed numpy columns instead of python lists (less memory).",
+        choices=constants.BACKTEST_ENGINES,
+    ),
     # Edge
     "stoploss_range": Arg(
         "--stoplosses",
@@ -4,6 +4,7 @@ from freqtrade.constants import (
     AVAILABLE_DATAHANDLERS,
     AVAILABLE_PAIRLISTS,
     BACKTEST_BREAKDOWNS,
+    BACKTEST_ENGINES,
     DRY_RUN_WALLET,
     EXPORT_OPTIONS,
     MARGIN_MODES,
@@ -216,6 +217,15 @@ CONF_SCHEMA = {
             "type": "array",
             "items": {"type": "string", "enum": BACKTEST_BREAKDOWNS},
         },
+        "backtest_engine": {
+            "description": (
+                "Candle storage used by the backtesting loop. "
+                "`arrays` uses typed numpy columns instead of python lists (less memory)."
+            ),
+            "type": "string",
+            "enum": BACKTEST_ENGINES,
+            "default": "lists",
+        },
         "bot_name": {
             "description": "Name of the trading bot. Passed via API to a client.",
             "type": "string",
@@ -716,6 +726,29 @@ CONF_SCHEMA = {
                     "description": "Enable systemd notify.",
                     "type": "boolean",
                 },
+                "analyze_workers": {
+                    "description": "Number of threads used to analyze pairs concurrently.",
+                    "type": "integer",
+                    "minimum": 1,
+                    "default": 1,
+                },
+                "data_load_workers": {
+                    "description": (
+                        "Number of threads used to load pair history concurrently "
+                        "for backtesting and hyperopt."
+                    ),
+                    "type": "integer",
+                    "minimum": 1,
+                    "default": 4,
+                },
+                "incremental_indicators_check": {
+                    "description": (
+                        "Compare incremental indicators against a full recompute "
+                        "on every new candle."
+                    ),
+                    "type": "boolean",
+                    "default": False,
+                },
             },
         },
         "dataformat_ohlcv": {
@@ -724,6 +757,23 @@ CONF_SCHEMA = {
             "enum": AVAILABLE_DATAHANDLERS,
             "default": "feather",
         },
+        "hyperopt_indicator_cache_mb": {
+            "description": (
+                "Memory budget (MB) per hyperopt process for indicators reused across epochs "
+                "with --analyze-per-epoch. 0 disables the cache."
+            ),
+            "type": "integer",
+            "minimum": 0,
+            "default": 1024,
+        },
+        "ohlcv_cache": {
+            "description": (
+                "Cache loaded OHLCV data for backtesting and hyperopt in "
+                "user_data/cache/ohlcv, as memory-mapped Arrow files."
+            ),
+            "type": "boolean",
+            "default": False,
+        },
         "dataformat_trades": {
             "description": "Data format for trade data.",
             "type": "string",
@@ -986,6 +1036,15 @@ CONF_SCHEMA = {
                     "maximum": 20,
                     "default": 8,
                 },
+                "message_format": {
+                    "description": (
+                        "Format of messages received from producers. "
+                        "`binary` transfers dataframes as Arrow IPC streams."
+                    ),
+                    "type": "string",
+                    "enum": ["json", "binary"],
+                    "default": "json",
+                },
             },
             "required": ["producers"],
         },
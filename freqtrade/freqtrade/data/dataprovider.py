@@ -8,6 +8,7 @@ Common Interface for bot and strategy to access data.
 import logging
 from collections import deque
 from datetime import datetime, timezone
+from threading import RLock
 from typing import Any
 
 from pandas import DataFrame, Timedelta, Timestamp, to_timedelta
@@ -20,6 +21,7 @@ from freqtrade.constants import (
     PairWithTimeframe,
 )
 from freqtrade.data.history import get_datahandler, load_pair_history
+from freqtrade.data.producer_df_buffer import ProducerDataFrameBuffer
 from freqtrade.enums import CandleType, RPCMessageType, RunMode, TradingMode
 from freqtrade.exceptions import ExchangeError, OperationalException
 from freqtrade.exchange import Exchange, timeframe_to_prev_date, timeframe_to_seconds
@@ -34,6 +36,8 @@ logger = logging.getLogger(__name__)
 
 NO_EXCHANGE_EXCEPTION = "Exchange is not available to DataProvider."
 MAX_DATAFRAME_CANDLES = 1000
+# Candles kept per dataframe received from producers
+MAX_PRODUCER_CANDLES = 1500
 
 
 class DataProvider:
@@ -54,9 +58,12 @@ class DataProvider:
 
         self.__cached_pairs_backtesting: dict[PairWithTimeframe, DataFrame] = {}
         self.__producer_pairs_df: dict[
-            str, dict[PairWithTimeframe, tuple[DataFrame, datetime]]
+            str, dict[PairWithTimeframe, tuple[DataFrame | ProducerDataFrameBuffer, datetime]]
         ] = {}
         self.__producer_pairs: dict[str, list[str]] = {}
+        # Producer dataframes are updated by the external message consumer thread,
+        # and read by the strategy - buffers are appended in place.
+        self._producer_lock = RLock()
         self._msg_queue: deque = deque()
 
         self._default_candle_type = self._config.get("candle_type_def", CandleType.SPOT)
@@ -146,7 +153,7 @@ class DataProvider:
     def _replace_external_df(
         self,
         pair: str,
-        dataframe: DataFrame,
+        dataframe: DataFrame | ProducerDataFrameBuffer,
         last_analyzed: datetime,
         timeframe: str,
         candle_type: CandleType,
@@ -161,12 +168,12 @@ class DataProvider:
         """
         pair_key = (pair, timeframe, candle_type)
 
-        if producer_name not in self.__producer_pairs_df:
-            self.__producer_pairs_df[producer_name] = {}
-
         _last_analyzed = datetime.now(timezone.utc) if not last_analyzed else last_analyzed
 
-        self.__producer_pairs_df[producer_name][pair_key] = (dataframe, _last_analyzed)
+        with self._producer_lock:
+            if producer_name not in self.__producer_pairs_df:
+                self.__producer_pairs_df[producer_name] = {}
+            self.__producer_pairs_df[producer_name][pair_key] = (dataframe, _last_analyzed)
         logger.debug(f"External DataFrame for {pair_key} from {producer_name} added.")
 
     def _add_external_df(
@@ -193,12 +200,80 @@ class DataProvider:
             # The incoming dataframe must have at least 1 candle
             return (False, 0)
 
-        if len(dataframe) >= FULL_DATAFRAME_THRESHOLD:
-            # This is likely a full dataframe
-            # Add the dataframe to the dataprovider
+        with self._producer_lock:
+            if len(dataframe) >= FULL_DATAFRAME_THRESHOLD:
+                # This is likely a full dataframe
+                # Add the dataframe to the dataprovider
+                self._replace_external_df(
+                    pair,
+                    dataframe,
+                    last_analyzed=last_analyzed,
+                    timeframe=timeframe,
+                    candle_type=candle_type,
+                    producer_name=producer_name,
+                )
+                return (True, 0)
+
+            if (
+                producer_name not in self.__producer_pairs_df
+                or pair_key not in self.__producer_pairs_df[producer_name]
+            ):
+                # We don't have data from this producer yet,
+                # or we don't have data for this pair_key
+                # return False and 1000 for the full df
+                return (False, 1000)
+
+            existing, _ = self.__producer_pairs_df[producer_name][pair_key]
+            existing_df = (
+                existing.frame() if isinstance(existing, ProducerDataFrameBuffer) else existing
+            )
+
+            if list(existing_df.columns) != list(dataframe.columns):
+                # The producer's dataframe changed (e.g. after a strategy update)
+                # return False and 1000 for the full df
+                return (False, 1000)
+
+            # CHECK FOR MISSING CANDLES
+            # Convert the timeframe to a timedelta for pandas
+            timeframe_delta: Timedelta = to_timedelta(timeframe)
+            local_last: Timestamp = existing_df.iloc[-1][
+                "date"
+            ]  # We want the last date from our copy
+            # We want the first date from the incoming
+            incoming_first: Timestamp = dataframe.iloc[0]["date"]
+
+            candle_difference = (incoming_first - local_last) / timeframe_delta
+
+            # If the difference divided by the timeframe is 1, then this
+            # is the candle we want and the incoming data isn't missing any.
+            # If the candle_difference is more than 1, that means
+            # we missed some candles between our data and the incoming
+            # so return False and candle_difference.
+            if candle_difference > 1:
+                return (False, int(candle_difference))
+
+            # Existing candles from the incoming first candle on are replaced
+            kept = int(existing_df["date"].searchsorted(incoming_first))
+            appended: DataFrame | ProducerDataFrameBuffer
+            if kept == 0:
+                appended = dataframe
+            else:
+                # Merge in place - so appending only processes the new candles
+                if not isinstance(existing, ProducerDataFrameBuffer) and (
+                    ProducerDataFrameBuffer.supports(existing_df)
+                ):
+                    existing = ProducerDataFrameBuffer(existing_df, MAX_PRODUCER_CANDLES)
+                if isinstance(existing, ProducerDataFrameBuffer) and existing.append(
+                    dataframe, len(existing_df) - kept, MAX_PRODUCER_CANDLES
+                ):
+                    appended = existing
+                else:
+                    appended = append_candles_to_dataframe(existing_df.iloc[:kept], dataframe)
+
+            # Everything is good, we appended
             self._replace_external_df(
                 pair,
-                dataframe,
+                appended,
                 last_analyzed=last_analyzed,
                 timeframe=timeframe,
                 candle_type=candle_type,
@@ -206,52 +281,6 @@ class DataProvider:
             )
             return (True, 0)
 
-        if (
-            producer_name not in self.__producer_pairs_df
-            or pair_key not in self.__producer_pairs_df[producer_name]
-        ):
-            # We don't have data from this producer yet,
-            # or we don't have data for this pair_key
-            # return False and 1000 for the full df
-            return (False, 1000)
-
-        existing_df, _ = self.__producer_pairs_df[producer_name][pair_key]
-
-        # CHECK FOR MISSING CANDLES
-        # Convert the timeframe to a timedelta for pandas
-        timeframe_delta: Timedelta = to_timedelta(timeframe)
-        local_last: Timestamp = existing_df.iloc[-1]["date"]  # We want the last date from our copy
-        # We want the first date from the incoming
-        incoming_first: Timestamp = dataframe.iloc[0]["date"]
-
-        # Remove existing candles that are newer than the incoming first candle
-        existing_df1 = existing_df[existing_df["date"] < incoming_first]
-
-        candle_difference = (incoming_first - local_last) / timeframe_delta
-
-        # If the difference divided by the timeframe is 1, then this
-        # is the candle we want and the incoming data isn't missing any.
-        # If the candle_difference is more than 1, that means
-        # we missed some candles between our data and the incoming
-        # so return False and candle_difference.
-        if candle_difference > 1:
-            return (False, int(candle_difference))
-        if existing_df1.empty:
-            appended_df = dataframe
-        else:
-            appended_df = append_candles_to_dataframe(existing_df1, dataframe)
-
-        # Everything is good, we appended
-        self._replace_external_df(
-            pair,
-            appended_df,
-            last_analyzed=last_analyzed,
-            timeframe=timeframe,
-            candle_type=candle_type,
-            producer_name=producer_name,
-        )
-        return (True, 0)
-
     def get_producer_df(
         self,
         pair: str,
@@ -272,19 +301,39 @@ class DataProvider:
 
         pair_key = (pair, _timeframe, _candle_type)
 
-        # If we have no data from this Producer yet
-        if producer_name not in self.__producer_pairs_df:
-            # We don't have this data yet, return empty DataFrame and datetime (01-01-1970)
-            return (DataFrame(), datetime.fromtimestamp(0, tz=timezone.utc))
-
-        # If we do have data from that Producer, but no data on this pair_key
-        if pair_key not in self.__producer_pairs_df[producer_name]:
-            # We don't have this data yet, return empty DataFrame and datetime (01-01-1970)
-            return (DataFrame(), datetime.fromtimestamp(0, tz=timezone.utc))
-
-        # We have it, return this data
-        df, la = self.__producer_pairs_df[producer_name][pair_key]
-        return (df.copy(), la)
+        with self._producer_lock:
+            # If we have no data from this Producer yet
+            if producer_name not in self.__producer_pairs_df:
+                # We don't have this data yet, return empty DataFrame and datetime (01-01-1970)
+                return (DataFrame(), datetime.fromtimestamp(0, tz=timezone.utc))
+
+            # If we do have data from that Producer, but no data on this pair_key
+            if pair_key not in self.__producer_pairs_df[producer_name]:
+                # We don't have this data yet, return empty DataFrame and datetime (01-01-1970)
+                return (DataFrame(), datetime.fromtimestamp(0, tz=timezone.utc))
+
+            # We have it, return a copy - buffers are changed in place by the consumer thread
+            df, la = self.__producer_pairs_df[producer_name][pair_key]
+            if isinstance(df, ProducerDataFrameBuffer):
+                df = df.frame()
+            return (df.copy(), la)
+
+    def _get_producer_last_candles(self, producer_name: str) -> dict[PairWithTimeframe, Timestamp]:
+        """
+        Get the date of the last candle of each dataframe received from this producer.
+        Used to only request newer candles from the producer.
+
+        :param producer_name: Name of the producer
+        :returns: Dict of the last candle date per pair key
+        """
+        last_candles = {}
+        with self._producer_lock:
+            for pair_key, (df, _) in self.__producer_pairs_df.get(producer_name, {}).items():
+                if isinstance(df, ProducerDataFrameBuffer):
+                    df = df.frame()
+                if not df.empty:
+                    last_candles[pair_key] = df["date"].iloc[-1]
+        return last_candles
 
     def add_pairlisthandler(self, pairlists) -> None:
         """
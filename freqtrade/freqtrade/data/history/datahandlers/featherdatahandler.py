@@ -1,6 +1,9 @@
 import logging
+from pathlib import Path
 
-from pandas import DataFrame, read_feather, to_datetime
+import pyarrow as pa
+from pandas import DataFrame, concat, read_feather, to_datetime
+from pyarrow import ipc
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS
@@ -14,6 +17,7 @@ logger = logging.getLogger(__name__)
 
 class FeatherDataHandler(IDataHandler):
     _columns = DEFAULT_DATAFRAME_COLUMNS
+    supports_append = True
 
     def ohlcv_store(
         self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
@@ -31,9 +35,35 @@ class FeatherDataHandler(IDataHandler):
         filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
         self.create_dir_if_needed(filename)
 
-        data.reset_index(drop=True).loc[:, self._columns].to_feather(
-            filename, compression_level=9, compression="lz4"
+        self._write_ohlcv_file(filename, data.reset_index(drop=True).loc[:, self._columns])
+        self._remove_segment_files(filename)
+
+    def _write_ohlcv_file(self, filename: Path, data: DataFrame) -> None:
+        # One record batch per month - allows loading only the requested timerange
+        bounds = self._partition_bounds(data)
+        batch = pa.RecordBatch.from_pandas(data, preserve_index=False)
+        schema = batch.schema.with_metadata(
+            {**(batch.schema.metadata or {}), **self._partition_metadata(data, bounds)}
         )
+        options = ipc.IpcWriteOptions(compression=pa.Codec("lz4", compression_level=9))
+        with ipc.new_file(filename, schema, options=options) as writer:
+            for start, end in bounds:
+                writer.write_batch(batch.slice(start, end - start))
+
+    def _read_ohlcv_file(self, filename: Path, timerange: TimeRange | None) -> DataFrame:
+        if not timerange:
+            return read_feather(filename)
+        with ipc.open_file(filename) as reader:
+            batches = self._partitions_in_timerange(
+                reader.schema.metadata, reader.num_record_batches, timerange
+            )
+            return pa.Table.from_batches(
+                [reader.get_batch(idx) for idx in batches], schema=reader.schema
+            ).to_pandas()
+
+    def _ohlcv_file_partitions(self, filename: Path) -> list[list[int]] | None:
+        with ipc.open_file(filename) as reader:
+            return self._partition_ranges(reader.schema.metadata)
 
     def _ohlcv_load(
         self, pair: str, timeframe: str, timerange: TimeRange | None, candle_type: CandleType
@@ -45,8 +75,8 @@ class FeatherDataHandler(IDataHandler):
         :param pair: Pair to load data
         :param timeframe: Timeframe (e.g. "5m")
         :param timerange: Limit data to be loaded to this timerange.
-                        Optionally implemented by subclasses to avoid loading
-                        all data where possible.
+                        Only partitions (months) overlapping the timerange are loaded.
+        Candles appended to segment files are merged into the result.
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         :return: DataFrame with ohlcv data, or empty DataFrame
         """
@@ -59,8 +89,7 @@ class FeatherDataHandler(IDataHandler):
             if not filename.exists():
                 return DataFrame(columns=self._columns)
         try:
-            pairdata = read_feather(filename)
-            pairdata.columns = self._columns
+            pairdata = self._load_ohlcv_files(filename, timerange)
             pairdata = pairdata.astype(
                 dtype={
                     "open": "float",
@@ -88,7 +117,7 @@ class FeatherDataHandler(IDataHandler):
         :param data: Data to append.
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         """
-        raise NotImplementedError()
+        self._append_ohlcv_segment(pair, timeframe, data, candle_type)
 
     def _trades_store(self, pair: str, data: DataFrame, trading_mode: TradingMode) -> None:
         """
@@ -100,16 +129,21 @@ class FeatherDataHandler(IDataHandler):
         """
         filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
         self.create_dir_if_needed(filename)
+        self._write_trades_file(filename, data)
+        self._remove_segment_files(filename)
+
+    def _write_trades_file(self, filename: Path, data: DataFrame) -> None:
         data.reset_index(drop=True).to_feather(filename, compression_level=9, compression="lz4")
 
-    def trades_append(self, pair: str, data: DataFrame):
+    def trades_append(self, pair: str, data: DataFrame, trading_mode: TradingMode):
         """
         Append data to existing files
         :param pair: Pair - used for filename
         :param data: Dataframe containing trades
                      column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
         """
-        raise NotImplementedError()
+        self._append_trades_segment(pair, data, trading_mode)
 
     def _trades_load(
         self, pair: str, trading_mode: TradingMode, timerange: TimeRange | None = None
@@ -127,6 +161,11 @@ class FeatherDataHandler(IDataHandler):
             return DataFrame(columns=DEFAULT_TRADES_COLUMNS)
 
         tradesdata = read_feather(filename)
+        segments = self._segment_files(filename)
+        if segments:
+            tradesdata = concat(
+                [tradesdata, *(read_feather(file) for file in segments)], axis=0, ignore_index=True
+            )
 
         return tradesdata
 
@@ -11,7 +11,9 @@ from copy import deepcopy
 from datetime import datetime, timezone
 from pathlib import Path
 
-from pandas import DataFrame, to_datetime
+import numpy as np
+import rapidjson
+from pandas import DataFrame, concat, to_datetime
 
 from freqtrade import misc
 from freqtrade.configuration import TimeRange
@@ -26,6 +28,8 @@ from freqtrade.enums import CandleType, TradingMode
 from freqtrade.exceptions import OperationalException
 from freqtrade.exchange import timeframe_to_seconds
 
+from .ohlcv_cache import OhlcvCache
+
 
 logger = logging.getLogger(__name__)
 
@@ -33,9 +37,17 @@ logger = logging.getLogger(__name__)
 class IDataHandler(ABC):
     _OHLCV_REGEX = r"^([a-zA-Z_\d-]+)\-(\d+[a-zA-Z]{1,2})\-?([a-zA-Z_]*)?(?=\.)"
     _TRADES_REGEX = r"^([a-zA-Z_\d-]+)\-(trades)?(?=\.)"
+    # File metadata key holding the date range (in ms) of each partition of an ohlcv file
+    _PARTITIONS_KEY = b"freqtrade_partitions"
+    # Appended data is written to segment files next to the data file ("<file>.<number>").
+    # Segments are merged into the data file once there are more than _max_segments.
+    supports_append = False
+    _max_segments = 20
 
     def __init__(self, datadir: Path) -> None:
         self._datadir = datadir
+        # Cache of loaded ohlcv data - see load_data(ohlcv_cache_dir=...)
+        self.ohlcv_cache: OhlcvCache | None = None
 
     @classmethod
     def _get_file_extension(cls) -> str:
@@ -150,6 +162,7 @@ class IDataHandler(ABC):
         :return: True when deleted, false if file did not exist.
         """
         filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        self._remove_segment_files(filename)
         if filename.exists():
             filename.unlink()
             return True
@@ -237,12 +250,13 @@ class IDataHandler(ABC):
         """
 
     @abstractmethod
-    def trades_append(self, pair: str, data: DataFrame):
+    def trades_append(self, pair: str, data: DataFrame, trading_mode: TradingMode):
         """
         Append data to existing files
         :param pair: Pair - used for filename
         :param data: Dataframe containing trades
                      column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
         """
 
     @abstractmethod
@@ -276,6 +290,7 @@ class IDataHandler(ABC):
         :return: True when deleted, false if file did not exist.
         """
         filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        self._remove_segment_files(filename)
         if filename.exists():
             filename.unlink()
             return True
@@ -364,6 +379,196 @@ class IDataHandler(ABC):
         res = re.sub("_", ":", res, count=1)
         return res
 
+    @staticmethod
+    def _partition_bounds(data: DataFrame) -> list[tuple[int, int]]:
+        """
+        Split ohlcv data (sorted by date) into one partition per calendar month.
+        :return: List of (start, end) row positions
+        """
+        if data.empty:
+            return []
+        dates = data["date"]
+        months = (dates.dt.year * 12 + dates.dt.month).to_numpy()
+        starts = [0, *(np.flatnonzero(np.diff(months)) + 1).tolist()]
+        return list(zip(starts, [*starts[1:], len(data)], strict=True))
+
+    @classmethod
+    def _partition_metadata(
+        cls, data: DataFrame, bounds: list[tuple[int, int]]
+    ) -> dict[bytes, bytes]:
+        """File metadata describing the date range of each partition"""
+        dates = data["date"].array.asi8 // 1_000_000
+        ranges = [[int(dates[start]), int(dates[end - 1])] for start, end in bounds]
+        return {cls._PARTITIONS_KEY: rapidjson.dumps(ranges).encode()}
+
+    @classmethod
+    def _partition_ranges(cls, metadata: dict[bytes, bytes] | None) -> list[list[int]] | None:
+        """Date range (in ms) of each partition - None for files without partition metadata"""
+        if not metadata or cls._PARTITIONS_KEY not in metadata:
+            return None
+        return rapidjson.loads(metadata[cls._PARTITIONS_KEY])
+
+    @classmethod
+    def _partitions_in_timerange(
+        cls, metadata: dict[bytes, bytes] | None, count: int, timerange: TimeRange | None
+    ) -> list[int]:
+        """
+        Partitions of an ohlcv file to load for this timerange.
+        Includes the first partition after the timerange, so the real end of the data
+        remains visible. All partitions are loaded for files without partition metadata.
+        :param metadata: File metadata
+        :param count: Number of partitions (record batches / row groups) in the file
+        :param timerange: Timerange to load - including startup candles
+        """
+        partitions = list(range(count))
+        ranges = cls._partition_ranges(metadata)
+        if not timerange or ranges is None or len(ranges) != count:
+            return partitions
+        start_ms = timerange.startts * 1000 if timerange.starttype == "date" else None
+        stop_ms = timerange.stopts * 1000 if timerange.stoptype == "date" else None
+        selected = []
+        for idx, (first, last) in enumerate(ranges):
+            if start_ms is not None and last < start_ms:
+                continue
+            selected.append(idx)
+            if stop_ms is not None and first > stop_ms:
+                break
+        return selected
+
+    @staticmethod
+    def _segment_files(filename: Path) -> list[Path]:
+        """Segment files appended to this data file - in the order they were written"""
+        files = filename.parent.glob(f"{filename.name}.*")
+        return sorted(
+            (file for file in files if file.suffix[1:].isdigit()),
+            key=lambda file: int(file.suffix[1:]),
+        )
+
+    @classmethod
+    def _next_segment_file(cls, filename: Path) -> Path:
+        segments = cls._segment_files(filename)
+        number = int(segments[-1].suffix[1:]) + 1 if segments else 1
+        return filename.with_name(f"{filename.name}.{number:05d}")
+
+    @classmethod
+    def _remove_segment_files(cls, filename: Path) -> None:
+        for file in cls._segment_files(filename):
+            file.unlink()
+
+    @classmethod
+    def _rename_data_file(cls, file_old: Path, file_new: Path) -> None:
+        """Rename a data file, including its segments"""
+        for file in cls._segment_files(file_old):
+            file.rename(file_new.with_name(f"{file_new.name}{file.suffix}"))
+        file_old.rename(file_new)
+
+    def _write_ohlcv_file(self, filename: Path, data: DataFrame) -> None:
+        """Write one ohlcv file (data file or segment) - only for handlers supporting append."""
+        raise NotImplementedError()
+
+    def _read_ohlcv_file(self, filename: Path, timerange: TimeRange | None) -> DataFrame:
+        """
+        Read one ohlcv file (data file or segment) - only for handlers supporting append.
+        :param timerange: Load only partitions overlapping this timerange (if possible)
+        """
+        raise NotImplementedError()
+
+    def _ohlcv_file_partitions(self, filename: Path) -> list[list[int]] | None:
+        """Partition date ranges of one ohlcv file - only for handlers supporting append."""
+        raise NotImplementedError()
+
+    def _write_trades_file(self, filename: Path, data: DataFrame) -> None:
+        """Write one trades file (data file or segment) - only for handlers supporting append."""
+        raise NotImplementedError()
+
+    def _load_ohlcv_files(self, filename: Path, timerange: TimeRange | None) -> DataFrame:
+        """
+        Load ohlcv data from the data file and its segments.
+        Candles from later segments replace candles with the same date.
+        """
+        segments = self._segment_files(filename)
+        frames = []
+        for file in [filename, *segments]:
+            frame = self._read_ohlcv_file(file, timerange)
+            frame.columns = self._columns
+            frames.append(frame)
+        if not segments:
+            return frames[0]
+        data = concat(frames, axis=0, ignore_index=True)
+        data = data.drop_duplicates(subset="date", keep="last").sort_values(by="date")
+        return data.reset_index(drop=True)
+
+    def ohlcv_date_range(
+        self, pair: str, timeframe: str, candle_type: CandleType
+    ) -> tuple[datetime, datetime] | None:
+        """
+        First and last candle date of the stored data - read from the file metadata,
+        without loading the data.
+        :return: (first, last) or None if not available (no data, or data format without
+            partition metadata)
+        """
+        if not self.supports_append:
+            return None
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if not filename.exists():
+            return None
+        ranges = []
+        for file in [filename, *self._segment_files(filename)]:
+            partitions = self._ohlcv_file_partitions(file)
+            if partitions is None:
+                return None
+            ranges.extend(partitions)
+        if not ranges:
+            return None
+        return (
+            datetime.fromtimestamp(min(r[0] for r in ranges) / 1000, tz=timezone.utc),
+            datetime.fromtimestamp(max(r[1] for r in ranges) / 1000, tz=timezone.utc),
+        )
+
+    def _append_ohlcv_segment(
+        self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
+    ) -> None:
+        """
+        Write appended candles to a new segment file.
+        Once there are _max_segments segments, all segments are merged into the data file.
+        """
+        if data.empty:
+            return
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if not filename.exists():
+            self.ohlcv_store(pair, timeframe, data, candle_type)
+        elif len(self._segment_files(filename)) >= self._max_segments:
+            logger.info(f"Compacting data for {pair}, {timeframe}, {candle_type}.")
+            stored = self._load_ohlcv_files(filename, None)
+            data = concat([stored, data.loc[:, self._columns]], axis=0, ignore_index=True)
+            data = data.drop_duplicates(subset="date", keep="last").sort_values(by="date")
+            self.ohlcv_store(pair, timeframe, data, candle_type)
+        else:
+            self._write_ohlcv_file(
+                self._next_segment_file(filename),
+                data.reset_index(drop=True).loc[:, self._columns],
+            )
+
+    def _append_trades_segment(self, pair: str, data: DataFrame, trading_mode: TradingMode) -> None:
+        """
+        Write appended trades to a new segment file.
+        Once there are _max_segments segments, all segments are merged into the data file.
+        """
+        if data.empty:
+            return
+        filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
+        if not filename.exists():
+            self.trades_store(pair, data, trading_mode)
+        elif len(self._segment_files(filename)) >= self._max_segments:
+            logger.info(f"Compacting trades for {pair}, {trading_mode}.")
+            trades = concat([self.trades_load(pair, trading_mode), data], axis=0, ignore_index=True)
+            self.trades_store(pair, trades_df_remove_duplicates(trades), trading_mode)
+        else:
+            self._write_trades_file(
+                self._next_segment_file(filename),
+                data.reset_index(drop=True).loc[:, DEFAULT_TRADES_COLUMNS],
+            )
+
     def ohlcv_load(
         self,
         pair,
@@ -387,8 +592,75 @@ class IDataHandler(ABC):
         :param startup_candles: Additional candles to load at the start of the period
         :param warn_no_data: Log a warning message when no data is found
         :param candle_type: Any of the enum CandleType (must match trading mode!)
-        :return: DataFrame with ohlcv data, or empty DataFrame
+        :return: DataFrame with ohlcv data, or empty DataFrame.
+            Served from ohlcv_cache (with read-only columns) if a cache is configured.
         """
+        if self.ohlcv_cache is None:
+            return self._ohlcv_load_clean(
+                pair,
+                timeframe,
+                candle_type,
+                timerange=timerange,
+                fill_missing=fill_missing,
+                drop_incomplete=drop_incomplete,
+                startup_candles=startup_candles,
+                warn_no_data=warn_no_data,
+            )
+
+        filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
+        if not filename.exists():
+            filename = self._pair_data_filename(
+                self._datadir, pair, timeframe, candle_type, no_timeframe_modify=True
+            )
+        source_key = OhlcvCache.source_key([filename, *self._segment_files(filename)])
+        name = OhlcvCache.entry_name(filename)
+        settings = {
+            "timeframe": timeframe,
+            "candle_type": candle_type,
+            "timerange": [
+                timerange.starttype,
+                timerange.startts,
+                timerange.stoptype,
+                timerange.stopts,
+            ]
+            if timerange
+            else None,
+            "fill_missing": fill_missing,
+            "drop_incomplete": drop_incomplete,
+            "startup_candles": startup_candles,
+        }
+        if source_key:
+            cached = self.ohlcv_cache.load(name, source_key, settings)
+            if cached is not None:
+                return cached
+
+        pairdf = self._ohlcv_load_clean(
+            pair,
+            timeframe,
+            candle_type,
+            timerange=timerange,
+            fill_missing=fill_missing,
+            drop_incomplete=drop_incomplete,
+            startup_candles=startup_candles,
+            warn_no_data=warn_no_data,
+        )
+        if source_key and not pairdf.empty:
+            self.ohlcv_cache.store(name, source_key, settings, pairdf)
+        return pairdf
+
+    def _ohlcv_load_clean(
+        self,
+        pair,
+        timeframe: str,
+        candle_type: CandleType,
+        *,
+        timerange: TimeRange | None,
+        fill_missing: bool,
+        drop_incomplete: bool,
+        startup_candles: int,
+        warn_no_data: bool,
+    ) -> DataFrame:
+        """Load, trim and clean ohlcv data - see ohlcv_load()"""
         # Fix startup period
         timerange_startup = deepcopy(timerange)
         if startup_candles > 0 and timerange_startup:
@@ -500,7 +772,7 @@ class IDataHandler(ABC):
         if file_new.exists():
             logger.warning(f"{file_new} exists already, can't migrate {pair}.")
             return
-        file_old.rename(file_new)
+        self._rename_data_file(file_old, file_new)
 
     def fix_funding_fee_timeframe(self, ff_timeframe: str):
         """
@@ -527,9 +799,10 @@ class IDataHandler(ABC):
 
             if Path(new_name).exists():
                 logger.warning(f"{new_name} already exists, Removing.")
+                self._remove_segment_files(new_name)
                 Path(new_name).unlink()
 
-            Path(old_name).rename(new_name)
+            self._rename_data_file(old_name, new_name)
 
 
 def get_datahandlerclass(datatype: str) -> type[IDataHandler]:
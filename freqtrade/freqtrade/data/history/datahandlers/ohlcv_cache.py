@@ -0,0 +1,92 @@
+"""
+Local cache of loaded (cleaned and gap-filled) OHLCV data, stored as uncompressed
+Arrow IPC files.
+"""
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import rapidjson
+from pandas import DataFrame
+from pyarrow import ipc
+
+
+logger = logging.getLogger(__name__)
+
+
+class OhlcvCache:
+    """
+    Cache entries are keyed by the source files (name, size and modification time)
+    and the load settings - so changed data files are never served from the cache.
+
+    Entries are memory-mapped when loading: the returned dataframe's columns are
+    read-only views on the cache file, and processes loading the same entry share
+    the same pages of memory.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        self._cache_dir = cache_dir
+
+    @staticmethod
+    def _digest(data: Any) -> str:
+        return hashlib.sha1(  # noqa: S324
+            rapidjson.dumps(data, default=str).encode("utf-8")
+        ).hexdigest()[:16]
+
+    @classmethod
+    def entry_name(cls, filename: Path) -> str:
+        """Name of the entries of a data file - unique across data directories"""
+        return f"{filename.name.split('.')[0]}-{cls._digest(str(filename.parent.resolve()))}"
+
+    @classmethod
+    def source_key(cls, files: list[Path]) -> str | None:
+        """Identification of the source files - None if any of them is missing"""
+        stats = []
+        for file in files:
+            try:
+                stat = file.stat()
+            except OSError:
+                return None
+            stats.append([file.name, stat.st_size, stat.st_mtime_ns])
+        return cls._digest(stats)
+
+    def _entry_file(self, name: str, source_key: str, settings: dict[str, Any]) -> Path:
+        return self._cache_dir / f"{name}-{source_key}-{self._digest(settings)}.arrow"
+
+    def load(self, name: str, source_key: str, settings: dict[str, Any]) -> DataFrame | None:
+        """
+        Load a cache entry - None if there is no entry for this source and settings.
+        :param name: Name of the data - see entry_name()
+        """
+        file = self._entry_file(name, source_key, settings)
+        if not file.is_file():
+            return None
+        try:
+            table = ipc.open_file(pa.memory_map(str(file))).read_all()
+            # split_blocks avoids consolidating the columns - which would copy them.
+            return table.to_pandas(split_blocks=True)
+        except Exception as e:
+            logger.warning(f"Could not read ohlcv cache file {file}: {e}")
+            return None
+
+    def store(self, name: str, source_key: str, settings: dict[str, Any], data: DataFrame) -> None:
+        """
+        Store a cache entry, and remove entries of outdated source files for this data.
+        Entries are written to a temporary file first, so concurrent processes
+        never see partially written entries.
+        """
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        file = self._entry_file(name, source_key, settings)
+        for outdated in self._cache_dir.glob(f"{name}-*.arrow"):
+            if not outdated.name.startswith(f"{name}-{source_key}-"):
+                outdated.unlink(missing_ok=True)
+
+        table = pa.Table.from_pandas(data, preserve_index=False)
+        tmp_file = file.with_name(f"{file.name}.{os.getpid()}.tmp")
+        with ipc.new_file(tmp_file, table.schema) as writer:
+            writer.write_table(table)
+        tmp_file.replace(file)
@@ -1,6 +1,9 @@
 import logging
+from pathlib import Path
 
-from pandas import DataFrame, read_parquet, to_datetime
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pandas import DataFrame, concat, read_parquet, to_datetime
 
 from freqtrade.configuration import TimeRange
 from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, DEFAULT_TRADES_COLUMNS
@@ -14,6 +17,7 @@ logger = logging.getLogger(__name__)
 
 class ParquetDataHandler(IDataHandler):
     _columns = DEFAULT_DATAFRAME_COLUMNS
+    supports_append = True
 
     def ohlcv_store(
         self, pair: str, timeframe: str, data: DataFrame, candle_type: CandleType
@@ -31,7 +35,31 @@ class ParquetDataHandler(IDataHandler):
         filename = self._pair_data_filename(self._datadir, pair, timeframe, candle_type)
         self.create_dir_if_needed(filename)
 
-        data.reset_index(drop=True).loc[:, self._columns].to_parquet(filename)
+        self._write_ohlcv_file(filename, data.reset_index(drop=True).loc[:, self._columns])
+        self._remove_segment_files(filename)
+
+    def _write_ohlcv_file(self, filename: Path, data: DataFrame) -> None:
+        # One row group per month - allows loading only the requested timerange
+        bounds = self._partition_bounds(data)
+        table = pa.Table.from_pandas(data, preserve_index=False)
+        table = table.replace_schema_metadata(
+            {**(table.schema.metadata or {}), **self._partition_metadata(data, bounds)}
+        )
+        with pq.ParquetWriter(filename, table.schema) as writer:
+            for start, end in bounds:
+                writer.write_table(table.slice(start, end - start), row_group_size=end - start)
+
+    def _read_ohlcv_file(self, filename: Path, timerange: TimeRange | None) -> DataFrame:
+        if not timerange:
+            return read_parquet(filename)
+        parquet_file = pq.ParquetFile(filename)
+        row_groups = self._partitions_in_timerange(
+            parquet_file.schema_arrow.metadata, parquet_file.num_row_groups, timerange
+        )
+        return parquet_file.read_row_groups(row_groups).to_pandas()
+
+    def _ohlcv_file_partitions(self, filename: Path) -> list[list[int]] | None:
+        return self._partition_ranges(pq.read_schema(filename).metadata)
 
     def _ohlcv_load(
         self, pair: str, timeframe: str, timerange: TimeRange | None, candle_type: CandleType
@@ -43,8 +71,8 @@ class ParquetDataHandler(IDataHandler):
         :param pair: Pair to load data
         :param timeframe: Timeframe (e.g. "5m")
         :param timerange: Limit data to be loaded to this timerange.
-                        Optionally implemented by subclasses to avoid loading
-                        all data where possible.
+                        Only partitions (months) overlapping the timerange are loaded.
+        Candles appended to segment files are merged into the result.
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         :return: DataFrame with ohlcv data, or empty DataFrame
         """
@@ -57,8 +85,7 @@ class ParquetDataHandler(IDataHandler):
             if not filename.exists():
                 return DataFrame(columns=self._columns)
         try:
-            pairdata = read_parquet(filename)
-            pairdata.columns = self._columns
+            pairdata = self._load_ohlcv_files(filename, timerange)
             pairdata = pairdata.astype(
                 dtype={
                     "open": "float",
@@ -86,7 +113,7 @@ class ParquetDataHandler(IDataHandler):
         :param data: Data to append.
         :param candle_type: Any of the enum CandleType (must match trading mode!)
         """
-        raise NotImplementedError()
+        self._append_ohlcv_segment(pair, timeframe, data, candle_type)
 
     def _trades_store(self, pair: str, data: DataFrame, trading_mode: TradingMode) -> None:
         """
@@ -98,16 +125,21 @@ class ParquetDataHandler(IDataHandler):
         """
         filename = self._pair_trades_filename(self._datadir, pair, trading_mode)
         self.create_dir_if_needed(filename)
+        self._write_trades_file(filename, data)
+        self._remove_segment_files(filename)
+
+    def _write_trades_file(self, filename: Path, data: DataFrame) -> None:
         data.reset_index(drop=True).to_parquet(filename)
 
-    def trades_append(self, pair: str, data: DataFrame):
+    def trades_append(self, pair: str, data: DataFrame, trading_mode: TradingMode):
         """
         Append data to existing files
         :param pair: Pair - used for filename
         :param data: Dataframe containing trades
                      column sequence as in DEFAULT_TRADES_COLUMNS
+        :param trading_mode: Trading mode to use (used to determine the filename)
         """
-        raise NotImplementedError()
+        self._append_trades_segment(pair, data, trading_mode)
 
     def _trades_load(
         self, pair: str, trading_mode: TradingMode, timerange: TimeRange | None = None
@@ -125,6 +157,11 @@ class ParquetDataHandler(IDataHandler):
             return DataFrame(columns=DEFAULT_TRADES_COLUMNS)
 
         tradesdata = read_parquet(filename)
+        segments = self._segment_files(filename)
+        if segments:
+            tradesdata = concat(
+                [tradesdata, *(read_parquet(file) for file in segments)], axis=0, ignore_index=True
+            )
 
         return tradesdata
 
@@ -1,5 +1,9 @@
 import logging
 import operator
+import threading
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -14,9 +18,10 @@ from freqtrade.data.converter import (
     trades_list_to_df,
 )
 from freqtrade.data.history.datahandlers import IDataHandler, get_datahandler
+from freqtrade.data.history.datahandlers.ohlcv_cache import OhlcvCache
 from freqtrade.enums import CandleType, TradingMode
 from freqtrade.exceptions import OperationalException
-from freqtrade.exchange import Exchange
+from freqtrade.exchange import Exchange, timeframe_to_seconds
 from freqtrade.plugins.pairlist.pairlist_helpers import dynamic_expand_pairlist
 from freqtrade.util import dt_now, dt_ts, format_ms_time, format_ms_time_det
 from freqtrade.util.migrations import migrate_data
@@ -68,6 +73,83 @@ def load_pair_history(
     )
 
 
+class _DeferredLogs(logging.Filter):
+    """
+    Holds back log records of worker threads while they load a pair,
+    so they can be emitted in pair order by the consuming thread.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._local = threading.local()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        records = getattr(self._local, "records", None)
+        if records is None:
+            return True
+        records.append(record)
+        return False
+
+    def run(
+        self, load: Callable[[str], DataFrame], pair: str
+    ) -> tuple[DataFrame | None, list[logging.LogRecord], Exception | None]:
+        self._local.records = []
+        try:
+            return load(pair), self._local.records, None
+        except Exception as e:
+            return None, self._local.records, e
+        finally:
+            self._local.records = None
+
+
+def _load_pairs(
+    load: Callable[[str], DataFrame], pairs: list[str], workers: int
+) -> Iterator[tuple[str, DataFrame]]:
+    """
+    Load pairs with a pool of `workers` threads - yielding the results in pair order.
+    At most 2 * workers pairs are loaded ahead of the consumer, to limit memory usage.
+    Log messages of each pair are emitted in pair order as well.
+    """
+    if workers <= 1 or len(pairs) <= 1:
+        for pair in pairs:
+            yield pair, load(pair)
+        return
+
+    deferred = _DeferredLogs()
+    # Filters only apply to the logger a record is logged with - not to parent loggers.
+    data_loggers = [
+        logging.getLogger(name)
+        for name in list(logging.root.manager.loggerDict)
+        if name.startswith("freqtrade.data")
+    ]
+    for data_logger in data_loggers:
+        data_logger.addFilter(deferred)
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ft_load_data") as pool:
+            pending = iter(pairs)
+            in_flight: deque[tuple[str, Future]] = deque()
+
+            def submit_next() -> None:
+                pair = next(pending, None)
+                if pair is not None:
+                    in_flight.append((pair, pool.submit(deferred.run, load, pair)))
+
+            for _ in range(2 * workers):
+                submit_next()
+            while in_flight:
+                pair, future = in_flight.popleft()
+                result, records, error = future.result()
+                for record in records:
+                    logging.getLogger(record.name).handle(record)
+                if error:
+                    raise error
+                submit_next()
+                yield pair, result
+    finally:
+        for data_logger in data_loggers:
+            data_logger.removeFilter(deferred)
+
+
 def load_data(
     datadir: Path,
     timeframe: str,
@@ -80,6 +162,8 @@ def load_data(
     data_format: str = "feather",
     candle_type: CandleType = CandleType.SPOT,
     user_futures_funding_rate: int | None = None,
+    workers: int = 1,
+    ohlcv_cache_dir: Path | None = None,
 ) -> dict[str, DataFrame]:
     """
     Load ohlcv history data for a list of pairs.
@@ -93,6 +177,10 @@ def load_data(
     :param fail_without_data: Raise OperationalException if no data is found.
     :param data_format: Data format which should be used. Defaults to json
     :param candle_type: Any of the enum CandleType (must match trading mode!)
+    :param workers: Number of threads loading pairs concurrently.
+        The result (and log output) is in pair order regardless.
+    :param ohlcv_cache_dir: Cache loaded data in this directory - cached data is
+        memory-mapped, with read-only columns.
     :return: dict(<pair>:<Dataframe>)
     """
     result: dict[str, DataFrame] = {}
@@ -100,9 +188,11 @@ def load_data(
         logger.info(f"Using indicator startup period: {startup_candles} ...")
 
     data_handler = get_datahandler(datadir, data_format)
+    if ohlcv_cache_dir:
+        data_handler.ohlcv_cache = OhlcvCache(ohlcv_cache_dir)
 
-    for pair in pairs:
-        hist = load_pair_history(
+    def load(pair: str) -> DataFrame:
+        return load_pair_history(
             pair=pair,
             timeframe=timeframe,
             datadir=datadir,
@@ -112,6 +202,8 @@ def load_data(
             data_handler=data_handler,
             candle_type=candle_type,
         )
+
+    for pair, hist in _load_pairs(load, pairs, workers):
         if not hist.empty:
             result[pair] = hist
         else:
@@ -173,6 +265,8 @@ def _load_cached_data_for_updating(
     downloaded.
     If that's the case then what's available should be completely overwritten.
     Otherwise downloads always start at the end of the available data to avoid data gaps.
+    For data handlers supporting append, only the last stored candles are loaded
+    (unless prepending).
     Note: Only used by download_pair_history().
     """
     start = None
@@ -183,11 +277,19 @@ def _load_cached_data_for_updating(
         if timerange.stoptype == "date":
             end = timerange.stopdt
 
-    # Intentionally don't pass timerange in - since we need to load the full dataset.
+    date_range = None if prepend else data_handler.ohlcv_date_range(pair, timeframe, candle_type)
+    load_timerange = None
+    if date_range:
+        # New candles will be appended - only the last candles are needed.
+        load_timerange = TimeRange(
+            "date", None, int(date_range[1].timestamp()) - 3 * timeframe_to_seconds(timeframe), 0
+        )
+    # Intentionally don't pass the requested timerange in - since we need the stored data
+    # up to the last candle.
     data = data_handler.ohlcv_load(
         pair,
         timeframe=timeframe,
-        timerange=None,
+        timerange=load_timerange,
         fill_missing=False,
         drop_incomplete=True,
         warn_no_data=False,
@@ -197,14 +299,15 @@ def _load_cached_data_for_updating(
         if prepend:
             end = data.iloc[0]["date"]
         else:
-            if start and start < data.iloc[0]["date"]:
+            data_start = date_range[0] if date_range else data.iloc[0]["date"]
+            if start and start < data_start:
                 # Earlier data than existing data requested, Update start date
                 logger.info(
                     f"{pair}, {timeframe}, {candle_type}: "
                     f"Requested start date {start:{DATETIME_PRINT_FORMAT}} earlier than local "
-                    f"data start date {data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}. "
+                    f"data start date {data_start:{DATETIME_PRINT_FORMAT}}. "
                     f"Use `--prepend` to download data prior "
-                    f"to {data.iloc[0]['date']:{DATETIME_PRINT_FORMAT}}, or "
+                    f"to {data_start:{DATETIME_PRINT_FORMAT}}, or "
                     "`--erase` to redownload all data."
                 )
             start = data.iloc[-1]["date"]
@@ -286,6 +389,10 @@ def _download_pair_history(
             until_ms=until_ms if until_ms else None,
         )
         logger.info(f"Downloaded data for {pair} with length {len(new_dataframe)}.")
+        if data_handler.supports_append and not prepend and not data.empty:
+            # Only the new candles are written - replacing stored candles with the same date.
+            data_handler.ohlcv_append(pair, timeframe, new_dataframe, candle_type=candle_type)
+            return True
         if data.empty:
             data = new_dataframe
         else:
@@ -469,10 +576,14 @@ def _download_trades_history(
         from_id=from_id,
     )
     new_trades_df = trades_list_to_df(new_trades[1])
+    stored = len(trades)
     trades = concat([trades, new_trades_df], axis=0)
     # Remove duplicates to make sure we're not storing data we don't need
     trades = trades_df_remove_duplicates(trades)
-    data_handler.trades_store(pair, trades, trading_mode)
+    if data_handler.supports_append and stored:
+        data_handler.trades_append(pair, trades.iloc[stored:], trading_mode)
+    else:
+        data_handler.trades_store(pair, trades, trading_mode)
 
     logger.debug(
         "New Start: %s",
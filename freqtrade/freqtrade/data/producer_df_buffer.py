@@ -0,0 +1,122 @@
+"""
+Analyzed dataframes received from producers (DataProvider.get_producer_df), stored so new
+candles are merged in place.
+"""
+
+from typing import Any
+
+import numpy as np
+from pandas import DataFrame, DatetimeTZDtype, array
+
+
+def _is_utc(dtype: Any) -> bool:
+    return isinstance(dtype, DatetimeTZDtype) and str(dtype.tz) == "UTC"
+
+
+class ProducerDataFrameBuffer:
+    """
+    Analyzed dataframe of one pair, stored column-wise in preallocated arrays.
+    Rows [start, end) of the arrays are valid. New candles are written in place - the arrays
+    are only reallocated when they are full, so merging candles only processes the new candles.
+    Dataframes returned by frame() are views on the arrays, and only valid until the next
+    append(). Not thread safe - DataProvider holds its producer lock around append() and
+    while copying frame().
+    """
+
+    def __init__(self, df: DataFrame, max_rows: int) -> None:
+        self.columns = list(df.columns)
+        self.dtypes = list(df.dtypes)
+        self.start = 0
+        self.end = 0
+        self._allocate(2 * max(len(df), max_rows, 1))
+        self._write(df, 0)
+        self.end = len(df)
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    @staticmethod
+    def supports(df: DataFrame) -> bool:
+        """Dataframe with a date column, unique column names and numpy or UTC datetime columns"""
+        return (
+            "date" in df.columns
+            and df.columns.is_unique
+            and all(isinstance(dtype, np.dtype) or _is_utc(dtype) for dtype in df.dtypes)
+        )
+
+    def compatible(self, df: DataFrame) -> bool:
+        """Same columns as the buffer, with dtypes that can be stored without losing data"""
+        if list(df.columns) != self.columns:
+            return False
+        for dtype, new in zip(self.dtypes, df.dtypes, strict=True):
+            if dtype == new:
+                continue
+            if not (isinstance(dtype, np.dtype) and isinstance(new, np.dtype)):
+                return False
+            if not np.can_cast(new, dtype, casting="safe"):
+                return False
+        return True
+
+    def _allocate(self, capacity: int) -> None:
+        """Move the valid rows to new arrays - returned dataframes keep the old arrays"""
+        count = len(self)
+        # Per column, the array written to and the array dataframes are created from.
+        # These differ for datetime columns, which are written as int64.
+        storage: list[np.ndarray] = []
+        columns: list[Any] = []
+        for dtype in self.dtypes:
+            if _is_utc(dtype):
+                dates = array(np.zeros(capacity, dtype=f"M8[{dtype.unit}]"), dtype=dtype)
+                storage.append(dates.asi8)
+                columns.append(dates)
+            else:
+                values = np.empty(capacity, dtype=dtype)
+                storage.append(values)
+                columns.append(values)
+        if count:
+            for new, old in zip(storage, self._storage, strict=True):
+                new[:count] = old[self.start : self.end]
+        self._storage = storage
+        self._columns = columns
+        self.start, self.end = 0, count
+        self._frame: DataFrame | None = None
+
+    def _write(self, df: DataFrame, position: int) -> None:
+        for col, dtype, values in zip(self.columns, self.dtypes, self._storage, strict=True):
+            column = df[col]
+            values[position : position + len(df)] = (
+                column.array.asi8 if _is_utc(dtype) else column.to_numpy()
+            )
+
+    def frame(self) -> DataFrame:
+        """
+        Dataframe on the valid rows - without copying the data.
+        The same object is returned until rows are appended.
+        """
+        if self._frame is None:
+            self._frame = DataFrame(
+                {
+                    col: values[self.start : self.end]
+                    for col, values in zip(self.columns, self._columns, strict=True)
+                },
+                copy=False,
+            )
+        return self._frame
+
+    def append(self, df: DataFrame, overlap: int, max_rows: int) -> bool:
+        """
+        Replace the last `overlap` rows by the first rows of df, and append the remaining rows.
+        Rows beyond max_rows are aged out.
+        :return: False if df isn't compatible with the buffer - nothing is changed then.
+        """
+        if not self.compatible(df):
+            return False
+        self.end -= min(overlap, len(self))
+        if self.end + len(df) > len(self._storage[0]):
+            self._allocate(2 * max(len(self) + len(df), max_rows))
+        self._write(df, self.end)
+        self.end += len(df)
+        if len(self) > max_rows:
+            self.start = self.end - max_rows
+        self._frame = None
+        return True
@@ -99,6 +99,7 @@ from freqtrade.exchange.exchange_utils_timeframe import (
     timeframe_to_seconds,
 )
 from freqtrade.exchange.exchange_ws import ExchangeWS
+from freqtrade.exchange.kline_cache import KlineCache
 from freqtrade.misc import (
     chunks,
     deep_merge_dicts,
@@ -213,7 +214,7 @@ class Exchange:
         self._entry_rate_cache: TTLCache = TTLCache(maxsize=100, ttl=300)
 
         # Holds candles
-        self._klines: dict[PairWithTimeframe, DataFrame] = {}
+        self._klines: KlineCache = KlineCache()
         self._expiring_candle_cache: dict[tuple[str, int], PeriodicCache] = {}
 
         # Holds public_trades
@@ -2560,8 +2561,14 @@ class Exchange:
             ticks, timeframe, pair=pair, fill_missing=True, drop_incomplete=drop_incomplete
         )
         if cache:
-            if (pair, timeframe, c_type) in self._klines:
-                old = self._klines[(pair, timeframe, c_type)]
+            key = (pair, timeframe, c_type)
+            if key in self._klines:
+                candle_limit = self.ohlcv_candle_limit(timeframe, self._config["candle_type_def"])
+                max_candles = candle_limit + self._startup_candle_count
+                # Usually only new candles - merged in place, aging out old candles
+                if self._klines.append(key, ohlcv_df, timeframe, max_candles):
+                    return self._klines[key]
+                old = self._klines[key]
                 # Reassign so we return the updated, combined df
                 ohlcv_df = clean_ohlcv_dataframe(
                     concat([old, ohlcv_df], axis=0),
@@ -2570,13 +2577,12 @@ class Exchange:
                     fill_missing=True,
                     drop_incomplete=False,
                 )
-                candle_limit = self.ohlcv_candle_limit(timeframe, self._config["candle_type_def"])
                 # Age out old candles
-                ohlcv_df = ohlcv_df.tail(candle_limit + self._startup_candle_count)
+                ohlcv_df = ohlcv_df.tail(max_candles)
                 ohlcv_df = ohlcv_df.reset_index(drop=True)
-                self._klines[(pair, timeframe, c_type)] = ohlcv_df
+                self._klines[key] = ohlcv_df
             else:
-                self._klines[(pair, timeframe, c_type)] = ohlcv_df
+                self._klines[key] = ohlcv_df
         return ohlcv_df
 
     def refresh_latest_ohlcv(
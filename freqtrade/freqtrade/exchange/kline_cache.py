@@ -0,0 +1,190 @@
+"""
+In-memory candle (OHLCV) cache of the exchange class (Exchange._klines).
+"""
+
+from collections.abc import Iterator, MutableMapping
+
+import numpy as np
+from pandas import DataFrame, DatetimeTZDtype, array
+
+from freqtrade.constants import DEFAULT_DATAFRAME_COLUMNS, PairWithTimeframe
+from freqtrade.exchange.exchange_utils_timeframe import timeframe_to_msecs
+
+
+_VALUE_COLUMNS = DEFAULT_DATAFRAME_COLUMNS[1:]
+_DATE_DTYPE = DatetimeTZDtype(tz="UTC")
+
+
+class KlineBuffer:
+    """
+    Candles of one pair, timeframe and candle type, stored column-wise in preallocated arrays.
+    Rows [start, end) of the arrays are valid, candles are spaced exactly one timeframe apart.
+    New candles are written in place - the arrays are only reallocated when they are full,
+    or when candles visible through the returned dataframe change.
+    """
+
+    def __init__(self, df: DataFrame, max_candles: int) -> None:
+        self.start = 0
+        self.end = 0
+        self._allocate(2 * max(len(df), max_candles, 1))
+        self._write(df, 0)
+        self.end = len(df)
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    @staticmethod
+    def supports(df: DataFrame, timeframe_ms: int) -> bool:
+        """Dataframe with the default ohlcv columns, and no gaps in the candles"""
+        if list(df.columns) != DEFAULT_DATAFRAME_COLUMNS or df["date"].dtype != _DATE_DTYPE:
+            return False
+        if any(df[col].dtype != np.float64 for col in _VALUE_COLUMNS):
+            return False
+        return bool((np.diff(df["date"].array.asi8) == timeframe_ms * 1_000_000).all())
+
+    def _allocate(self, capacity: int) -> None:
+        """Move the valid candles to new arrays - returned dataframes keep the old arrays"""
+        count = len(self)
+        dates = array(np.zeros(capacity, dtype="M8[ns]"), dtype=_DATE_DTYPE)
+        # int64 view on the dates - used for comparisons and writing.
+        dates_i8 = dates.asi8
+        values = {col: np.zeros(capacity, dtype=np.float64) for col in _VALUE_COLUMNS}
+        if count:
+            dates_i8[:count] = self.dates_i8[self.start : self.end]
+            for col in _VALUE_COLUMNS:
+                values[col][:count] = self.values[col][self.start : self.end]
+        self.dates = dates
+        self.dates_i8 = dates_i8
+        self.values = values
+        self.start, self.end = 0, count
+        self._frame: DataFrame | None = None
+        # Set once views on these arrays were handed out - they must not be changed anymore.
+        self._shared = False
+
+    def _write(self, df: DataFrame, position: int) -> None:
+        self.dates_i8[position : position + len(df)] = df["date"].array.asi8
+        for col in _VALUE_COLUMNS:
+            self.values[col][position : position + len(df)] = df[col].to_numpy()
+
+    def frame(self) -> DataFrame:
+        """
+        Dataframe on the candles - without copying the data.
+        Values are read-only, and the same object is returned until the candles change.
+        """
+        if self._frame is None:
+            columns = {}
+            for col in _VALUE_COLUMNS:
+                view = self.values[col][self.start : self.end]
+                view.flags.writeable = False
+                columns[col] = view
+            self._frame = DataFrame(
+                {"date": self.dates[self.start : self.end], **columns}, copy=False
+            )
+            self._shared = True
+        return self._frame
+
+    def append(self, df: DataFrame, timeframe_ms: int, max_candles: int) -> bool:
+        """
+        Merge new candles into the buffer. Equivalent to concatenating both dataframes
+        and running clean_ohlcv_dataframe() on the result, followed by .tail(max_candles).
+        :param df: New candles - without gaps, as returned by ohlcv_to_dataframe()
+        :return: False if the candles can't be merged in place (candles before the
+            first cached candle or a gap to the cached candles)
+        """
+        timeframe_ns = timeframe_ms * 1_000_000
+        dates = df["date"].array.asi8
+        if len(dates):
+            if not len(self):
+                return False
+            offset, remainder = divmod(int(dates[0] - self.dates_i8[self.start]), timeframe_ns)
+            if remainder or offset < 0 or offset > len(self):
+                return False
+            overlap = min(len(self) - offset, len(dates))
+            if overlap:
+                self._merge(df.iloc[:overlap], offset)
+            added = len(dates) - overlap
+            if added:
+                if self.end + added > len(self.dates_i8):
+                    self._allocate(2 * max(len(self) + added, max_candles))
+                self._write(df.iloc[overlap:], self.end)
+                self.end += added
+                self._frame = None
+
+        if len(self) > max_candles:
+            # Age out old candles
+            self.start = self.end - max_candles
+            self._frame = None
+        return True
+
+    def _merge(self, df: DataFrame, offset: int) -> None:
+        """Combine candles already in the buffer with new versions of these candles"""
+        rows = slice(self.start + offset, self.start + offset + len(df))
+        old = {col: self.values[col][rows] for col in _VALUE_COLUMNS}
+        new = {col: df[col].to_numpy() for col in _VALUE_COLUMNS}
+        # Same aggregation as clean_ohlcv_dataframe - missing values are skipped
+        merged = {
+            "open": np.where(np.isnan(old["open"]), new["open"], old["open"]),
+            "high": np.fmax(old["high"], new["high"]),
+            "low": np.fmin(old["low"], new["low"]),
+            "close": np.where(np.isnan(new["close"]), old["close"], new["close"]),
+            "volume": np.fmax(old["volume"], new["volume"]),
+        }
+        if all(np.array_equal(old[col], merged[col], equal_nan=True) for col in _VALUE_COLUMNS):
+            # Usually only the last candle changes, if at all.
+            return
+        if self._shared:
+            # Don't change candles of dataframes handed out before.
+            self._allocate(len(self.dates_i8))
+            rows = slice(self.start + offset, self.start + offset + len(df))
+        for col in _VALUE_COLUMNS:
+            self.values[col][rows] = merged[col]
+        self._frame = None
+
+
+class KlineCache(MutableMapping[PairWithTimeframe, DataFrame]):
+    """
+    Candles per (pair, timeframe, candle_type).
+    Candles refreshed via append() are kept in a KlineBuffer, so a refresh only processes
+    the new candles. Dataframes assigned directly are stored as they are.
+    """
+
+    def __init__(self) -> None:
+        self._data: dict[PairWithTimeframe, DataFrame | KlineBuffer] = {}
+
+    def __getitem__(self, key: PairWithTimeframe) -> DataFrame:
+        entry = self._data[key]
+        return entry.frame() if isinstance(entry, KlineBuffer) else entry
+
+    def __setitem__(self, key: PairWithTimeframe, value: DataFrame) -> None:
+        self._data[key] = value
+
+    def __delitem__(self, key: PairWithTimeframe) -> None:
+        del self._data[key]
+
+    def __iter__(self) -> Iterator[PairWithTimeframe]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def append(
+        self, key: PairWithTimeframe, df: DataFrame, timeframe: str, max_candles: int
+    ) -> bool:
+        """
+        Merge new candles into the cached candles of this key, aging out candles beyond
+        max_candles.
+        :return: False if the candles can't be merged in place.
+            The caller is then expected to combine the dataframes and assign the result.
+        """
+        timeframe_ms = timeframe_to_msecs(timeframe)
+        if not KlineBuffer.supports(df, timeframe_ms):
+            return False
+        entry = self._data[key]
+        if not isinstance(entry, KlineBuffer):
+            if not KlineBuffer.supports(entry, timeframe_ms):
+                return False
+            entry = KlineBuffer(entry, max_candles)
+        if not entry.append(df, timeframe_ms, max_candles):
+            return False
+        self._data[key] = entry
+        return True
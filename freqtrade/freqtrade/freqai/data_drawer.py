@@ -5,6 +5,7 @@ import re
 import shutil
 import threading
 import warnings
+from collections.abc import Mapping
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, TypedDict
@@ -23,6 +24,7 @@ from freqtrade.data.history import load_pair_history
 from freqtrade.enums import CandleType
 from freqtrade.exceptions import OperationalException
 from freqtrade.freqai.data_kitchen import FreqaiDataKitchen
+from freqtrade.freqai.historic_predictions import HistoricPredictions
 from freqtrade.strategy.interface import IStrategy
 
 
@@ -78,8 +80,10 @@ class FreqaiDataDrawer:
         self.meta_data_dictionary: dict[str, dict[str, Any]] = {}
         self.model_return_values: dict[str, DataFrame] = {}
         self.historic_data: dict[str, dict[str, DataFrame]] = {}
-        self.historic_predictions: dict[str, DataFrame] = {}
+        self.historic_predictions = HistoricPredictions()
         self.full_path = full_path
+        self.historic_predictions_dir = Path(self.full_path / "historic_predictions")
+        # Single pickle file of earlier versions - only loaded.
         self.historic_predictions_path = Path(self.full_path / "historic_predictions.pkl")
         self.historic_predictions_bkp_path = Path(
             self.full_path / "historic_predictions.backup.pkl"
@@ -105,6 +109,16 @@ class FreqaiDataDrawer:
         }
         self.model_type = self.freqai_info.get("model_save_type", "joblib")
 
+    @property
+    def historic_predictions(self) -> HistoricPredictions:
+        return self._historic_predictions
+
+    @historic_predictions.setter
+    def historic_predictions(self, value: Mapping[str, DataFrame]) -> None:
+        if not isinstance(value, HistoricPredictions):
+            value = HistoricPredictions(value)
+        self._historic_predictions = value
+
     def update_metric_tracker(self, metric: str, value: float, pair: str) -> None:
         """
         General utility for adding and updating custom metrics. Typically used
@@ -174,16 +188,13 @@ class FreqaiDataDrawer:
         Locate and load a previously saved historic predictions.
         :return: bool - whether or not the drawer was located
         """
-        exists = self.historic_predictions_path.is_file()
-        if exists:
+        exists = self.historic_predictions_dir.is_dir() or self.historic_predictions_path.is_file()
+        if self.historic_predictions_dir.is_dir():
+            self.historic_predictions = HistoricPredictions.load(self.historic_predictions_dir)
+        elif exists:
             try:
                 with self.historic_predictions_path.open("rb") as fp:
                     self.historic_predictions = cloudpickle.load(fp)
-                logger.info(
-                    f"Found existing historic predictions at {self.full_path}, but beware "
-                    "that statistics may be inaccurate if the bot has been offline for "
-                    "an extended period of time."
-                )
             except EOFError:
                 logger.warning(
                     "Historical prediction file was corrupted. Trying to load backup file."
@@ -192,6 +203,12 @@ class FreqaiDataDrawer:
                     self.historic_predictions = cloudpickle.load(fp)
                 logger.warning("FreqAI successfully loaded the backup historical predictions file.")
 
+        if exists:
+            logger.info(
+                f"Found existing historic predictions at {self.full_path}, but beware "
+                "that statistics may be inaccurate if the bot has been offline for "
+                "an extended period of time."
+            )
         else:
             logger.info("Could not find existing historic_predictions, starting from scratch")
 
@@ -199,13 +216,11 @@ class FreqaiDataDrawer:
 
     def save_historic_predictions_to_disk(self):
         """
-        Save historic predictions pickle to disk
+        Save historic predictions to disk - only predictions added since the last save are
+        written.
         """
-        with self.historic_predictions_path.open("wb") as fp:
-            cloudpickle.dump(self.historic_predictions, fp, protocol=cloudpickle.DEFAULT_PROTOCOL)
-
-        # create a backup
-        shutil.copy(self.historic_predictions_path, self.historic_predictions_bkp_path)
+        with self.save_lock:
+            self.historic_predictions.save(self.historic_predictions_dir)
 
     def save_metric_tracker_to_disk(self):
         """
@@ -347,54 +362,35 @@ class FreqaiDataDrawer:
         """
 
         len_df = len(strat_df)
-        index = self.historic_predictions[pair].index[-1:]
-        columns = self.historic_predictions[pair].columns
-
-        zeros_df = pd.DataFrame(np.zeros((1, len(columns))), index=index, columns=columns)
-        self.historic_predictions[pair] = pd.concat(
-            [self.historic_predictions[pair], zeros_df], ignore_index=True, axis=0
-        )
-        df = self.historic_predictions[pair]
+        hist_preds = self.historic_predictions[pair]
+        row: dict[str, Any] = dict.fromkeys(hist_preds.columns, 0)
 
         # model outputs and associated statistics
         for label in predictions.columns:
-            label_loc = df.columns.get_loc(label)
-            pred_label_loc = predictions.columns.get_loc(label)
-            df.iloc[-1, label_loc] = predictions.iloc[-1, pred_label_loc]
-            if df[label].dtype == object:
+            row[label] = predictions[label].iloc[-1]
+            if hist_preds[label].dtype == object:
                 continue
-            label_mean_loc = df.columns.get_loc(f"{label}_mean")
-            label_std_loc = df.columns.get_loc(f"{label}_std")
-            df.iloc[-1, label_mean_loc] = dk.data["labels_mean"][label]
-            df.iloc[-1, label_std_loc] = dk.data["labels_std"][label]
+            row[f"{label}_mean"] = dk.data["labels_mean"][label]
+            row[f"{label}_std"] = dk.data["labels_std"][label]
 
         # outlier indicators
-        do_predict_loc = df.columns.get_loc("do_predict")
-        df.iloc[-1, do_predict_loc] = do_preds[-1]
+        row["do_predict"] = do_preds[-1]
         if self.freqai_info["feature_parameters"].get("DI_threshold", 0) > 0:
-            DI_values_loc = df.columns.get_loc("DI_values")
-            df.iloc[-1, DI_values_loc] = dk.DI_values[-1]
+            row["DI_values"] = dk.DI_values[-1]
 
         # extra values the user added within custom prediction model
         if dk.data["extra_returns_per_train"]:
             rets = dk.data["extra_returns_per_train"]
             for return_str in rets:
-                return_loc = df.columns.get_loc(return_str)
-                df.iloc[-1, return_loc] = rets[return_str]
-
-        high_price_loc = df.columns.get_loc("high_price")
-        high_loc = strat_df.columns.get_loc("high")
-        df.iloc[-1, high_price_loc] = strat_df.iloc[-1, high_loc]
-        low_price_loc = df.columns.get_loc("low_price")
-        low_loc = strat_df.columns.get_loc("low")
-        df.iloc[-1, low_price_loc] = strat_df.iloc[-1, low_loc]
-        close_price_loc = df.columns.get_loc("close_price")
-        close_loc = strat_df.columns.get_loc("close")
-        df.iloc[-1, close_price_loc] = strat_df.iloc[-1, close_loc]
-        date_pred_loc = df.columns.get_loc("date_pred")
-        date_loc = strat_df.columns.get_loc("date")
-        df.iloc[-1, date_pred_loc] = strat_df.iloc[-1, date_loc]
+                row[return_str] = rets[return_str]
+
+        row["high_price"] = strat_df["high"].iloc[-1]
+        row["low_price"] = strat_df["low"].iloc[-1]
+        row["close_price"] = strat_df["close"].iloc[-1]
+        row["date_pred"] = strat_df["date"].iloc[-1]
 
+        self.historic_predictions.append(pair, row)
+        df = self.historic_predictions[pair]
         self.model_return_values[pair] = df.tail(len_df).reset_index(drop=True)
 
     def attach_return_values_to_return_dataframe(
@@ -741,14 +737,12 @@ class FreqaiDataDrawer:
         Returns timerange information based on historic predictions file
         :return: timerange calculated from saved live data
         """
-        if not self.historic_predictions_path.is_file():
+        if not self.load_historic_predictions_from_disk():
             raise OperationalException(
                 "Historic predictions not found. Historic predictions data is required "
                 "to run backtest with the freqai-backtest-live-models option "
             )
 
-        self.load_historic_predictions_from_disk()
-
         all_pairs_end_dates = []
         for pair in self.historic_predictions:
             pair_historic_data = self.historic_predictions[pair]
@@ -0,0 +1,175 @@
+"""
+Historic predictions of FreqAI (FreqaiDataDrawer.historic_predictions), in memory and on disk.
+"""
+
+import logging
+from collections.abc import Iterator, Mapping, MutableMapping
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+from joblib.externals import cloudpickle
+from pandas import DataFrame
+from pyarrow import ipc
+
+from freqtrade.misc import pair_to_filename
+
+
+logger = logging.getLogger(__name__)
+
+_PAIR_KEY = b"ft_pair"
+
+
+class PredictionBuffer:
+    """
+    Historic predictions of one pair, stored in a dataframe with spare rows.
+    Rows [0, len) are valid. The spare rows grow geometrically, so appending a row is
+    amortised O(1) - dataframes returned before keep their rows.
+    """
+
+    def __init__(self, df: DataFrame) -> None:
+        self._df = df.reset_index(drop=True)
+        self._len = len(df)
+        self._frame: DataFrame | None = None
+
+    def __len__(self) -> int:
+        return self._len
+
+    def append(self, row: dict[str, Any]) -> None:
+        if self._len == len(self._df):
+            # Spare rows are all-NaN until written
+            self._df = self._df.reindex(range(max(2 * self._len, 16)))
+        for col, value in row.items():
+            self._df.iat[self._len, self._df.columns.get_loc(col)] = value
+        self._len += 1
+        self._frame = None
+
+    def frame(self) -> DataFrame:
+        """Dataframe on the valid rows - the same object is returned until rows are appended"""
+        if self._frame is None:
+            self._frame = self._df.iloc[: self._len]
+        return self._frame
+
+
+class HistoricPredictions(MutableMapping[str, DataFrame]):
+    """
+    Historic predictions per pair.
+    Predictions extended via append() are kept in a PredictionBuffer, dataframes assigned
+    directly are stored as they are.
+
+    On disk, every pair is stored as an Arrow IPC file, followed by segment files holding
+    the rows appended since. Saving only writes the new rows, and compacts the segments into
+    the main file once there are max_segments of them.
+    """
+
+    max_segments = 20
+
+    def __init__(self, data: Mapping[str, DataFrame] | None = None) -> None:
+        self._data: dict[str, DataFrame | PredictionBuffer] = dict(data or {})
+        # Rows per pair which are stored on disk - pairs missing need to be stored in full.
+        self._saved: dict[str, int] = {}
+
+    def __getitem__(self, pair: str) -> DataFrame:
+        entry = self._data[pair]
+        return entry.frame() if isinstance(entry, PredictionBuffer) else entry
+
+    def __setitem__(self, pair: str, value: DataFrame) -> None:
+        self._data[pair] = value
+        self._saved.pop(pair, None)
+
+    def __delitem__(self, pair: str) -> None:
+        del self._data[pair]
+        self._saved.pop(pair, None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def append(self, pair: str, row: dict[str, Any]) -> None:
+        """
+        Append one row of predictions to the predictions of this pair.
+        :param row: Value per column - columns not in the predictions raise a KeyError
+        """
+        entry = self._data[pair]
+        if not isinstance(entry, PredictionBuffer):
+            entry = PredictionBuffer(entry)
+            self._data[pair] = entry
+        entry.append(row)
+
+    @staticmethod
+    def _segment_files(filename: Path) -> list[Path]:
+        files = filename.parent.glob(f"{filename.name}.*[0-9]")
+        return sorted(files, key=lambda f: int(f.suffix[1:]))
+
+    @staticmethod
+    def _write_table(filename: Path, table: pa.Table) -> None:
+        # Write to a temporary file first, so an interrupted save never leaves a partial file
+        tmp_file = filename.with_name(f"{filename.name}.tmp")
+        with ipc.new_file(tmp_file, table.schema) as writer:
+            writer.write_table(table)
+        tmp_file.replace(filename)
+
+    def _store_pair(self, pair: str, filename: Path) -> None:
+        df = self[pair]
+        segments = self._segment_files(filename)
+        saved = self._saved.get(pair)
+        if saved is None or saved > len(df) or len(segments) >= self.max_segments:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            metadata = {**(table.schema.metadata or {}), _PAIR_KEY: pair.encode()}
+            self._write_table(filename, table.replace_schema_metadata(metadata))
+            for segment in segments:
+                segment.unlink()
+            filename.with_suffix(".pkl").unlink(missing_ok=True)
+        elif len(df) > saved:
+            segment = filename.with_name(f"{filename.name}.{len(segments) + 1:05d}")
+            self._write_table(segment, pa.Table.from_pandas(df.iloc[saved:], preserve_index=False))
+        self._saved[pair] = len(df)
+
+    def save(self, directory: Path) -> None:
+        """
+        Store the predictions in directory - writing only rows appended since the last save.
+        Files of pairs no longer present are removed.
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        names = set()
+        for pair in self._data:
+            filename = directory / f"{pair_to_filename(pair)}.arrow"
+            names.add(filename.stem)
+            try:
+                self._store_pair(pair, filename)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+                # Columns Arrow can't represent - pickle this pair in full.
+                logger.debug(f"Pickling historic predictions for {pair}: {e}")
+                with filename.with_suffix(".pkl").open("wb") as fp:
+                    cloudpickle.dump((pair, self[pair]), fp, protocol=cloudpickle.DEFAULT_PROTOCOL)
+                for file in [filename, *self._segment_files(filename)]:
+                    file.unlink(missing_ok=True)
+                self._saved.pop(pair, None)
+
+        for file in directory.iterdir():
+            if file.name.split(".")[0] not in names:
+                file.unlink()
+
+    @classmethod
+    def load(cls, directory: Path) -> "HistoricPredictions":
+        """
+        Load predictions stored by save().
+        """
+        predictions = cls()
+        for filename in sorted(directory.glob("*.arrow")):
+            table = ipc.open_file(pa.memory_map(str(filename))).read_all()
+            pair = table.schema.metadata[_PAIR_KEY].decode()
+            frames = [table.to_pandas()]
+            for segment in cls._segment_files(filename):
+                frames.append(ipc.open_file(pa.memory_map(str(segment))).read_all().to_pandas())
+            df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+            predictions._data[pair] = df
+            predictions._saved[pair] = len(df)
+        for filename in sorted(directory.glob("*.pkl")):
+            with filename.open("rb") as fp:
+                pair, df = cloudpickle.load(fp)
+            predictions._data[pair] = df
+        return predictions
@@ -185,11 +185,16 @@ class FreqtradeBot(LoggingMixin):
         self.protections = ProtectionManager(self.config, self.strategy.protections)
 
         def log_took_too_long(duration: float, time_limit: float):
+            slowest = sorted(
+                self.strategy.analysis_durations.items(), key=lambda x: x[1], reverse=True
+            )[:5]
             logger.warning(
                 f"Strategy analysis took {duration:.2f}s, more than 25% of the timeframe "
                 f"({time_limit:.2f}s). This can lead to delayed orders and missed signals."
-                "Consider either reducing the amount of work your strategy performs "
-                "or reduce the amount of pairs in the Pairlist."
+                "Consider either reducing the amount of work your strategy performs, "
+                "reduce the amount of pairs in the Pairlist "
+                "or analyze pairs concurrently (`internals.analyze_workers`). "
+                f"Slowest pairs: {', '.join(f'{p} ({d:.2f}s)' for p, d in slowest)}"
             )
 
         self._measure_execution = MeasureTime(log_took_too_long, timeframe_secs * 0.25)
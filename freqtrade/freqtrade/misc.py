@@ -18,6 +18,9 @@ from freqtrade.enums import SignalTagType, SignalType
 
 logger = logging.getLogger(__name__)
 
+# Schema metadata key used to transfer non-columnar information alongside arrow data
+ARROW_METADATA_KEY = b"freqtrade"
+
 
 def dump_json_to_file(file_obj: TextIO, data: Any) -> None:
     """
@@ -204,6 +207,48 @@ def json_to_dataframe(data: str) -> pd.DataFrame:
     return dataframe
 
 
+def dataframe_to_arrow_ipc(
+    dataframe: pd.DataFrame, metadata: dict[str, Any] | None = None
+) -> bytes:
+    """
+    Serialize a DataFrame into an Arrow IPC stream.
+    Columns are transferred in their binary representation - without per-cell conversion.
+    :param dataframe: A pandas DataFrame
+    :param metadata: Optional json-serializable dict, stored in the schema metadata
+    :returns: Arrow IPC stream as bytes
+    """
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(dataframe, preserve_index=False)
+    if metadata is not None:
+        table = table.replace_schema_metadata(
+            {
+                **(table.schema.metadata or {}),
+                ARROW_METADATA_KEY: rapidjson.dumps(
+                    metadata, default=str, number_mode=rapidjson.NM_NATIVE | rapidjson.NM_NAN
+                ),
+            }
+        )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def arrow_ipc_to_dataframe(data: bytes) -> tuple[pd.DataFrame, dict[str, Any]]:
+    """
+    Deserialize an Arrow IPC stream created by dataframe_to_arrow_ipc
+    :param data: Arrow IPC stream as bytes
+    :returns: Tuple of (DataFrame, metadata dict)
+    """
+    import pyarrow as pa
+
+    table = pa.ipc.open_stream(data).read_all()
+    raw_meta = (table.schema.metadata or {}).get(ARROW_METADATA_KEY)
+    metadata = rapidjson.loads(raw_meta) if raw_meta else {}
+    return table.to_pandas(), metadata
+
+
 def remove_entry_exit_signals(dataframe: pd.DataFrame):
     """
     Remove Entry and Exit signals from a DataFrame
@@ -0,0 +1,86 @@
+"""
+Columnar (numpy backed) candle storage for the backtesting loop.
+
+Used instead of lists of row-lists when ``backtest_engine`` is set to ``arrays``.
+Rows are handed to the backtesting loop as tuples of the same values as the list rows,
+but only built for a window of candles at a time.
+"""
+
+from collections.abc import Iterator, Sequence
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+
+# Must be aligned with HEADERS in freqtrade.optimize.backtesting
+_DATE = 0
+_PRICE_COLUMNS = ("open", "high", "low", "close")
+_SIGNAL_COLUMNS = ("enter_long", "exit_long", "enter_short", "exit_short")
+_TAG_COLUMNS = ("enter_tag", "exit_tag")
+ROW_LENGTH = 1 + len(_PRICE_COLUMNS) + len(_SIGNAL_COLUMNS) + len(_TAG_COLUMNS)
+_FIRST_TAG = ROW_LENGTH - len(_TAG_COLUMNS)
+# Rows built at once - the backtesting loop reads the candles of a pair in order.
+_CHUNK_SIZE = 1024
+
+
+class PairColumns(Sequence):
+    """
+    Candles of one pair as typed columns:
+    int64 epoch dates (ns), float64 OHLC, int8 signals and interned tags.
+    Rows are returned as tuples of plain values, built for one chunk of candles at a time.
+    """
+
+    def __init__(self, df: DataFrame):
+        self.dates = df["date"].to_numpy(dtype="datetime64[ns]").view(np.int64)
+        columns: list[np.ndarray] = [self.dates]
+        columns += [df[col].to_numpy(dtype=np.float64) for col in _PRICE_COLUMNS]
+        columns += [
+            df[col].fillna(0).to_numpy(dtype=np.float64).astype(np.int8) for col in _SIGNAL_COLUMNS
+        ]
+        # Tags are stored as codes into a per-column list of unique values (-1 -> None)
+        self.tags: list[list[str | None]] = []
+        for col in _TAG_COLUMNS:
+            codes, uniques = pd.factorize(df[col], use_na_sentinel=True)
+            columns.append(codes.astype(np.int32))
+            self.tags.append([*uniques.tolist(), None])
+        self._columns = columns
+        self._chunk_start = -1
+        self._chunk: list[tuple] = []
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def _build_chunk(self, start: int) -> None:
+        """Build the rows of one chunk - columns are converted at once, dates only once"""
+        end = min(start + _CHUNK_SIZE, len(self))
+        dates = pd.DatetimeIndex(self.dates[start:end].view("datetime64[ns]")).tz_localize("UTC")
+        values: list[list] = [dates.astype(object).tolist()]
+        values += [col[start:end].tolist() for col in self._columns[1:_FIRST_TAG]]
+        for tags, codes in zip(self.tags, self._columns[_FIRST_TAG:], strict=True):
+            # code -1 maps to the trailing None
+            values.append([tags[code] for code in codes[start:end].tolist()])
+        self._chunk = list(zip(*values, strict=True))
+        self._chunk_start = start
+
+    def __getitem__(self, idx):
+        # Fast path - the row is in the current chunk (negative offsets are never valid)
+        if isinstance(idx, int) and 0 <= (offset := idx - self._chunk_start) < len(self._chunk):
+            return self._chunk[offset]
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        length = len(self.dates)
+        if idx < 0:
+            idx += length
+        if not 0 <= idx < length:
+            raise IndexError("PairColumns index out of range")
+        self._build_chunk(idx - idx % _CHUNK_SIZE)
+        return self._chunk[idx - self._chunk_start]
+
+    def __iter__(self) -> Iterator[tuple]:
+        for idx in range(len(self)):
+            yield self[idx]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(col.nbytes for col in self._columns)
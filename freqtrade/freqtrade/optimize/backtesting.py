@@ -8,9 +8,11 @@ import logging
 from collections import defaultdict
 from copy import deepcopy
 from datetime import datetime, timedelta
+from pathlib import Path
 
+import numpy as np
 from numpy import isnan, nan
-from pandas import DataFrame, Series
+from pandas import DataFrame, Series, to_datetime
 
 from freqtrade import constants
 from freqtrade.configuration import TimeRange, validate_config_consistency
@@ -49,6 +51,7 @@ from freqtrade.ft_types import (
 from freqtrade.leverage.liquidation_price import update_liquidation_prices
 from freqtrade.mixins import LoggingMixin
 from freqtrade.optimize.backtest_caching import get_strategy_run_id
+from freqtrade.optimize.backtest_columns import PairColumns
 from freqtrade.optimize.bt_progress import BTProgress
 from freqtrade.optimize.optimize_reports import (
     generate_backtest_stats,
@@ -142,6 +145,13 @@ class Backtesting:
         self.exchange = exchange
 
         self.dataprovider = DataProvider(self.config, self.exchange)
+        # Threads loading pairs concurrently
+        self.data_load_workers: int = self.config.get("internals", {}).get("data_load_workers", 4)
+        self.ohlcv_cache_dir: Path | None = (
+            self.config["user_data_dir"] / "cache" / "ohlcv"
+            if self.config.get("ohlcv_cache", False)
+            else None
+        )
 
         if self.config.get("strategy_list"):
             if self.config.get("freqai", {}).get("enabled", False):
@@ -255,7 +265,10 @@ class Backtesting:
 
         else:
             self.timeframe_detail_td = timedelta(seconds=0)
+        self.backtest_engine: str = self.config.get("backtest_engine", "lists")
         self.detail_data: dict[str, DataFrame] = {}
+        # pair -> (detail dataframe, dates as epoch ns, OHLC array) - see get_detail_data
+        self._detail_index: dict[str, tuple[DataFrame, np.ndarray, np.ndarray]] = {}
         self.futures_data: dict[str, DataFrame] = {}
 
     def init_backtest(self):
@@ -303,6 +316,8 @@ class Backtesting:
             fail_without_data=True,
             data_format=self.config["dataformat_ohlcv"],
             candle_type=self.config.get("candle_type_def", CandleType.SPOT),
+            workers=self.data_load_workers,
+            ohlcv_cache_dir=self.ohlcv_cache_dir,
         )
 
         min_date, max_date = history.get_timerange(data)
@@ -341,6 +356,8 @@ class Backtesting:
                 fail_without_data=True,
                 data_format=self.config["dataformat_ohlcv"],
                 candle_type=self.config.get("candle_type_def", CandleType.SPOT),
+                workers=self.data_load_workers,
+                ohlcv_cache_dir=self.ohlcv_cache_dir,
             )
         else:
             self.detail_data = {}
@@ -359,6 +376,8 @@ class Backtesting:
                 fail_without_data=True,
                 data_format=self.config["dataformat_ohlcv"],
                 candle_type=CandleType.FUNDING_RATE,
+                workers=self.data_load_workers,
+                ohlcv_cache_dir=self.ohlcv_cache_dir,
             )
 
             # For simplicity, assign to CandleType.Mark (might contain index candles!)
@@ -371,6 +390,8 @@ class Backtesting:
                 fail_without_data=True,
                 data_format=self.config["dataformat_ohlcv"],
                 candle_type=CandleType.from_string(self.exchange.get_option("mark_ohlcv_price")),
+                workers=self.data_load_workers,
+                ohlcv_cache_dir=self.ohlcv_cache_dir,
             )
             # Combine data to avoid combining the data per trade.
             unavailable_pairs = []
@@ -494,9 +515,15 @@ class Backtesting:
 
             df_analyzed = df_analyzed.drop(df_analyzed.head(1).index)
 
-            # Convert from Pandas to list for performance reasons
-            # (Looping Pandas is slow.)
-            data[pair] = df_analyzed[HEADERS].values.tolist() if not df_analyzed.empty else []
+            if df_analyzed.empty:
+                data[pair] = []
+            elif self.backtest_engine == "arrays":
+                # Typed columns - rows are handed to the loop as lightweight views.
+                data[pair] = PairColumns(df_analyzed[HEADERS])
+            else:
+                # Convert from Pandas to list for performance reasons
+                # (Looping Pandas is slow.)
+                data[pair] = df_analyzed[HEADERS].values.tolist()
         return data
 
     def _get_close_rate(
@@ -1481,26 +1508,50 @@ class Backtesting:
             return exiting_dir
         return None
 
-    def get_detail_data(self, pair: str, row: tuple) -> list[tuple] | None:
+    def _get_detail_index(self, pair: str) -> tuple[np.ndarray, np.ndarray]:
         """
-        Spread into detail data
+        Detail data of a pair as sorted epoch-ns dates and a float64 OHLC array.
+        Built once per pair (rebuilt only if the detail dataframe is replaced).
         """
-        current_detail_time: datetime = row[DATE_IDX].to_pydatetime()
-        exit_candle_end = current_detail_time + self.timeframe_td
         detail_data = self.detail_data[pair]
-        detail_data = detail_data.loc[
-            (detail_data["date"] >= current_detail_time) & (detail_data["date"] < exit_candle_end)
-        ].copy()
+        cached = self._detail_index.get(pair)
+        if cached is None or cached[0] is not detail_data:
+            dates_ns = detail_data["date"].to_numpy(dtype="datetime64[ns]").view(np.int64)
+            ohlc = detail_data[HEADERS[1:5]].to_numpy(dtype=np.float64)
+            if len(dates_ns) > 1 and not (np.diff(dates_ns) >= 0).all():
+                # Ensure sorted dates for searchsorted
+                order = np.argsort(dates_ns, kind="stable")
+                dates_ns = dates_ns[order]
+                ohlc = ohlc[order]
+            cached = (detail_data, dates_ns, ohlc)
+            self._detail_index[pair] = cached
+        return cached[1], cached[2]
+
+    def get_detail_data(self, pair: str, row: tuple) -> list[list] | None:
+        """
+        Spread into detail data
+        """
+        dates_ns, ohlc = self._get_detail_index(pair)
+        current_detail_time = row[DATE_IDX].value
+        exit_candle_end = current_detail_time + int(self.timeframe_td.total_seconds() * 1e9)
+        start, end = np.searchsorted(dates_ns, [current_detail_time, exit_candle_end])
 
-        if len(detail_data) == 0:
+        if start == end:
             return None
-        detail_data.loc[:, "enter_long"] = row[LONG_IDX]
-        detail_data.loc[:, "exit_long"] = row[ELONG_IDX]
-        detail_data.loc[:, "enter_short"] = row[SHORT_IDX]
-        detail_data.loc[:, "exit_short"] = row[ESHORT_IDX]
-        detail_data.loc[:, "enter_tag"] = row[ENTER_TAG_IDX]
-        detail_data.loc[:, "exit_tag"] = row[EXIT_TAG_IDX]
-        return detail_data[HEADERS].values.tolist()
+        signals = [
+            row[LONG_IDX],
+            row[ELONG_IDX],
+            row[SHORT_IDX],
+            row[ESHORT_IDX],
+            row[ENTER_TAG_IDX],
+            row[EXIT_TAG_IDX],
+        ]
+        # Rows are only built for the candles of this slice
+        dates = to_datetime(dates_ns[start:end], utc=True)
+        return [
+            [date, *values, *signals]
+            for date, values in zip(dates, ohlc[start:end].tolist(), strict=True)
+        ]
 
     def _time_generator(self, start_date: datetime, end_date: datetime):
         current_time = start_date + self.timeframe_td
@@ -1561,6 +1612,8 @@ class Backtesting:
             strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
                 current_time=current_time
             )
+            # Locks expired before the candles of this loop are no longer relevant.
+            PairLocks.prune_locks(current_time - self.timeframe_td)
             pair_detail_cache: dict[str, list[tuple]] = {}
             pair_tradedir_cache: dict[str, LongShort | None] = {}
             pairs_with_open_trades = [t.pair for t in LocalTrade.bt_trades_open]
@@ -7,6 +7,7 @@ This module contains the hyperopt logic
 import gc
 import logging
 import random
+from collections.abc import Iterable
 from datetime import datetime
 from math import ceil
 from multiprocessing import Manager
@@ -15,11 +16,14 @@ from typing import Any
 
 import rapidjson
 from joblib import Parallel, cpu_count
+from optuna.samplers import RandomSampler
+from optuna.trial import TrialState
 
 from freqtrade.constants import FTHYPT_FILEVERSION, LAST_BT_RESULT_FN, Config
 from freqtrade.enums import HyperoptState
 from freqtrade.exceptions import OperationalException
 from freqtrade.misc import file_dump_json, plural
+from freqtrade.optimize.hyperopt.hyperopt_data import remove_hyperopt_data
 from freqtrade.optimize.hyperopt.hyperopt_logger import logging_mp_handle, logging_mp_setup
 from freqtrade.optimize.hyperopt.hyperopt_optimizer import HyperOptimizer
 from freqtrade.optimize.hyperopt.hyperopt_output import HyperoptOutput
@@ -70,9 +74,7 @@ class Hyperopt:
             / "hyperopt_results"
             / f"strategy_{strategy}_{time_now}.fthypt"
         )
-        self.data_pickle_file = (
-            self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_tickerdata.pkl"
-        )
+        self.data_dir = self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_tickerdata"
         self.total_epochs = config.get("epochs", 0)
 
         self.current_best_loss = 100
@@ -90,7 +92,7 @@ class Hyperopt:
         self.hyperopt_table_header = 0
         self.print_json = self.config.get("print_json", False)
 
-        self.hyperopter = HyperOptimizer(self.config, self.data_pickle_file)
+        self.hyperopter = HyperOptimizer(self.config, self.data_dir)
 
     @staticmethod
     def get_lock_filename(config: Config) -> str:
@@ -98,10 +100,11 @@ class Hyperopt:
 
     def clean_hyperopt(self) -> None:
         """
-        Remove hyperopt pickle files to restart hyperopt.
+        Remove hyperopt data and result files to restart hyperopt.
         """
-        for f in [self.data_pickle_file, self.results_file]:
-            p = Path(f)
+        if remove_hyperopt_data(self.data_dir):
+            logger.info(f"Removing `{self.data_dir}`.")
+        for p in [self.data_dir.with_suffix(".pkl"), self.results_file]:
             if p.is_file():
                 logger.info(f"Removing `{p}`.")
                 p.unlink()
@@ -147,8 +150,13 @@ class Hyperopt:
                 self.print_all,
             )
 
-    def run_optimizer_parallel(self, parallel: Parallel, asked: list[list]) -> list[dict[str, Any]]:
-        """Start optimizer in a parallel way"""
+    def run_optimizer_parallel(
+        self, parallel: Parallel, asked: list[list]
+    ) -> Iterable[dict[str, Any]]:
+        """
+        Start optimizer in a parallel way.
+        Returns immediately - results are yielded in order, as they become available.
+        """
 
         def optimizer_wrapper(*args, **kwargs):
             # global log queue. This must happen in the file that initializes Parallel
@@ -169,52 +177,53 @@ class Hyperopt:
             asked.append(self.opt.ask(dimensions))
         return asked
 
+    @staticmethod
+    def _point_key(params: dict[str, Any]) -> tuple:
+        """Hashable, canonical representation of a point of the search space"""
+        return tuple(sorted(params.items()))
+
+    def _ask(self, dimensions: dict, is_random: bool) -> Any:
+        if not is_random:
+            return self.opt.ask(dimensions)
+        sampler = self.opt.sampler
+        self.opt.sampler = self._random_sampler
+        try:
+            return self.opt.ask(dimensions)
+        finally:
+            self.opt.sampler = sampler
+
+    def _tell(self, trial: Any, loss: float) -> None:
+        self.opt.tell(trial, loss)
+        self._tried_points[self._point_key(trial.params)] = loss
+
     def get_asked_points(self, n_points: int, dimensions: dict) -> tuple[list[Any], list[bool]]:
         """
-        Enforce points returned from `self.opt.ask` have not been already evaluated
+        Enforce points returned from `self.opt.ask` have not been already asked in this run
 
         Steps:
-        1. Try to get points using `self.opt.ask` first
-        2. Discard the points that have already been evaluated
-        3. Retry using `self.opt.ask` up to 3 times
-        4. If still some points are missing in respect to `n_points`, random sample some points
-        5. Repeat until at least `n_points` points in the `asked_non_tried` list
-        6. Return a list with length truncated at `n_points`
+        1. Ask the optimizer for the missing points - up to 3 times
+        2. Discard points asked before. Their trials are completed with the known loss,
+           or marked as failed while the point is still being evaluated
+        3. If still some points are missing, random sample them - up to 2 times
+        4. Without any new point, return the optimizer's points regardless
         """
-
-        def unique_list(a_list):
-            new_list = []
-            for item in a_list:
-                if item not in new_list:
-                    new_list.append(item)
-            return new_list
-
-        i = 0
-        asked_non_tried: list[list[Any]] = []
-        is_random_non_tried: list[bool] = []
-        while i < 5 and len(asked_non_tried) < n_points:
-            if i < 3:
-                self.opt.cache_ = {}
-                asked = unique_list(
-                    self.get_optuna_asked_points(
-                        n_points=n_points * 5 if i > 0 else n_points, dimensions=dimensions
-                    )
-                )
-                is_random = [False for _ in range(len(asked))]
-            else:
-                asked = unique_list(self.opt.space.rvs(n_samples=n_points * 5))
-                is_random = [True for _ in range(len(asked))]
-            is_random_non_tried += [
-                rand for x, rand in zip(asked, is_random, strict=False) if x not in asked_non_tried
-            ]
-            asked_non_tried += [x for x in asked if x not in asked_non_tried]
-            i += 1
-
-        if asked_non_tried:
-            return (
-                asked_non_tried[: min(len(asked_non_tried), n_points)],
-                is_random_non_tried[: min(len(asked_non_tried), n_points)],
-            )
+        asked: list[Any] = []
+        is_random: list[bool] = []
+        for i in range(5):
+            for _ in range(n_points - len(asked)):
+                trial = self._ask(dimensions, is_random=i >= 3)
+                key = self._point_key(trial.params)
+                if key not in self._tried_points:
+                    self._tried_points[key] = None
+                    asked.append(trial)
+                    is_random.append(i >= 3)
+                elif (loss := self._tried_points[key]) is not None:
+                    self.opt.tell(trial, loss)
+                else:
+                    self.opt.tell(trial, state=TrialState.FAIL)
+
+        if asked:
+            return asked, is_random
         else:
             return self.get_optuna_asked_points(n_points=n_points, dimensions=dimensions), [
                 False for _ in range(n_points)
@@ -265,9 +274,12 @@ class Hyperopt:
         logger.info(f"Number of parallel jobs set as: {config_jobs}")
 
         self.opt = self.hyperopter.get_optimizer(self.random_state)
+        self._random_sampler = RandomSampler(seed=self.random_state)
+        # Loss per point asked in this run - None while the point is being evaluated.
+        self._tried_points: dict[tuple, float | None] = {}
         self._setup_logging_mp_workaround()
         try:
-            with Parallel(n_jobs=config_jobs) as parallel:
+            with Parallel(n_jobs=config_jobs, return_as="generator") as parallel:
                 jobs = parallel._effective_n_jobs()
                 logger.info(f"Effective number of parallel workers used: {jobs}")
 
@@ -284,31 +296,35 @@ class Hyperopt:
                             n_points=1, dimensions=self.hyperopter.o_dimensions
                         )
                         f_val0 = self.hyperopter.generate_optimizer(asked[0].params)
-                        self.opt.tell(asked[0], [f_val0["loss"]])
+                        self._tell(asked[0], f_val0["loss"])
                         self.evaluate_result(f_val0, 1, is_random[0])
                         pbar.update(task, advance=1)
                         start += 1
 
-                    evals = ceil((self.total_epochs - start) / jobs)
-                    for i in range(evals):
+                    def batch_size(i: int) -> int:
                         # Correct the number of epochs to be processed for the last
                         # iteration (should not exceed self.total_epochs in total)
                         n_rest = (i + 1) * jobs - (self.total_epochs - start)
-                        current_jobs = jobs - n_rest if n_rest > 0 else jobs
+                        return jobs - n_rest if n_rest > 0 else jobs
 
+                    evals = ceil((self.total_epochs - start) / jobs)
+                    if evals > 0:
                         asked, is_random = self.get_asked_points(
-                            n_points=current_jobs, dimensions=self.hyperopter.o_dimensions
+                            n_points=batch_size(0), dimensions=self.hyperopter.o_dimensions
                         )
-
+                    for i in range(evals):
                         f_val = self.run_optimizer_parallel(
                             parallel,
                             [asked1.params for asked1 in asked],
                         )
-                        f_val_loss = [v["loss"] for v in f_val]
-                        for o_ask, v in zip(asked, f_val_loss, strict=False):
-                            self.opt.tell(o_ask, v)
+                        if i + 1 < evals:
+                            # Ask for the next batch while the workers evaluate this batch.
+                            next_asked, next_is_random = self.get_asked_points(
+                                n_points=batch_size(i + 1), dimensions=self.hyperopter.o_dimensions
+                            )
 
                         for j, val in enumerate(f_val):
+                            self._tell(asked[j], val["loss"])
                             # Use human-friendly indexes here (starting from 1)
                             current = i * jobs + j + 1 + start
 
@@ -317,6 +333,9 @@ class Hyperopt:
                         logging_mp_handle(log_queue)
                         gc.collect()
 
+                        if i + 1 < evals:
+                            asked, is_random = next_asked, next_is_random
+
         except KeyboardInterrupt:
             print("User interrupted..")
 
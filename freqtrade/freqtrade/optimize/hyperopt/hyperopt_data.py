@@ -0,0 +1,100 @@
+"""
+Storage of the (preprocessed) hyperopt data, shared by all hyperopt worker processes.
+"""
+
+import logging
+import shutil
+import uuid
+from pathlib import Path
+
+import pyarrow as pa
+import rapidjson
+from joblib import dump, load
+from pandas import DataFrame
+from pandas.api.types import is_float_dtype
+from pyarrow import ipc
+
+
+logger = logging.getLogger(__name__)
+
+# Memory-mapped tables per data directory - kept for the lifetime of the worker process.
+_tables: dict[Path, tuple[str, dict[str, pa.Table]]] = {}
+
+
+def _to_table(df: DataFrame) -> pa.Table:
+    """
+    Convert df to an Arrow table - keeping NaN in float columns as values.
+    Arrow nulls would make to_pandas() copy the (indicator) columns on every load.
+    """
+    table = pa.Table.from_pandas(df)
+    for name, column in df.items():
+        idx = table.schema.get_field_index(str(name))
+        if idx >= 0 and is_float_dtype(column.dtype):
+            table = table.set_column(
+                idx, table.field(idx), pa.array(column.to_numpy(), from_pandas=False)
+            )
+    return table
+
+
+def dump_hyperopt_data(data: dict[str, DataFrame], datadir: Path) -> None:
+    """
+    Store data as one uncompressed Arrow file per pair.
+    Pairs with columns Arrow can't represent are pickled instead.
+    :param data: Dict of dataframes per pair
+    :param datadir: Directory to store the data in - existing data is replaced
+    """
+    if datadir.exists():
+        shutil.rmtree(datadir)
+    datadir.mkdir(parents=True)
+    pairs = []
+    for idx, (pair, df) in enumerate(data.items()):
+        try:
+            table = _to_table(df)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+            logger.debug(f"Pickling hyperopt data for {pair}: {e}")
+            filename = f"{idx:05d}.pkl"
+            dump(df, datadir / filename)
+        else:
+            filename = f"{idx:05d}.arrow"
+            with ipc.new_file(datadir / filename, table.schema) as writer:
+                writer.write_table(table)
+        pairs.append([pair, filename])
+    # New id per dump - invalidates tables mapped by long-lived worker processes.
+    index = {"id": uuid.uuid4().hex, "pairs": pairs}
+    (datadir / "index.json").write_text(rapidjson.dumps(index))
+
+
+def load_hyperopt_data(datadir: Path) -> dict[str, DataFrame]:
+    """
+    Load data stored by dump_hyperopt_data().
+    Arrow files are memory-mapped once per process - the dataframes returned are new
+    objects on every call, but their columns are read-only views on the shared pages.
+    """
+    index = rapidjson.loads((datadir / "index.json").read_text())
+    cached = _tables.get(datadir)
+    if cached is None or cached[0] != index["id"]:
+        tables = {
+            pair: ipc.open_file(pa.memory_map(str(datadir / filename))).read_all()
+            for pair, filename in index["pairs"]
+            if filename.endswith(".arrow")
+        }
+        _tables[datadir] = cached = (index["id"], tables)
+
+    tables = cached[1]
+    data = {}
+    for pair, filename in index["pairs"]:
+        if pair in tables:
+            # split_blocks avoids consolidating the columns - which would copy them.
+            data[pair] = tables[pair].to_pandas(split_blocks=True)
+        else:
+            data[pair] = load(datadir / filename)
+    return data
+
+
+def remove_hyperopt_data(datadir: Path) -> bool:
+    """Remove stored hyperopt data - returns True if data was removed"""
+    _tables.pop(datadir, None)
+    if datadir.is_dir():
+        shutil.rmtree(datadir)
+        return True
+    return False
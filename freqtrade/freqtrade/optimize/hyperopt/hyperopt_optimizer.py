@@ -11,7 +11,7 @@ from pathlib import Path
 from typing import Any
 
 import optuna
-from joblib import delayed, dump, load, wrap_non_picklable_objects
+from joblib import delayed, wrap_non_picklable_objects
 from joblib.externals import cloudpickle
 from optuna.exceptions import ExperimentalWarning
 from pandas import DataFrame
@@ -28,6 +28,8 @@ from freqtrade.optimize.backtesting import Backtesting
 
 # Import IHyperOptLoss to allow unpickling classes from these modules
 from freqtrade.optimize.hyperopt.hyperopt_auto import HyperOptAuto
+from freqtrade.optimize.hyperopt.hyperopt_data import dump_hyperopt_data, load_hyperopt_data
+from freqtrade.optimize.hyperopt.indicator_cache import get_indicator_cache
 from freqtrade.optimize.hyperopt_loss.hyperopt_loss_interface import IHyperOptLoss
 from freqtrade.optimize.hyperopt_tools import HyperoptStateContainer, HyperoptTools
 from freqtrade.optimize.optimize_reports import generate_strategy_stats
@@ -63,7 +65,7 @@ class HyperOptimizer:
     This class is sent to the hyperopt worker processes.
     """
 
-    def __init__(self, config: Config, data_pickle_file: Path) -> None:
+    def __init__(self, config: Config, data_dir: Path) -> None:
         self.buy_space: list[DimensionProtocol] = []
         self.sell_space: list[DimensionProtocol] = []
         self.protection_space: list[DimensionProtocol] = []
@@ -82,6 +84,8 @@ class HyperOptimizer:
         self.pairlist = self.backtesting.pairlists.whitelist
         self.custom_hyperopt: HyperOptAuto
         self.analyze_per_epoch = self.config.get("analyze_per_epoch", False)
+        # Memory budget for indicators memoized across epochs (with analyze_per_epoch)
+        self.indicator_cache_bytes = self.config.get("hyperopt_indicator_cache_mb", 1024) * 2**20
 
         if not self.config.get("hyperopt"):
             self.custom_hyperopt = HyperOptAuto(self.config)
@@ -100,7 +104,8 @@ class HyperOptimizer:
         )
         self.calculate_loss = self.custom_hyperoptloss.hyperopt_loss_function
 
-        self.data_pickle_file = data_pickle_file
+        # Preprocessed data - shared by all worker processes
+        self.data_dir = data_dir
 
         self.market_change = 0.0
 
@@ -315,11 +320,10 @@ class HyperOptimizer:
 
             self.backtesting.strategy.max_open_trades = updated_max_open_trades
 
-        with self.data_pickle_file.open("rb") as f:
-            processed = load(f, mmap_mode="r")
+        processed = load_hyperopt_data(self.data_dir)
         if self.analyze_per_epoch:
             # Data is not yet analyzed, rerun populate_indicators.
-            processed = self.advise_and_trim(processed)
+            processed = self.advise_and_trim(processed, memoize=self.indicator_cache_bytes > 0)
 
         bt_results = self.backtesting.backtest(
             processed=processed, start_date=self.min_date, end_date=self.max_date
@@ -427,8 +431,18 @@ class HyperOptimizer:
         logger.info(f"Using optuna sampler {o_sampler}.")
         return optuna.create_study(sampler=sampler, direction="minimize")
 
-    def advise_and_trim(self, data: dict[str, DataFrame]) -> dict[str, DataFrame]:
-        preprocessed = self.backtesting.strategy.advise_all_indicators(data)
+    def advise_and_trim(
+        self, data: dict[str, DataFrame], memoize: bool = False
+    ) -> dict[str, DataFrame]:
+        """
+        :param memoize: Reuse indicators of earlier epochs with the same indicator parameters
+        """
+        if memoize:
+            preprocessed = get_indicator_cache(self.indicator_cache_bytes).advise_all_indicators(
+                self.backtesting.strategy, data
+            )
+        else:
+            preprocessed = self.backtesting.strategy.advise_all_indicators(data)
 
         # Trim startup period from analyzed dataframe to get correct dates for output.
         # This is only used to keep track of min/max date after trimming.
@@ -458,6 +472,6 @@ class HyperOptimizer:
                 f"({(self.max_date - self.min_date).days} days).."
             )
             # Store non-trimmed data - will be trimmed after signal generation.
-            dump(preprocessed, self.data_pickle_file)
+            dump_hyperopt_data(preprocessed, self.data_dir)
         else:
-            dump(data, self.data_pickle_file)
+            dump_hyperopt_data(data, self.data_dir)
@@ -0,0 +1,121 @@
+"""
+Memoization of populated indicators across hyperopt epochs (with --analyze-per-epoch).
+"""
+
+from collections import OrderedDict
+from typing import Any
+
+from pandas import DataFrame
+
+from freqtrade.strategy import IStrategy
+from freqtrade.strategy.hyper import detect_parameters
+from freqtrade.strategy.parameters import BaseParameter, track_parameter_reads
+
+
+class IndicatorCache:
+    """
+    Indicators of a pair only depend on its data and on the strategy parameters read while
+    populating them. Entries are keyed by strategy, pair and the values of these parameters -
+    so epochs only changing other parameters (e.g. entry thresholds) reuse the indicators.
+    Parameters are referenced by space and name, as every hyperopt task works on its own
+    (unpickled) strategy and parameter objects.
+    The least recently used entries are evicted once the cache exceeds max_bytes.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, DataFrame] = OrderedDict()
+        self._sizes: dict[tuple, int] = {}
+        self._size = 0
+        # Parameter sets read while populating indicators, per strategy, pair and data.
+        self._dependencies: dict[tuple, set[tuple[tuple[str, str], ...]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _entry_key(
+        base: tuple, parameters: tuple[tuple[str, str], ...], values: dict[tuple[str, str], Any]
+    ) -> tuple:
+        return (base, parameters, tuple(values[parameter] for parameter in parameters))
+
+    def _store(self, key: tuple, dataframe: DataFrame) -> None:
+        size = int(dataframe.memory_usage(index=True, deep=False).sum())
+        if size > self.max_bytes:
+            return
+        self._entries[key] = dataframe
+        self._sizes[key] = size
+        self._size += size
+        while self._size > self.max_bytes:
+            evicted, _ = self._entries.popitem(last=False)
+            self._size -= self._sizes.pop(evicted)
+
+    def _advise_indicators(
+        self,
+        strategy: IStrategy,
+        strategy_parameters: dict[tuple[str, str], BaseParameter],
+        pair: str,
+        data: DataFrame,
+    ) -> DataFrame:
+        base: tuple[Any, ...] = (strategy.get_strategy_name(), pair, len(data))
+        if len(data):
+            base += (data["date"].iloc[0], data["date"].iloc[-1])
+
+        values = {key: parameter.value for key, parameter in strategy_parameters.items()}
+        for parameters in self._dependencies.get(base, ()):
+            try:
+                key = self._entry_key(base, parameters, values)
+                cached = self._entries.get(key)
+            except (KeyError, TypeError):
+                continue
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached.copy()
+
+        self.misses += 1
+        with track_parameter_reads() as reads:
+            dataframe = strategy.advise_indicators(data.copy(), {"pair": pair}).copy()
+        names = {id(parameter): key for key, parameter in strategy_parameters.items()}
+        if any(id(parameter) not in names for parameter in reads):
+            # Parameters not known to the strategy can't be looked up in later epochs
+            return dataframe
+        parameters = tuple(sorted(names[id(parameter)] for parameter in reads))
+        try:
+            key = self._entry_key(base, parameters, values)
+            hash(key)
+        except TypeError:
+            # Unhashable parameter values can't be used as key
+            return dataframe
+        self._dependencies.setdefault(base, set()).add(parameters)
+        self._store(key, dataframe.copy())
+        return dataframe
+
+    def advise_all_indicators(
+        self, strategy: IStrategy, data: dict[str, DataFrame]
+    ) -> dict[str, DataFrame]:
+        """
+        Memoized version of IStrategy.advise_all_indicators().
+        """
+        strategy_parameters = {
+            (space, name): parameter
+            for space in ("buy", "sell", "protection")
+            for name, parameter in detect_parameters(strategy, space)
+        }
+        return {
+            pair: self._advise_indicators(strategy, strategy_parameters, pair, pair_data)
+            for pair, pair_data in data.items()
+        }
+
+
+# One cache per (hyperopt worker) process.
+_cache: IndicatorCache | None = None
+
+
+def get_indicator_cache(max_bytes: int) -> IndicatorCache:
+    global _cache
+    if _cache is None or _cache.max_bytes != max_bytes:
+        _cache = IndicatorCache(max_bytes)
+    return _cache
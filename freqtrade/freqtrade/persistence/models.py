@@ -19,6 +19,7 @@ from freqtrade.persistence.key_value_store import _KeyValueStoreModel
 from freqtrade.persistence.migrations import check_migrate
 from freqtrade.persistence.pairlock import PairLock
 from freqtrade.persistence.trade_model import Order, Trade
+from freqtrade.persistence.trade_performance import TradePerformance
 
 
 logger = logging.getLogger(__name__)
@@ -87,6 +88,8 @@ def init_db(db_url: str) -> None:
     Order.session = Trade.session
     PairLock.session = Trade.session
     _KeyValueStoreModel.session = Trade.session
+    TradePerformance.session = Trade.session
+    TradePerformance.register_listeners(Trade.session.session_factory)
     _CustomData.session = scoped_session(
         sessionmaker(bind=engine, autoflush=True), scopefunc=get_request_or_thread_id
     )
@@ -94,3 +97,4 @@ def init_db(db_url: str) -> None:
     previous_tables = inspect(engine).get_table_names()
     ModelBase.metadata.create_all(engine)
     check_migrate(engine, decl_base=ModelBase, previous_tables=previous_tables)
+    TradePerformance.rebuild_if_inconsistent()
@@ -1,5 +1,6 @@
 import logging
-from collections.abc import Sequence
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Sequence
 from datetime import datetime, timezone
 
 from sqlalchemy import select
@@ -23,6 +24,14 @@ class PairLocks:
 
     timeframe: str = ""
 
+    # Backtesting only - PairLocks.locks by pair and side, sorted by lock_end_time.
+    # Entries are (position in PairLocks.locks, lock)
+    _index: dict[str, dict[str, tuple[list[datetime], list[tuple[int, PairLock]]]]] = {}
+    _indexed_locks: list[PairLock] | None = None
+    _indexed_count: int = 0
+    # Locks which expired before this date are no longer part of the index
+    _pruned_until: datetime | None = None
+
     @staticmethod
     def reset_locks() -> None:
         """
@@ -30,6 +39,79 @@ class PairLocks:
         """
         if not PairLocks.use_db:
             PairLocks.locks = []
+            PairLocks._sync_index()
+
+    @staticmethod
+    def _sync_index() -> None:
+        """
+        Add new locks to the lock index - rebuilds the index if PairLocks.locks was replaced.
+        """
+        if (
+            PairLocks._indexed_locks is not PairLocks.locks
+            or len(PairLocks.locks) < PairLocks._indexed_count
+        ):
+            PairLocks._index = {}
+            PairLocks._indexed_locks = PairLocks.locks
+            PairLocks._indexed_count = 0
+            PairLocks._pruned_until = None
+
+        for position in range(PairLocks._indexed_count, len(PairLocks.locks)):
+            lock = PairLocks.locks[position]
+            if PairLocks._pruned_until and lock.lock_end_time < PairLocks._pruned_until:
+                continue
+            ends, entries = PairLocks._index.setdefault(lock.pair, {}).setdefault(
+                lock.side, ([], [])
+            )
+            idx = bisect_right(ends, lock.lock_end_time)
+            ends.insert(idx, lock.lock_end_time)
+            entries.insert(idx, (position, lock))
+        PairLocks._indexed_count = len(PairLocks.locks)
+
+    @staticmethod
+    def prune_locks(now: datetime) -> None:
+        """
+        Backtesting only: Drop locks which expired before "now" from the lock index.
+        Queries for an earlier date fall back to scanning all locks.
+        :param now: Current (simulated) time
+        """
+        if PairLocks.use_db:
+            return
+        PairLocks._sync_index()
+        if PairLocks._pruned_until and now <= PairLocks._pruned_until:
+            return
+        PairLocks._pruned_until = now
+        for pair, pair_locks in list(PairLocks._index.items()):
+            for side, (ends, entries) in list(pair_locks.items()):
+                idx = bisect_left(ends, now)
+                if idx == len(ends):
+                    del pair_locks[side]
+                elif idx:
+                    del ends[:idx]
+                    del entries[:idx]
+            if not pair_locks:
+                del PairLocks._index[pair]
+
+    @staticmethod
+    def _matches_side(lock_side: str, side: str | None) -> bool:
+        return side is None or lock_side == "*" or lock_side == side
+
+    @staticmethod
+    def _query_locks_index(pair: str | None, now: datetime, side: str | None) -> list[PairLock]:
+        """Active locks from the lock index - in the order they were created"""
+        PairLocks._sync_index()
+        if pair is None:
+            pairs: Iterable[dict] = PairLocks._index.values()
+        else:
+            pairs = [PairLocks._index[pair]] if pair in PairLocks._index else []
+
+        result: list[tuple[int, PairLock]] = []
+        for pair_locks in pairs:
+            for lock_side, (ends, entries) in pair_locks.items():
+                if PairLocks._matches_side(lock_side, side):
+                    idx = bisect_left(ends, now)
+                    result.extend(entry for entry in entries[idx:] if entry[1].active is True)
+        result.sort(key=lambda entry: entry[0])
+        return [lock for _, lock in result]
 
     @staticmethod
     def lock_pair(
@@ -81,6 +163,8 @@ class PairLocks:
 
         if PairLocks.use_db:
             return PairLock.query_pair_locks(pair, now, side).all()
+        elif PairLocks._pruned_until is None or now >= PairLocks._pruned_until:
+            return PairLocks._query_locks_index(pair, now, side)
         else:
             locks = [
                 lock
@@ -89,7 +173,7 @@ class PairLocks:
                     lock.lock_end_time >= now
                     and lock.active is True
                     and (pair is None or lock.pair == pair)
-                    and (side is None or lock.side == "*" or lock.side == side)
+                    and PairLocks._matches_side(lock.side, side)
                 )
             ]
             return locks
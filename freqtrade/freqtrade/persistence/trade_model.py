@@ -3,14 +3,16 @@ This module contains the class to persist trades into SQLite
 """
 
 import logging
+from bisect import bisect_right
 from collections import defaultdict
 from collections.abc import Sequence
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from math import isclose
 from typing import Any, ClassVar, Optional, cast
 
 from sqlalchemy import (
+    Date,
     Enum,
     Float,
     ForeignKey,
@@ -55,6 +57,38 @@ from freqtrade.util import FtPrecise, dt_from_ts, dt_now, dt_ts, dt_ts_none
 logger = logging.getLogger(__name__)
 
 
+class ClosedTradeIndex:
+    """
+    Closed backtesting trades, sorted by close_date.
+    Allows bisecting for trades closed after a given date.
+    """
+
+    def __init__(self) -> None:
+        self.close_dates: list[datetime] = []
+        self.trades: list[LocalTrade] = []
+        # Closed trades without close_date - never match a close_date filter
+        self.undated: list[LocalTrade] = []
+
+    def __len__(self) -> int:
+        return len(self.trades) + len(self.undated)
+
+    def add(self, trade: "LocalTrade") -> None:
+        if trade.close_date is None:
+            self.undated.append(trade)
+        elif not self.close_dates or trade.close_date >= self.close_dates[-1]:
+            # Trades usually close in chronological order
+            self.close_dates.append(trade.close_date)
+            self.trades.append(trade)
+        else:
+            idx = bisect_right(self.close_dates, trade.close_date)
+            self.close_dates.insert(idx, trade.close_date)
+            self.trades.insert(idx, trade)
+
+    def closed_after(self, close_date: datetime) -> list["LocalTrade"]:
+        """Trades with close_date > the given date"""
+        return self.trades[bisect_right(self.close_dates, close_date) :]
+
+
 @dataclass
 class ProfitStruct:
     profit_abs: float
@@ -392,9 +426,14 @@ class LocalTrade:
     bt_trades_open: list["LocalTrade"] = []
     # Copy of trades_open - but indexed by pair
     bt_trades_open_pp: dict[str, list["LocalTrade"]] = defaultdict(list)
+    # Index on bt_trades - all pairs and per pair
+    bt_trades_closed_index: ClosedTradeIndex = ClosedTradeIndex()
+    bt_trades_closed_pp: dict[str, ClosedTradeIndex] = defaultdict(ClosedTradeIndex)
     bt_open_open_trade_count: int = 0
     bt_total_profit: float = 0
     realized_profit: float = 0
+    # Incremented whenever a trade is closed or deleted - used to invalidate cached aggregates
+    closed_trades_version: int = 0
 
     id: int = 0
 
@@ -769,6 +808,8 @@ class LocalTrade:
         LocalTrade.bt_trades = []
         LocalTrade.bt_trades_open = []
         LocalTrade.bt_trades_open_pp = defaultdict(list)
+        LocalTrade.bt_trades_closed_index = ClosedTradeIndex()
+        LocalTrade.bt_trades_closed_pp = defaultdict(ClosedTradeIndex)
         LocalTrade.bt_open_open_trade_count = 0
         LocalTrade.bt_total_profit = 0
 
@@ -946,6 +987,7 @@ class LocalTrade:
         self.is_open = False
         self.exit_order_status = "closed"
         self.recalc_trade_from_orders(is_closing=True)
+        LocalTrade.closed_trades_version += 1
         if show_msg:
             logger.info(
                 f"Marking {self} as closed as the trade is fulfilled "
@@ -1450,11 +1492,21 @@ class LocalTrade:
         """
 
         # Offline mode - without database
-        if is_open is not None:
-            if is_open:
-                sel_trades = LocalTrade.bt_trades_open
-            else:
-                sel_trades = LocalTrade.bt_trades
+        if close_date and not is_open:
+            # Closed trades of the pair, bisected by close_date (sorted by close_date).
+            # Open trades have no close_date, so never match this filter.
+            index = LocalTrade._bt_closed_trades_index(pair)
+            return [
+                trade
+                for trade in index.closed_after(close_date)
+                if not open_date or trade.open_date > open_date
+            ]
+
+        if is_open is False:
+            sel_trades = LocalTrade.bt_trades
+
+        elif is_open:
+            sel_trades = LocalTrade.bt_trades_open
 
         else:
             # Not used during backtesting, but might be used by a strategy
@@ -1471,12 +1523,33 @@ class LocalTrade:
 
         return sel_trades
 
+    @staticmethod
+    def _bt_closed_trades_index(pair: str | None) -> ClosedTradeIndex:
+        """
+        Index of the closed trades (of one pair, or of all pairs).
+        Rebuilt if bt_trades was modified directly.
+        """
+        if len(LocalTrade.bt_trades_closed_index) != len(LocalTrade.bt_trades):
+            LocalTrade.bt_trades_closed_index = ClosedTradeIndex()
+            LocalTrade.bt_trades_closed_pp = defaultdict(ClosedTradeIndex)
+            for trade in LocalTrade.bt_trades:
+                LocalTrade._index_closed_bt_trade(trade)
+        if not pair:
+            return LocalTrade.bt_trades_closed_index
+        return LocalTrade.bt_trades_closed_pp.get(pair) or ClosedTradeIndex()
+
+    @staticmethod
+    def _index_closed_bt_trade(trade: "LocalTrade") -> None:
+        LocalTrade.bt_trades_closed_index.add(trade)
+        LocalTrade.bt_trades_closed_pp[trade.pair].add(trade)
+
     @staticmethod
     def close_bt_trade(trade):
         LocalTrade.bt_trades_open.remove(trade)
         LocalTrade.bt_trades_open_pp[trade.pair].remove(trade)
         LocalTrade.bt_open_open_trade_count -= 1
         LocalTrade.bt_trades.append(trade)
+        LocalTrade._index_closed_bt_trade(trade)
         LocalTrade.bt_total_profit += trade.close_profit_abs
 
     @staticmethod
@@ -1487,6 +1560,7 @@ class LocalTrade:
             LocalTrade.bt_open_open_trade_count += 1
         else:
             LocalTrade.bt_trades.append(trade)
+            LocalTrade._index_closed_bt_trade(trade)
 
     @staticmethod
     def remove_bt_trade(trade):
@@ -1784,6 +1858,7 @@ class Trade(ModelBase, LocalTrade):
 
         Trade.session.delete(self)
         Trade.commit()
+        LocalTrade.closed_trades_version += 1
 
     @staticmethod
     def commit():
@@ -1914,6 +1989,26 @@ class Trade(ModelBase, LocalTrade):
             )
         return total_profit or 0
 
+    @staticmethod
+    def get_closed_profit_per_day(start_date: date) -> dict[date, tuple[float, int]]:
+        """
+        Realized profit of trades closed since start_date, grouped by close day (UTC).
+        Runs a single grouped query.
+        NOTE: Not supported in Backtesting.
+        :return: dict of {day: (profit_abs, trade_count)}
+        """
+        close_day = func.date(Trade.close_date, type_=Date)
+        rows = Trade.session.execute(
+            select(
+                close_day.label("close_day"),
+                func.sum(Trade.close_profit_abs).label("profit_sum_abs"),
+                func.count(Trade.id).label("count"),
+            )
+            .filter(Trade.is_open.is_(False), Trade.close_date >= start_date)
+            .group_by(close_day)
+        ).all()
+        return {row.close_day: (row.profit_sum_abs or 0.0, row.count) for row in rows}
+
     @staticmethod
     def total_open_trades_stakes() -> float:
         """
@@ -1990,11 +2085,15 @@ class Trade(ModelBase, LocalTrade):
     def get_overall_performance(start_date: datetime | None = None) -> list[dict[str, Any]]:
         """
         Returns List of dicts containing all Trades, including profit and trade count
+        Served from the trade performance aggregate if no start_date is given.
         NOTE: Not supported in Backtesting.
         """
-        filters: list = [Trade.is_open.is_(False)]
-        if start_date:
-            filters.append(Trade.close_date >= start_date)
+        if not start_date:
+            from freqtrade.persistence.trade_performance import TradePerformance
+
+            return TradePerformance.pair_performance()
+
+        filters: list = [Trade.is_open.is_(False), Trade.close_date >= start_date]
         pair_rates_query = Trade._generic_performance_query([Trade.pair], filters)
         pair_rates = Trade.session.execute(pair_rates_query).all()
         return [
@@ -2016,24 +2115,9 @@ class Trade(ModelBase, LocalTrade):
         Can either be average for all pairs or a specific pair provided
         NOTE: Not supported in Backtesting.
         """
+        from freqtrade.persistence.trade_performance import TradePerformance
 
-        filters: list = [Trade.is_open.is_(False)]
-        if pair is not None:
-            filters.append(Trade.pair == pair)
-
-        pair_rates_query = Trade._generic_performance_query([Trade.enter_tag], filters, "Other")
-        enter_tag_perf = Trade.session.execute(pair_rates_query).all()
-
-        return [
-            {
-                "enter_tag": enter_tag if enter_tag is not None else "Other",
-                "profit_ratio": profit,
-                "profit_pct": round(profit * 100, 2),
-                "profit_abs": profit_abs,
-                "count": count,
-            }
-            for enter_tag, profit, profit_abs, count in enter_tag_perf
-        ]
+        return TradePerformance.enter_tag_performance(pair)
 
     @staticmethod
     def get_exit_reason_performance(pair: str | None) -> list[dict[str, Any]]:
@@ -2042,24 +2126,9 @@ class Trade(ModelBase, LocalTrade):
         Can either be average for all pairs or a specific pair provided
         NOTE: Not supported in Backtesting.
         """
+        from freqtrade.persistence.trade_performance import TradePerformance
 
-        filters: list = [Trade.is_open.is_(False)]
-        if pair is not None:
-            filters.append(Trade.pair == pair)
-
-        pair_rates_query = Trade._generic_performance_query([Trade.exit_reason], filters, "Other")
-        sell_tag_perf = Trade.session.execute(pair_rates_query).all()
-
-        return [
-            {
-                "exit_reason": exit_reason if exit_reason is not None else "Other",
-                "profit_ratio": profit,
-                "profit_pct": round(profit * 100, 2),
-                "profit_abs": profit_abs,
-                "count": count,
-            }
-            for exit_reason, profit, profit_abs, count in sell_tag_perf
-        ]
+        return TradePerformance.exit_reason_performance(pair)
 
     @staticmethod
     def get_mix_tag_performance(pair: str | None) -> list[dict[str, Any]]:
@@ -2068,55 +2137,9 @@ class Trade(ModelBase, LocalTrade):
         Can either be average for all pairs or a specific pair provided
         NOTE: Not supported in Backtesting.
         """
+        from freqtrade.persistence.trade_performance import TradePerformance
 
-        filters: list = [Trade.is_open.is_(False)]
-        if pair is not None:
-            filters.append(Trade.pair == pair)
-        mix_tag_perf = Trade.session.execute(
-            select(
-                Trade.id,
-                Trade.enter_tag,
-                Trade.exit_reason,
-                func.sum(Trade.close_profit).label("profit_sum"),
-                func.sum(Trade.close_profit_abs).label("profit_sum_abs"),
-                func.count(Trade.pair).label("count"),
-            )
-            .filter(*filters)
-            .group_by(Trade.id)
-            .order_by(desc("profit_sum_abs"))
-        ).all()
-
-        resp: list[dict] = []
-        for _, enter_tag, exit_reason, profit, profit_abs, count in mix_tag_perf:
-            enter_tag = enter_tag if enter_tag is not None else "Other"
-            exit_reason = exit_reason if exit_reason is not None else "Other"
-
-            if exit_reason is not None and enter_tag is not None:
-                mix_tag = enter_tag + " " + exit_reason
-                i = 0
-                if not any(item["mix_tag"] == mix_tag for item in resp):
-                    resp.append(
-                        {
-                            "mix_tag": mix_tag,
-                            "profit_ratio": profit,
-                            "profit_pct": round(profit * 100, 2),
-                            "profit_abs": profit_abs,
-                            "count": count,
-                        }
-                    )
-                else:
-                    while i < len(resp):
-                        if resp[i]["mix_tag"] == mix_tag:
-                            resp[i] = {
-                                "mix_tag": mix_tag,
-                                "profit_ratio": profit + resp[i]["profit_ratio"],
-                                "profit_pct": round(profit + resp[i]["profit_ratio"] * 100, 2),
-                                "profit_abs": profit_abs + resp[i]["profit_abs"],
-                                "count": 1 + resp[i]["count"],
-                            }
-                        i += 1
-
-        return resp
+        return TradePerformance.mix_tag_performance(pair)
 
     @staticmethod
     def get_best_pair(start_date: datetime | None = None):
@@ -0,0 +1,317 @@
+"""
+Aggregate of closed trades per (pair, enter_tag, exit_reason) - used by the performance,
+entries, exits and mix_tags endpoints.
+"""
+
+import logging
+from collections.abc import Callable, Iterable
+from itertools import chain
+from typing import Any, ClassVar
+
+from sqlalchemy import Float, Integer, String, case, delete, desc, event, func, insert, inspect
+from sqlalchemy import select as sa_select
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from freqtrade.constants import CUSTOM_TAG_MAX_LENGTH
+from freqtrade.persistence.base import ModelBase, SessionType
+from freqtrade.persistence.trade_model import Order, Trade
+
+
+logger = logging.getLogger(__name__)
+
+# Fallback for trades without enter_tag / exit_reason
+_FALLBACK = "Other"
+
+
+class TradePerformance(ModelBase):
+    """
+    Closed trades aggregated per (pair, enter_tag, exit_reason).
+    Rows of a pair are recalculated whenever a closed trade of that pair is
+    written, deleted or reopened - as part of the same transaction.
+    """
+
+    __tablename__ = "trade_performance"
+    session: ClassVar[SessionType]
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    pair: Mapped[str] = mapped_column(String(25), nullable=False, index=True)
+    enter_tag: Mapped[str] = mapped_column(String(CUSTOM_TAG_MAX_LENGTH), nullable=False)
+    exit_reason: Mapped[str] = mapped_column(String(CUSTOM_TAG_MAX_LENGTH), nullable=False)
+    count: Mapped[int] = mapped_column(Integer, nullable=False)
+    # Sum of close_profit
+    profit_sum: Mapped[float] = mapped_column(Float(), nullable=False)
+    profit_sum_abs: Mapped[float] = mapped_column(Float(), nullable=False)
+    # Cost of the filled entry orders - None if no entry order was filled
+    cost_sum: Mapped[float | None] = mapped_column(Float(), nullable=True)
+
+    # Bumped on every committed change of the aggregate - invalidates the result cache
+    version: ClassVar[int] = 0
+    _cache: ClassVar[dict[tuple, list[dict[str, Any]]]] = {}
+    _cache_version: ClassVar[int] = -1
+
+    def __repr__(self) -> str:
+        return (
+            f"TradePerformance(pair={self.pair}, enter_tag={self.enter_tag}, "
+            f"exit_reason={self.exit_reason}, count={self.count}, "
+            f"profit_sum_abs={self.profit_sum_abs})"
+        )
+
+    @staticmethod
+    def _aggregate_query(pairs: Iterable[str] | None = None):
+        """Aggregate of the closed trades of the given pairs (all pairs if None)"""
+        filters: list = [Trade.is_open.is_(False)]
+        if pairs is not None:
+            filters.append(Trade.pair.in_(pairs))
+        enter_tag = func.coalesce(Trade.enter_tag, _FALLBACK).label("enter_tag")
+        exit_reason = func.coalesce(Trade.exit_reason, _FALLBACK).label("exit_reason")
+
+        costs = (
+            sa_select(
+                Trade.pair,
+                enter_tag,
+                exit_reason,
+                func.sum(
+                    (
+                        func.coalesce(Order.filled, Order.amount)
+                        * func.coalesce(Order.average, Order.price, Order.ft_price)
+                    )
+                    / func.coalesce(Trade.leverage, 1)
+                ).label("cost_sum"),
+            )
+            .join(Order, Trade.id == Order.ft_trade_id)
+            .filter(
+                *filters,
+                Order.ft_order_side == case((Trade.is_short.is_(True), "sell"), else_="buy"),
+                Order.filled > 0,
+            )
+            .group_by(Trade.pair, enter_tag, exit_reason)
+            .cte("performance_costs")
+        )
+        grouped = (
+            sa_select(
+                Trade.pair,
+                enter_tag,
+                exit_reason,
+                func.count(Trade.id).label("count"),
+                func.coalesce(func.sum(Trade.close_profit), 0.0).label("profit_sum"),
+                func.coalesce(func.sum(Trade.close_profit_abs), 0.0).label("profit_sum_abs"),
+            )
+            .filter(*filters)
+            .group_by(Trade.pair, enter_tag, exit_reason)
+            .cte("performance_trades")
+        )
+        return sa_select(
+            grouped.c.pair,
+            grouped.c.enter_tag,
+            grouped.c.exit_reason,
+            grouped.c.count,
+            grouped.c.profit_sum,
+            grouped.c.profit_sum_abs,
+            costs.c.cost_sum,
+        ).outerjoin(
+            costs,
+            (grouped.c.pair == costs.c.pair)
+            & (grouped.c.enter_tag == costs.c.enter_tag)
+            & (grouped.c.exit_reason == costs.c.exit_reason),
+        )
+
+    @staticmethod
+    def _recalculate(connection, pairs: Iterable[str] | None = None) -> None:
+        """Replace the aggregate rows of the given pairs (all rows if None)"""
+        pairs = sorted(pairs) if pairs is not None else None
+        remove = delete(TradePerformance)
+        if pairs is not None:
+            remove = remove.where(TradePerformance.pair.in_(pairs))
+        connection.execute(remove)
+        connection.execute(
+            insert(TradePerformance).from_select(
+                [
+                    "pair",
+                    "enter_tag",
+                    "exit_reason",
+                    "count",
+                    "profit_sum",
+                    "profit_sum_abs",
+                    "cost_sum",
+                ],
+                TradePerformance._aggregate_query(pairs),
+            )
+        )
+
+    @staticmethod
+    def rebuild() -> None:
+        """Recalculate the aggregate from all closed trades"""
+        TradePerformance._recalculate(TradePerformance.session.connection())
+        TradePerformance.session.commit()
+        TradePerformance.invalidate()
+
+    @staticmethod
+    def rebuild_if_inconsistent() -> None:
+        """
+        Rebuild the aggregate if it doesn't cover all closed trades
+        (new table, or trades closed by a version not maintaining the aggregate).
+        """
+        session = TradePerformance.session
+        aggregated = session.scalar(sa_select(func.coalesce(func.sum(TradePerformance.count), 0)))
+        closed = session.scalar(sa_select(func.count(Trade.id)).filter(Trade.is_open.is_(False)))
+        if aggregated != closed:
+            logger.info("Rebuilding trade performance aggregate.")
+            TradePerformance.rebuild()
+        else:
+            TradePerformance.invalidate()
+
+    @staticmethod
+    def _affected_pairs(session: Session) -> set[str]:
+        """Pairs with closed trades (or their orders) changed in this flush"""
+        pairs: set[str] = set()
+        for obj in chain(session.new, session.dirty, session.deleted):
+            trade = obj._trade_live if isinstance(obj, Order) else obj
+            if not isinstance(trade, Trade):
+                continue
+            if obj in session.dirty and not session.is_modified(obj):
+                continue
+            state = inspect(trade)
+            if trade.is_open and (
+                trade in session.new or not state.attrs.is_open.history.has_changes()
+            ):
+                # Open trades are not part of the aggregate - unless they were just reopened
+                continue
+            pairs.add(trade.pair)
+            pairs.update(state.attrs.pair.history.deleted)
+        return pairs
+
+    @staticmethod
+    def _after_flush(session: Session, flush_context) -> None:
+        pairs = TradePerformance._affected_pairs(session)
+        if pairs:
+            TradePerformance._recalculate(session.connection(), pairs)
+            session.info["trade_performance_changed"] = True
+
+    @staticmethod
+    def _after_commit(session: Session) -> None:
+        if session.info.pop("trade_performance_changed", False):
+            TradePerformance.invalidate()
+
+    @staticmethod
+    def _after_rollback(session: Session) -> None:
+        session.info.pop("trade_performance_changed", None)
+
+    @staticmethod
+    def register_listeners(session_factory) -> None:
+        """Maintain the aggregate on every flush of the given session(maker)"""
+        event.listen(session_factory, "after_flush", TradePerformance._after_flush)
+        event.listen(session_factory, "after_commit", TradePerformance._after_commit)
+        event.listen(session_factory, "after_rollback", TradePerformance._after_rollback)
+
+    @staticmethod
+    def invalidate() -> None:
+        TradePerformance.version += 1
+
+    @staticmethod
+    def _cached(key: tuple, calculate: Callable[[], list[dict[str, Any]]]) -> list[dict[str, Any]]:
+        """Results are cached until the aggregate changes"""
+        if TradePerformance._cache_version != TradePerformance.version:
+            TradePerformance._cache = {}
+            TradePerformance._cache_version = TradePerformance.version
+        if key not in TradePerformance._cache:
+            TradePerformance._cache[key] = calculate()
+        return [row.copy() for row in TradePerformance._cache[key]]
+
+    @staticmethod
+    def _grouped(column, pair: str | None, require_cost: bool = True):
+        """Rollup of the aggregate by `column`"""
+        query = sa_select(
+            column,
+            func.sum(TradePerformance.profit_sum).label("profit_sum"),
+            func.sum(TradePerformance.profit_sum_abs).label("profit_sum_abs"),
+            func.sum(TradePerformance.cost_sum).label("cost_sum"),
+            func.sum(TradePerformance.count).label("count"),
+        )
+        if pair is not None:
+            query = query.filter(TradePerformance.pair == pair)
+        query = query.group_by(column).order_by(desc("profit_sum_abs"))
+        if require_cost:
+            # Same as the join against the entry orders - groups without filled orders are skipped
+            query = query.having(func.sum(TradePerformance.cost_sum).is_not(None))
+        return TradePerformance.session.execute(query).all()
+
+    @staticmethod
+    def _ratio_rows(column_name: str, rows) -> list[dict[str, Any]]:
+        result = []
+        for value, _, profit_abs, cost, count in rows:
+            profit = profit_abs / cost if cost else None
+            result.append(
+                {
+                    column_name: value,
+                    "profit_ratio": profit,
+                    "profit_pct": round(profit * 100, 2) if profit is not None else None,
+                    "profit_abs": profit_abs,
+                    "count": count,
+                }
+            )
+        return result
+
+    @staticmethod
+    def pair_performance() -> list[dict[str, Any]]:
+        """Performance of all closed trades per pair - see Trade.get_overall_performance()"""
+
+        def calculate():
+            return [
+                {
+                    "pair": row["pair"],
+                    "profit_ratio": row["profit_ratio"],
+                    "profit": row["profit_pct"],  # Compatibility mode
+                    "profit_pct": row["profit_pct"],
+                    "profit_abs": row["profit_abs"],
+                    "count": row["count"],
+                }
+                for row in TradePerformance._ratio_rows(
+                    "pair", TradePerformance._grouped(TradePerformance.pair, None)
+                )
+            ]
+
+        return TradePerformance._cached(("pair",), calculate)
+
+    @staticmethod
+    def enter_tag_performance(pair: str | None) -> list[dict[str, Any]]:
+        return TradePerformance._cached(
+            ("enter_tag", pair),
+            lambda: TradePerformance._ratio_rows(
+                "enter_tag", TradePerformance._grouped(TradePerformance.enter_tag, pair)
+            ),
+        )
+
+    @staticmethod
+    def exit_reason_performance(pair: str | None) -> list[dict[str, Any]]:
+        return TradePerformance._cached(
+            ("exit_reason", pair),
+            lambda: TradePerformance._ratio_rows(
+                "exit_reason", TradePerformance._grouped(TradePerformance.exit_reason, pair)
+            ),
+        )
+
+    @staticmethod
+    def mix_tag_performance(pair: str | None) -> list[dict[str, Any]]:
+        """
+        Performance per enter_tag + exit_reason combination.
+        profit_ratio is the sum of the profit ratios of the trades.
+        """
+
+        def calculate():
+            mix_tag = (TradePerformance.enter_tag + " " + TradePerformance.exit_reason).label(
+                "mix_tag"
+            )
+            return [
+                {
+                    "mix_tag": tag,
+                    "profit_ratio": profit,
+                    "profit_pct": round(profit * 100, 2),
+                    "profit_abs": profit_abs,
+                    "count": count,
+                }
+                for tag, profit, profit_abs, _, count in TradePerformance._grouped(
+                    mix_tag, pair, require_cost=False
+                )
+            ]
+
+        return TradePerformance._cached(("mix_tag", pair), calculate)
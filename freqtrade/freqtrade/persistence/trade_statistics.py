@@ -0,0 +1,231 @@
+"""
+Incrementally maintained statistics over closed trades - used by /profit.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import func, select
+
+from freqtrade.data.metrics import DrawDownResult
+from freqtrade.persistence.trade_model import Trade
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ClosedTradeStatistics:
+    """
+    Running aggregate of closed trades.
+    Trades must be added in close_date order (as they close) - matching the results of
+    calculate_expectancy() and calculate_max_drawdown() over the same trades.
+    The starting balance is only applied when reading the drawdown, as it moves with
+    open trades and fees (unless available_capital is configured).
+    """
+
+    closed_trade_count: int = 0
+    profit_closed_coin: float = 0.0
+    profit_closed_ratio_sum: float = 0.0
+    duration_sum: float = 0.0
+    duration_count: int = 0
+    winning_trades: int = 0
+    losing_trades: int = 0
+    winning_profit: float = 0.0
+    losing_profit: float = 0.0
+
+    # Expectancy - based on profit_abs (not on the profit ratio like winning/losing trades)
+    expectancy_trades: int = 0
+    expectancy_win_count: int = 0
+    expectancy_win_sum: float = 0.0
+    expectancy_loss_count: int = 0
+    expectancy_loss_sum: float = 0.0
+
+    # (trade id, open date) of the first / latest trade
+    first_trade: tuple[int, datetime] | None = None
+    latest_trade: tuple[int, datetime] | None = None
+
+    # Drawdown state
+    cumulative: float = 0.0
+    high_value: float = 0.0
+    high_date: pd.Timestamp | None = None
+    high_cumulative: float = 0.0
+    # Max drawdown point - high_value is the (non-negative) high of the drawdown
+    drawdown_high_date: pd.Timestamp | None = None
+    drawdown_low_date: pd.Timestamp | None = None
+    drawdown_high_cumulative: float = 0.0
+    drawdown_high_value: float = 0.0
+    drawdown_low_value: float = 0.0
+    _max_drawdown: float | None = None
+    last_close_date: datetime | None = None
+
+    # Bookkeeping for incremental refreshes
+    trade_ids: set[int] = field(default_factory=set)
+    version: int = -1
+
+    def add_trade(
+        self,
+        trade_id: int,
+        open_date: datetime,
+        close_date: datetime | None,
+        close_profit: float | None,
+        close_profit_abs: float | None,
+    ) -> None:
+        """Fold a closed trade into the aggregate"""
+        self.trade_ids.add(trade_id)
+        self.closed_trade_count += 1
+        open_date_utc = open_date.replace(tzinfo=timezone.utc)
+        if self.first_trade is None or trade_id < self.first_trade[0]:
+            self.first_trade = (trade_id, open_date_utc)
+        if self.latest_trade is None or trade_id > self.latest_trade[0]:
+            self.latest_trade = (trade_id, open_date_utc)
+
+        profit_ratio = close_profit or 0.0
+        profit_abs = close_profit_abs or 0.0
+        self.profit_closed_coin += profit_abs
+        self.profit_closed_ratio_sum += profit_ratio
+        if profit_ratio >= 0:
+            self.winning_trades += 1
+            self.winning_profit += profit_abs
+        else:
+            self.losing_trades += 1
+            self.losing_profit += profit_abs
+
+        if not close_date:
+            return
+        self.duration_sum += (close_date - open_date).total_seconds()
+        self.duration_count += 1
+
+        self.expectancy_trades += 1
+        if close_profit_abs is not None and close_profit_abs > 0:
+            self.expectancy_win_count += 1
+            self.expectancy_win_sum += close_profit_abs
+        elif close_profit_abs is not None and close_profit_abs < 0:
+            self.expectancy_loss_count += 1
+            self.expectancy_loss_sum += abs(close_profit_abs)
+
+        self._add_to_drawdown(pd.Timestamp(close_date), profit_abs)
+        self.last_close_date = close_date
+
+    def _add_to_drawdown(self, close_date: pd.Timestamp, profit_abs: float) -> None:
+        first = self.high_date is None
+        self.cumulative += profit_abs
+        if first or self.cumulative > self.high_value:
+            # The high is never below 0 - but the first trade always starts the series
+            self.high_value = max(0.0, self.cumulative)
+            self.high_date = close_date
+            self.high_cumulative = self.cumulative
+
+        drawdown = self.cumulative - self.high_value
+        if self._max_drawdown is None or drawdown < self._max_drawdown:
+            self._max_drawdown = drawdown
+            self.drawdown_high_date = self.high_date
+            self.drawdown_low_date = close_date
+            self.drawdown_high_cumulative = self.high_cumulative
+            self.drawdown_high_value = self.high_value
+            self.drawdown_low_value = self.cumulative
+
+    def get_drawdown(self, starting_balance: float) -> DrawDownResult:
+        """Same result as calculate_max_drawdown() with the given starting balance"""
+        if self._max_drawdown is None:
+            return DrawDownResult()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if starting_balance:
+                max_balance = starting_balance + self.drawdown_high_value
+                relative = (max_balance - (starting_balance + self.drawdown_low_value)) / (
+                    np.float64(max_balance)
+                )
+            else:
+                relative = (self.drawdown_high_value - self.drawdown_low_value) / np.float64(
+                    self.drawdown_high_value
+                )
+        return DrawDownResult(
+            drawdown_abs=abs(self._max_drawdown),
+            high_date=self.drawdown_high_date,
+            low_date=self.drawdown_low_date,
+            high_value=self.drawdown_high_cumulative,
+            low_value=self.drawdown_low_value,
+            relative_account_drawdown=float(relative),
+        )
+
+    @property
+    def expectancy(self) -> tuple[float, float]:
+        """Same result as calculate_expectancy() - (expectancy, expectancy_ratio)"""
+        expectancy = 0.0
+        expectancy_ratio = 100.0
+        if self.expectancy_trades > 0:
+            average_win = (
+                self.expectancy_win_sum / self.expectancy_win_count
+                if self.expectancy_win_count > 0
+                else 0
+            )
+            average_loss = (
+                self.expectancy_loss_sum / self.expectancy_loss_count
+                if self.expectancy_loss_count > 0
+                else 0
+            )
+            winrate = self.expectancy_win_count / self.expectancy_trades
+            loserate = self.expectancy_loss_count / self.expectancy_trades
+
+            expectancy = (winrate * average_win) - (loserate * average_loss)
+            if average_loss > 0:
+                risk_reward_ratio = average_win / average_loss
+                expectancy_ratio = ((1 + risk_reward_ratio) * winrate) - 1
+        return expectancy, expectancy_ratio
+
+    @staticmethod
+    def _closed_trades_query(*filters):
+        return (
+            select(
+                Trade.id,
+                Trade.open_date,
+                Trade.close_date,
+                Trade.close_profit,
+                Trade.close_profit_abs,
+            )
+            .filter(Trade.is_open.is_(False), *filters)
+            .order_by(Trade.close_date, Trade.id)
+        )
+
+    @classmethod
+    def from_database(cls, start_date: datetime | None = None) -> "ClosedTradeStatistics":
+        """
+        Build the aggregate from all trades closed after start_date.
+        Only the required columns are loaded - no ORM objects.
+        """
+        stats = cls(version=Trade.closed_trades_version)
+        filters = [Trade.close_date >= start_date] if start_date else []
+        for row in Trade.session.execute(cls._closed_trades_query(*filters)):
+            stats.add_trade(*row)
+        return stats
+
+    def refresh(self) -> "ClosedTradeStatistics":
+        """
+        Fold trades closed since the last refresh into the aggregate.
+        Falls back to a full rebuild if trades were removed or closed out of order.
+        :return: Up-to-date statistics (self, or a rebuilt instance)
+        """
+        if self.version == Trade.closed_trades_version:
+            return self
+
+        version = Trade.closed_trades_version
+        filters = [Trade.close_date >= self.last_close_date] if self.last_close_date else []
+        new_trades = [
+            row
+            for row in Trade.session.execute(self._closed_trades_query(*filters))
+            if row.id not in self.trade_ids
+        ]
+        closed_count = Trade.session.scalar(
+            select(func.count(Trade.id)).filter(Trade.is_open.is_(False))
+        )
+        if closed_count != self.closed_trade_count + len(new_trades):
+            logger.debug("Closed trades changed, rebuilding trade statistics.")
+            return self.from_database()
+
+        for row in new_trades:
+            self.add_trade(*row)
+        self.version = version
+        return self
@@ -6,7 +6,8 @@ from fastapi import APIRouter, Depends, HTTPException
 from freqtrade.configuration import validate_config_consistency
 from freqtrade.rpc.api_server.api_pairlists import handleExchangePayload
 from freqtrade.rpc.api_server.api_schemas import PairHistory, PairHistoryRequest
-from freqtrade.rpc.api_server.deps import get_config, get_exchange
+from freqtrade.rpc.api_server.deps import accepts_arrow_stream, get_config, get_exchange
+from freqtrade.rpc.api_server.webserver import FTArrowResponse
 from freqtrade.rpc.rpc import RPC
 
 
@@ -24,6 +25,7 @@ def pair_history(
     freqaimodel: str | None = None,
     config=Depends(get_config),
     exchange=Depends(get_exchange),
+    as_arrow: bool = Depends(accepts_arrow_stream),
 ):
     # The initial call to this endpoint can be slow, as it may need to initialize
     # the exchange class.
@@ -38,13 +40,20 @@ def pair_history(
     )
     validate_config_consistency(config_loc)
     try:
-        return RPC._rpc_analysed_history_full(config_loc, pair, timeframe, exchange, None, False)
+        res = RPC._rpc_analysed_history_full(
+            config_loc, pair, timeframe, exchange, None, False, as_arrow=as_arrow
+        )
     except Exception as e:
         raise HTTPException(status_code=502, detail=str(e))
+    return FTArrowResponse(res) if as_arrow else res
 
 
 @router.post("/pair_history", response_model=PairHistory, tags=["candle data"])
-def pair_history_filtered(payload: PairHistoryRequest, config=Depends(get_config)):
+def pair_history_filtered(
+    payload: PairHistoryRequest,
+    config=Depends(get_config),
+    as_arrow: bool = Depends(accepts_arrow_stream),
+):
     # The initial call to this endpoint can be slow, as it may need to initialize
     # the exchange class.
     config_loc = deepcopy(config)
@@ -64,14 +73,16 @@ def pair_history_filtered(payload: PairHistoryRequest, config=Depends(get_config
     validate_config_consistency(config_loc)
 
     try:
-        return RPC._rpc_analysed_history_full(
+        res = RPC._rpc_analysed_history_full(
             config_loc,
             payload.pair,
             payload.timeframe,
             exchange,
             payload.columns,
             payload.live_mode,
+            as_arrow=as_arrow,
         )
     except Exception as e:
         logger.exception("Error in pair_history_filtered")
         raise HTTPException(status_code=502, detail=str(e))
+    return FTArrowResponse(res) if as_arrow else res
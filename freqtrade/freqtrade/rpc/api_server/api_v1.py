@@ -53,7 +53,14 @@ from freqtrade.rpc.api_server.api_schemas import (
     Version,
     WhitelistResponse,
 )
-from freqtrade.rpc.api_server.deps import get_config, get_exchange, get_rpc, get_rpc_optional
+from freqtrade.rpc.api_server.deps import (
+    accepts_arrow_stream,
+    get_config,
+    get_exchange,
+    get_rpc,
+    get_rpc_optional,
+)
+from freqtrade.rpc.api_server.webserver import FTArrowResponse
 from freqtrade.rpc.rpc import RPCException
 
 
@@ -89,7 +96,8 @@ logger = logging.getLogger(__name__)
 # 2.40: Add hyperopt-loss endpoint
 # 2.41: Add download-data endpoint
 # 2.42: Add /pair_history endpoint with live data
-API_VERSION = 2.42
+# 2.43: pair_candles and pair_history support Arrow IPC responses
+API_VERSION = 2.43
 
 # Public API, requires no auth.
 router_public = APIRouter()
@@ -385,16 +393,28 @@ def reload_config(rpc: RPC = Depends(get_rpc)):
 
 
 @router.get("/pair_candles", response_model=PairHistory, tags=["candle data"])
-def pair_candles(pair: str, timeframe: str, limit: int | None = None, rpc: RPC = Depends(get_rpc)):
-    return rpc._rpc_analysed_dataframe(pair, timeframe, limit, None)
+def pair_candles(
+    pair: str,
+    timeframe: str,
+    limit: int | None = None,
+    rpc: RPC = Depends(get_rpc),
+    as_arrow: bool = Depends(accepts_arrow_stream),
+):
+    res = rpc._rpc_analysed_dataframe(pair, timeframe, limit, None, as_arrow=as_arrow)
+    return FTArrowResponse(res) if as_arrow else res
 
 
 @router.post("/pair_candles", response_model=PairHistory, tags=["candle data"])
-def pair_candles_filtered(payload: PairCandlesRequest, rpc: RPC = Depends(get_rpc)):
+def pair_candles_filtered(
+    payload: PairCandlesRequest,
+    rpc: RPC = Depends(get_rpc),
+    as_arrow: bool = Depends(accepts_arrow_stream),
+):
     # Advanced pair_candles endpoint with column filtering
-    return rpc._rpc_analysed_dataframe(
-        payload.pair, payload.timeframe, payload.limit, payload.columns
+    res = rpc._rpc_analysed_dataframe(
+        payload.pair, payload.timeframe, payload.limit, payload.columns, as_arrow=as_arrow
     )
+    return FTArrowResponse(res) if as_arrow else res
 
 
 @router.get("/plot_config", response_model=PlotConfig, tags=["candle data"])
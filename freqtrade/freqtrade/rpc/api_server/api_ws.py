@@ -12,6 +12,7 @@ from freqtrade.rpc.api_server.api_auth import validate_ws_token
 from freqtrade.rpc.api_server.deps import get_message_stream, get_rpc
 from freqtrade.rpc.api_server.ws.channel import WebSocketChannel, create_channel
 from freqtrade.rpc.api_server.ws.message_stream import MessageStream
+from freqtrade.rpc.api_server.ws.serializer import WS_SERIALIZERS, HybridJSONWebSocketSerializer
 from freqtrade.rpc.api_server.ws_schemas import (
     WSAnalyzedDFMessage,
     WSErrorMessage,
@@ -46,7 +47,7 @@ async def channel_broadcaster(channel: WebSocketChannel, message_stream: Message
     """
     Iterate over messages in the message stream and send them
     """
-    async for message, ts in message_stream:
+    async for message, ts, cache in message_stream.entries():
         if channel.subscribed_to(message.get("type")):
             # Log a warning if this channel is behind
             # on the message stream by a lot
@@ -58,7 +59,19 @@ async def channel_broadcaster(channel: WebSocketChannel, message_stream: Message
                     " consumers."
                 )
 
-            await channel.send(message, use_timeout=True)
+            # Serialized once per message format, for all channels
+            await channel.send(message, use_timeout=True, cache=cache)
+
+
+def _parse_since(since: Any) -> dict[str, int] | None:
+    """Validate the last candle dates sent by a consumer - invalid entries are ignored"""
+    if not isinstance(since, dict):
+        return None
+    return {
+        pair: date
+        for pair, date in since.items()
+        if isinstance(date, int) and not isinstance(date, bool)
+    }
 
 
 async def _process_consumer_request(request: dict[str, Any], channel: WebSocketChannel, rpc: RPC):
@@ -102,9 +115,11 @@ async def _process_consumer_request(request: dict[str, Any], channel: WebSocketC
         # Limit the amount of candles per dataframe to 'limit' or 1500
         limit = int(min(data.get("limit", 1500), 1500)) if data else None
         pair = data.get("pair", None) if data else None
+        # Date (in ms) of the last candle the consumer has per pair - only newer candles are sent
+        since = _parse_since(data.get("since")) if data else None
 
         # For every pair in the generator, send a separate message
-        for message in rpc._ws_request_analyzed_df(limit, pair):
+        for message in rpc._ws_request_analyzed_df(limit, pair, since):
             # Format response
             response = WSAnalyzedDFMessage(data=message)
             await channel.send(response.model_dump(exclude_none=True))
@@ -116,9 +131,11 @@ async def message_endpoint(
     token: str = Depends(validate_ws_token),
     rpc: RPC = Depends(get_rpc),
     message_stream: MessageStream = Depends(get_message_stream),
+    message_format: str = "json",
 ):
     if token:
-        async with create_channel(websocket) as channel:
+        serializer_cls = WS_SERIALIZERS.get(message_format, HybridJSONWebSocketSerializer)
+        async with create_channel(websocket, serializer_cls=serializer_cls) as channel:
             await channel.run_channel_tasks(
                 channel_reader(channel, rpc), channel_broadcaster(channel, message_stream)
             )
@@ -2,7 +2,7 @@ from collections.abc import AsyncIterator
 from typing import Any
 from uuid import uuid4
 
-from fastapi import Depends, HTTPException
+from fastapi import Depends, Header, HTTPException
 
 from freqtrade.constants import Config
 from freqtrade.enums import RunMode
@@ -11,7 +11,7 @@ from freqtrade.persistence.models import _request_id_ctx_var
 from freqtrade.rpc.api_server.webserver_bgwork import ApiBG
 from freqtrade.rpc.rpc import RPC, RPCException
 
-from .webserver import ApiServer
+from .webserver import ARROW_STREAM_MEDIA_TYPE, ApiServer
 
 
 def get_rpc_optional() -> RPC | None:
@@ -69,3 +69,11 @@ def is_webserver_mode(config=Depends(get_config)):
     if config["runmode"] != RunMode.WEBSERVER:
         raise HTTPException(status_code=503, detail="Bot is not in the correct state.")
     return None
+
+
+def accepts_arrow_stream(accept: str | None = Header(None)) -> bool:
+    """
+    Content negotiation for dataframe endpoints.
+    Arrow is only returned if explicitly requested by the client.
+    """
+    return accept is not None and ARROW_STREAM_MEDIA_TYPE in accept
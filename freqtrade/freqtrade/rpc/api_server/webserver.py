@@ -6,7 +6,7 @@ import orjson
 import uvicorn
 from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 
 from freqtrade.configuration import running_in_docker
 from freqtrade.constants import Config
@@ -32,6 +32,17 @@ class FTJSONResponse(JSONResponse):
         return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
 
 
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
+class FTArrowResponse(Response):
+    """
+    Response for already serialized Arrow IPC streams.
+    """
+
+    media_type = ARROW_STREAM_MEDIA_TYPE
+
+
 class ApiServer(RPCHandler):
     __instance = None
     __initialized = False
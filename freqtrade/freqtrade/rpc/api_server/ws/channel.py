@@ -80,7 +80,12 @@ class WebSocketChannel:
             # maximum of 3 seconds per message
             self._send_high_limit = min(max(self.avg_send_time * 2, 1), 3)
 
-    async def send(self, message: WSMessageSchemaType | dict[str, Any], use_timeout: bool = False):
+    async def send(
+        self,
+        message: WSMessageSchemaType | dict[str, Any],
+        use_timeout: bool = False,
+        cache: dict[str, Any] | None = None,
+    ):
         """
         Send a message on the wrapped websocket. If the sending
         takes too long, it will raise a TimeoutError and
@@ -88,6 +93,7 @@ class WebSocketChannel:
 
         :param message: The message to send
         :param use_timeout: Enforce send high limit, defaults to False
+        :param cache: Serialized messages shared between channels, see MessageStream.entries
         """
         try:
             _ = time.time()
@@ -95,7 +101,7 @@ class WebSocketChannel:
             # a TimeoutError and bubble up to the
             # message_endpoint to close the connection
             await asyncio.wait_for(
-                self._wrapped_ws.send(message),
+                self._wrapped_ws.send(message, cache),
                 timeout=self._send_high_limit if use_timeout else None,
             )
             total_time = time.time() - _
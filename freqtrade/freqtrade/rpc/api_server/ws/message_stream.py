@@ -19,14 +19,22 @@ class MessageStream:
         :param message: The message to publish
         """
         waiter, self._waiter = self._waiter, self._loop.create_future()
-        waiter.set_result((message, time.time(), self._waiter))
+        waiter.set_result((message, time.time(), {}, self._waiter))
 
     async def __aiter__(self):
         """
         Iterate over the messages in the message stream
         """
+        async for message, ts, _ in self.entries():
+            yield message, ts
+
+    async def entries(self):
+        """
+        Iterate over the messages in the message stream, together with a cache
+        shared by all subscribers of this message (e.g. for the serialized message)
+        """
         waiter = self._waiter
         while True:
             # Shield the future from being cancelled by a task waiting on it
-            message, ts, waiter = await asyncio.shield(waiter)
-            yield message, ts
+            message, ts, cache, waiter = await asyncio.shield(waiter)
+            yield message, ts, cache
@@ -1,6 +1,7 @@
 from typing import Any
 
 from fastapi import WebSocket as FastAPIWebSocket
+from fastapi import WebSocketDisconnect
 from websockets.asyncio.client import ClientConnection as WebSocket
 
 from freqtrade.rpc.api_server.ws.ws_types import WebSocketType
@@ -34,7 +35,10 @@ class WebSocketProxy:
         Send data on the wrapped websocket
         """
         if hasattr(self._websocket, "send_text"):
-            await self._websocket.send_text(data)
+            if isinstance(data, bytes):
+                await self._websocket.send_bytes(data)
+            else:
+                await self._websocket.send_text(data)
         else:
             await self._websocket.send(data)
 
@@ -43,7 +47,13 @@ class WebSocketProxy:
         Receive data on the wrapped websocket
         """
         if hasattr(self._websocket, "receive_text"):
-            return await self._websocket.receive_text()
+            # Text or binary, depending on the consumer's message format
+            message = await self._websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message["code"], message.get("reason"))
+            if message.get("text") is not None:
+                return message["text"]
+            return message["bytes"]
         else:
             return await self._websocket.recv()
 
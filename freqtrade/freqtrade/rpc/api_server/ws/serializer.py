@@ -1,12 +1,19 @@
 import logging
+import struct
 from abc import ABC, abstractmethod
 from typing import Any
 
 import orjson
+import pyarrow as pa
 import rapidjson
 from pandas import DataFrame
 
-from freqtrade.misc import dataframe_to_json, json_to_dataframe
+from freqtrade.misc import (
+    arrow_ipc_to_dataframe,
+    dataframe_to_arrow_ipc,
+    dataframe_to_json,
+    json_to_dataframe,
+)
 from freqtrade.rpc.api_server.ws.proxy import WebSocketProxy
 from freqtrade.rpc.api_server.ws_schemas import WSMessageSchemaType
 
@@ -15,6 +22,8 @@ logger = logging.getLogger(__name__)
 
 
 class WebSocketSerializer(ABC):
+    message_format: str
+
     def __init__(self, websocket: WebSocketProxy):
         self._websocket: WebSocketProxy = websocket
 
@@ -26,8 +35,18 @@ class WebSocketSerializer(ABC):
     def _deserialize(self, data):
         raise NotImplementedError()
 
-    async def send(self, data: WSMessageSchemaType | dict[str, Any]):
-        await self._websocket.send(self._serialize(data))
+    async def send(
+        self, data: WSMessageSchemaType | dict[str, Any], cache: dict[str, Any] | None = None
+    ):
+        """
+        :param cache: Serialized messages per format, shared by all channels sending
+            this message - so the message is only serialized once per format.
+        """
+        if cache is None:
+            payload = self._serialize(data)
+        elif (payload := cache.get(self.message_format)) is None:
+            payload = cache[self.message_format] = self._serialize(data)
+        await self._websocket.send(payload)
 
     async def recv(self) -> bytes:
         data = await self._websocket.recv()
@@ -35,6 +54,8 @@ class WebSocketSerializer(ABC):
 
 
 class HybridJSONWebSocketSerializer(WebSocketSerializer):
+    message_format = "json"
+
     def _serialize(self, data) -> str:
         return str(orjson.dumps(data, default=_json_default), "utf-8")
 
@@ -55,3 +76,87 @@ def _json_object_hook(z):
     if z.get("__type__") == "dataframe":
         return json_to_dataframe(z.get("__value__"))
     return z
+
+
+class BinaryWebSocketSerializer(WebSocketSerializer):
+    """
+    Binary messages: the length of the JSON envelope (4 bytes, little endian),
+    the JSON envelope, followed by the Arrow IPC stream of every DataFrame in the message,
+    each prefixed by its length (8 bytes, little endian).
+    DataFrames are referenced in the envelope by their position.
+    Text messages are read as JSON, for producers not supporting the binary format.
+    """
+
+    message_format = "binary"
+
+    def _serialize(self, data) -> bytes:
+        frames: list[bytes] = []
+
+        def default(z):
+            if isinstance(z, DataFrame):
+                try:
+                    frames.append(dataframe_to_arrow_ipc(z))
+                except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                    # Columns Arrow can't represent
+                    return _json_default(z)
+                return {"__type__": "dataframe", "__frame__": len(frames) - 1}
+            raise TypeError
+
+        envelope = orjson.dumps(data, default=default)
+        parts = [_ENVELOPE_SIZE.pack(len(envelope)), envelope]
+        for frame in frames:
+            parts += [_FRAME_SIZE.pack(len(frame)), frame]
+        return b"".join(parts)
+
+    def _deserialize(self, data: str | bytes):
+        return _binary_to_message(data)
+
+
+class BinaryConsumerWebSocketSerializer(HybridJSONWebSocketSerializer):
+    """
+    Consumer side of the binary format. Requests contain no DataFrames and are sent as
+    JSON text, which every producer can read - messages are received as binary messages,
+    or as JSON from producers not supporting the binary format.
+    """
+
+    def _deserialize(self, data: str | bytes):
+        return _binary_to_message(data)
+
+
+def _binary_to_message(data: str | bytes):
+    """Decode a message written by BinaryWebSocketSerializer - text messages are JSON"""
+    if isinstance(data, str):
+        return rapidjson.loads(data, object_hook=_json_object_hook)
+
+    (size,) = _ENVELOPE_SIZE.unpack_from(data)
+    offset = _ENVELOPE_SIZE.size + size
+    envelope = data[_ENVELOPE_SIZE.size : offset]
+    frames = []
+    view = memoryview(data)
+    while offset < len(data):
+        (size,) = _FRAME_SIZE.unpack_from(data, offset)
+        offset += _FRAME_SIZE.size
+        frames.append(view[offset : offset + size])
+        offset += size
+
+    def object_hook(z):
+        if z.get("__type__") == "dataframe" and "__frame__" in z:
+            return arrow_ipc_to_dataframe(frames[z["__frame__"]])[0]
+        return _json_object_hook(z)
+
+    return rapidjson.loads(envelope, object_hook=object_hook)
+
+
+_ENVELOPE_SIZE = struct.Struct("<I")
+_FRAME_SIZE = struct.Struct("<Q")
+
+# Serializers per message format - negotiated when connecting to the message websocket.
+WS_SERIALIZERS: dict[str, type[WebSocketSerializer]] = {
+    HybridJSONWebSocketSerializer.message_format: HybridJSONWebSocketSerializer,
+    BinaryWebSocketSerializer.message_format: BinaryWebSocketSerializer,
+}
+# Serializers used by consumers per requested message format.
+WS_CONSUMER_SERIALIZERS: dict[str, type[WebSocketSerializer]] = {
+    HybridJSONWebSocketSerializer.message_format: HybridJSONWebSocketSerializer,
+    BinaryWebSocketSerializer.message_format: BinaryConsumerWebSocketSerializer,
+}
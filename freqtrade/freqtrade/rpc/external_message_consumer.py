@@ -21,6 +21,7 @@ from freqtrade.enums import RPCMessageType
 from freqtrade.misc import remove_entry_exit_signals
 from freqtrade.rpc.api_server.ws.channel import WebSocketChannel, create_channel
 from freqtrade.rpc.api_server.ws.message_stream import MessageStream
+from freqtrade.rpc.api_server.ws.serializer import WS_CONSUMER_SERIALIZERS
 from freqtrade.rpc.api_server.ws_schemas import (
     WSAnalyzedDFMessage,
     WSAnalyzedDFRequest,
@@ -30,6 +31,7 @@ from freqtrade.rpc.api_server.ws_schemas import (
     WSWhitelistMessage,
     WSWhitelistRequest,
 )
+from freqtrade.util import dt_ts
 
 
 class Producer(TypedDict):
@@ -79,6 +81,9 @@ class ExternalMessageConsumer:
         # as the websockets client expects bytes.
         self.message_size_limit = self._emc_config.get("message_size_limit", 8) << 20
 
+        # Message format requested from the producers - dataframes as json or Arrow IPC.
+        self.message_format = self._emc_config.get("message_format", "json")
+
         # Setting these explicitly as they probably shouldn't be changed by a user
         # Unless we somehow integrate this with the strategy to allow creating
         # callbacks for the messages
@@ -191,19 +196,26 @@ class ExternalMessageConsumer:
                 name = producer["name"]
                 scheme = "wss" if producer.get("secure", False) else "ws"
                 ws_url = f"{scheme}://{host}:{port}/api/v1/message/ws?token={token}"
+                if self.message_format != "json":
+                    ws_url += f"&message_format={self.message_format}"
 
                 # This will raise InvalidURI if the url is bad
                 async with websockets.connect(
                     ws_url, max_size=self.message_size_limit, ping_interval=None
                 ) as ws:
-                    async with create_channel(ws, channel_id=name, send_throttle=0.5) as channel:
+                    async with create_channel(
+                        ws,
+                        channel_id=name,
+                        send_throttle=0.5,
+                        serializer_cls=WS_CONSUMER_SERIALIZERS[self.message_format],
+                    ) as channel:
                         # Create the message stream for this channel
                         self._channel_streams[name] = MessageStream()
 
                         # Run the channel tasks while connected
                         await channel.run_channel_tasks(
                             self._receive_messages(channel, producer, lock),
-                            self._send_requests(channel, self._channel_streams[name]),
+                            self._send_requests(channel, self._channel_streams[name], name),
                         )
 
             except (websockets.exceptions.InvalidURI, ValueError) as e:
@@ -234,9 +246,14 @@ class ExternalMessageConsumer:
                 await asyncio.sleep(self.sleep_time)
                 continue
 
-    async def _send_requests(self, channel: WebSocketChannel, channel_stream: MessageStream):
+    async def _send_requests(
+        self, channel: WebSocketChannel, channel_stream: MessageStream, producer_name: str
+    ):
         # Send the initial requests
         for init_request in self._initial_requests:
+            if isinstance(init_request, WSAnalyzedDFRequest):
+                # After a reconnect, only request the candles we don't have yet
+                init_request = self._add_last_candles(producer_name, init_request)
             await channel.send(schema_to_dict(init_request))
 
         # Now send any subsequent requests published to
@@ -296,6 +313,26 @@ class ExternalMessageConsumer:
         if channel_stream := self._channel_streams.get(producer_name):
             channel_stream.publish(request)
 
+    def _add_last_candles(
+        self, producer_name: str, request: WSAnalyzedDFRequest
+    ) -> WSAnalyzedDFRequest:
+        """
+        Add the date of our last candle per pair to an analyzed dataframe request,
+        so the producer only sends newer candles for these pairs.
+
+        :param producer_name: The name of the producer the request is sent to
+        :param request: The request to extend
+        """
+        pair = request.data.get("pair")
+        since = {
+            pair_key[0]: dt_ts(date)
+            for pair_key, date in self._dp._get_producer_last_candles(producer_name).items()
+            if pair in (None, pair_key[0])
+        }
+        if not since:
+            return request
+        return WSAnalyzedDFRequest(data={**request.data, "since": since})
+
     def handle_producer_message(self, producer: Producer, message: dict[str, Any]):
         """
         Handles external messages from a Producer
@@ -373,14 +410,17 @@ class ExternalMessageConsumer:
             # Set to None for all candles if we missed a full df's worth of candles
             n_missing = n_missing if n_missing < FULL_DATAFRAME_THRESHOLD else 1500
 
+            request = WSAnalyzedDFRequest(data={"limit": n_missing, "pair": pair})
+            if n_missing < FULL_DATAFRAME_THRESHOLD:
+                # The producer only sends the candles from our last candle on
+                request = self._add_last_candles(producer_name, request)
+
             logger.warning(
                 f"Holes in data or no existing df, requesting {n_missing} candles "
                 f"for {key} from `{producer_name}`"
             )
 
-            self.send_producer_request(
-                producer_name, WSAnalyzedDFRequest(data={"limit": n_missing, "pair": pair})
-            )
+            self.send_producer_request(producer_name, request)
             return
 
         logger.debug(
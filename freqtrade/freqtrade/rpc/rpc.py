@@ -11,15 +11,19 @@ from typing import TYPE_CHECKING, Any
 import psutil
 from dateutil.relativedelta import relativedelta
 from dateutil.tz import tzlocal
-from numpy import inf, int64, isnan, mean, nan
+from numpy import inf, int64, isnan, nan
 from pandas import DataFrame, NaT
 from sqlalchemy import func, select
 
 from freqtrade import __version__
 from freqtrade.configuration.timerange import TimeRange
-from freqtrade.constants import CANCEL_REASON, DEFAULT_DATAFRAME_COLUMNS, Config
+from freqtrade.constants import (
+    CANCEL_REASON,
+    DEFAULT_DATAFRAME_COLUMNS,
+    FULL_DATAFRAME_THRESHOLD,
+    Config,
+)
 from freqtrade.data.history import load_data
-from freqtrade.data.metrics import DrawDownResult, calculate_expectancy, calculate_max_drawdown
 from freqtrade.enums import (
     CandleType,
     ExitCheckTuple,
@@ -34,8 +38,10 @@ from freqtrade.exchange import Exchange, timeframe_to_minutes, timeframe_to_msec
 from freqtrade.exchange.exchange_utils import price_to_precision
 from freqtrade.ft_types import AnnotationType
 from freqtrade.loggers import bufferHandler
+from freqtrade.misc import dataframe_to_arrow_ipc
 from freqtrade.persistence import CustomDataWrapper, KeyValueStore, PairLocks, Trade
 from freqtrade.persistence.models import PairLock
+from freqtrade.persistence.trade_statistics import ClosedTradeStatistics
 from freqtrade.plugins.pairlist.pairlist_helpers import expand_pairlist
 from freqtrade.rpc.fiat_convert import CryptoToFiatConverter
 from freqtrade.rpc.rpc_types import RPCSendMsg
@@ -121,6 +127,9 @@ class RPC:
         self._config: Config = freqtrade.config
         if self._config.get("fiat_display_currency"):
             self._fiat_converter = CryptoToFiatConverter(self._config)
+        self._closed_trade_stats: ClosedTradeStatistics | None = None
+        # (timeunit, timescale, start_date) -> (closed_trades_version, profit per period)
+        self._timeunit_profit_cache: dict[tuple, tuple[int, dict[date, tuple[float, int]]]] = {}
 
     @staticmethod
     def _rpc_show_config(
@@ -393,29 +402,16 @@ class RPC:
         profit_units: dict[date, dict] = {}
         daily_stake = self._freqtrade.wallets.get_total_stake_amount()
 
-        for day in range(0, timescale):
-            profitday = start_date - time_offset(day)
-            # Only query for necessary columns for performance reasons.
-            trades = Trade.session.execute(
-                select(Trade.close_profit_abs)
-                .filter(
-                    Trade.is_open.is_(False),
-                    Trade.close_date >= profitday,
-                    Trade.close_date < (profitday + time_offset(1)),
-                )
-                .order_by(Trade.close_date)
-            ).all()
-
-            curdayprofit = sum(
-                trade.close_profit_abs for trade in trades if trade.close_profit_abs is not None
-            )
+        for profitday, (curdayprofit, trade_count) in self._timeunit_closed_profit(
+            start_date, timescale, timeunit, time_offset
+        ).items():
             # Calculate this periods starting balance
             daily_stake = daily_stake - curdayprofit
             profit_units[profitday] = {
                 "amount": curdayprofit,
                 "daily_stake": daily_stake,
                 "rel_profit": round(curdayprofit / daily_stake, 8) if daily_stake > 0 else 0,
-                "trades": len(trades),
+                "trades": trade_count,
             }
 
         data = [
@@ -441,6 +437,43 @@ class RPC:
             "data": data,
         }
 
+    def _timeunit_closed_profit(
+        self, start_date: date, timescale: int, timeunit: str, time_offset
+    ) -> dict[date, tuple[float, int]]:
+        """
+        Realized profit and trade count per period, newest period first.
+        Uses one grouped query (per close day), rolled up into the requested timeunit.
+        Results are cached until the next trade is closed.
+        """
+        key = (timeunit, timescale, start_date)
+        cached = self._timeunit_profit_cache.get(key)
+        if cached and cached[0] == Trade.closed_trades_version:
+            return cached[1]
+
+        periods = [start_date - time_offset(step) for step in range(0, timescale)]
+        profit_per_day = Trade.get_closed_profit_per_day(periods[-1])
+
+        def period_start(day: date) -> date:
+            if timeunit == "weeks":
+                return day - timedelta(days=day.weekday())
+            if timeunit == "months":
+                return day.replace(day=1)
+            return day
+
+        result = {period: (0.0, 0) for period in periods}
+        for day, (profit, count) in profit_per_day.items():
+            period = period_start(day)
+            if period in result:
+                period_profit, period_count = result[period]
+                result[period] = (period_profit + profit, period_count + count)
+
+        # Only the latest result per timeunit / timescale is relevant
+        self._timeunit_profit_cache = {
+            k: v for k, v in self._timeunit_profit_cache.items() if k[:2] != key[:2]
+        }
+        self._timeunit_profit_cache[key] = (Trade.closed_trades_version, result)
+        return result
+
     def _rpc_trade_history(self, limit: int, offset: int = 0, order_by_id: bool = False) -> dict:
         """Returns the X last trades"""
         order_by: Any = Trade.id if order_by_id else Trade.close_date.desc()
@@ -505,75 +538,64 @@ class RPC:
     def _rpc_trade_statistics(
         self, stake_currency: str, fiat_display_currency: str, start_date: datetime | None = None
     ) -> dict[str, Any]:
-        """Returns cumulative profit statistics"""
-
-        start_date = datetime.fromtimestamp(0) if start_date is None else start_date
-
-        trade_filter = (
-            Trade.is_open.is_(False) & (Trade.close_date >= start_date)
-        ) | Trade.is_open.is_(True)
-        trades: Sequence[Trade] = Trade.session.scalars(
-            Trade.get_trades_query(trade_filter, include_orders=False).order_by(Trade.id)
-        ).all()
-
-        profit_all_coin = []
-        profit_all_ratio = []
-        profit_closed_coin = []
-        profit_closed_ratio = []
-        durations = []
-        winning_trades = 0
-        losing_trades = 0
-        winning_profit = 0.0
-        losing_profit = 0.0
+        """
+        Returns cumulative profit statistics.
+        Closed trades are taken from an incrementally updated aggregate (ClosedTradeStatistics),
+        only open trades are evaluated against current rates.
+        """
+        starting_balance = self._freqtrade.wallets.get_starting_balance()
+        if start_date is None:
+            if self._closed_trade_stats is None:
+                self._closed_trade_stats = ClosedTradeStatistics.from_database()
+            else:
+                self._closed_trade_stats = self._closed_trade_stats.refresh()
+            closed = self._closed_trade_stats
+        else:
+            closed = ClosedTradeStatistics.from_database(start_date)
 
-        for trade in trades:
+        open_trades = Trade.get_open_trades()
+        profit_open_coin = []
+        profit_open_ratio = []
+        durations_open = []
+
+        for trade in open_trades:
             current_rate: float = 0.0
 
             if trade.close_date:
-                durations.append((trade.close_date - trade.open_date).total_seconds())
-
-            if not trade.is_open:
-                profit_ratio = trade.close_profit or 0.0
-                profit_abs = trade.close_profit_abs or 0.0
-                profit_closed_coin.append(profit_abs)
-                profit_closed_ratio.append(profit_ratio)
-                if profit_ratio >= 0:
-                    winning_trades += 1
-                    winning_profit += profit_abs
-                else:
-                    losing_trades += 1
-                    losing_profit += profit_abs
+                durations_open.append((trade.close_date - trade.open_date).total_seconds())
+
+            # Get current rate
+            if len(trade.select_filled_orders(trade.entry_side)) == 0:
+                # Skip trades with no filled orders
+                continue
+            try:
+                current_rate = self._freqtrade.exchange.get_rate(
+                    trade.pair, side="exit", is_short=trade.is_short, refresh=False
+                )
+            except (PricingError, ExchangeError):
+                current_rate = nan
+                profit_ratio = nan
+                profit_abs = nan
             else:
-                # Get current rate
-                if len(trade.select_filled_orders(trade.entry_side)) == 0:
-                    # Skip trades with no filled orders
-                    continue
-                try:
-                    current_rate = self._freqtrade.exchange.get_rate(
-                        trade.pair, side="exit", is_short=trade.is_short, refresh=False
-                    )
-                except (PricingError, ExchangeError):
-                    current_rate = nan
-                    profit_ratio = nan
-                    profit_abs = nan
-                else:
-                    _profit = trade.calculate_profit(trade.close_rate or current_rate)
+                _profit = trade.calculate_profit(trade.close_rate or current_rate)
 
-                    profit_ratio = _profit.profit_ratio
-                    profit_abs = _profit.total_profit
+                profit_ratio = _profit.profit_ratio
+                profit_abs = _profit.total_profit
 
-            profit_all_coin.append(profit_abs)
-            profit_all_ratio.append(profit_ratio)
+            profit_open_coin.append(profit_abs)
+            profit_open_ratio.append(profit_ratio)
 
-        closed_trade_count = len([t for t in trades if not t.is_open])
+        closed_trade_count = closed.closed_trade_count
 
-        best_pair = Trade.get_best_pair(start_date)
-        trading_volume = Trade.get_trading_volume(start_date)
+        best_pair = Trade.get_best_pair(start_date or datetime.fromtimestamp(0))
+        trading_volume = Trade.get_trading_volume(start_date or datetime.fromtimestamp(0))
 
         # Prepare data to display
-        profit_closed_coin_sum = round(sum(profit_closed_coin), 8)
-        profit_closed_ratio_mean = float(mean(profit_closed_ratio) if profit_closed_ratio else 0.0)
-        profit_closed_ratio_sum = sum(profit_closed_ratio) if profit_closed_ratio else 0.0
+        profit_closed_coin_sum = round(closed.profit_closed_coin, 8)
+        profit_closed_ratio_sum = closed.profit_closed_ratio_sum
+        profit_closed_ratio_mean = (
+            profit_closed_ratio_sum / closed_trade_count if closed_trade_count else 0.0
+        )
 
         profit_closed_fiat = (
             self._fiat_converter.convert_amount(
@@ -583,47 +605,29 @@ class RPC:
             else 0
         )
 
-        profit_all_coin_sum = round(sum(profit_all_coin), 8)
-        profit_all_ratio_mean = float(mean(profit_all_ratio) if profit_all_ratio else 0.0)
+        profit_all_coin_sum = round(closed.profit_closed_coin + sum(profit_open_coin), 8)
+        profit_all_count = closed_trade_count + len(profit_open_ratio)
         # Doing the sum is not right - overall profit needs to be based on initial capital
-        profit_all_ratio_sum = sum(profit_all_ratio) if profit_all_ratio else 0.0
-        starting_balance = self._freqtrade.wallets.get_starting_balance()
+        profit_all_ratio_sum = profit_closed_ratio_sum + sum(profit_open_ratio)
+        profit_all_ratio_mean = float(
+            profit_all_ratio_sum / profit_all_count if profit_all_count else 0.0
+        )
         profit_closed_ratio_fromstart = 0.0
         profit_all_ratio_fromstart = 0.0
         if starting_balance:
             profit_closed_ratio_fromstart = profit_closed_coin_sum / starting_balance
             profit_all_ratio_fromstart = profit_all_coin_sum / starting_balance
 
-        profit_factor = winning_profit / abs(losing_profit) if losing_profit else float("inf")
-
-        winrate = (winning_trades / closed_trade_count) if closed_trade_count > 0 else 0
-
-        trades_df = DataFrame(
-            [
-                {
-                    "close_date": format_date(trade.close_date),
-                    "close_date_dt": trade.close_date,
-                    "profit_abs": trade.close_profit_abs,
-                }
-                for trade in trades
-                if not trade.is_open and trade.close_date
-            ]
+        profit_factor = (
+            closed.winning_profit / abs(closed.losing_profit)
+            if closed.losing_profit
+            else float("inf")
         )
 
-        expectancy, expectancy_ratio = calculate_expectancy(trades_df)
+        winrate = (closed.winning_trades / closed_trade_count) if closed_trade_count > 0 else 0
 
-        drawdown = DrawDownResult()
-        if len(trades_df) > 0:
-            try:
-                drawdown = calculate_max_drawdown(
-                    trades_df,
-                    value_col="profit_abs",
-                    date_col="close_date_dt",
-                    starting_balance=starting_balance,
-                )
-            except ValueError:
-                # ValueError if no losing trade.
-                pass
+        expectancy, expectancy_ratio = closed.expectancy
+        drawdown = closed.get_drawdown(starting_balance)
 
         profit_all_fiat = (
             self._fiat_converter.convert_amount(
@@ -633,9 +637,13 @@ class RPC:
             else 0
         )
 
-        first_date = trades[0].open_date_utc if trades else None
-        last_date = trades[-1].open_date_utc if trades else None
-        num = float(len(durations) or 1)
+        # First / latest trade by trade id - open or closed
+        trade_dates = [(t.id, t.open_date_utc) for t in open_trades]
+        trade_dates += [t for t in (closed.first_trade, closed.latest_trade) if t]
+        first_date = min(trade_dates)[1] if trade_dates else None
+        last_date = max(trade_dates)[1] if trade_dates else None
+        duration_sum = closed.duration_sum + sum(durations_open)
+        num = float((closed.duration_count + len(durations_open)) or 1)
         bot_start = KeyValueStore.get_datetime_value("bot_start_time")
         return {
             "profit_closed_coin": profit_closed_coin_sum,
@@ -654,7 +662,7 @@ class RPC:
             "profit_all_ratio": profit_all_ratio_fromstart,
             "profit_all_percent": round(profit_all_ratio_fromstart * 100, 2),
             "profit_all_fiat": profit_all_fiat,
-            "trade_count": len(trades),
+            "trade_count": closed_trade_count + len(open_trades),
             "closed_trade_count": closed_trade_count,
             "first_trade_date": format_date(first_date),
             "first_trade_humanized": dt_humanize_delta(first_date) if first_date else "",
@@ -662,13 +670,13 @@ class RPC:
             "latest_trade_date": format_date(last_date),
             "latest_trade_humanized": dt_humanize_delta(last_date) if last_date else "",
             "latest_trade_timestamp": dt_ts_def(last_date, 0),
-            "avg_duration": str(timedelta(seconds=sum(durations) / num)).split(".")[0],
+            "avg_duration": str(timedelta(seconds=duration_sum / num)).split(".")[0],
             "best_pair": best_pair[0] if best_pair else "",
             "best_rate": round(best_pair[1] * 100, 2) if best_pair else 0,  # Deprecated
             "best_pair_profit_ratio": best_pair[1] if best_pair else 0,
             "best_pair_profit_abs": best_pair[2] if best_pair else 0,
-            "winning_trades": winning_trades,
-            "losing_trades": losing_trades,
+            "winning_trades": closed.winning_trades,
+            "losing_trades": closed.losing_trades,
             "profit_factor": profit_factor,
             "winrate": winrate,
             "expectancy": expectancy,
@@ -1350,16 +1358,13 @@ class RPC:
         return self._freqtrade.edge.accepted_pairs()
 
     @staticmethod
-    def _convert_dataframe_to_dict(
-        strategy: str,
-        pair: str,
-        timeframe: str,
-        dataframe: DataFrame,
-        last_analyzed: datetime,
-        selected_cols: list[str] | None,
-        annotations: list[AnnotationType],
-    ) -> dict[str, Any]:
-        has_content = len(dataframe) != 0
+    def _prepare_analysed_dataframe(
+        dataframe: DataFrame, selected_cols: list[str] | None
+    ) -> tuple[DataFrame, list[str], dict[str, int]]:
+        """
+        Select columns and add plotting helper columns (date timestamp, signal close).
+        :return: Tuple of (dataframe, all columns of the original dataframe, signal counts)
+        """
         dataframe_columns = list(dataframe.columns)
         signals = {
             "enter_long": 0,
@@ -1367,7 +1372,7 @@ class RPC:
             "enter_short": 0,
             "exit_short": 0,
         }
-        if has_content:
+        if len(dataframe) != 0:
             if selected_cols is not None:
                 # Ensure OHLCV columns are always present
                 cols_set = set(DEFAULT_DATAFRAME_COLUMNS + list(signals.keys()) + selected_cols)
@@ -1381,17 +1386,22 @@ class RPC:
                     mask = dataframe[sig_type] == 1
                     signals[sig_type] = int(mask.sum())
                     dataframe.loc[mask, f"_{sig_type}_signal_close"] = dataframe.loc[mask, "close"]
+        return dataframe, dataframe_columns, signals
 
-            # band-aid until this is fixed:
-            # https://github.com/pandas-dev/pandas/issues/45836
-            datetime_types = ["datetime", "datetime64", "datetime64[ns, UTC]"]
-            date_columns = dataframe.select_dtypes(include=datetime_types)
-            for date_column in date_columns:
-                # replace NaT with `None`
-                dataframe[date_column] = dataframe[date_column].astype(object).replace({NaT: None})
-
-            dataframe = dataframe.replace({inf: None, -inf: None, nan: None})
-
+    @staticmethod
+    def _analysed_dataframe_info(
+        strategy: str,
+        pair: str,
+        timeframe: str,
+        dataframe: DataFrame,
+        dataframe_columns: list[str],
+        signals: dict[str, int],
+        last_analyzed: datetime,
+        annotations: list[AnnotationType],
+    ) -> dict[str, Any]:
+        """
+        Build the pair_candles / pair_history response - without the "data" field.
+        """
         res = {
             "pair": pair,
             "timeframe": timeframe,
@@ -1399,7 +1409,6 @@ class RPC:
             "strategy": strategy,
             "all_columns": dataframe_columns,
             "columns": list(dataframe.columns),
-            "data": dataframe.values.tolist(),
             "length": len(dataframe),
             "buy_signals": signals["enter_long"],  # Deprecated
             "sell_signals": signals["exit_long"],  # Deprecated
@@ -1415,7 +1424,7 @@ class RPC:
             "data_stop_ts": 0,
             "annotations": annotations,
         }
-        if has_content:
+        if len(dataframe) != 0:
             res.update(
                 {
                     "data_start": str(dataframe.iloc[0]["date"]),
@@ -1426,15 +1435,90 @@ class RPC:
             )
         return res
 
-    def _rpc_analysed_dataframe(
-        self, pair: str, timeframe: str, limit: int | None, selected_cols: list[str] | None
+    @staticmethod
+    def _convert_dataframe_to_dict(
+        strategy: str,
+        pair: str,
+        timeframe: str,
+        dataframe: DataFrame,
+        last_analyzed: datetime,
+        selected_cols: list[str] | None,
+        annotations: list[AnnotationType],
     ) -> dict[str, Any]:
-        """Analyzed dataframe in Dict form"""
+        dataframe, dataframe_columns, signals = RPC._prepare_analysed_dataframe(
+            dataframe, selected_cols
+        )
+        res = RPC._analysed_dataframe_info(
+            strategy,
+            pair,
+            timeframe,
+            dataframe,
+            dataframe_columns,
+            signals,
+            last_analyzed,
+            annotations,
+        )
+        if len(dataframe) != 0:
+            # band-aid until this is fixed:
+            # https://github.com/pandas-dev/pandas/issues/45836
+            datetime_types = ["datetime", "datetime64", "datetime64[ns, UTC]"]
+            date_columns = dataframe.select_dtypes(include=datetime_types)
+            for date_column in date_columns:
+                # replace NaT with `None`
+                dataframe[date_column] = dataframe[date_column].astype(object).replace({NaT: None})
+
+            dataframe = dataframe.replace({inf: None, -inf: None, nan: None})
+
+        res["data"] = dataframe.values.tolist()
+        return res
+
+    @staticmethod
+    def _convert_dataframe_to_arrow(
+        strategy: str,
+        pair: str,
+        timeframe: str,
+        dataframe: DataFrame,
+        last_analyzed: datetime,
+        selected_cols: list[str] | None,
+        annotations: list[AnnotationType],
+    ) -> bytes:
+        """
+        Columnar variant of _convert_dataframe_to_dict.
+        Columns are written as-is into an Arrow IPC stream, the remaining response fields
+        are attached as schema metadata.
+        """
+        dataframe, dataframe_columns, signals = RPC._prepare_analysed_dataframe(
+            dataframe, selected_cols
+        )
+        res = RPC._analysed_dataframe_info(
+            strategy,
+            pair,
+            timeframe,
+            dataframe,
+            dataframe_columns,
+            signals,
+            last_analyzed,
+            annotations,
+        )
+        # Arrow has no notion of inf - align with the json response, which returns null.
+        dataframe = dataframe.replace({inf: nan, -inf: nan})
+        return dataframe_to_arrow_ipc(dataframe, res)
+
+    def _rpc_analysed_dataframe(
+        self,
+        pair: str,
+        timeframe: str,
+        limit: int | None,
+        selected_cols: list[str] | None,
+        as_arrow: bool = False,
+    ) -> dict[str, Any] | bytes:
+        """Analyzed dataframe in Dict form - or as Arrow IPC stream if as_arrow is set"""
 
         _data, last_analyzed = self.__rpc_analysed_dataframe_raw(pair, timeframe, limit)
         annotations = self._freqtrade.strategy.ft_plot_annotations(pair=pair, dataframe=_data)
 
-        return RPC._convert_dataframe_to_dict(
+        convert = RPC._convert_dataframe_to_arrow if as_arrow else RPC._convert_dataframe_to_dict
+        return convert(
             self._freqtrade.config["strategy"],
             pair,
             timeframe,
@@ -1445,7 +1529,7 @@ class RPC:
         )
 
     def __rpc_analysed_dataframe_raw(
-        self, pair: str, timeframe: str, limit: int | None
+        self, pair: str, timeframe: str, limit: int | None, since: int | None = None
     ) -> tuple[DataFrame, datetime]:
         """
         Get the dataframe and last analyze from the dataprovider
@@ -1453,17 +1537,29 @@ class RPC:
         :param pair: The pair to get
         :param timeframe: The timeframe of data to get
         :param limit: The amount of candles in the dataframe
+        :param since: Date (in ms) of the last candle the receiver has. If this candle is
+                      still present, only candles from this candle on are returned.
         """
         _data, last_analyzed = self._freqtrade.dataprovider.get_analyzed_dataframe(pair, timeframe)
-        _data = _data.copy()
+
+        if since is not None and not _data.empty:
+            since_date = dt_from_ts(since)
+            start = int(_data["date"].searchsorted(since_date))
+            if (
+                start < len(_data)
+                and _data["date"].iloc[start] == since_date
+                and len(_data) - start < FULL_DATAFRAME_THRESHOLD
+            ):
+                # The candle is included, so the receiver can update it and check continuity
+                limit = len(_data) - start
 
         if limit:
             _data = _data.iloc[-limit:]
 
-        return _data, last_analyzed
+        return _data.copy(), last_analyzed
 
     def _ws_all_analysed_dataframes(
-        self, pairlist: list[str], limit: int | None
+        self, pairlist: list[str], limit: int | None, since: dict[str, int] | None = None
     ) -> Generator[dict[str, Any], None, None]:
         """
         Get the analysed dataframes of each pair in the pairlist.
@@ -1473,21 +1569,32 @@ class RPC:
         :param pairlist: A list of pairs to get
         :param limit: If an integer, limits the size of dataframe
                       If a list of string date times, only returns those candles
+        :param since: Date (in ms) of the last candle the receiver has, per pair.
+                      Only newer candles are returned for these pairs, unless the
+                      receiver's candle is no longer known.
         :returns: A generator of dictionaries with the key, dataframe, and last analyzed timestamp
         """
         timeframe = self._freqtrade.config["timeframe"]
         candle_type = self._freqtrade.config.get("candle_type_def", CandleType.SPOT)
+        since = since or {}
 
         for pair in pairlist:
-            dataframe, last_analyzed = self.__rpc_analysed_dataframe_raw(pair, timeframe, limit)
+            dataframe, last_analyzed = self.__rpc_analysed_dataframe_raw(
+                pair, timeframe, limit, since.get(pair)
+            )
 
             yield {"key": (pair, timeframe, candle_type), "df": dataframe, "la": last_analyzed}
 
-    def _ws_request_analyzed_df(self, limit: int | None = None, pair: str | None = None):
+    def _ws_request_analyzed_df(
+        self,
+        limit: int | None = None,
+        pair: str | None = None,
+        since: dict[str, int] | None = None,
+    ):
         """Historical Analyzed Dataframes for WebSocket"""
         pairlist = [pair] if pair else self._freqtrade.active_pair_whitelist
 
-        return self._ws_all_analysed_dataframes(pairlist, limit)
+        return self._ws_all_analysed_dataframes(pairlist, limit, since)
 
     def _ws_request_whitelist(self):
         """Whitelist data for WebSocket"""
@@ -1501,7 +1608,8 @@ class RPC:
         exchange: Exchange,
         selected_cols: list[str] | None,
         live: bool,
-    ) -> dict[str, Any]:
+        as_arrow: bool = False,
+    ) -> dict[str, Any] | bytes:
         timerange_parsed = TimeRange.parse_timerange(config.get("timerange"))
 
         from freqtrade.data.converter import trim_dataframe
@@ -1556,7 +1664,8 @@ class RPC:
         else:
             df_analyzed = data
 
-        return RPC._convert_dataframe_to_dict(
+        convert = RPC._convert_dataframe_to_arrow if as_arrow else RPC._convert_dataframe_to_dict
+        return convert(
             strategy_name,
             pair,
             timeframe,
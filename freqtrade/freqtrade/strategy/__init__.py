@@ -8,6 +8,15 @@ from freqtrade.exchange import (
 )
 from freqtrade.ft_types import AnnotationType
 from freqtrade.persistence import Order, PairLocks, Trade
+from freqtrade.strategy.incremental_indicators import (
+    ADX,
+    CCI,
+    EMA,
+    MOM,
+    RSI,
+    BollingerBands,
+    IncrementalIndicator,
+)
 from freqtrade.strategy.informative_decorator import informative
 from freqtrade.strategy.interface import IStrategy
 from freqtrade.strategy.parameters import (
@@ -31,6 +40,14 @@ __all__ = [
     "Order",
     "PairLocks",
     "informative",
+    # Incremental indicators
+    "IncrementalIndicator",
+    "ADX",
+    "BollingerBands",
+    "CCI",
+    "EMA",
+    "MOM",
+    "RSI",
     # Parameters
     "BooleanParameter",
     "CategoricalParameter",
@@ -0,0 +1,441 @@
+"""
+Indicators which can be updated one candle at a time.
+
+In dry/live mode, populate_indicators() is called once per new candle - but a vectorized
+indicator recomputes the whole history every time. The indicators in this module keep their
+rolling state per (pair, timeframe), so only candles which were not seen before are computed.
+Outside of dry/live mode (backtesting, hyperopt, ...), the vectorized (talib / qtpylib)
+implementation is used.
+"""
+
+import logging
+from abc import ABC, abstractmethod
+from collections import deque
+from copy import deepcopy
+from dataclasses import dataclass
+from math import fabs, nan, sqrt
+
+import numpy as np
+import talib.abstract as ta
+from pandas import DataFrame
+
+from freqtrade.vendor.qtpylib import indicators as qtpylib
+
+
+logger = logging.getLogger(__name__)
+
+
+def _is_zero(value: float) -> bool:
+    """Same as TA_IS_ZERO - used where talib uses it, to produce identical results"""
+    return -0.00000001 < value < 0.00000001
+
+
+class IncrementalIndicator(ABC):
+    """
+    Indicator with a rolling state, updated one candle at a time.
+    update() must produce the same values as reference() over the same candles.
+    """
+
+    # Column suffixes of the indicator outputs. A single output uses the column name as is.
+    outputs: tuple[str, ...] = ("",)
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Reset the rolling state"""
+
+    @abstractmethod
+    def update(self, high: float, low: float, close: float) -> tuple[float, ...]:
+        """Add one candle - returns the indicator outputs for this candle"""
+
+    @abstractmethod
+    def reference(self, dataframe: DataFrame) -> list:
+        """Vectorized calculation over the whole dataframe - one array per output"""
+
+
+class EMA(IncrementalIndicator):
+    """Exponential moving average of close - same as ta.EMA"""
+
+    def __init__(self, timeperiod: int = 30):
+        self.timeperiod = timeperiod
+        self._k = 2.0 / (timeperiod + 1)
+        self.reset()
+
+    def reset(self) -> None:
+        self._count = 0
+        self._value = 0.0
+
+    def update(self, high: float, low: float, close: float) -> tuple[float, ...]:
+        if self._count < self.timeperiod:
+            # Seeded with the simple average of the first candles
+            self._count += 1
+            self._value += close
+            if self._count < self.timeperiod:
+                return (nan,)
+            self._value /= self.timeperiod
+        else:
+            self._value = (close - self._value) * self._k + self._value
+        return (self._value,)
+
+    def reference(self, dataframe: DataFrame) -> list:
+        return [ta.EMA(dataframe, timeperiod=self.timeperiod)]
+
+
+class RSI(IncrementalIndicator):
+    """Relative strength index (Wilder smoothing) of close - same as ta.RSI"""
+
+    def __init__(self, timeperiod: int = 14):
+        self.timeperiod = timeperiod
+        self.reset()
+
+    def reset(self) -> None:
+        self._count = 0
+        self._prev_close = nan
+        self._gain = 0.0
+        self._loss = 0.0
+
+    def _value(self) -> float:
+        total = self._gain + self._loss
+        return 0.0 if _is_zero(total) else 100.0 * (self._gain / total)
+
+    def update(self, high: float, low: float, close: float) -> tuple[float, ...]:
+        self._count += 1
+        if self._count == 1:
+            self._prev_close = close
+            return (nan,)
+        change = close - self._prev_close
+        self._prev_close = close
+        if self._count <= self.timeperiod + 1:
+            if change < 0:
+                self._loss -= change
+            else:
+                self._gain += change
+            if self._count <= self.timeperiod:
+                return (nan,)
+            self._loss /= self.timeperiod
+            self._gain /= self.timeperiod
+            return (self._value(),)
+
+        self._loss *= self.timeperiod - 1
+        self._gain *= self.timeperiod - 1
+        if change < 0:
+            self._loss -= change
+        else:
+            self._gain += change
+        self._loss /= self.timeperiod
+        self._gain /= self.timeperiod
+        return (self._value(),)
+
+    def reference(self, dataframe: DataFrame) -> list:
+        return [ta.RSI(dataframe, timeperiod=self.timeperiod)]
+
+
+class ADX(IncrementalIndicator):
+    """Average directional movement index - same as ta.ADX"""
+
+    def __init__(self, timeperiod: int = 14):
+        self.timeperiod = timeperiod
+        self.reset()
+
+    def reset(self) -> None:
+        self._count = 0
+        self._prev_high = self._prev_low = self._prev_close = nan
+        self._plus_dm = self._minus_dm = self._tr = 0.0
+        self._sum_dx = 0.0
+        self._adx = nan
+
+    def _dx(self) -> float | None:
+        if _is_zero(self._tr):
+            return None
+        minus_di = 100.0 * (self._minus_dm / self._tr)
+        plus_di = 100.0 * (self._plus_dm / self._tr)
+        total = minus_di + plus_di
+        if _is_zero(total):
+            return None
+        return 100.0 * (fabs(minus_di - plus_di) / total)
+
+    def update(self, high: float, low: float, close: float) -> tuple[float, ...]:
+        period = self.timeperiod
+        self._count += 1
+        if self._count == 1:
+            self._prev_high, self._prev_low, self._prev_close = high, low, close
+            return (nan,)
+
+        diff_plus = high - self._prev_high
+        diff_minus = self._prev_low - low
+        true_range = max(high, self._prev_close) - min(low, self._prev_close)
+        self._prev_high, self._prev_low, self._prev_close = high, low, close
+
+        if self._count <= period:
+            # Sum of the initial directional movements / true ranges
+            if diff_minus > 0 and diff_plus < diff_minus:
+                self._minus_dm += diff_minus
+            elif diff_plus > 0 and diff_plus > diff_minus:
+                self._plus_dm += diff_plus
+            self._tr += true_range
+            return (nan,)
+
+        self._minus_dm -= self._minus_dm / period
+        self._plus_dm -= self._plus_dm / period
+        if diff_minus > 0 and diff_plus < diff_minus:
+            self._minus_dm += diff_minus
+        elif diff_plus > 0 and diff_plus > diff_minus:
+            self._plus_dm += diff_plus
+        self._tr = self._tr - self._tr / period + true_range
+        dx = self._dx()
+
+        if self._count <= 2 * period:
+            # The first value is the average of the initial directional indexes
+            if dx is not None:
+                self._sum_dx += dx
+            if self._count < 2 * period:
+                return (nan,)
+            self._adx = self._sum_dx / period
+        elif dx is not None:
+            self._adx = ((self._adx * (period - 1)) + dx) / period
+        return (self._adx,)
+
+    def reference(self, dataframe: DataFrame) -> list:
+        return [ta.ADX(dataframe, timeperiod=self.timeperiod)]
+
+
+class CCI(IncrementalIndicator):
+    """Commodity channel index - same as ta.CCI"""
+
+    def __init__(self, timeperiod: int = 14):
+        self.timeperiod = timeperiod
+        self.reset()
+
+    def reset(self) -> None:
+        # Summed in buffer order (like talib) to produce identical results
+        self._buffer = [0.0] * self.timeperiod
+        self._idx = 0
+        self._count = 0
+
+    def update(self, high: float, low: float, close: float) -> tuple[float, ...]:
+        period = self.timeperiod
+        typical = (high + low + close) / 3.0
+        self._buffer[self._idx] = typical
+        self._idx = (self._idx + 1) % period
+        self._count += 1
+        if self._count < period:
+            return (nan,)
+
+        average = sum(self._buffer) / period
+        deviation = sum(fabs(value - average) for value in self._buffer) / period
+        diff = typical - average
+        if diff != 0.0 and deviation != 0.0:
+            return (diff / (0.015 * deviation),)
+        return (0.0,)
+
+    def reference(self, dataframe: DataFrame) -> list:
+        return [ta.CCI(dataframe, timeperiod=self.timeperiod)]
+
+
+class MOM(IncrementalIndicator):
+    """Momentum of close - same as ta.MOM"""
+
+    def __init__(self, timeperiod: int = 10):
+        self.timeperiod = timeperiod
+        self.reset()
+
+    def reset(self) -> None:
+        self._closes: deque[float] = deque(maxlen=self.timeperiod + 1)
+
+    def update(self, high: float, low: float, close: float) -> tuple[float, ...]:
+        self._closes.append(close)
+        if len(self._closes) <= self.timeperiod:
+            return (nan,)
+        return (close - self._closes[0],)
+
+    def reference(self, dataframe: DataFrame) -> list:
+        return [ta.MOM(dataframe, timeperiod=self.timeperiod)]
+
+
+class BollingerBands(IncrementalIndicator):
+    """
+    Bollinger bands of the typical price -
+    same as qtpylib.bollinger_bands(qtpylib.typical_price(dataframe))
+    """
+
+    outputs = ("lower", "mid", "upper")
+
+    def __init__(self, window: int = 20, stds: float = 2):
+        self.window = window
+        self.stds = stds
+        self.reset()
+
+    def reset(self) -> None:
+        self._values: deque[float] = deque(maxlen=self.window)
+
+    def update(self, high: float, low: float, close: float) -> tuple[float, ...]:
+        self._values.append((high + low + close) / 3.0)
+        count = len(self._values)
+        mid = sum(self._values) / count
+        if count < 2:
+            return (nan, mid, nan)
+        std = sqrt(sum((value - mid) ** 2 for value in self._values) / (count - 1))
+        return (mid - std * self.stds, mid, mid + std * self.stds)
+
+    def reference(self, dataframe: DataFrame) -> list:
+        bands = qtpylib.bollinger_bands(
+            qtpylib.typical_price(dataframe), window=self.window, stds=self.stds
+        )
+        return [bands["lower"], bands["mid"], bands["upper"]]
+
+
+@dataclass
+class _PairState:
+    indicators: dict[str, IncrementalIndicator]
+    # Candle dates (epoch ns) and indicator columns of the last populated dataframe
+    dates: np.ndarray
+    columns: dict[str, np.ndarray]
+    last_close: float
+
+
+class IncrementalIndicators:
+    """
+    Rolling state of a set of incremental indicators, per (pair, timeframe).
+
+    populate() adds the indicator columns to a dataframe. If the dataframe continues the
+    candles seen on the previous call, only new candles are computed - otherwise (first call,
+    missing candles, changed history) all candles are recomputed.
+    """
+
+    def __init__(
+        self,
+        indicators: dict[str, IncrementalIndicator],
+        incremental: bool = True,
+        check: bool = False,
+        check_tolerance: float = 1e-6,
+    ):
+        """
+        :param indicators: Column name (prefix for multiple outputs) -> indicator
+        :param incremental: Keep the rolling state between calls. If False, the vectorized
+            implementation is used on every call.
+        :param check: Compare computed candles against a full (vectorized) recompute
+        :param check_tolerance: Relative tolerance of the check
+        """
+        self.indicators = indicators
+        self.incremental = incremental
+        self.check = check
+        self.check_tolerance = check_tolerance
+        self._states: dict[tuple[str, str], _PairState] = {}
+
+    def _column_names(self) -> list[str]:
+        return [
+            f"{name}_{suffix}" if suffix else name
+            for name, indicator in self.indicators.items()
+            for suffix in indicator.outputs
+        ]
+
+    def reference(self, dataframe: DataFrame) -> dict[str, np.ndarray]:
+        """Vectorized calculation of all indicators over the dataframe"""
+        values = [
+            np.asarray(output, dtype=np.float64)
+            for indicator in self.indicators.values()
+            for output in indicator.reference(dataframe)
+        ]
+        return dict(zip(self._column_names(), values, strict=True))
+
+    def _compute(self, state: _PairState, dataframe: DataFrame, start: int) -> list[np.ndarray]:
+        """Feed the candles from start onwards into the rolling state"""
+        rows = zip(
+            dataframe["high"].iloc[start:].tolist(),
+            dataframe["low"].iloc[start:].tolist(),
+            dataframe["close"].iloc[start:].tolist(),
+            strict=True,
+        )
+        indicators = list(state.indicators.values())
+        values = [
+            [value for indicator in indicators for value in indicator.update(high, low, close)]
+            for high, low, close in rows
+        ]
+        return list(np.array(values, dtype=np.float64).reshape(-1, len(self._column_names())).T)
+
+    @staticmethod
+    def _continues_at(state: _PairState | None, dates: np.ndarray, closes: np.ndarray) -> int:
+        """
+        Index of the first candle not seen before, or -1 if the dataframe
+        doesn't continue the candles of the previous call.
+        """
+        if state is None or len(dates) == 0 or len(state.dates) == 0:
+            return -1
+        start = int(np.searchsorted(dates, state.dates[-1], side="right"))
+        offset = len(state.dates) - start
+        if (
+            start == 0
+            or dates[start - 1] != state.dates[-1]
+            or closes[start - 1] != state.last_close
+            or offset < 0
+            or state.dates[offset] != dates[0]
+        ):
+            return -1
+        return start
+
+    def populate(self, dataframe: DataFrame, pair: str, timeframe: str) -> DataFrame:
+        """
+        Add the indicator columns to the dataframe.
+        :param dataframe: Candles of the pair, sorted by date
+        :param pair: Pair of the candles
+        :param timeframe: Timeframe of the candles
+        :return: Dataframe with the indicator columns
+        """
+        if not self.incremental:
+            for column, values in self.reference(dataframe).items():
+                dataframe[column] = values
+            return dataframe
+
+        key = (pair, timeframe)
+        state = self._states.get(key)
+        dates = dataframe["date"].to_numpy(dtype="datetime64[ns]").view(np.int64)
+        closes = dataframe["close"].to_numpy(dtype=np.float64)
+        start = self._continues_at(state, dates, closes)
+
+        if state is None or start < 0:
+            if state is not None:
+                logger.debug(f"Recomputing incremental indicators for {pair}, {timeframe}.")
+            state = _PairState(
+                indicators=deepcopy(self.indicators), dates=dates, columns={}, last_close=nan
+            )
+            for indicator in state.indicators.values():
+                indicator.reset()
+            start = 0
+
+        new_values = self._compute(state, dataframe, start)
+        offset = len(state.dates) - start
+        columns = {}
+        for column, values in zip(self._column_names(), new_values, strict=True):
+            previous = state.columns.get(column)
+            columns[column] = np.concatenate([previous[offset:], values]) if start > 0 else values
+            dataframe[column] = columns[column]
+
+        if self.check and start < len(dataframe):
+            self._check(dataframe, pair, start, columns)
+
+        state.dates = dates
+        state.columns = columns
+        state.last_close = closes[-1] if len(closes) else nan
+        self._states[key] = state
+        return dataframe
+
+    def _check(
+        self, dataframe: DataFrame, pair: str, start: int, columns: dict[str, np.ndarray]
+    ) -> None:
+        for column, expected in self.reference(dataframe).items():
+            actual = columns[column][start:]
+            expected = expected[start:]
+            if np.allclose(actual, expected, rtol=self.check_tolerance, atol=0, equal_nan=True):
+                continue
+            with np.errstate(invalid="ignore"):
+                deviation = np.nanmax(np.abs(actual - expected))
+            logger.warning(
+                f"Incremental indicator {column} for {pair} deviates from a full recompute "
+                f"by up to {deviation}."
+            )
+
+    def reset(self, pair: str | None = None) -> None:
+        """Drop the rolling state (of one pair, or of all pairs)"""
+        if pair is None:
+            self._states.clear()
+        else:
+            self._states = {key: state for key, state in self._states.items() if key[0] != pair}
@@ -4,7 +4,10 @@ This module defines the interface to apply for strategies
 """
 
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from math import isinf, isnan
 
@@ -16,6 +19,7 @@ from freqtrade.data.converter import populate_dataframe_with_trades
 from freqtrade.data.converter.converter import reduce_dataframe_footprint
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.enums import (
+    TRADE_MODES,
     CandleType,
     ExitCheckTuple,
     ExitType,
@@ -32,6 +36,7 @@ from freqtrade.ft_types import AnnotationType
 from freqtrade.misc import remove_entry_exit_signals
 from freqtrade.persistence import Order, PairLocks, Trade
 from freqtrade.strategy.hyper import HyperStrategyMixin
+from freqtrade.strategy.incremental_indicators import IncrementalIndicator, IncrementalIndicators
 from freqtrade.strategy.informative_decorator import (
     InformativeData,
     PopulateIndicators,
@@ -126,6 +131,9 @@ class IStrategy(ABC, HyperStrategyMixin):
     # Protections
     protections: list = []
 
+    # Indicators added by populate_incremental_indicators() - column name -> indicator
+    incremental_indicators: dict[str, IncrementalIndicator] = {}
+
     # Class level variables (intentional) containing
     # the dataprovider (dp) (access to other candles, historic data, ...)
     # and wallets - access to the current balance.
@@ -150,6 +158,11 @@ class IStrategy(ABC, HyperStrategyMixin):
         self.config = config
         # Dict to determine if analysis is necessary
         self._last_candle_seen_per_pair: dict[str, datetime] = {}
+        # Duration (seconds) of the last analysis, per pair
+        self.analysis_durations: dict[str, float] = {}
+        self._analyze_executor: ThreadPoolExecutor | None = None
+        self._analyze_local = threading.local()
+        self._incremental_state: IncrementalIndicators | None = None
         super().__init__(config)
 
         # Gather informative pairs from @informative-decorated methods.
@@ -220,6 +233,9 @@ class IStrategy(ABC, HyperStrategyMixin):
         Clean up FreqAI and child threads
         """
         self.freqai.shutdown()
+        if self._analyze_executor:
+            self._analyze_executor.shutdown(wait=True)
+            self._analyze_executor = None
 
     @abstractmethod
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
@@ -231,6 +247,26 @@ class IStrategy(ABC, HyperStrategyMixin):
         """
         return dataframe
 
+    def populate_incremental_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        """
+        Add the indicators defined in `incremental_indicators` to the dataframe.
+        Call this from populate_indicators().
+        In dry/live mode, the indicator state is kept per (pair, timeframe) - so only
+        candles which were not analyzed before are computed.
+        :param dataframe: DataFrame with data from the exchange
+        :param metadata: Additional information, like the currently traded pair
+        :return: a Dataframe with the indicator columns
+        """
+        if self._incremental_state is None:
+            self._incremental_state = IncrementalIndicators(
+                self.incremental_indicators,
+                incremental=self.config.get("runmode") in TRADE_MODES,
+                check=self.config.get("internals", {}).get("incremental_indicators_check", False),
+            )
+        return self._incremental_state.populate(
+            dataframe, metadata["pair"], metadata.get("timeframe", self.timeframe)
+        )
+
     def populate_buy_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
         DEPRECATED - please migrate to populate_entry_trend
@@ -1185,10 +1221,7 @@ class IStrategy(ABC, HyperStrategyMixin):
             dataframe = self.analyze_ticker(dataframe, metadata)
 
             self._last_candle_seen_per_pair[pair] = dataframe.iloc[-1]["date"]
-
-            candle_type = self.config.get("candle_type_def", CandleType.SPOT)
-            self.dp._set_cached_df(pair, self.timeframe, dataframe, candle_type=candle_type)
-            self.dp._emit_df((pair, self.timeframe, candle_type), dataframe, new_candle)
+            self._store_analyzed_df(pair, dataframe, new_candle)
 
         else:
             logger.debug("Skipping TA Analysis for already analyzed candle")
@@ -1228,13 +1261,65 @@ class IStrategy(ABC, HyperStrategyMixin):
             logger.warning("Empty dataframe for pair %s", pair)
             return
 
+    def _store_analyzed_df(self, pair: str, dataframe: DataFrame, new_candle: bool) -> None:
+        """
+        Store the analyzed dataframe in the dataprovider (and emit it to consumers).
+        Deferred while pairs are analyzed concurrently - see analyze().
+        """
+        pending = getattr(self._analyze_local, "pending", None)
+        if pending is not None:
+            pending.append((pair, dataframe, new_candle))
+            return
+        candle_type = self.config.get("candle_type_def", CandleType.SPOT)
+        self.dp._set_cached_df(pair, self.timeframe, dataframe, candle_type=candle_type)
+        self.dp._emit_df((pair, self.timeframe, candle_type), dataframe, new_candle)
+
+    def _timed_analyze_pair(self, pair: str) -> None:
+        start = time.perf_counter()
+        self.analyze_pair(pair)
+        self.analysis_durations[pair] = time.perf_counter() - start
+
+    def _analyze_pair_deferred(self, pair: str) -> list[tuple[str, DataFrame, bool]]:
+        """Analyze a pair in a worker thread - returns the results to store"""
+        self._analyze_local.pending = []
+        try:
+            self._timed_analyze_pair(pair)
+            return self._analyze_local.pending
+        finally:
+            self._analyze_local.pending = None
+
+    @property
+    def analyze_workers(self) -> int:
+        """
+        Number of threads used to analyze pairs concurrently (internals.analyze_workers).
+        FreqAI strategies are always analyzed sequentially.
+        """
+        if self.config.get("freqai", {}).get("enabled", False):
+            return 1
+        return self.config.get("internals", {}).get("analyze_workers", 1)
+
     def analyze(self, pairs: list[str]) -> None:
         """
         Analyze all pairs using analyze_pair().
+        With `internals.analyze_workers` > 1, pairs are analyzed concurrently. Results are
+        stored in the dataprovider in pair order once all pairs have been analyzed.
         :param pairs: List of pairs to analyze
         """
-        for pair in pairs:
-            self.analyze_pair(pair)
+        self.analysis_durations = {}
+        workers = self.analyze_workers
+        if workers <= 1 or len(pairs) <= 1:
+            for pair in pairs:
+                self._timed_analyze_pair(pair)
+            return
+
+        if self._analyze_executor is None:
+            self._analyze_executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="ft_analyze"
+            )
+        # map() keeps the order of pairs
+        for results in self._analyze_executor.map(self._analyze_pair_deferred, pairs):
+            for pair, dataframe, new_candle in results:
+                self._store_analyzed_df(pair, dataframe, new_candle)
 
     @staticmethod
     def preserve_df(dataframe: DataFrame) -> tuple[int, float, datetime]:
@@ -5,8 +5,9 @@ This module defines a base class for auto-hyperoptable strategies.
 
 import logging
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
-from contextlib import suppress
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
 from typing import Any, Union
 
 from freqtrade.enums import HyperoptState
@@ -26,6 +27,24 @@ from freqtrade.exceptions import OperationalException
 
 logger = logging.getLogger(__name__)
 
+# Parameters whose value was read - see track_parameter_reads()
+_parameter_reads: ContextVar[set["BaseParameter"] | None] = ContextVar(
+    "_parameter_reads", default=None
+)
+
+
+@contextmanager
+def track_parameter_reads() -> Iterator[set["BaseParameter"]]:
+    """
+    Collect the parameters whose value (or range) is read within this context.
+    """
+    reads: set[BaseParameter] = set()
+    token = _parameter_reads.set(reads)
+    try:
+        yield reads
+    finally:
+        _parameter_reads.reset(token)
+
 
 class BaseParameter(ABC):
     """
@@ -34,7 +53,6 @@ class BaseParameter(ABC):
 
     category: str | None
     default: Any
-    value: Any
     in_space: bool = False
     name: str
 
@@ -70,6 +88,17 @@ class BaseParameter(ABC):
     def __repr__(self):
         return f"{self.__class__.__name__}({self.value})"
 
+    @property
+    def value(self) -> Any:
+        reads = _parameter_reads.get()
+        if reads is not None:
+            reads.add(self)
+        return self._value
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        self._value = value
+
     @abstractmethod
     def get_space(self, name: str) -> Union["Integer", "Real", "SKDecimal", "Categorical"]:
         """
@@ -5,12 +5,13 @@ from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from pandas import DataFrame, Timestamp
 from pandas.testing import assert_frame_equal
 
 from freqtrade.configuration import TimeRange
-from freqtrade.constants import AVAILABLE_DATAHANDLERS
 from freqtrade.data.history.datahandlers.featherdatahandler import FeatherDataHandler
 from freqtrade.data.history.datahandlers.idatahandler import (
     IDataHandler,
@@ -21,7 +22,7 @@ from freqtrade.data.history.datahandlers.jsondatahandler import JsonDataHandler,
 from freqtrade.data.history.datahandlers.parquetdatahandler import ParquetDataHandler
 from freqtrade.enums import CandleType, TradingMode
 from freqtrade.exceptions import OperationalException
-from tests.conftest import log_has, log_has_re
+from tests.conftest import generate_test_data, log_has, log_has_re
 
 
 def test_datahandler_ohlcv_get_pairs(testdatadir):
@@ -290,23 +291,104 @@ def test_jsondatahandler_trades_load(testdatadir, caplog):
     assert log_has(logmsg, caplog)
 
 
-@pytest.mark.parametrize("datahandler", AVAILABLE_DATAHANDLERS)
+@pytest.mark.parametrize("datahandler", ["json", "jsongz"])
 def test_datahandler_ohlcv_append(
     datahandler,
     testdatadir,
 ):
     dh = get_datahandler(testdatadir, datahandler)
+    assert not dh.supports_append
+    assert dh.ohlcv_date_range("UNITTEST/BTC", "5m", CandleType.SPOT) is None
     with pytest.raises(NotImplementedError):
         dh.ohlcv_append("UNITTEST/ETH", "5m", DataFrame(), CandleType.SPOT)
     with pytest.raises(NotImplementedError):
         dh.ohlcv_append("UNITTEST/ETH", "5m", DataFrame(), CandleType.MARK)
 
 
-@pytest.mark.parametrize("datahandler", AVAILABLE_DATAHANDLERS)
+@pytest.mark.parametrize("datahandler", ["json", "jsongz"])
 def test_datahandler_trades_append(datahandler, testdatadir):
     dh = get_datahandler(testdatadir, datahandler)
     with pytest.raises(NotImplementedError):
-        dh.trades_append("UNITTEST/ETH", DataFrame())
+        dh.trades_append("UNITTEST/ETH", DataFrame(), TradingMode.SPOT)
+
+
+@pytest.mark.parametrize("datahandler", ["feather", "parquet"])
+def test_datahandler_ohlcv_append_segments(datahandler, tmp_path, mocker, caplog):
+    data = generate_test_data("1h", 24 * 40, "2023-01-15")
+    dh = get_datahandler(tmp_path, datahandler)
+    file = tmp_path / f"UNITTEST_NEW-1h.{dh._get_file_extension()}"
+    assert dh.ohlcv_date_range("UNITTEST/NEW", "1h", CandleType.SPOT) is None
+    # No data yet - stored as a whole
+    dh.ohlcv_append("UNITTEST/NEW", "1h", data.iloc[:500], CandleType.SPOT)
+    assert file.is_file()
+    assert dh._segment_files(file) == []
+
+    # Appended data overlaps the last candle, which is replaced
+    updated = data.iloc[499:600].copy()
+    updated.loc[499, "close"] += 1
+    dh.ohlcv_append("UNITTEST/NEW", "1h", updated, CandleType.SPOT)
+    dh.ohlcv_append("UNITTEST/NEW", "1h", data.iloc[600:601], CandleType.SPOT)
+    dh.ohlcv_append("UNITTEST/NEW", "1h", data.iloc[:0], CandleType.SPOT)
+    assert [f.name for f in dh._segment_files(file)] == [
+        f"{file.name}.00001",
+        f"{file.name}.00002",
+    ]
+    expected = data.iloc[:601].copy()
+    expected.loc[499, "close"] += 1
+    result = dh.ohlcv_load("UNITTEST/NEW", "1h", candle_type=CandleType.SPOT, fill_missing=False)
+    assert_frame_equal(result, expected)
+    assert dh.ohlcv_date_range("UNITTEST/NEW", "1h", CandleType.SPOT) == (
+        data["date"].iloc[0],
+        data["date"].iloc[600],
+    )
+    # Only the last month (and its segments) is read for the last candles
+    tr = TimeRange.parse_timerange("20230201-")
+    loaded = dh._ohlcv_load("UNITTEST/NEW", "1h", tr, candle_type=CandleType.SPOT)
+    assert loaded["date"].iloc[0] == Timestamp("2023-02-01", tz="UTC")
+    assert loaded["date"].iloc[-1] == data["date"].iloc[600]
+
+    # Compaction once there are too many segments
+    mocker.patch.object(dh, "_max_segments", 2)
+    dh.ohlcv_append("UNITTEST/NEW", "1h", data.iloc[601:700], CandleType.SPOT)
+    assert log_has_re(r"Compacting data for UNITTEST/NEW, 1h.*", caplog)
+    assert dh._segment_files(file) == []
+    expected = data.iloc[:700].copy()
+    expected.loc[499, "close"] += 1
+    result = dh.ohlcv_load("UNITTEST/NEW", "1h", candle_type=CandleType.SPOT, fill_missing=False)
+    assert_frame_equal(result, expected)
+
+    # Segments are moved and removed together with the data file
+    dh.ohlcv_append("UNITTEST/NEW", "1h", data.iloc[700:], CandleType.SPOT)
+    assert len(dh._segment_files(file)) == 1
+    dh._rename_data_file(file, tmp_path / f"UNITTEST_MOVED-1h.{dh._get_file_extension()}")
+    assert dh._segment_files(file) == []
+    result = dh.ohlcv_load("UNITTEST/MOVED", "1h", candle_type=CandleType.SPOT, fill_missing=False)
+    assert len(result) == len(data)
+    assert dh.ohlcv_purge("UNITTEST/MOVED", "1h", CandleType.SPOT)
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("datahandler", ["feather", "parquet"])
+def test_datahandler_trades_append_segments(datahandler, testdatadir, tmp_path, mocker):
+    trades = get_datahandler(testdatadir, datahandler).trades_load("XRP/ETH", TradingMode.SPOT)
+    dh = get_datahandler(tmp_path, datahandler)
+    file = tmp_path / f"XRP_NEW-trades.{dh._get_file_extension()}"
+
+    dh.trades_append("XRP/NEW", trades.iloc[:100], TradingMode.SPOT)
+    dh.trades_append("XRP/NEW", trades.iloc[100:150], TradingMode.SPOT)
+    dh.trades_append("XRP/NEW", trades.iloc[150:], TradingMode.SPOT)
+    assert len(dh._segment_files(file)) == 2
+    assert_frame_equal(dh.trades_load("XRP/NEW", TradingMode.SPOT), trades, check_exact=True)
+
+    mocker.patch.object(dh, "_max_segments", 2)
+    # Duplicate trades are removed on compaction
+    dh.trades_append("XRP/NEW", trades.iloc[-10:], TradingMode.SPOT)
+    assert dh._segment_files(file) == []
+    assert_frame_equal(dh.trades_load("XRP/NEW", TradingMode.SPOT), trades, check_exact=True)
+
+    dh.trades_append("XRP/NEW", trades.iloc[-10:], TradingMode.SPOT)
+    assert dh.trades_purge("XRP/NEW", TradingMode.SPOT)
+    assert list(tmp_path.iterdir()) == []
 
 
 @pytest.mark.parametrize(
@@ -403,6 +485,65 @@ def test_generic_datahandler_ohlcv_load_and_resave(
     assert log_has_re("Error loading data from", caplog)
 
 
+@pytest.mark.parametrize("datahandler", ["feather", "parquet"])
+def test_datahandler_ohlcv_partitions(datahandler, tmp_path):
+    data = generate_test_data("1h", 24 * 120, "2023-01-15")
+    dh = get_datahandler(tmp_path, datahandler)
+    dh.ohlcv_store("UNITTEST/NEW", "1h", data, candle_type=CandleType.SPOT)
+    file = tmp_path / f"UNITTEST_NEW-1h.{dh._get_file_extension()}"
+    if datahandler == "feather":
+        with pa.ipc.open_file(file) as reader:
+            partitions = reader.num_record_batches
+    else:
+        partitions = pq.ParquetFile(file).num_row_groups
+    # Jan - May
+    assert partitions == 5
+
+    full = dh.ohlcv_load("UNITTEST/NEW", "1h", candle_type=CandleType.SPOT, fill_missing=False)
+    assert_frame_equal(full, data)
+    for timerange, months in [
+        # Startup candles reach into the previous month
+        ("20230301-20230310", [2, 3, 4]),
+        ("20230301-", [2, 3, 4, 5]),
+        ("-20230201", [1, 2, 3]),
+        ("20230110-20230120", [1, 2]),
+        ("-20230131", [1, 2]),
+        ("20230301-20230401", [2, 3, 4, 5]),
+    ]:
+        tr = TimeRange.parse_timerange(timerange)
+        result = dh.ohlcv_load(
+            "UNITTEST/NEW",
+            "1h",
+            candle_type=CandleType.SPOT,
+            timerange=tr,
+            startup_candles=24,
+            drop_incomplete=True,
+            warn_no_data=False,
+        )
+        tr.subtract_start(24 * 3600)
+        # Only months overlapping the timerange (and the following month) are read
+        loaded = dh._ohlcv_load("UNITTEST/NEW", "1h", tr, candle_type=CandleType.SPOT)
+        assert sorted(loaded["date"].dt.month.unique()) == months
+        expected = full.loc[full["date"] >= tr.startdt] if tr.startdt else full
+        expected = expected.loc[expected["date"] <= tr.stopdt] if tr.stopdt else expected
+        if expected["date"].iloc[-1] == full["date"].iloc[-1]:
+            # Incomplete candle is only dropped at the end of the data
+            expected = expected.iloc[:-1]
+        assert_frame_equal(result, expected.reset_index(drop=True))
+
+    # Files without partitions are loaded completely
+    data.to_feather(tmp_path / "UNITTEST_OLD-1h.feather")
+    data.to_parquet(tmp_path / "UNITTEST_OLD-1h.parquet")
+    result = dh.ohlcv_load(
+        "UNITTEST/OLD",
+        "1h",
+        candle_type=CandleType.SPOT,
+        timerange=TimeRange.parse_timerange("20230301-20230310"),
+    )
+    assert result["date"].iloc[0] == Timestamp("2023-03-01", tz="UTC")
+    assert result["date"].iloc[-1] == Timestamp("2023-03-10", tz="UTC")
+
+
 @pytest.mark.parametrize("datahandler", ["jsongz", "feather", "parquet"])
 def test_datahandler_trades_load(testdatadir, datahandler):
     dh = get_datahandler(testdatadir, datahandler)
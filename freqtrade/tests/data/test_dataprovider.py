@@ -1,10 +1,12 @@
 from datetime import datetime, timezone
+from threading import Event, Thread
 from unittest.mock import MagicMock
 
 import pytest
 from pandas import DataFrame, Timestamp
 
 from freqtrade.data.dataprovider import DataProvider
+from freqtrade.data.producer_df_buffer import ProducerDataFrameBuffer
 from freqtrade.enums import CandleType, RunMode
 from freqtrade.exceptions import ExchangeError, OperationalException
 from freqtrade.plugins.pairlistmanager import PairListManager
@@ -555,6 +557,94 @@ def test_dp__add_external_df(default_conf_usdt):
     assert res[1] == 0
 
 
+def test_dp__add_external_df_in_place(default_conf_usdt):
+    timeframe = "1h"
+    default_conf_usdt["timeframe"] = timeframe
+    dp = DataProvider(default_conf_usdt, None)
+    data = generate_test_data(timeframe, 1700, "2022-01-01 00:00:00+00:00")
+    data["enter_long"] = (data.index % 7 == 0).astype(float)
+    data["enter_tag"] = None
+    last_analyzed = datetime.now(timezone.utc)
+
+    assert dp._get_producer_last_candles("default") == {}
+    dp._add_external_df("ETH/USDT", data.iloc[:1400], last_analyzed, timeframe, CandleType.SPOT)
+    end = 1400
+    for step in [1, 1, 0, 5, 60, 1, 50, 30]:
+        # Every message repeats our last candle, with an updated value
+        new = data.iloc[end - 1 : end + step].copy()
+        new.loc[new.index[0], "close"] += 1
+        data.loc[new.index[0], "close"] += 1
+        res = dp._add_external_df("ETH/USDT", new, last_analyzed, timeframe, CandleType.SPOT)
+        assert res == (True, 0)
+        end += step
+        df, _ = dp.get_producer_df("ETH/USDT", timeframe, CandleType.SPOT)
+        expected = data.iloc[max(end - 1500, 0) : end].reset_index(drop=True)
+        assert df.equals(expected)
+
+    assert dp._get_producer_last_candles("default") == {
+        ("ETH/USDT", timeframe, CandleType.SPOT): data.iloc[end - 1]["date"]
+    }
+    # Returned dataframes are copies
+    df.loc[0, "close"] = -1
+    df, _ = dp.get_producer_df("ETH/USDT", timeframe, CandleType.SPOT)
+    assert df.loc[0, "close"] > 0
+
+    # Signals received as int (e.g. decoded from json) - stored as float
+    new = data.iloc[end : end + 1].astype({"enter_long": int})
+    assert dp._add_external_df("ETH/USDT", new, last_analyzed, timeframe, CandleType.SPOT)[0]
+    df, _ = dp.get_producer_df("ETH/USDT", timeframe, CandleType.SPOT)
+    assert df["enter_long"].dtype == float
+    assert df.equals(data.iloc[end - 1499 : end + 1].reset_index(drop=True))
+
+    # Other columns require the full dataframe
+    new = data.iloc[end : end + 2].assign(extra=1)
+    res = dp._add_external_df("ETH/USDT", new, last_analyzed, timeframe, CandleType.SPOT)
+    assert res == (False, 1000)
+
+
+def test_dp__add_external_df_threaded(default_conf_usdt, mocker):
+    # The consumer thread appends candles while the strategy reads the dataframe
+    timeframe = "1h"
+    default_conf_usdt["timeframe"] = timeframe
+    dp = DataProvider(default_conf_usdt, None)
+    data = generate_test_data(timeframe, 1500, "2022-01-01 00:00:00+00:00")
+    last_analyzed = datetime.now(timezone.utc)
+    dp._add_external_df("ETH/USDT", data.iloc[:1400], last_analyzed, timeframe, CandleType.SPOT)
+    dp._add_external_df("ETH/USDT", data.iloc[1399:1401], last_analyzed, timeframe, CandleType.SPOT)
+
+    writing = Event()
+    resume = Event()
+    write = ProducerDataFrameBuffer._write
+
+    def paused_write(*args):
+        writing.set()
+        resume.wait(5)
+        write(*args)
+
+    mocker.patch.object(ProducerDataFrameBuffer, "_write", paused_write)
+    consumer = Thread(
+        target=dp._add_external_df,
+        args=("ETH/USDT", data.iloc[1400:1402], last_analyzed, timeframe, CandleType.SPOT),
+    )
+    consumer.start()
+    assert writing.wait(5)
+
+    result = []
+    reader = Thread(
+        target=lambda: result.append(dp.get_producer_df("ETH/USDT", timeframe, CandleType.SPOT))
+    )
+    reader.start()
+    # The reader waits for the append to finish
+    reader.join(0.2)
+    assert reader.is_alive()
+    resume.set()
+    consumer.join()
+    reader.join()
+
+    df, _ = result[0]
+    assert df.equals(data.iloc[:1402].reset_index(drop=True))
+
+
 def test_dp_get_required_startup(default_conf_usdt):
     timeframe = "1h"
     default_conf_usdt["timeframe"] = timeframe
@@ -16,6 +16,7 @@ from freqtrade.configuration import TimeRange
 from freqtrade.constants import DATETIME_PRINT_FORMAT
 from freqtrade.data.converter import ohlcv_to_dataframe
 from freqtrade.data.history import get_datahandler
+from freqtrade.data.history.datahandlers.featherdatahandler import FeatherDataHandler
 from freqtrade.data.history.datahandlers.jsondatahandler import JsonDataHandler, JsonGzDataHandler
 from freqtrade.data.history.history_utils import (
     _download_pair_history,
@@ -30,6 +31,7 @@ from freqtrade.data.history.history_utils import (
     validate_backtest_data,
 )
 from freqtrade.enums import CandleType, TradingMode
+from freqtrade.exceptions import OperationalException
 from freqtrade.exchange import timeframe_to_minutes
 from freqtrade.misc import file_dump_json
 from freqtrade.resolvers import StrategyResolver
@@ -37,6 +39,7 @@ from freqtrade.util import dt_ts, dt_utc
 from tests.conftest import (
     CURRENT_TEST_STRATEGY,
     EXMS,
+    generate_test_data,
     get_patched_exchange,
     log_has,
     log_has_re,
@@ -101,6 +104,75 @@ def test_load_data_mark(ohlcv_history, mocker, caplog, testdatadir) -> None:
     )
 
 
+def test_load_data_workers(mocker, caplog, testdatadir) -> None:
+    pairs = ["UNITTEST/BTC", "NOPAIR/BTC", "XLM/BTC", "ADA/BTC", "NOPAIR/ETH", "ETC/BTC"]
+    timerange = TimeRange.parse_timerange("20180110-20180120")
+    expected = load_data(testdatadir, "5m", pairs, timerange=timerange)
+    expected_logs = [r.getMessage() for r in caplog.records]
+    assert len([msg for msg in expected_logs if msg.startswith("No history for")]) == 2
+    caplog.clear()
+
+    result = load_data(testdatadir, "5m", pairs, timerange=timerange, workers=3)
+    assert list(result) == list(expected) == ["UNITTEST/BTC", "XLM/BTC", "ADA/BTC", "ETC/BTC"]
+    for pair in expected:
+        assert_frame_equal(result[pair], expected[pair])
+    # Log messages are emitted in pair order
+    assert [r.getMessage() for r in caplog.records] == expected_logs
+
+    mocker.patch(
+        "freqtrade.data.history.history_utils.load_pair_history",
+        side_effect=[DataFrame(), OperationalException("Load failure")],
+    )
+    with pytest.raises(OperationalException, match="Load failure"):
+        load_data(testdatadir, "5m", pairs[:2], workers=2)
+
+
+def test_load_data_ohlcv_cache(mocker, caplog, testdatadir, tmp_path) -> None:
+    datadir = tmp_path / "data"
+    datadir.mkdir()
+    copyfile(testdatadir / "UNITTEST_BTC-5m.feather", datadir / "UNITTEST_BTC-5m.feather")
+    cache_dir = tmp_path / "cache"
+    pairs = ["UNITTEST/BTC", "NOPAIR/BTC"]
+    timerange = TimeRange.parse_timerange("20180110-20180120")
+    expected = load_data(datadir, "5m", pairs, timerange=timerange, startup_candles=20)
+
+    load_mock = mocker.spy(FeatherDataHandler, "_ohlcv_load")
+    result = load_data(
+        datadir, "5m", pairs, timerange=timerange, startup_candles=20, ohlcv_cache_dir=cache_dir
+    )
+    assert load_mock.call_count == 2
+    assert len(list(cache_dir.glob("UNITTEST_BTC-5m-*.arrow"))) == 1
+    assert_frame_equal(result["UNITTEST/BTC"], expected["UNITTEST/BTC"])
+    caplog.clear()
+
+    # Served from the cache - memory-mapped, read-only
+    result = load_data(
+        datadir, "5m", pairs, timerange=timerange, startup_candles=20, ohlcv_cache_dir=cache_dir
+    )
+    assert load_mock.call_count == 3
+    assert_frame_equal(result["UNITTEST/BTC"], expected["UNITTEST/BTC"])
+    assert log_has(
+        "No history for NOPAIR/BTC, spot, 5m found. "
+        "Use `freqtrade download-data` to download the data",
+        caplog,
+    )
+    with pytest.raises(ValueError, match="read-only"):
+        result["UNITTEST/BTC"].loc[5, "close"] = 1
+
+    # Other settings use another entry
+    load_data(datadir, "5m", pairs, timerange=timerange, ohlcv_cache_dir=cache_dir)
+    assert load_mock.call_count == 5
+    assert len(list(cache_dir.glob("UNITTEST_BTC-5m-*.arrow"))) == 2
+
+    # Changed data files invalidate the cache
+    data = expected["UNITTEST/BTC"].iloc[:100]
+    FeatherDataHandler(datadir).ohlcv_store("UNITTEST/BTC", "5m", data, CandleType.SPOT)
+    result = load_data(datadir, "5m", pairs, ohlcv_cache_dir=cache_dir)
+    assert load_mock.call_count == 7
+    assert_frame_equal(result["UNITTEST/BTC"], data)
+    assert len(list(cache_dir.glob("UNITTEST_BTC-5m-*.arrow"))) == 1
+
+
 def test_load_data_startup_candles(mocker, testdatadir) -> None:
     ltfmock = mocker.patch(
         "freqtrade.data.history.datahandlers.featherdatahandler.FeatherDataHandler._ohlcv_load",
@@ -357,6 +429,10 @@ def test_download_pair_history2(mocker, default_conf, testdatadir, ohlcv_history
         "freqtrade.data.history.datahandlers.featherdatahandler.FeatherDataHandler.ohlcv_store",
         return_value=None,
     )
+    append_mock = mocker.patch(
+        "freqtrade.data.history.datahandlers.featherdatahandler.FeatherDataHandler.ohlcv_append",
+        return_value=None,
+    )
     exchange = get_patched_exchange(mocker, default_conf)
     mocker.patch.object(exchange, "get_historic_ohlcv", return_value=ohlcv_history)
     _download_pair_history(
@@ -380,7 +456,41 @@ def test_download_pair_history2(mocker, default_conf, testdatadir, ohlcv_history
         timeframe="1h",
         candle_type="mark",
     )
-    assert json_dump_mock.call_count == 3
+    # Existing UNITTEST/BTC 1m data is appended to
+    assert json_dump_mock.call_count == 2
+    assert append_mock.call_count == 1
+
+
+def test_download_pair_history_append(mocker, default_conf, tmp_path) -> None:
+    data = generate_test_data("1h", 24 * 60, "2023-01-01")
+    data_handler = get_datahandler(tmp_path, "feather")
+    data_handler.ohlcv_store("UNITTEST/BTC", "1h", data.iloc[:1000], CandleType.SPOT)
+    # Last stored candle was incomplete when downloaded
+    new_data = data.iloc[998:].reset_index(drop=True)
+    new_data.loc[0, "close"] += 1
+    exchange = get_patched_exchange(mocker, default_conf)
+    ghoh_mock = mocker.patch.object(exchange, "get_historic_ohlcv", return_value=new_data)
+    load_mock = mocker.spy(data_handler, "ohlcv_load")
+    store_mock = mocker.spy(data_handler, "ohlcv_store")
+
+    assert _download_pair_history(
+        datadir=tmp_path,
+        exchange=exchange,
+        data_handler=data_handler,
+        pair="UNITTEST/BTC",
+        timeframe="1h",
+        candle_type=CandleType.SPOT,
+    )
+    # Only the last candles are loaded, the new candles are appended
+    assert load_mock.call_args[1]["timerange"].startdt == data["date"].iloc[996]
+    assert ghoh_mock.call_args[1]["since_ms"] == dt_ts(data["date"].iloc[998])
+    assert store_mock.call_count == 0
+    expected = data.copy()
+    expected.loc[998, "close"] += 1
+    result = data_handler.ohlcv_load(
+        "UNITTEST/BTC", "1h", candle_type=CandleType.SPOT, fill_missing=False
+    )
+    assert_frame_equal(result, expected)
 
 
 def test_download_backtesting_data_exception(mocker, caplog, default_conf, tmp_path) -> None:
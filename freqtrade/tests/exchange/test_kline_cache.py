@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+from pandas import concat
+
+from freqtrade.data.converter import clean_ohlcv_dataframe
+from freqtrade.enums import CandleType
+from freqtrade.exchange.kline_cache import KlineBuffer, KlineCache
+from tests.conftest import generate_test_data
+
+
+KEY = ("ETH/USDT", "5m", CandleType.SPOT)
+
+
+def _combine(old, new, max_candles):
+    df = clean_ohlcv_dataframe(
+        concat([old, new], axis=0), "5m", "ETH/USDT", fill_missing=True, drop_incomplete=False
+    )
+    return df.tail(max_candles).reset_index(drop=True)
+
+
+def test_kline_cache_append():
+    data = generate_test_data("5m", 400)
+    cache = KlineCache()
+    cache[KEY] = data.iloc[:200].reset_index(drop=True)
+    expected = cache[KEY]
+    max_candles = 250
+
+    end = 200
+    for step in [1, 1, 3, 0, 60, 1, 120]:
+        # Refresh returns the last candles again, with an updated last candle
+        new = data.iloc[end - 2 : end + step].reset_index(drop=True)
+        new.loc[len(new) - 1, "close"] += 1
+        new.loc[len(new) - 1, "high"] += 2
+        expected = _combine(expected, new, max_candles)
+        assert cache.append(KEY, new, "5m", max_candles)
+        assert cache[KEY].equals(expected)
+        end += step
+
+    buffer = cache._data[KEY]
+    assert isinstance(buffer, KlineBuffer)
+    assert len(buffer) == max_candles
+    assert len(buffer.dates_i8) <= 2 * (max_candles + 120)
+
+
+def test_kline_cache_append_fallback():
+    data = generate_test_data("5m", 100)
+    cache = KlineCache()
+    cache[KEY] = data.iloc[50:80].reset_index(drop=True)
+    # Candles before the cached candles
+    assert not cache.append(KEY, data.iloc[40:60].reset_index(drop=True), "5m", 100)
+    # Gap to the cached candles
+    assert not cache.append(KEY, data.iloc[82:90].reset_index(drop=True), "5m", 100)
+    # Other columns
+    assert not cache.append(KEY, data.iloc[79:82].assign(extra=1), "5m", 100)
+    assert not isinstance(cache._data[KEY], KlineBuffer)
+
+    assert cache.append(KEY, data.iloc[79:82].reset_index(drop=True), "5m", 100)
+    assert cache[KEY].equals(data.iloc[50:82].reset_index(drop=True))
+    assert list(cache) == [KEY]
+    del cache[KEY]
+    assert KEY not in cache
+    assert len(cache) == 0
+
+
+def test_kline_cache_frame():
+    data = generate_test_data("5m", 100)
+    cache = KlineCache()
+    cache[KEY] = data.iloc[:50].reset_index(drop=True)
+    cache.append(KEY, data.iloc[50:51].reset_index(drop=True), "5m", 100)
+
+    frame = cache[KEY]
+    assert frame is cache[KEY]
+    assert frame["date"].dtype == data["date"].dtype
+    with pytest.raises(ValueError, match="read-only"):
+        frame.loc[3, "close"] = 5
+    # Copies are writable
+    copied = frame.copy()
+    copied.loc[3, "close"] = 5
+    assert copied.loc[3, "close"] == 5
+
+    # Appended candles don't change the handed out dataframe
+    cache.append(KEY, data.iloc[51:53].reset_index(drop=True), "5m", 100)
+    assert frame.equals(data.iloc[:51].reset_index(drop=True))
+    # Nor do updates to its candles - after candles were appended in between
+    updated = data.iloc[50:51].reset_index(drop=True)
+    updated["close"] += 1
+    cache.append(KEY, updated, "5m", 100)
+    assert frame.equals(data.iloc[:51].reset_index(drop=True))
+    assert cache[KEY]["close"].iloc[50] == updated["close"].iloc[0]
+    # Restore the original candle
+    cache.append(KEY, data.iloc[50:51].reset_index(drop=True), "5m", 100)
+    frame = cache[KEY]
+    assert len(frame) == 53
+
+    # Neither do updated candles
+    last = data.iloc[52:53].reset_index(drop=True)
+    last["close"] += 1
+    cache.append(KEY, last, "5m", 100)
+    assert frame.equals(data.iloc[:53].reset_index(drop=True))
+    assert cache[KEY]["close"].iloc[-1] == last["close"].iloc[0]
+    np.testing.assert_array_equal(cache[KEY]["close"].iloc[:-1], frame["close"].iloc[:-1])
@@ -9,6 +9,7 @@ from freqtrade.configuration import TimeRange
 from freqtrade.data.dataprovider import DataProvider
 from freqtrade.exceptions import OperationalException
 from freqtrade.freqai.data_kitchen import FreqaiDataKitchen
+from freqtrade.freqai.historic_predictions import HistoricPredictions
 from tests.conftest import get_patched_exchange
 from tests.freqai.conftest import get_patched_freqai_strategy
 
@@ -237,3 +238,71 @@ def test_set_initial_return_values_warning(mocker, freqai_conf):
 
     # Ensure logger error is not called
     mock_logger_warning.assert_called()
+
+
+def test_historic_predictions_append(tmp_path):
+    predictions = HistoricPredictions()
+    initial = pd.DataFrame(
+        {
+            "&-s_close": [0.1, 0.2],
+            "&-s_close_mean": 0.0,
+            "do_predict": [1, 1],
+            "label": ["up", "down"],
+            "date_pred": pd.date_range("2024-01-01", periods=2, freq="5min", tz="UTC"),
+        }
+    )
+    predictions["ETH/USDT:USDT"] = initial
+    assert predictions["ETH/USDT:USDT"] is initial
+    predictions["BTC/USDT"] = initial.copy()
+
+    expected = initial.copy()
+    dates = pd.date_range("2024-01-01 00:10", periods=40, freq="5min", tz="UTC")
+    frame = predictions["ETH/USDT:USDT"]
+    for i, date in enumerate(dates):
+        row = {"&-s_close": i, "&-s_close_mean": 0.5, "do_predict": 1, "label": "up"}
+        row["date_pred"] = date
+        predictions.append("ETH/USDT:USDT", row)
+        expected = pd.concat([expected, pd.DataFrame([row])], ignore_index=True)
+        if i == 4:
+            predictions.save(tmp_path)
+            assert sorted(f.name for f in tmp_path.iterdir()) == [
+                "BTC_USDT.arrow",
+                "ETH_USDT_USDT.arrow",
+            ]
+        if i in (10, 20):
+            predictions.save(tmp_path)
+
+    # Appending doesn't change dataframes handed out before
+    assert len(frame) == 2
+    df = predictions["ETH/USDT:USDT"]
+    assert df is predictions["ETH/USDT:USDT"]
+    assert len(df) == 42
+    pd.testing.assert_frame_equal(df, expected, check_dtype=False)
+    assert df["date_pred"].dtype == initial["date_pred"].dtype
+
+    # Only new rows are written
+    predictions.save(tmp_path)
+    assert sorted(f.name for f in tmp_path.iterdir()) == [
+        "BTC_USDT.arrow",
+        "ETH_USDT_USDT.arrow",
+        "ETH_USDT_USDT.arrow.00001",
+        "ETH_USDT_USDT.arrow.00002",
+        "ETH_USDT_USDT.arrow.00003",
+    ]
+    loaded = HistoricPredictions.load(tmp_path)
+    assert list(loaded) == ["BTC/USDT", "ETH/USDT:USDT"]
+    pd.testing.assert_frame_equal(loaded["ETH/USDT:USDT"], expected, check_dtype=False)
+    pd.testing.assert_frame_equal(loaded["BTC/USDT"], initial)
+
+    # Segments are compacted
+    loaded.max_segments = 3
+    loaded.append("ETH/USDT:USDT", row)
+    loaded.save(tmp_path)
+    assert len(list(tmp_path.glob("ETH_USDT_USDT.arrow*"))) == 1
+    # Replaced predictions are stored in full, removed pairs are deleted
+    del loaded["BTC/USDT"]
+    loaded["ETH/USDT:USDT"] = initial
+    loaded.save(tmp_path)
+    assert sorted(f.name for f in tmp_path.iterdir()) == ["ETH_USDT_USDT.arrow"]
+    loaded = HistoricPredictions.load(tmp_path)
+    pd.testing.assert_frame_equal(loaded["ETH/USDT:USDT"], initial)
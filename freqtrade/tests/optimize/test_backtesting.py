@@ -24,7 +24,14 @@ from freqtrade.exceptions import DependencyException, OperationalException
 from freqtrade.exchange import timeframe_to_next_date, timeframe_to_prev_date
 from freqtrade.exchange.exchange_utils import DECIMAL_PLACES, TICK_SIZE
 from freqtrade.optimize.backtest_caching import get_backtest_metadata_filename, get_strategy_run_id
-from freqtrade.optimize.backtesting import Backtesting
+from freqtrade.optimize.backtest_columns import PairColumns
+from freqtrade.optimize.backtesting import (
+    DATE_IDX,
+    ENTER_TAG_IDX,
+    HEADERS,
+    LONG_IDX,
+    Backtesting,
+)
 from freqtrade.persistence import LocalTrade, Trade
 from freqtrade.resolvers import StrategyResolver
 from freqtrade.util.datetime_helpers import dt_utc
@@ -751,6 +758,78 @@ def test_backtest__check_trade_exit(default_conf, mocker) -> None:
     assert res is None
 
 
+def test_backtest_get_detail_data(default_conf, mocker, testdatadir) -> None:
+    patch_exchange(mocker)
+    default_conf["timeframe_detail"] = "1m"
+    backtesting = Backtesting(default_conf)
+    pair = "UNITTEST/BTC"
+    detail = history.load_data(datadir=testdatadir, timeframe="1m", pairs=[pair])[pair]
+    backtesting.detail_data[pair] = detail
+
+    for date in (detail["date"].iloc[0], detail["date"].iloc[500], detail["date"].iloc[-2]):
+        row = [date, 1, 2, 0.5, 1.5, 1, 0, 0, 1, "enter", "exit"]
+        expected = detail.loc[
+            (detail["date"] >= date) & (detail["date"] < date + timedelta(minutes=5))
+        ].copy()
+        for col, value in zip(
+            ["enter_long", "exit_long", "enter_short", "exit_short", "enter_tag", "exit_tag"],
+            row[5:],
+            strict=True,
+        ):
+            expected.loc[:, col] = value
+
+        result = backtesting.get_detail_data(pair, row)
+        assert result == expected[HEADERS].values.tolist()
+
+    # Detail data is kept as arrays - rows are only built for the returned candles
+    dates_ns, ohlc = backtesting._get_detail_index(pair)
+    assert dates_ns.dtype == np.int64
+    assert ohlc.dtype == np.float64
+    assert ohlc.shape == (len(detail), 4)
+
+    # No detail candles in range
+    row = [detail["date"].iloc[-1] + timedelta(days=1), 1, 2, 0.5, 1.5, 0, 0, 0, 0, "", ""]
+    assert backtesting.get_detail_data(pair, row) is None
+
+    # Replaced detail data is picked up
+    backtesting.detail_data[pair] = detail.iloc[:10]
+    row = [detail["date"].iloc[8], 1, 2, 0.5, 1.5, 0, 0, 0, 0, "", ""]
+    assert len(backtesting.get_detail_data(pair, row)) == 2
+
+
+def test_backtest_ohlcv_cache(default_conf, mocker, testdatadir, tmp_path) -> None:
+    default_conf["max_open_trades"] = 10
+    default_conf["ohlcv_cache"] = True
+    default_conf["user_data_dir"] = tmp_path
+    default_conf["datadir"] = testdatadir
+    default_conf["timerange"] = "20180120-20180130"
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    mocker.patch(
+        "freqtrade.plugins.pairlistmanager.PairListManager.whitelist",
+        PropertyMock(return_value=["UNITTEST/BTC", "ETH/BTC"]),
+    )
+    backtesting = Backtesting(default_conf)
+    backtesting._set_strategy(backtesting.strategylist[0])
+    assert backtesting.ohlcv_cache_dir == tmp_path / "cache" / "ohlcv"
+
+    results = []
+    for _ in range(2):
+        # Second run uses the memory-mapped cache files
+        data, timerange = backtesting.load_bt_data()
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        results.append(
+            backtesting.backtest(processed=processed, start_date=min_date, end_date=max_date)[
+                "results"
+            ]
+        )
+    assert len(list(backtesting.ohlcv_cache_dir.glob("*.arrow"))) == 2
+    assert not results[0].empty
+    pd.testing.assert_frame_equal(results[0], results[1])
+
+
 def test_backtest_one(default_conf, mocker, testdatadir) -> None:
     default_conf["use_exit_signal"] = False
     default_conf["max_open_trades"] = 10
@@ -873,6 +952,76 @@ def test_backtest_one(default_conf, mocker, testdatadir) -> None:
         ) < round(t["close_rate"], 6) < round(ln1.iloc[0]["high"], 6)
 
 
+@pytest.mark.parametrize("use_detail", [True, False])
+def test_backtest_engine_arrays(default_conf_usdt, mocker, testdatadir, use_detail) -> None:
+    patch_exchange(mocker)
+    mocker.patch(f"{EXMS}.get_min_pair_stake_amount", return_value=0.00001)
+    mocker.patch(f"{EXMS}.get_max_pair_stake_amount", return_value=float("inf"))
+    if use_detail:
+        default_conf_usdt["timeframe_detail"] = "1m"
+    default_conf_usdt["max_open_trades"] = 10
+
+    def advise_entry(df, *args, **kwargs):
+        df.loc[(df["rsi"] < 40), "enter_long"] = 1
+        df.loc[(df["rsi"] < 40), "enter_tag"] = "rsi_low"
+        return df
+
+    pair = "XRP/ETH"
+    timerange = TimeRange.parse_timerange("20191010-20191013")
+    data = history.load_data(datadir=testdatadir, timeframe="5m", pairs=[pair], timerange=timerange)
+
+    results = {}
+    for engine in ("lists", "arrays"):
+        default_conf_usdt["backtest_engine"] = engine
+        backtesting = Backtesting(default_conf_usdt)
+        backtesting._set_strategy(backtesting.strategylist[0])
+        backtesting.strategy.populate_entry_trend = advise_entry
+        if use_detail:
+            backtesting.detail_data = history.load_data(
+                datadir=testdatadir, timeframe="1m", pairs=[pair], timerange=timerange
+            )
+        processed = backtesting.strategy.advise_all_indicators(data)
+        min_date, max_date = get_timerange(processed)
+        results[engine] = backtesting.backtest(
+            processed=deepcopy(processed), start_date=min_date, end_date=max_date
+        )["results"]
+
+    assert len(results["lists"]) > 0
+    assert (results["arrays"]["enter_tag"] == "rsi_low").all()
+    pd.testing.assert_frame_equal(results["lists"], results["arrays"])
+
+
+def test_pair_columns(testdatadir) -> None:
+    df = history.load_pair_history(pair="UNITTEST/BTC", timeframe="5m", datadir=testdatadir)
+    df["enter_long"] = 0
+    df.loc[3, "enter_long"] = 1
+    df["exit_long"] = 0
+    df["enter_short"] = 0
+    df["exit_short"] = 0
+    df["enter_tag"] = None
+    df.loc[3, "enter_tag"] = "tag1"
+    df["exit_tag"] = None
+
+    columns = PairColumns(df[HEADERS])
+    rows = df[HEADERS].values.tolist()
+    assert len(columns) == len(rows)
+    for idx in (0, 3, -1):
+        assert list(columns[idx]) == rows[idx]
+    assert columns[3][ENTER_TAG_IDX] == "tag1"
+    assert columns[3][LONG_IDX] == 1
+    assert columns[0][DATE_IDX].to_pydatetime() == df["date"].iloc[0].to_pydatetime()
+    with pytest.raises(IndexError):
+        columns[len(rows)]
+    # Rows are tuples of plain values - across chunks, in any order
+    assert len(rows) > 2048
+    assert [list(row) for row in columns] == rows
+    assert list(columns[-1]) == rows[-1]
+    assert [list(row) for row in columns[5:8]] == rows[5:8]
+    assert isinstance(columns[0], tuple)
+    # 8 bytes date + 4 * 8 bytes OHLC + 4 * 1 byte signals + 2 * 4 bytes tags
+    assert columns.nbytes == len(rows) * 52
+
+
 @pytest.mark.parametrize("use_detail", [True, False])
 def test_backtest_one_detail(default_conf_usdt, mocker, testdatadir, use_detail) -> None:
     default_conf_usdt["use_exit_signal"] = False
@@ -4,9 +4,12 @@ from functools import partial, wraps
 from pathlib import Path
 from unittest.mock import ANY, MagicMock, PropertyMock
 
+import numpy as np
+import optuna
 import pandas as pd
 import pytest
 from filelock import Timeout
+from optuna.trial import TrialState
 
 from freqtrade.commands.optimize_commands import setup_optimize_configuration, start_hyperopt
 from freqtrade.data.history import load_data
@@ -14,9 +17,16 @@ from freqtrade.enums import ExitType, RunMode
 from freqtrade.exceptions import OperationalException
 from freqtrade.optimize.hyperopt import Hyperopt
 from freqtrade.optimize.hyperopt.hyperopt_auto import HyperOptAuto
+from freqtrade.optimize.hyperopt.hyperopt_data import (
+    dump_hyperopt_data,
+    load_hyperopt_data,
+    remove_hyperopt_data,
+)
+from freqtrade.optimize.hyperopt.indicator_cache import IndicatorCache
 from freqtrade.optimize.hyperopt_tools import HyperoptTools
 from freqtrade.optimize.optimize_reports import generate_strategy_stats
 from freqtrade.optimize.space import SKDecimal, ft_IntDistribution
+from freqtrade.resolvers import StrategyResolver
 from freqtrade.strategy import IntParameter
 from freqtrade.util import dt_utc
 from tests.conftest import (
@@ -337,7 +347,7 @@ def test_params_no_optimize_details(hyperopt) -> None:
 
 
 def test_start_calls_optimizer(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump_hyperopt_data")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -541,7 +551,8 @@ def test_generate_optimizer(mocker, hyperopt_conf) -> None:
     mocker.patch.object(Path, "open")
     mocker.patch("freqtrade.configuration.config_validation.validate_config_schema")
     mocker.patch(
-        "freqtrade.optimize.hyperopt.hyperopt_optimizer.load", return_value={"XRP/BTC": None}
+        "freqtrade.optimize.hyperopt.hyperopt_optimizer.load_hyperopt_data",
+        return_value={"XRP/BTC": None},
     )
 
     optimizer_param = {
@@ -621,11 +632,11 @@ def test_clean_hyperopt(mocker, hyperopt_conf, caplog):
     h = Hyperopt(hyperopt_conf)
 
     assert unlinkmock.call_count == 2
-    assert log_has(f"Removing `{h.data_pickle_file}`.", caplog)
+    assert log_has(f"Removing `{h.data_dir.with_suffix('.pkl')}`.", caplog)
 
 
 def test_print_json_spaces_all(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump_hyperopt_data")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.file_dump_json")
     mocker.patch(
@@ -692,7 +703,7 @@ def test_print_json_spaces_all(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_print_json_spaces_default(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump_hyperopt_data")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.file_dump_json")
     mocker.patch(
@@ -749,7 +760,7 @@ def test_print_json_spaces_default(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_print_json_spaces_roi_stoploss(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump_hyperopt_data")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -804,7 +815,7 @@ def test_print_json_spaces_roi_stoploss(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_simplified_interface_roi_stoploss(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump_hyperopt_data")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -858,7 +869,7 @@ def test_simplified_interface_roi_stoploss(mocker, hyperopt_conf, capsys) -> Non
 
 
 def test_simplified_interface_all_failed(mocker, hyperopt_conf, caplog) -> None:
-    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump", MagicMock())
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump_hyperopt_data", MagicMock())
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.file_dump_json")
     mocker.patch(
         "freqtrade.optimize.backtesting.Backtesting.load_bt_data",
@@ -897,7 +908,7 @@ def test_simplified_interface_all_failed(mocker, hyperopt_conf, caplog) -> None:
 
 
 def test_simplified_interface_buy(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump_hyperopt_data")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -951,7 +962,7 @@ def test_simplified_interface_buy(mocker, hyperopt_conf, capsys) -> None:
 
 
 def test_simplified_interface_sell(mocker, hyperopt_conf, capsys) -> None:
-    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump")
+    dumper = mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump_hyperopt_data")
     dumper2 = mocker.patch("freqtrade.optimize.hyperopt.Hyperopt._save_result")
     mocker.patch(
         "freqtrade.optimize.hyperopt.hyperopt_optimizer.calculate_market_change", return_value=1.5
@@ -1017,7 +1028,7 @@ def test_simplified_interface_sell(mocker, hyperopt_conf, capsys) -> None:
     ],
 )
 def test_simplified_interface_failed(mocker, hyperopt_conf, space) -> None:
-    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump", MagicMock())
+    mocker.patch("freqtrade.optimize.hyperopt.hyperopt_optimizer.dump_hyperopt_data", MagicMock())
     mocker.patch("freqtrade.optimize.hyperopt.hyperopt.file_dump_json")
     mocker.patch(
         "freqtrade.optimize.backtesting.Backtesting.load_bt_data",
@@ -1339,3 +1350,168 @@ def test_max_open_trades_consistency(mocker, hyperopt_conf, tmp_path, fee) -> No
 
     assert hyperopt.hyperopter.backtesting.strategy.max_open_trades == 4
     assert hyperopt.config["max_open_trades"] == 4
+
+
+def test_hyperopt_data_shared(tmp_path, testdatadir) -> None:
+    data = load_data(testdatadir, "5m", ["UNITTEST/BTC", "ETH/BTC", "LTC/BTC"])
+    data["ETH/BTC"]["enter_tag"] = None
+    data["ETH/BTC"].loc[5, "enter_tag"] = "tag"
+    data["ETH/BTC"]["enter_long"] = 0
+    data["UNITTEST/BTC"]["sma"] = data["UNITTEST/BTC"]["close"].rolling(10).mean()
+    # Not representable in Arrow - pickled
+    data["LTC/BTC"]["mixed"] = [1, "a"] * (len(data["LTC/BTC"]) // 2)
+    datadir = tmp_path / "hyperopt_tickerdata"
+    dump_hyperopt_data(data, datadir)
+    assert sorted(f.name for f in datadir.iterdir()) == [
+        "00000.arrow",
+        "00001.arrow",
+        "00002.pkl",
+        "index.json",
+    ]
+
+    loaded = load_hyperopt_data(datadir)
+    assert list(loaded) == list(data)
+    for pair, df in data.items():
+        pd.testing.assert_frame_equal(loaded[pair], df)
+
+    # New dataframes on every load, sharing the memory-mapped columns
+    loaded2 = load_hyperopt_data(datadir)
+    assert loaded2["UNITTEST/BTC"] is not loaded["UNITTEST/BTC"]
+    assert np.shares_memory(loaded2["UNITTEST/BTC"]["close"], loaded["UNITTEST/BTC"]["close"])
+    # NaN warm-up rows don't prevent sharing the column
+    assert loaded2["UNITTEST/BTC"]["sma"].isna().any()
+    assert np.shares_memory(loaded2["UNITTEST/BTC"]["sma"], loaded["UNITTEST/BTC"]["sma"])
+    with pytest.raises(ValueError, match="read-only"):
+        loaded2["UNITTEST/BTC"].loc[3, "close"] = 1
+    loaded2["UNITTEST/BTC"]["new_column"] = 1
+    assert "new_column" not in load_hyperopt_data(datadir)["UNITTEST/BTC"]
+
+    # Dumping new data replaces the mapped data
+    dump_hyperopt_data({"UNITTEST/BTC": data["UNITTEST/BTC"].iloc[:10]}, datadir)
+    loaded = load_hyperopt_data(datadir)
+    assert list(loaded) == ["UNITTEST/BTC"]
+    assert len(loaded["UNITTEST/BTC"]) == 10
+
+    assert remove_hyperopt_data(datadir)
+    assert not datadir.exists()
+    assert not remove_hyperopt_data(datadir)
+
+
+def test_indicator_cache(hyperopt_conf, testdatadir) -> None:
+    strategy = StrategyResolver.load_strategy(hyperopt_conf)
+    data = load_data(testdatadir, "5m", ["UNITTEST/BTC", "ETH/BTC"])
+    calls = []
+
+    def populate_indicators(dataframe, metadata):
+        calls.append(metadata["pair"])
+        dataframe["sma"] = dataframe["close"].rolling(strategy.sell_rsi.value).mean()
+        return dataframe
+
+    strategy.populate_indicators = populate_indicators
+    cache = IndicatorCache(2**30)
+    expected = strategy.advise_all_indicators(data)
+    calls.clear()
+
+    result = cache.advise_all_indicators(strategy, data)
+    assert calls == ["UNITTEST/BTC", "ETH/BTC"]
+    assert len(cache) == 2
+    for pair, df in expected.items():
+        pd.testing.assert_frame_equal(result[pair], df)
+    assert "sma" not in data["ETH/BTC"]
+
+    # Parameters not read while populating indicators don't invalidate the indicators
+    strategy.buy_plusdi.value = 0.8
+    result["ETH/BTC"]["sma"] = 0
+    result = cache.advise_all_indicators(strategy, data)
+    assert calls == ["UNITTEST/BTC", "ETH/BTC"]
+    assert cache.hits == 2
+    pd.testing.assert_frame_equal(result["ETH/BTC"], expected["ETH/BTC"])
+
+    strategy.sell_rsi.value = 20
+    result = cache.advise_all_indicators(strategy, data)
+    assert calls == ["UNITTEST/BTC", "ETH/BTC"] * 2
+    assert len(cache) == 4
+    assert not result["ETH/BTC"]["sma"].equals(expected["ETH/BTC"]["sma"])
+
+    strategy.sell_rsi.value = 70
+    cache.advise_all_indicators(strategy, data)
+    assert cache.hits == 4
+
+    # Least recently used entries are evicted beyond the memory budget
+    size = int(expected["ETH/BTC"].memory_usage(index=True).sum())
+    cache = IndicatorCache(size)
+    cache.advise_all_indicators(strategy, {"ETH/BTC": data["ETH/BTC"]})
+    strategy.sell_rsi.value = 20
+    cache.advise_all_indicators(strategy, {"ETH/BTC": data["ETH/BTC"]})
+    assert len(cache) == 1
+    strategy.sell_rsi.value = 70
+    cache.advise_all_indicators(strategy, {"ETH/BTC": data["ETH/BTC"]})
+    assert cache.hits == 0
+    assert cache.misses == 3
+
+
+def test_indicator_cache_new_strategy_objects(hyperopt_conf, testdatadir) -> None:
+    # Every hyperopt task works on its own (unpickled) strategy and parameter objects
+    data = {"ETH/BTC": load_data(testdatadir, "5m", ["ETH/BTC"])["ETH/BTC"]}
+    calls = []
+
+    def load_strategy(sell_rsi: int):
+        strategy = StrategyResolver.load_strategy(hyperopt_conf)
+
+        def populate_indicators(dataframe, metadata):
+            calls.append(metadata["pair"])
+            dataframe["sma"] = dataframe["close"].rolling(strategy.sell_rsi.value).mean()
+            return dataframe
+
+        strategy.populate_indicators = populate_indicators
+        strategy.sell_rsi.value = sell_rsi
+        return strategy
+
+    cache = IndicatorCache(2**30)
+    strategy = load_strategy(20)
+    assert strategy.sell_rsi is not load_strategy(20).sell_rsi
+    first = cache.advise_all_indicators(strategy, data)
+    second = cache.advise_all_indicators(load_strategy(70), data)
+    assert calls == ["ETH/BTC"] * 2
+    assert not first["ETH/BTC"]["sma"].equals(second["ETH/BTC"]["sma"])
+
+    result = cache.advise_all_indicators(load_strategy(20), data)
+    assert calls == ["ETH/BTC"] * 2
+    assert cache.hits == 1
+    pd.testing.assert_frame_equal(result["ETH/BTC"], first["ETH/BTC"])
+
+
+def test_get_asked_points(hyperopt) -> None:
+    dimensions = {"buy_x": optuna.distributions.CategoricalDistribution([1, 2, 3])}
+    hyperopt.opt = optuna.create_study(
+        sampler=optuna.samplers.TPESampler(seed=1), direction="minimize"
+    )
+    hyperopt._random_sampler = optuna.samplers.RandomSampler(seed=1)
+    hyperopt._tried_points = {}
+
+    asked, is_random = hyperopt.get_asked_points(n_points=2, dimensions=dimensions)
+    assert len(asked) == 2
+    assert len(is_random) == 2
+    assert asked[0].params != asked[1].params
+    for trial in asked:
+        hyperopt._tell(trial, trial.params["buy_x"])
+
+    asked, _ = hyperopt.get_asked_points(n_points=2, dimensions=dimensions)
+    # Only one point of the space is left
+    assert len(asked) == 1
+    assert len(hyperopt._tried_points) == 3
+    assert hyperopt._tried_points[(("buy_x", asked[0].params["buy_x"]),)] is None
+    # Duplicates are completed with the known loss, or failed while being evaluated
+    trials = hyperopt.opt.get_trials(deepcopy=False)
+    assert {t.state for t in trials} == {
+        TrialState.COMPLETE,
+        TrialState.FAIL,
+        TrialState.RUNNING,
+    }
+    assert all(t.value == t.params["buy_x"] for t in trials if t.state == TrialState.COMPLETE)
+    hyperopt._tell(asked[0], 0)
+
+    # All points tried - the optimizer's points are returned regardless
+    asked, is_random = hyperopt.get_asked_points(n_points=2, dimensions=dimensions)
+    assert len(asked) == 2
+    assert is_random == [False, False]
@@ -1889,6 +1889,67 @@ def test_get_trades_proxy(fee, use_db, is_short):
     Trade.use_db = True
 
 
+def test_get_trades_proxy_closed_index(fee):
+    Trade.use_db = False
+    Trade.reset_trades()
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    pairs = ["ETH/BTC", "XRP/BTC", "LTC/BTC"]
+    # Close dates out of order, with duplicates
+    offsets = [5, 3, 9, 3, 1, 7, 7, 12, 0, 4, 11, 2]
+    for i, offset in enumerate(offsets):
+        trade = Trade(
+            pair=pairs[i % 3],
+            stake_amount=0.001,
+            amount=123.0,
+            fee_open=fee.return_value,
+            fee_close=fee.return_value,
+            open_rate=0.123,
+            exchange="binance",
+            is_open=False,
+            open_date=start + timedelta(hours=offset),
+            close_date=start + timedelta(hours=offset + 1),
+        )
+        Trade.add_bt_trade(trade)
+    open_trade = Trade(
+        pair="ETH/BTC",
+        stake_amount=0.001,
+        amount=123.0,
+        fee_open=fee.return_value,
+        fee_close=fee.return_value,
+        open_rate=0.123,
+        exchange="binance",
+        open_date=start,
+        is_open=True,
+    )
+    Trade.add_bt_trade(open_trade)
+    # Modified without add_bt_trade - the index is rebuilt
+    Trade.bt_trades.append(Trade.bt_trades[0])
+
+    for pair in [None, "ETH/BTC", "XRP/BTC", "NEO/BTC"]:
+        for is_open in [None, False]:
+            for hours in [-1, 0, 3, 4, 8, 13, 20]:
+                close_date = start + timedelta(hours=hours)
+                open_date = start + timedelta(hours=2) if hours == 4 else None
+                expected = [
+                    t
+                    for t in Trade.bt_trades
+                    if (not pair or t.pair == pair)
+                    and t.close_date > close_date
+                    and (not open_date or t.open_date > open_date)
+                ]
+                result = Trade.get_trades_proxy(
+                    pair=pair, is_open=is_open, open_date=open_date, close_date=close_date
+                )
+                assert sorted(result, key=id) == sorted(expected, key=id)
+                assert [t.close_date for t in result] == sorted(t.close_date for t in result)
+
+    assert len(Trade.get_trades_proxy(is_open=False)) == 13
+    assert Trade.get_trades_proxy(is_open=True) == [open_trade]
+    Trade.reset_trades()
+    assert Trade.get_trades_proxy(is_open=False, close_date=start) == []
+    Trade.use_db = True
+
+
 @pytest.mark.usefixtures("init_persistence")
 @pytest.mark.parametrize("is_short", [True, False])
 def test_get_trades__query(fee, is_short):
@@ -2128,6 +2189,7 @@ def test_Trade_object_idem():
         "get_best_pair",
         "get_overall_performance",
         "get_total_closed_profit",
+        "get_closed_profit_per_day",
         "total_open_trades_stakes",
         "get_closed_trades_without_assigned_fees",
         "get_open_trades_without_assigned_fees",
@@ -2144,8 +2206,11 @@ def test_Trade_object_idem():
         "bt_trades",
         "bt_trades_open",
         "bt_trades_open_pp",
+        "bt_trades_closed_index",
+        "bt_trades_closed_pp",
         "bt_open_open_trade_count",
         "bt_total_profit",
+        "closed_trades_version",
         "from_json",
     )
 
@@ -0,0 +1,134 @@
+import pytest
+from sqlalchemy import select
+
+from freqtrade.persistence import Trade
+from freqtrade.persistence.trade_performance import TradePerformance
+from freqtrade.util import dt_now
+from tests.conftest import create_mock_trades_usdt
+
+
+def _generic_performance(column, pair=None):
+    filters = [Trade.is_open.is_(False)]
+    if pair:
+        filters.append(Trade.pair == pair)
+    query = Trade._generic_performance_query([column], filters, "Other")
+    return [tuple(row) for row in Trade.session.execute(query).all()]
+
+
+def _aggregate_rows():
+    return {
+        (row.pair, row.enter_tag, row.exit_reason): row.count
+        for row in Trade.session.scalars(select(TradePerformance)).all()
+    }
+
+
+@pytest.mark.usefixtures("init_persistence")
+@pytest.mark.parametrize("is_short", [False, True, None])
+def test_trade_performance_matches_query(fee, is_short):
+    create_mock_trades_usdt(fee, is_short)
+
+    assert _aggregate_rows() == {
+        ("NEO/USDT", "TEST1", "exit_signal"): 1,
+        ("XRP/USDT", "TEST3", "roi"): 1,
+        ("LTC/USDT", "Other", "Other"): 1,
+    }
+    expected = _generic_performance(Trade.pair)
+    result = Trade.get_overall_performance()
+    assert [(r["pair"], r["profit_abs"], r["count"]) for r in result] == [
+        (pair, profit_abs, count) for pair, _, profit_abs, count in expected
+    ]
+    assert [r["profit_ratio"] for r in result] == pytest.approx([e[1] for e in expected])
+    assert result[0]["profit"] == result[0]["profit_pct"]
+
+    for column, method in [
+        (Trade.enter_tag, Trade.get_enter_tag_performance),
+        (Trade.exit_reason, Trade.get_exit_reason_performance),
+    ]:
+        for pair in (None, "NEO/USDT"):
+            expected = _generic_performance(column, pair)
+            result = method(pair)
+            assert [(r[column.name], r["profit_abs"], r["count"]) for r in result] == [
+                (value, profit_abs, count) for value, _, profit_abs, count in expected
+            ]
+            assert [r["profit_ratio"] for r in result] == pytest.approx([e[1] for e in expected])
+
+    result = Trade.get_mix_tag_performance(None)
+    assert [r["mix_tag"] for r in result] == ["TEST1 exit_signal", "TEST3 roi", "Other Other"]
+    assert result[0]["profit_ratio"] == pytest.approx(0.05)
+    assert result[0]["profit_pct"] == 5.0
+    assert [r["mix_tag"] for r in Trade.get_mix_tag_performance("XRP/USDT")] == ["TEST3 roi"]
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_trade_performance_maintained(fee, mocker):
+    create_mock_trades_usdt(fee)
+    assert len(Trade.get_overall_performance()) == 3
+
+    # Served from the cache until the aggregate changes
+    execute_spy = mocker.spy(TradePerformance.session, "execute")
+    assert len(Trade.get_overall_performance()) == 3
+    assert len(Trade.get_enter_tag_performance(None)) == 3
+    assert execute_spy.call_count == 1
+
+    # Closing a trade updates the aggregate of its pair
+    version = TradePerformance.version
+    trade = Trade.session.scalars(
+        select(Trade).filter(Trade.is_open.is_(True), Trade.pair == "NEO/USDT")
+    ).first()
+    trade.enter_tag = "TEST1"
+    trade.exit_reason = "roi"
+    trade.close_date = dt_now()
+    trade.close(trade.open_rate * 1.1)
+    trade.close_profit_abs = 5.0
+    Trade.commit()
+    assert TradePerformance.version > version
+    assert _aggregate_rows()[("NEO/USDT", "TEST1", "roi")] == 1
+    neo = next(r for r in Trade.get_overall_performance() if r["pair"] == "NEO/USDT")
+    assert neo["count"] == 2
+    assert neo["profit_abs"] == pytest.approx(3.9875 + 5.0)
+
+    # Reopened trades are removed from the aggregate
+    trade.is_open = True
+    Trade.commit()
+    assert ("NEO/USDT", "TEST1", "roi") not in _aggregate_rows()
+
+    # Deleted trades as well
+    closed = Trade.session.scalars(
+        select(Trade).filter(Trade.is_open.is_(False), Trade.pair == "XRP/USDT")
+    ).first()
+    closed.delete()
+    assert ("XRP/USDT", "TEST3", "roi") not in _aggregate_rows()
+    assert [r["pair"] for r in Trade.get_overall_performance()] == ["NEO/USDT", "LTC/USDT"]
+
+    # Changes which are rolled back don't change the aggregate
+    closed = Trade.session.scalars(select(Trade).filter(Trade.pair == "LTC/USDT")).first()
+    closed.close_profit_abs = 100
+    Trade.session.flush()
+    Trade.rollback()
+    assert _aggregate_rows()[("LTC/USDT", "Other", "Other")] == 1
+    assert Trade.get_overall_performance()[-1]["profit_abs"] == pytest.approx(-4.09)
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_trade_performance_rebuild(fee, caplog):
+    create_mock_trades_usdt(fee)
+    TradePerformance.session.query(TradePerformance).delete()
+    Trade.commit()
+    assert Trade.get_overall_performance() == []
+
+    TradePerformance.rebuild_if_inconsistent()
+    assert "Rebuilding trade performance aggregate." in caplog.text
+    assert len(Trade.get_overall_performance()) == 3
+    caplog.clear()
+
+    TradePerformance.rebuild_if_inconsistent()
+    assert "Rebuilding trade performance aggregate." not in caplog.text
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_overall_performance_start_date(fee, mocker):
+    create_mock_trades_usdt(fee)
+    performance_mock = mocker.spy(TradePerformance, "pair_performance")
+    res = Trade.get_overall_performance(dt_now())
+    assert res == []
+    assert performance_mock.call_count == 0
@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+
+from freqtrade.data.metrics import calculate_expectancy, calculate_max_drawdown
+from freqtrade.persistence import Trade
+from freqtrade.persistence.trade_statistics import ClosedTradeStatistics
+from tests.conftest import create_mock_trades_usdt
+
+
+def _reference_stats(profits: list[float], starting_balance: float):
+    start = datetime(2024, 1, 1)
+    trades_df = pd.DataFrame(
+        {
+            "close_date": [start + timedelta(hours=i) for i in range(len(profits))],
+            "profit_abs": profits,
+        }
+    )
+    drawdown = calculate_max_drawdown(
+        trades_df, value_col="profit_abs", starting_balance=starting_balance
+    )
+    return drawdown, calculate_expectancy(trades_df)
+
+
+@pytest.mark.parametrize("starting_balance", [0, 1000])
+@pytest.mark.parametrize(
+    "profits",
+    [
+        [10, -5, 20, -30, 5, 15, -2],
+        [-5, -10, 3, -1],
+        [5, 5, 5],
+        [-1, 2, -3, 4, -50, 60],
+    ],
+)
+def test_closed_trade_statistics_matches_metrics(profits, starting_balance):
+    stats = ClosedTradeStatistics()
+    start = datetime(2024, 1, 1)
+    for idx, profit in enumerate(profits):
+        close_date = start + timedelta(hours=idx)
+        stats.add_trade(
+            idx + 1, close_date - timedelta(minutes=30), close_date, profit / 100, profit
+        )
+
+    drawdown, expectancy = _reference_stats(profits, starting_balance)
+    stats_drawdown = stats.get_drawdown(starting_balance)
+    assert stats.expectancy == pytest.approx(expectancy)
+    assert stats_drawdown.drawdown_abs == pytest.approx(drawdown.drawdown_abs)
+    assert stats_drawdown.high_date == drawdown.high_date
+    assert stats_drawdown.low_date == drawdown.low_date
+    assert stats_drawdown.high_value == pytest.approx(drawdown.high_value)
+    assert stats_drawdown.low_value == pytest.approx(drawdown.low_value)
+    assert stats_drawdown.relative_account_drawdown == pytest.approx(
+        drawdown.relative_account_drawdown, nan_ok=True
+    )
+
+    assert stats.closed_trade_count == len(profits)
+    assert stats.profit_closed_coin == pytest.approx(sum(profits))
+    assert stats.winning_trades == len([p for p in profits if p >= 0])
+    assert stats.duration_sum == 30 * 60 * len(profits)
+    assert stats.first_trade[0] == 1
+    assert stats.latest_trade[0] == len(profits)
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_closed_trade_statistics_refresh(fee):
+    create_mock_trades_usdt(fee)
+    stats = ClosedTradeStatistics.from_database()
+    assert stats.closed_trade_count == 3
+    assert stats.profit_closed_coin == pytest.approx(2.74)
+
+    # Nothing changed
+    assert stats.refresh() is stats
+
+    trade = Trade.get_trades([Trade.is_open.is_(True)]).first()
+    trade.close(trade.open_rate * 1.1)
+    trade.close_profit_abs = 5.0
+    Trade.commit()
+    refreshed = stats.refresh()
+    assert refreshed is stats
+    assert stats.closed_trade_count == 4
+    assert stats.profit_closed_coin == pytest.approx(7.74)
+
+    # Deleted trades cause a rebuild
+    trade.delete()
+    refreshed = stats.refresh()
+    assert refreshed is not stats
+    assert refreshed.closed_trade_count == 3
+    assert refreshed.profit_closed_coin == pytest.approx(2.74)
+
+    # The starting balance only applies when reading the drawdown - no rebuild
+    assert refreshed.refresh() is refreshed
+    assert refreshed.get_drawdown(1000) != refreshed.get_drawdown(2000)
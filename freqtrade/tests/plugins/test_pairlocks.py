@@ -158,3 +158,62 @@ def test_PairLocks_reason(use_db):
 
     PairLocks.reset_locks()
     PairLocks.use_db = True
+
+
+def _scan_locks(pair, now, side):
+    return [
+        lock
+        for lock in PairLocks.get_all_locks()
+        if lock.lock_end_time >= now
+        and lock.active is True
+        and (pair is None or lock.pair == pair)
+        and (side is None or lock.side == "*" or lock.side == side)
+    ]
+
+
+@pytest.mark.usefixtures("init_persistence")
+def test_PairLocks_backtest_index():
+    PairLocks.timeframe = "5m"
+    PairLocks.use_db = False
+    PairLocks.reset_locks()
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    pairs = ["ETH/BTC", "XRP/BTC", "*"]
+    sides = ["*", "long", "short"]
+    # Lock end times out of order
+    for i, minutes in enumerate([50, 20, 35, 5, 90, 20, 65, 10, 40, 120, 15, 70]):
+        PairLocks.lock_pair(
+            pairs[i % 3],
+            start + timedelta(minutes=minutes),
+            f"reason{i % 2}",
+            now=start,
+            side=sides[i % 4 % 3],
+        )
+    PairLocks.unlock_reason("reason1", now=start + timedelta(minutes=60))
+
+    def check_queries(minimum_offset=0):
+        for pair in [None, "ETH/BTC", "XRP/BTC", "*", "LTC/BTC"]:
+            for side in [None, "*", "long", "short"]:
+                for minutes in range(minimum_offset, 130, 5):
+                    now = start + timedelta(minutes=minutes)
+                    assert PairLocks.get_pair_locks(pair, now, side) == _scan_locks(pair, now, side)
+
+    check_queries()
+    PairLocks.prune_locks(start + timedelta(minutes=40))
+    assert sum(len(entries) for pl in PairLocks._index.values() for _, entries in pl.values()) < 12
+    # Queries before the prune date still see all locks
+    check_queries()
+
+    # Locks created after pruning
+    PairLocks.lock_pair("ETH/BTC", start + timedelta(minutes=30), now=start)
+    PairLocks.lock_pair("ETH/BTC", start + timedelta(minutes=100), now=start, side="long")
+    check_queries()
+    PairLocks.prune_locks(start + timedelta(minutes=100))
+    check_queries(100)
+    assert PairLocks.is_pair_locked("ETH/BTC", start + timedelta(minutes=100), side="long")
+    assert len(PairLocks.get_all_locks()) == 14
+
+    PairLocks.reset_locks()
+    assert PairLocks._index == {}
+    assert PairLocks._pruned_until is None
+    assert not PairLocks.is_pair_locked("ETH/BTC", start)
+    PairLocks.use_db = True
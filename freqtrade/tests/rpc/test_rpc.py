@@ -1,5 +1,5 @@
 from copy import deepcopy
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from unittest.mock import ANY, MagicMock, PropertyMock
 
 import pytest
@@ -355,6 +355,51 @@ def test__rpc_timeunit_profit(
         rpc._rpc_timeunit_profit(0, stake_currency, fiat_display_currency)
 
 
+def test__rpc_timeunit_profit_cached(
+    default_conf_usdt, ticker, fee, markets, mocker, time_machine
+) -> None:
+    time_machine.move_to("2023-09-05 10:00:00 +00:00", tick=False)
+
+    mocker.patch("freqtrade.rpc.telegram.Telegram", MagicMock())
+    mocker.patch.multiple(
+        EXMS, fetch_ticker=ticker, get_fee=fee, markets=PropertyMock(return_value=markets)
+    )
+
+    freqtradebot = get_patched_freqtradebot(mocker, default_conf_usdt)
+    create_mock_trades_usdt(fee)
+    stake_currency = default_conf_usdt["stake_currency"]
+    fiat_display_currency = default_conf_usdt["fiat_display_currency"]
+
+    rpc = RPC(freqtradebot)
+    query_mock = mocker.spy(Trade, "get_closed_profit_per_day")
+
+    days = rpc._rpc_timeunit_profit(365, stake_currency, fiat_display_currency)
+    assert len(days["data"]) == 365
+    assert query_mock.call_count == 1
+    assert sum(d["trade_count"] for d in days["data"]) == 3
+    assert sum(d["abs_profit"] for d in days["data"]) == pytest.approx(2.74)
+
+    # Rolled up from the same daily buckets
+    weeks = rpc._rpc_timeunit_profit(52, stake_currency, fiat_display_currency, "weeks")
+    assert weeks["data"][0]["date"] == date(2023, 9, 4)
+    assert sum(w["trade_count"] for w in weeks["data"]) == 3
+    months = rpc._rpc_timeunit_profit(12, stake_currency, fiat_display_currency, "months")
+    assert months["data"][0]["date"] == date(2023, 9, 1)
+    assert sum(m["abs_profit"] for m in months["data"]) == pytest.approx(2.74)
+    assert query_mock.call_count == 3
+
+    # Served from cache until a trade is closed
+    rpc._rpc_timeunit_profit(365, stake_currency, fiat_display_currency)
+    assert query_mock.call_count == 3
+
+    trade = Trade.get_trades([Trade.is_open.is_(True)]).first()
+    trade.close(trade.open_rate)
+    Trade.commit()
+    days = rpc._rpc_timeunit_profit(365, stake_currency, fiat_display_currency)
+    assert query_mock.call_count == 4
+    assert sum(d["trade_count"] for d in days["data"]) == 4
+
+
 @pytest.mark.parametrize("is_short", [True, False])
 def test_rpc_trade_history(mocker, default_conf, markets, fee, is_short):
     mocker.patch("freqtrade.rpc.telegram.Telegram", MagicMock())
@@ -23,6 +23,7 @@ from freqtrade.__init__ import __version__
 from freqtrade.enums import CandleType, RunMode, State, TradingMode
 from freqtrade.exceptions import DependencyException, ExchangeError, OperationalException
 from freqtrade.loggers import setup_logging, setup_logging_pre
+from freqtrade.misc import arrow_ipc_to_dataframe
 from freqtrade.optimize.backtesting import Backtesting
 from freqtrade.persistence import CustomDataWrapper, Trade
 from freqtrade.rpc import RPC
@@ -30,6 +31,11 @@ from freqtrade.rpc.api_server import ApiServer
 from freqtrade.rpc.api_server.api_auth import create_token, get_user_from_token
 from freqtrade.rpc.api_server.uvicorn_threaded import UvicornServer
 from freqtrade.rpc.api_server.webserver_bgwork import ApiBG
+from freqtrade.rpc.api_server.ws import (
+    BinaryWebSocketSerializer,
+    HybridJSONWebSocketSerializer,
+    MessageStream,
+)
 from freqtrade.util.datetime_helpers import format_date
 from tests.conftest import (
     CURRENT_TEST_STRATEGY,
@@ -2149,6 +2155,57 @@ def test_api_pair_candles(botclient, ohlcv_history):
     ]
 
 
+def test_api_pair_candles_arrow(botclient, ohlcv_history):
+    ftbot, client = botclient
+    timeframe = "5m"
+    amount = 3
+    ohlcv_history["sma"] = ohlcv_history["close"].rolling(2).mean()
+    ohlcv_history["enter_long"] = 0
+    ohlcv_history.loc[1, "enter_long"] = 1
+    ohlcv_history["exit_long"] = 0
+    ohlcv_history["enter_short"] = 0
+    ohlcv_history["exit_short"] = 0
+    ftbot.dataprovider._set_cached_df("XRP/BTC", timeframe, ohlcv_history, CandleType.SPOT)
+
+    headers = {
+        "Authorization": _basic_auth_str(_TEST_USER, _TEST_PASS),
+        "Accept": "application/vnd.apache.arrow.stream",
+    }
+    rc = client.get(
+        f"{BASE_URI}/pair_candles?limit={amount}&pair=XRP%2FBTC&timeframe={timeframe}",
+        headers=headers,
+    )
+    assert rc.status_code == 200
+    assert rc.headers["content-type"] == "application/vnd.apache.arrow.stream"
+    df, meta = arrow_ipc_to_dataframe(rc.content)
+
+    json_resp = client_get(
+        client, f"{BASE_URI}/pair_candles?limit={amount}&pair=XRP%2FBTC&timeframe={timeframe}"
+    ).json()
+    assert list(df.columns) == json_resp["columns"]
+    assert len(df) == amount
+    assert meta["pair"] == "XRP/BTC"
+    assert meta["strategy"] == CURRENT_TEST_STRATEGY
+    assert meta["enter_long_signals"] == 1
+    assert meta["data_start_ts"] == 1511686200000
+    assert meta["data_stop_ts"] == 1511686800000
+    assert "data" not in meta
+    assert df["date"].dtype == "datetime64[ns, UTC]"
+    assert df["__date_ts"].tolist() == [1511686200000, 1511686500000, 1511686800000]
+    assert df["sma"].tolist()[1:] == [row[6] for row in json_resp["data"][1:]]
+    assert pd.isna(df.iloc[0]["sma"])
+
+    rc = client.post(
+        f"{BASE_URI}/pair_candles",
+        json={"pair": "XRP/BTC", "timeframe": timeframe, "limit": amount, "columns": []},
+        headers=headers,
+    )
+    assert rc.status_code == 200
+    df, meta = arrow_ipc_to_dataframe(rc.content)
+    assert "sma" not in df.columns
+    assert set(meta["all_columns"]) >= {"sma", "date"}
+
+
 def test_api_pair_history(botclient, tmp_path, mocker):
     _ftbot, client = botclient
     _ftbot.config["user_data_dir"] = tmp_path
@@ -3142,6 +3199,111 @@ def test_api_ws_requests(botclient, caplog):
     assert response["type"] == "analyzed_df"
 
 
+def test_api_ws_binary(botclient, mocker):
+    ftbot, client = botclient
+    ws_url = f"/api/v1/message/ws?token={_TEST_WS_TOKEN}&message_format=binary"
+    serializer = BinaryWebSocketSerializer(None)
+    df = generate_test_data("5m", 20)
+    mocker.patch(
+        "freqtrade.rpc.rpc.RPC._ws_request_analyzed_df",
+        return_value=[{"key": ("ETH/BTC", "5m", CandleType.SPOT), "df": df, "la": datetime.now()}],
+    )
+
+    with client.websocket_connect(ws_url) as ws:
+        # Json requests are supported, too
+        ws.send_json({"type": "whitelist", "data": None})
+        response = serializer._deserialize(ws.receive_bytes())
+        assert response["type"] == "whitelist"
+
+        ws.send_bytes(serializer._serialize({"type": "analyzed_df", "data": {"limit": 100}}))
+        response = serializer._deserialize(ws.receive_bytes())
+
+    assert response["type"] == "analyzed_df"
+    pd.testing.assert_frame_equal(response["data"]["df"], df)
+
+
+def test_api_ws_analyzed_df_since(botclient, mocker):
+    _ftbot, client = botclient
+    ws_url = f"/api/v1/message/ws?token={_TEST_WS_TOKEN}&message_format=binary"
+    serializer = BinaryWebSocketSerializer(None)
+    df = generate_test_data("5m", 300)
+    mocker.patch(
+        "freqtrade.data.dataprovider.DataProvider.get_analyzed_dataframe",
+        return_value=(df, datetime.now(timezone.utc)),
+    )
+    dates_ms = [int(date.timestamp() * 1000) for date in df["date"]]
+
+    def request_df(data):
+        ws.send_bytes(serializer._serialize({"type": "analyzed_df", "data": data}))
+        return serializer._deserialize(ws.receive_bytes())["data"]["df"]
+
+    with client.websocket_connect(ws_url) as ws:
+        # Only the candles from the consumer's last candle on
+        result = request_df({"limit": 1500, "pair": "ETH/BTC", "since": {"ETH/BTC": dates_ms[-3]}})
+        assert result.equals(df.tail(3).reset_index(drop=True))
+        # Consumer is up to date
+        result = request_df({"pair": "ETH/BTC", "since": {"ETH/BTC": dates_ms[-1]}})
+        assert result.equals(df.tail(1).reset_index(drop=True))
+        # Too many new candles - full dataframe
+        result = request_df({"limit": 200, "pair": "ETH/BTC", "since": {"ETH/BTC": dates_ms[10]}})
+        assert result.equals(df.tail(200).reset_index(drop=True))
+        # Unknown candle (e.g. the producer restarted) - full dataframe
+        result = request_df({"limit": 200, "pair": "ETH/BTC", "since": {"ETH/BTC": 5}})
+        assert result.equals(df.tail(200).reset_index(drop=True))
+        # Invalid dates are ignored
+        result = request_df({"limit": 50, "pair": "ETH/BTC", "since": {"ETH/BTC": "abc"}})
+        assert result.equals(df.tail(50).reset_index(drop=True))
+        result = request_df({"limit": 50, "pair": "ETH/BTC", "since": [dates_ms[-3]]})
+        assert result.equals(df.tail(50).reset_index(drop=True))
+
+
+def test_ws_serializer():
+    df = generate_test_data("5m", 20)
+    df["enter_tag"] = None
+    df.loc[3, "enter_tag"] = "tag"
+    mixed = df.assign(mixed=[1, "a"] * 10)
+    message = {"type": "analyzed_df", "data": {"key": ["ETH/BTC"], "df": df, "mixed": mixed}}
+
+    json_serializer = HybridJSONWebSocketSerializer(None)
+    binary_serializer = BinaryWebSocketSerializer(None)
+    serialized = binary_serializer._serialize(message)
+    assert isinstance(serialized, bytes)
+    result = binary_serializer._deserialize(serialized)
+    assert result["data"]["key"] == ["ETH/BTC"]
+    pd.testing.assert_frame_equal(result["data"]["df"], df)
+    # Not representable in Arrow - sent as json
+    assert result["data"]["mixed"]["mixed"].tolist() == [1, "a"] * 10
+    # Json messages of producers not supporting the binary format
+    result = binary_serializer._deserialize(json_serializer._serialize(message))
+    assert result["data"]["df"]["close"].tolist() == pytest.approx(df["close"].tolist())
+
+
+async def test_ws_serializer_cache(mocker):
+    stream = MessageStream()
+    sent = []
+    json_serializer = HybridJSONWebSocketSerializer(MagicMock(send=get_mock_coro()))
+    binary_serializer = BinaryWebSocketSerializer(MagicMock(send=get_mock_coro()))
+    json_spy = mocker.spy(json_serializer, "_serialize")
+    binary_spy = mocker.spy(binary_serializer, "_serialize")
+
+    async def consume():
+        async for message, _, cache in stream.entries():
+            for serializer in [json_serializer, binary_serializer, json_serializer]:
+                await serializer.send(message, cache)
+            sent.append(cache)
+            break
+
+    task = asyncio.create_task(consume())
+    await asyncio.sleep(0)
+    stream.publish({"type": "whitelist", "data": ["ETH/BTC"]})
+    await task
+
+    # Serialized once per message format
+    assert json_spy.call_count == 1
+    assert binary_spy.call_count == 1
+    assert set(sent[0]) == {"json", "binary"}
+
+
 def test_api_ws_send_msg(default_conf, mocker, caplog):
     try:
         caplog.set_level(logging.DEBUG)
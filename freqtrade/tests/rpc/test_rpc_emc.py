@@ -8,9 +8,16 @@ from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
 import pytest
+import rapidjson
 import websockets
 
 from freqtrade.data.dataprovider import DataProvider
+from freqtrade.rpc import external_message_consumer
+from freqtrade.rpc.api_server.ws import (
+    BinaryConsumerWebSocketSerializer,
+    HybridJSONWebSocketSerializer,
+)
+from freqtrade.rpc.api_server.ws_schemas import WSAnalyzedDFRequest
 from freqtrade.rpc.external_message_consumer import ExternalMessageConsumer
 from tests.conftest import log_has, log_has_re, log_has_when
 
@@ -160,6 +167,50 @@ def test_emc_handle_producer_message(patched_emc, caplog, ohlcv_history):
     assert log_has_re(r"Empty message .+", caplog)
 
 
+def test_emc_request_since_last_candle(patched_emc, mocker, ohlcv_history):
+    request_mock = mocker.patch.object(patched_emc, "send_producer_request")
+    la = datetime.now(timezone.utc)
+    patched_emc._dp._replace_external_df("BTC/USDT", ohlcv_history, la, "5m", "spot")
+    patched_emc._dp._replace_external_df("ETH/USDT", ohlcv_history.iloc[:-1], la, "5m", "spot")
+    last_ms = int(ohlcv_history["date"].iloc[-1].timestamp() * 1000)
+    prev_ms = int(ohlcv_history["date"].iloc[-2].timestamp() * 1000)
+
+    request = patched_emc._add_last_candles("default", WSAnalyzedDFRequest())
+    assert request.data == {
+        "limit": 1500,
+        "pair": None,
+        "since": {"BTC/USDT": last_ms, "ETH/USDT": prev_ms},
+    }
+    # No data from this producer
+    request = patched_emc._add_last_candles("other", WSAnalyzedDFRequest())
+    assert request.data == {"limit": 1500, "pair": None}
+
+    # Missing candles are requested from our last candle on
+    dates = ohlcv_history["date"]
+    df_message = {
+        "type": "analyzed_df",
+        "data": {
+            "key": ("ETH/USDT", "5m", "spot"),
+            "df": ohlcv_history.iloc[-1:].assign(
+                date=dates.iloc[-1] + (dates.iloc[-1] - dates.iloc[-2])
+            ),
+            "la": la,
+        },
+    }
+    patched_emc.handle_producer_message({"name": "default"}, df_message)
+    assert request_mock.call_count == 1
+    assert request_mock.call_args[0][1].data == {
+        "limit": 3,
+        "pair": "ETH/USDT",
+        "since": {"ETH/USDT": prev_ms},
+    }
+
+    # Other columns - the full dataframe is requested
+    df_message["data"]["df"] = ohlcv_history.iloc[-1:].assign(extra=1)
+    patched_emc.handle_producer_message({"name": "default"}, df_message)
+    assert request_mock.call_args[0][1].data == {"limit": 1500, "pair": "ETH/USDT"}
+
+
 async def test_emc_create_connection_success(default_conf, caplog, mocker):
     default_conf.update(
         {
@@ -203,6 +254,109 @@ async def test_emc_create_connection_success(default_conf, caplog, mocker):
         emc.shutdown()
 
 
+async def test_emc_create_connection_binary(default_conf, caplog, mocker):
+    default_conf.update(
+        {
+            "external_message_consumer": {
+                "enabled": True,
+                "producers": [
+                    {
+                        "name": "default",
+                        "host": _TEST_WS_HOST,
+                        "port": _TEST_WS_PORT,
+                        "ws_token": _TEST_WS_TOKEN,
+                    }
+                ],
+                "message_format": "binary",
+            }
+        }
+    )
+    mocker.patch(
+        "freqtrade.rpc.external_message_consumer.ExternalMessageConsumer.start", MagicMock()
+    )
+    dp = DataProvider(default_conf, None, None, None)
+    emc = ExternalMessageConsumer(default_conf, dp)
+    create_channel = mocker.spy(external_message_consumer, "create_channel")
+    paths = []
+
+    async def eat(websocket):
+        paths.append(websocket.request.path)
+        emc._running = False
+
+    try:
+        emc._running = True
+        async with websockets.serve(eat, _TEST_WS_HOST, _TEST_WS_PORT):
+            await emc._create_connection(
+                default_conf["external_message_consumer"]["producers"][0], asyncio.Lock()
+            )
+
+        assert paths == [f"/api/v1/message/ws?token={_TEST_WS_TOKEN}&message_format=binary"]
+        assert (
+            create_channel.call_args.kwargs["serializer_cls"] is BinaryConsumerWebSocketSerializer
+        )
+    finally:
+        emc.shutdown()
+
+
+async def test_emc_binary_json_producer(default_conf, mocker):
+    default_conf.update(
+        {
+            "external_message_consumer": {
+                "enabled": True,
+                "producers": [
+                    {
+                        "name": "default",
+                        "host": _TEST_WS_HOST,
+                        "port": _TEST_WS_PORT,
+                        "ws_token": _TEST_WS_TOKEN,
+                    }
+                ],
+                "message_format": "binary",
+            }
+        }
+    )
+    mocker.patch(
+        "freqtrade.rpc.external_message_consumer.ExternalMessageConsumer.start", MagicMock()
+    )
+    dp = DataProvider(default_conf, None, None, None)
+    emc = ExternalMessageConsumer(default_conf, dp)
+    requests = []
+    connections = []
+
+    async def json_producer(websocket):
+        connections.append(websocket)
+        if len(connections) > 1:
+            # Reconnect after the first connection was closed - stop the consumer
+            emc._running = False
+            return
+        # Producer without the binary format - only reads text messages, sends json
+        for _ in range(3):
+            request = await websocket.recv()
+            assert isinstance(request, str)
+            requests.append(rapidjson.loads(request))
+        await websocket.send(
+            HybridJSONWebSocketSerializer(None)._serialize(
+                {"type": "whitelist", "data": ["BTC/USDT"]}
+            )
+        )
+
+    try:
+        emc._running = True
+        async with websockets.serve(json_producer, _TEST_WS_HOST, _TEST_WS_PORT):
+            await emc._create_connection(
+                default_conf["external_message_consumer"]["producers"][0], asyncio.Lock()
+            )
+
+        assert [request["type"] for request in requests] == [
+            "subscribe",
+            "whitelist",
+            "analyzed_df",
+        ]
+        assert dp.get_producer_pairs("default") == ["BTC/USDT"]
+    finally:
+        emc.shutdown()
+
+
 @pytest.mark.parametrize(
     "host,port",
     [
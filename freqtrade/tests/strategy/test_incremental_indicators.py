@@ -0,0 +1,153 @@
+import logging
+
+import numpy as np
+import pytest
+
+from freqtrade.enums import RunMode
+from freqtrade.strategy import ADX, CCI, EMA, MOM, RSI, BollingerBands
+from freqtrade.strategy.incremental_indicators import IncrementalIndicators
+from tests.conftest import generate_test_data, log_has_re
+
+from .strats.strategy_test_v3 import StrategyTestV3
+
+
+def _indicators():
+    return {
+        "rsi": RSI(timeperiod=14),
+        "ema_fast": EMA(timeperiod=9),
+        "ema_trend": EMA(timeperiod=50),
+        "mom": MOM(timeperiod=5),
+        "cci": CCI(timeperiod=14),
+        "adx": ADX(timeperiod=14),
+        "bb": BollingerBands(window=20, stds=2),
+    }
+
+
+COLUMNS = [
+    "rsi",
+    "ema_fast",
+    "ema_trend",
+    "mom",
+    "cci",
+    "adx",
+    "bb_lower",
+    "bb_mid",
+    "bb_upper",
+]
+
+
+def test_incremental_indicators_full_matches_reference():
+    data = generate_test_data("1h", 400)
+    indicators = IncrementalIndicators(_indicators())
+    result = indicators.populate(data.copy(), "ETH/USDT", "1h")
+    reference = indicators.reference(data)
+
+    assert list(reference) == COLUMNS
+    for column in COLUMNS:
+        np.testing.assert_allclose(result[column], reference[column], rtol=1e-9, equal_nan=True)
+
+
+def test_incremental_indicators_new_candles(mocker):
+    data = generate_test_data("1h", 420)
+    window = 400
+    incremental = IncrementalIndicators(_indicators())
+    incremental.populate(data.iloc[:window].copy(), "ETH/USDT", "1h")
+
+    update_spy = mocker.spy(EMA, "update")
+    for shift in range(1, 6):
+        frame = data.iloc[shift : window + shift].reset_index(drop=True).copy()
+        result = incremental.populate(frame, "ETH/USDT", "1h")
+    # Only the new candle is computed (2 EMA's, 5 new candles)
+    assert update_spy.call_count == 10
+    # No new candle
+    incremental.populate(frame.copy(), "ETH/USDT", "1h")
+    assert update_spy.call_count == 10
+
+    # Same result as a full calculation over the whole history
+    full = IncrementalIndicators(_indicators()).populate(
+        data.iloc[: window + 5].copy(), "ETH/USDT", "1h"
+    )
+    for column in COLUMNS:
+        np.testing.assert_array_equal(result[column], full[column].iloc[5:])
+
+
+def test_incremental_indicators_recompute(mocker, caplog):
+    caplog.set_level(logging.DEBUG)
+    data = generate_test_data("1h", 420)
+    incremental = IncrementalIndicators(_indicators())
+    incremental.populate(data.iloc[:400].copy(), "ETH/USDT", "1h")
+    # Other pairs and timeframes don't share the state
+    incremental.populate(data.iloc[:300].copy(), "BTC/USDT", "1h")
+    incremental.populate(data.iloc[:300].copy(), "ETH/USDT", "4h")
+    assert not log_has_re(r"Recomputing incremental indicators.*", caplog)
+
+    update_spy = mocker.spy(EMA, "update")
+    # Candles removed from the analyzed history
+    frame = data.drop(index=[200]).iloc[:405].reset_index(drop=True)
+    incremental.populate(frame, "ETH/USDT", "1h")
+    assert update_spy.call_count == 2 * 405
+    assert log_has_re(r"Recomputing incremental indicators for ETH/USDT, 1h\.", caplog)
+
+    # Last analyzed candle is not part of the dataframe
+    update_spy.reset_mock()
+    incremental.populate(data.iloc[410:].copy(), "ETH/USDT", "1h")
+    assert update_spy.call_count == 2 * 10
+
+    # Changed candle
+    incremental.populate(data.iloc[:400].copy(), "ETH/USDT", "1h")
+    update_spy.reset_mock()
+    frame = data.iloc[5:401].copy()
+    frame.loc[399, "close"] += 1
+    result = incremental.populate(frame, "ETH/USDT", "1h")
+    assert update_spy.call_count == 2 * 396
+    reference = incremental.reference(frame)
+    for column in COLUMNS:
+        np.testing.assert_allclose(result[column], reference[column], rtol=1e-9, equal_nan=True)
+
+    incremental.reset("ETH/USDT")
+    assert list(incremental._states) == [("BTC/USDT", "1h")]
+    incremental.reset()
+    assert incremental._states == {}
+
+
+def test_incremental_indicators_check(mocker, caplog):
+    data = generate_test_data("1h", 420)
+    incremental = IncrementalIndicators(_indicators(), check=True)
+    incremental.populate(data.iloc[:400].copy(), "ETH/USDT", "1h")
+    incremental.populate(data.iloc[1:401].copy(), "ETH/USDT", "1h")
+    assert not log_has_re(r"Incremental indicator .* deviates.*", caplog)
+
+    mocker.patch.object(MOM, "reference", side_effect=lambda df: [df["close"] * 0])
+    incremental.populate(data.iloc[2:402].copy(), "ETH/USDT", "1h")
+    assert log_has_re(r"Incremental indicator mom for ETH/USDT deviates .*", caplog)
+    assert not log_has_re(r"Incremental indicator rsi .*", caplog)
+
+
+def test_incremental_indicators_vectorized(mocker):
+    data = generate_test_data("1h", 100)
+    incremental = IncrementalIndicators(_indicators(), incremental=False)
+    update_spy = mocker.spy(EMA, "update")
+    result = incremental.populate(data.copy(), "ETH/USDT", "1h")
+    assert update_spy.call_count == 0
+    assert incremental._states == {}
+    assert all(column in result for column in COLUMNS)
+
+
+@pytest.mark.parametrize(
+    "runmode,incremental",
+    [(RunMode.DRY_RUN, True), (RunMode.LIVE, True), (RunMode.BACKTEST, False)],
+)
+def test_populate_incremental_indicators(runmode, incremental):
+    strategy = StrategyTestV3(
+        {"runmode": runmode, "internals": {"incremental_indicators_check": True}}
+    )
+    strategy.incremental_indicators = _indicators()
+    data = generate_test_data("5m", 100)
+
+    result = strategy.populate_incremental_indicators(data, {"pair": "ETH/USDT"})
+    assert all(column in result for column in COLUMNS)
+    assert strategy._incremental_state.incremental is incremental
+    assert strategy._incremental_state.check is True
+    assert list(strategy._incremental_state._states) == (
+        [("ETH/USDT", "5m")] if incremental else []
+    )
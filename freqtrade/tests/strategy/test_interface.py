@@ -26,6 +26,7 @@ from freqtrade.strategy.parameters import (
     DecimalParameter,
     IntParameter,
     RealParameter,
+    track_parameter_reads,
 )
 from freqtrade.util import dt_now
 from tests.conftest import CURRENT_TEST_STRATEGY, TRADE_SIDES, log_has, log_has_re
@@ -131,6 +132,31 @@ def test_analyze_pair_empty(mocker, caplog, ohlcv_history):
     assert log_has("Empty dataframe for pair ETH/BTC", caplog)
 
 
+@pytest.mark.parametrize("workers", [1, 3])
+def test_analyze_workers(mocker, ohlcv_history, workers):
+    strategy = StrategyTestV3({"internals": {"analyze_workers": workers}})
+    strategy.dp = DataProvider({}, None, None)
+    mocker.patch.object(
+        strategy.dp, "ohlcv", side_effect=lambda *args, **kwargs: ohlcv_history.copy()
+    )
+    set_cached_mock = mocker.patch.object(strategy.dp, "_set_cached_df")
+    mocker.patch.object(strategy.dp, "_emit_df")
+    pairs = ["ETH/BTC", "LTC/BTC", "XRP/BTC", "NEO/BTC"]
+
+    assert strategy.analyze_workers == workers
+    strategy.analyze(pairs)
+
+    assert [c[0][0] for c in set_cached_mock.call_args_list] == pairs
+    assert set(strategy.analysis_durations) == set(pairs)
+    assert (strategy._analyze_executor is not None) == (workers > 1)
+    strategy.freqai = MagicMock()
+    strategy.ft_bot_cleanup()
+    assert strategy._analyze_executor is None
+
+    strategy.config["freqai"] = {"enabled": True}
+    assert strategy.analyze_workers == 1
+
+
 def test_get_signal_empty(default_conf, caplog):
     assert (None, None) == _STRATEGY.get_latest_candle(
         "foo", default_conf["timeframe"], DataFrame()
@@ -982,6 +1008,29 @@ def test_hyperopt_parameters():
     assert len(list(boolpar.range)) == 1
 
 
+def test_track_parameter_reads():
+    intpar = IntParameter(low=0, high=5, default=1, space="buy")
+    fltpar = RealParameter(low=0.0, high=5.5, default=1.0, space="buy")
+    catpar = CategoricalParameter(["a", "b"], default="a", space="buy")
+    assert intpar.value == 1
+
+    with track_parameter_reads() as reads:
+        assert intpar.value == 1
+        assert fltpar.value == 1.0
+        assert intpar.value == 1
+    assert reads == {intpar, fltpar}
+
+    with track_parameter_reads() as reads:
+        with track_parameter_reads() as inner:
+            assert catpar.value == "a"
+        assert intpar.value == 1
+    assert inner == {catpar}
+    assert reads == {intpar}
+
+    catpar.value = "b"
+    assert catpar.value == "b"
+
+
 def test_auto_hyperopt_interface(default_conf):
     default_conf.update({"strategy": "HyperoptableStrategyV2"})
     PairLocks.timeframe = default_conf["timeframe"]
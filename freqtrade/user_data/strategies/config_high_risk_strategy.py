@@ -1,16 +1,18 @@
 # --- Do not remove these libs ---
 from freqtrade.strategy import IStrategy
+from freqtrade.strategy import ADX, CCI, EMA, MOM, RSI, BollingerBands
 from pandas import DataFrame
 
 # --------------------------------
 # config007.json
-import talib.abstract as ta
-import freqtrade.vendor.qtpylib.indicators as qtpylib
 import numpy as np
+import logging
 import requests
 
 remote_server_url = "http://172.100.4.91:5000"
 
+logger = logging.getLogger(__name__)
+
 
 class config_high_risk_strategy(IStrategy):
     INTERFACE_VERSION: int = 3
@@ -31,22 +33,21 @@ class config_high_risk_strategy(IStrategy):
         "stoploss_on_exchange": False,
     }
 
-    def populate_indicators(self, df: DataFrame, metadata: dict) -> DataFrame:
-        df["rsi"] = ta.RSI(df, timeperiod=14)
-        df["ema_fast"] = ta.EMA(df, timeperiod=9)
-        df["ema_slow"] = ta.EMA(df, timeperiod=21)
-        df["ema_trend"] = ta.EMA(df, timeperiod=50)
-        df["mom"] = ta.MOM(df, timeperiod=5)
-        df["cci"] = ta.CCI(df, timeperiod=14)
-        df["adx"] = ta.ADX(df)
-
-        tp = qtpylib.typical_price(df)
-        bb = qtpylib.bollinger_bands(tp, window=20, stds=2)
-        df["bb_lower"] = bb["lower"]
-        df["bb_upper"] = bb["upper"]
-        df["bb_mid"] = bb["mid"]
+    # Updated one candle at a time in dry/live mode
+    incremental_indicators = {
+        "rsi": RSI(timeperiod=14),
+        "ema_fast": EMA(timeperiod=9),
+        "ema_slow": EMA(timeperiod=21),
+        "ema_trend": EMA(timeperiod=50),
+        "mom": MOM(timeperiod=5),
+        "cci": CCI(timeperiod=14),
+        "adx": ADX(),
+        # bb_lower, bb_mid, bb_upper - of the typical price
+        "bb": BollingerBands(window=20, stds=2),
+    }
 
-        return df
+    def populate_indicators(self, df: DataFrame, metadata: dict) -> DataFrame:
+        return self.populate_incremental_indicators(df, metadata)
 
     def populate_entry_trend(self, df: DataFrame, metadata: dict) -> DataFrame:
         df["enter_long"] = (
@@ -64,20 +65,35 @@ class config_high_risk_strategy(IStrategy):
         ).astype(int)
         return df
 
-    def custom_exit(self, pair: str, trade, current_time, current_rate, current_profit, **kwargs):
+    def bot_start(self, **kwargs) -> None:
+        # Sell callbacks of one bot iteration - sent as a single batch
+        self.pending_sell_callbacks = []
+
+    def bot_loop_start(self, current_time, **kwargs) -> None:
+        self.send_sell_callbacks()
+
+    def send_sell_callbacks(self) -> None:
+        """Send the exits of the previous iteration in one request"""
+        if not self.pending_sell_callbacks:
+            return
+        events, self.pending_sell_callbacks = self.pending_sell_callbacks, []
         try:
-            profit_usd = round(trade.stake_amount * current_profit, 2)
-
-            requests.get(
-                f"{remote_server_url}/trade/callback/sell",  # url
-                params={
-                    "risk_level": "high",
-                    # "pair": pair,
-                    "profit_usd": profit_usd,
-                    "stake_amount": trade.stake_amount,
-                },
+            requests.post(
+                f"{remote_server_url}/trade/callback/sell/batch",  # url
+                json={"events": events},
             )
         except Exception as e:
-            self.logger.warning(f"Sell callback error: {e}")
+            logger.warning(f"Sell callback error: {e}")
+
+    def custom_exit(self, pair: str, trade, current_time, current_rate, current_profit, **kwargs):
+        profit_usd = round(trade.stake_amount * current_profit, 2)
+        self.pending_sell_callbacks.append(
+            {
+                "risk_level": "high",
+                "pair": pair,
+                "profit_usd": profit_usd,
+                "stake_amount": trade.stake_amount,
+            }
+        )
 
         return "exit"
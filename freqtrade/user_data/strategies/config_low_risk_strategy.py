@@ -4,6 +4,7 @@ from typing import Dict, List
 from functools import reduce
 from pandas import DataFrame
 import requests
+import logging
 
 # --------------------------------
 
@@ -15,6 +16,8 @@ import numpy  # noqa
 
 remote_server_url = "http://172.100.4.91:5000"
 
+logger = logging.getLogger(__name__)
+
 
 class config_low_risk_strategy(IStrategy):
     """
@@ -135,20 +138,35 @@ class config_low_risk_strategy(IStrategy):
         ] = 1
         return dataframe
 
-    def custom_exit(self, pair: str, trade, current_time, current_rate, current_profit, **kwargs):
+    def bot_start(self, **kwargs) -> None:
+        # Sell callbacks of one bot iteration - sent as a single batch
+        self.pending_sell_callbacks = []
+
+    def bot_loop_start(self, current_time, **kwargs) -> None:
+        self.send_sell_callbacks()
+
+    def send_sell_callbacks(self) -> None:
+        """Send the exits of the previous iteration in one request"""
+        if not self.pending_sell_callbacks:
+            return
+        events, self.pending_sell_callbacks = self.pending_sell_callbacks, []
         try:
-            profit_usd = round(trade.stake_amount * current_profit, 2)
-
-            requests.get(
-                f"{remote_server_url}/trade/callback/sell",  # url
-                params={
-                    "risk_level": "low",
-                    # "pair": pair,
-                    "profit_usd": profit_usd,
-                    "stake_amount": trade.stake_amount,
-                },
+            requests.post(
+                f"{remote_server_url}/trade/callback/sell/batch",  # url
+                json={"events": events},
             )
         except Exception as e:
-            self.logger.warning(f"Sell callback error: {e}")
+            logger.warning(f"Sell callback error: {e}")
+
+    def custom_exit(self, pair: str, trade, current_time, current_rate, current_profit, **kwargs):
+        profit_usd = round(trade.stake_amount * current_profit, 2)
+        self.pending_sell_callbacks.append(
+            {
+                "risk_level": "low",
+                "pair": pair,
+                "profit_usd": profit_usd,
+                "stake_amount": trade.stake_amount,
+            }
+        )
 
         return "exit"
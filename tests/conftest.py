@@ -12,9 +12,85 @@ def app():
     })
     return app
 
+class ASGIResponse:
+    """Exposes the flask test response interface (.json property) on httpx responses"""
+
+    def __init__(self, response):
+        self._response = response
+        self.status_code = response.status_code
+        self.headers = response.headers
+
+    @property
+    def json(self):
+        return self._response.json()
+
+
+class ASGITestClient:
+    def __init__(self, client):
+        self._client = client
+
+    def __getattr__(self, method):
+        def request(*args, **kwargs):
+            return ASGIResponse(getattr(self._client, method)(*args, **kwargs))
+
+        return request
+
+
+@pytest.fixture(params=['flask', 'asgi'])
+def client(request, app):
+    if request.param == 'flask':
+        yield app.test_client()
+        return
+
+    from starlette.testclient import TestClient
+    from app.asgi import create_asgi_app
+
+    # Context manager runs the lifespan (async mongo / http clients)
+    with TestClient(create_asgi_app(app)) as test_client:
+        yield ASGITestClient(test_client)
+
 @pytest.fixture
-def client(app):
-    return app.test_client()
+def auth_user(app):
+    """User with 1000 USDT and the Authorization header of its access token"""
+    from uuid import uuid4
+    from flask_jwt_extended import create_access_token
+    from app.models.freqtrade_history import FreqtradeHistory
+    from app.models.usdt_transaction import USDTTransaction
+    from app.models.user import User
+
+    user = User(
+        user_id=str(uuid4()),
+        email=f'{uuid4().hex}@example.com',
+        password='password',
+        usdt_balance=1000.0,
+    ).save()
+    with app.app_context():
+        token = create_access_token(identity=user.user_id)
+    started_at = user.created_at
+
+    yield user, {'Authorization': f'Bearer {token}'}
+
+    user.reload()
+    for investment in user.investments:
+        for trade_history in investment.trade_history:
+            trade_history.delete()
+        investment.delete()
+    USDTTransaction.objects(user=user).delete()
+    FreqtradeHistory.objects(created_at__gte=started_at).delete()
+    user.delete()
+
+
+@pytest.fixture
+def btc_price(monkeypatch):
+    """Fixed BTC price for both the sync and async binance lookups"""
+    from app.services.binance_service import BinanceService
+
+    async def get_btc_price_async(client):
+        return 50000.0
+
+    monkeypatch.setattr(BinanceService, 'get_btc_price', lambda: 50000.0)
+    monkeypatch.setattr(BinanceService, 'get_btc_price_async', get_btc_price_async)
+    return 50000.0
 
 @pytest.fixture
 def runner(app):
@@ -0,0 +1,95 @@
+import threading
+
+from app.admission_control import AdmissionController, ConcurrencyLane, TokenBucket
+
+
+def test_token_bucket_refill():
+    bucket = TokenBucket(rate=1, burst=2)
+    now = bucket.updated_at
+    assert bucket.consume(now) == 0
+    assert bucket.consume(now) == 0
+    assert bucket.consume(now) == 1
+    # Refilled after one second
+    assert bucket.consume(now + 1) == 0
+
+
+def test_concurrency_lane_rejects_when_queue_full():
+    lane = ConcurrencyLane(limit=1, max_queue=0, queue_timeout=0.1)
+    assert lane.acquire()
+    assert not lane.acquire()
+    lane.release()
+    assert lane.acquire()
+
+
+def test_concurrency_lane_waits_for_release():
+    lane = ConcurrencyLane(limit=1, max_queue=1, queue_timeout=2)
+    assert lane.acquire()
+    threading.Timer(0.05, lane.release).start()
+    assert lane.acquire()
+
+
+def test_rate_limit_returns_429_with_retry_after():
+    controller = AdmissionController(rate=1, burst=1)
+    lanes, rejection = controller.admit("/investments", "user:1")
+    assert rejection is None
+    for lane in lanes:
+        lane.release()
+
+    lanes, rejection = controller.admit("/investments", "user:1")
+    assert lanes == []
+    assert rejection.status == 429
+    assert rejection.headers["Retry-After"] == "1"
+
+    # Other identities are not affected
+    _, rejection = controller.admit("/investments", "user:2")
+    assert rejection is None
+
+
+def test_critical_route_uses_reserved_lane():
+    controller = AdmissionController(
+        max_concurrency=2, reserved_concurrency=1, queue_timeout=0, rate=100, burst=100
+    )
+    # Normal capacity is exhausted
+    _, rejection = controller.admit("/wallet", "user:1")
+    assert rejection is None
+    _, rejection = controller.admit("/wallet", "user:1")
+    assert rejection.status == 503
+    assert "Retry-After" in rejection.headers
+
+    lanes, rejection = controller.admit("/trade/callback/sell", "addr:127.0.0.1")
+    assert rejection is None
+    assert lanes == [controller.critical_lane]
+
+
+def test_critical_route_flood_does_not_starve_normal_requests():
+    controller = AdmissionController(
+        max_concurrency=3, reserved_concurrency=1, queue_timeout=0, rate=100, burst=100
+    )
+    lanes, rejection = controller.admit("/trade/callback/sell", "addr:10.0.0.1")
+    assert rejection is None
+    assert lanes == [controller.critical_lane]
+    for _ in range(10):
+        _, rejection = controller.admit("/trade/callback/sell", "addr:10.0.0.1")
+        assert rejection.status == 503
+    assert controller.normal_lane.in_flight == 0
+
+    for _ in range(2):
+        _, rejection = controller.admit("/wallet", "user:1")
+        assert rejection is None
+
+
+def test_route_concurrency_limit():
+    controller = AdmissionController(
+        max_concurrency=10,
+        reserved_concurrency=1,
+        queue_timeout=0,
+        route_limits={"/investments": 1},
+    )
+    lanes, rejection = controller.admit("/investments", "user:1")
+    assert rejection is None
+    _, rejection = controller.admit("/investments/abc", "user:2")
+    assert rejection.status == 503
+    # Global capacity is released again when the route limit rejects
+    assert controller.normal_lane.in_flight == 1
+    _, rejection = controller.admit("/wallet", "user:2")
+    assert rejection is None
@@ -0,0 +1,247 @@
+from datetime import datetime
+from unittest.mock import ANY
+from urllib.parse import urlencode
+
+import pytest
+from flask_jwt_extended import create_refresh_token
+from starlette.testclient import TestClient
+
+from app import create_app
+from app.admission_control import AdmissionController
+from app.asgi import create_asgi_app
+from app.models.freqtrade_history import FreqtradeHistory
+from app.models.investment import Investment
+from app.models.investment_trade_history import InvestmentTradeHistory
+from app.models.usdt_transaction import USDTTransaction
+
+
+def _client():
+    return TestClient(create_asgi_app(create_app()))
+
+
+def test_async_route_requires_jwt():
+    with _client() as client:
+        response = client.get('/auth/info')
+        assert response.status_code == 401
+        assert response.json() == {'msg': 'Missing Authorization Header'}
+
+        response = client.get('/wallet/balance', headers={'Authorization': 'Token abc'})
+        assert response.status_code == 422
+
+
+def test_async_route_rejects_refresh_token():
+    app = create_app()
+    with app.app_context():
+        token = create_refresh_token(identity='user-1')
+    with TestClient(create_asgi_app(app)) as client:
+        response = client.get('/wallet/balance', headers={'Authorization': f'Bearer {token}'})
+        assert response.status_code == 422
+        assert response.json() == {'msg': 'Only non-refresh tokens are allowed'}
+
+
+def test_sell_callback_validation():
+    with _client() as client:
+        response = client.get('/trade/callback/sell', params={'risk_level': 'extreme'})
+        assert response.status_code == 400
+        assert response.json() == {'message': 'Invalid risk level'}
+
+        response = client.get(
+            '/trade/callback/sell',
+            params={'risk_level': 'low', 'stake_amount': 'unlimited', 'profit_usd': '1'},
+        )
+        assert response.status_code == 400
+
+
+def test_admission_control_applies_to_async_routes():
+    app = create_app()
+    app.extensions['admission_control'] = AdmissionController(rate=0.001, burst=1)
+    with TestClient(create_asgi_app(app)) as client:
+        # Admitted - rejected by the route itself
+        assert client.get('/auth/info').status_code == 401
+        response = client.get('/wallet/balance')
+        assert response.status_code == 429
+        assert 'Retry-After' in response.headers
+
+
+# Contract tests - the `client` fixture runs each of them against the flask app and the
+# ASGI app, which serves these routes with its async handlers.
+
+INVESTMENT = {
+    'name': 'My BTC',
+    'coin_type': 'BTC',
+    'initial_amount': 100.0,
+    'risk_level': 'low',
+    'internal_position': 1,
+}
+
+
+def test_create_investment_contract(client, auth_user, btc_price):
+    user, headers = auth_user
+    response = client.post('/investments', json=INVESTMENT, headers=headers)
+    assert response.status_code == 201
+    assert response.json == {
+        'message': 'Investment created successfully',
+        'investment': {
+            **INVESTMENT,
+            'id': ANY,
+            'entry_price_usdt': btc_price,
+            'current_profit': 0.0,
+            'created_at': ANY,
+            'updated_at': ANY,
+            'transactions': [{
+                'type': 'deposit',
+                'amount': 100.0,
+                'created_at': ANY,
+                'description': 'Initial investment',
+            }],
+            'trade_history': [],
+        },
+    }
+    user.reload()
+    assert user.usdt_balance == 900.0
+    assert [str(inv.id) for inv in user.investments] == [response.json['investment']['id']]
+
+    # Same internal position
+    response = client.post('/investments', json=INVESTMENT, headers=headers)
+    assert response.status_code == 400
+    assert response.json == {'error': '이미 동일한 이름과 포지션을 가진 투자가 존재합니다.'}
+
+
+@pytest.mark.parametrize('field,value,error', [
+    ('coin_type', 'DOGE', 'Invalid coin type'),
+    ('risk_level', 'extreme', 'Invalid risk level'),
+    ('initial_amount', 5000.0, '잔액이 부족합니다.'),
+])
+def test_create_investment_invalid_contract(client, auth_user, btc_price, field, value, error):
+    user, headers = auth_user
+    response = client.post('/investments', json={**INVESTMENT, field: value}, headers=headers)
+    assert response.status_code == 400
+    assert response.json == {'error': error}
+    # Rejected before the balance is touched
+    user.reload()
+    assert user.usdt_balance == 1000.0
+    assert user.investments == []
+
+
+def _add_investment(user, coin_type='BTC', risk_level='low', internal_position=1):
+    trade_history = InvestmentTradeHistory(profit_amount=1.5).save()
+    investment = Investment(
+        name=f'{risk_level} {coin_type}',
+        coin_type=coin_type,
+        risk_level=risk_level,
+        initial_amount=100.0,
+        entry_price_usdt=50000.0,
+        internal_position=internal_position,
+        transactions=[{'type': 'deposit', 'amount': 100.0, 'description': 'Initial investment'}],
+        trade_history=[trade_history],
+    ).save()
+    user.investments.append(investment)
+    user.save()
+    return investment
+
+
+def test_user_info_contract(client, auth_user):
+    user, headers = auth_user
+    investment = _add_investment(user)
+    user.reload()
+
+    response = client.get('/auth/info', headers=headers)
+    assert response.status_code == 200
+    assert response.json == {
+        'message': 'User details retrieved successfully',
+        'user': {
+            'id': str(user.pk),
+            'email': user.email,
+            'usdt_balance': 1000.0,
+            'created_at': user.created_at.isoformat(),
+            'updated_at': user.updated_at.isoformat(),
+        },
+        'investments': [Investment.objects.get(id=investment.id).to_dict()],
+    }
+
+
+def test_list_investments_contract(client, auth_user):
+    user, headers = auth_user
+    investments = [
+        _add_investment(user, 'BTC', internal_position=1),
+        _add_investment(user, 'ETH', internal_position=2),
+    ]
+
+    response = client.get('/investments', headers=headers)
+    assert response.status_code == 200
+    assert response.json == {
+        'message': 'Investments retrieved successfully',
+        'investments': [Investment.objects.get(id=inv.id).to_dict() for inv in investments],
+    }
+
+
+def test_wallet_transactions_contract(client, auth_user):
+    user, headers = auth_user
+    for hour, amount in enumerate([10.0, 20.0, -5.0]):
+        USDTTransaction(
+            user=user,
+            amount=amount,
+            transaction_type='deposit' if amount > 0 else 'withdraw',
+            created_at=datetime(2024, 1, 1, hour),
+        ).save()
+    expected = USDTTransaction.objects(user=user).order_by('created_at')
+
+    response = client.get('/wallet/transactions?page=1&per_page=2&sort=asc', headers=headers)
+    assert response.status_code == 200
+    assert response.json == {
+        'transactions': [t.to_dict() for t in expected[:2]],
+        'page': 1,
+        'per_page': 2,
+        'total_pages': 2,
+        'total_transactions': 3,
+        'sort': 'asc',
+    }
+
+    response = client.get('/wallet/transactions?page=2&per_page=2', headers=headers)
+    assert response.status_code == 200
+    assert response.json['transactions'] == [expected[0].to_dict()]
+    assert response.json['sort'] == 'desc'
+
+
+def test_wallet_balance_contract(client, auth_user):
+    _, headers = auth_user
+    response = client.get('/wallet/balance', headers=headers)
+    assert response.status_code == 200
+    assert response.json == {'usdt_balance': 1000.0}
+
+
+def test_sell_callback_contract(client, auth_user):
+    user, _ = auth_user
+    investment = _add_investment(user)
+    params = {'risk_level': 'low', 'pair': 'BTC/USDT', 'profit_usd': 10, 'stake_amount': 1000}
+
+    response = client.get(f'/trade/callback/sell?{urlencode(params)}')
+    assert response.status_code == 200
+    assert response.json == {'message': 'Sell callback received'}
+
+    investment.reload()
+    assert investment.current_profit == 1.0
+    assert [th.profit_amount for th in investment.trade_history] == [1.5, 1.0]
+    assert FreqtradeHistory.objects(
+        risk_level='low', pair='BTC/USDT', created_at__gte=user.created_at
+    ).count() == 1
+
+
+def test_sell_callback_batch_contract(client, auth_user):
+    user, _ = auth_user
+    low_btc = _add_investment(user, 'BTC', 'low', internal_position=1)
+    high_eth = _add_investment(user, 'ETH', 'high', internal_position=2)
+    events = [
+        {'risk_level': 'low', 'pair': 'BTC/USDT', 'profit_usd': 10, 'stake_amount': 1000},
+        {'risk_level': 'high', 'pair': 'ETH/USDT', 'profit_usd': -20, 'stake_amount': 400},
+    ]
+
+    response = client.post('/trade/callback/sell/batch', json={'events': events})
+    assert response.status_code == 200
+    assert response.json == {'message': 'Sell callbacks received', 'count': 2}
+
+    low_btc.reload()
+    high_eth.reload()
+    assert low_btc.current_profit == 1.0
+    assert high_eth.current_profit == -5.0
+    assert FreqtradeHistory.objects(created_at__gte=user.created_at).count() == 2
@@ -0,0 +1,169 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.ft_async_rest_client import AsyncFtRestClient, FtRestClientError
+
+
+def make_client(handler, **kwargs):
+    kwargs.setdefault("backoff", 0)
+    return AsyncFtRestClient(
+        "http://bot", "user", "pass", transport=httpx.MockTransport(handler), **kwargs
+    )
+
+
+def test_gather_batches_calls():
+    seen = []
+
+    def handler(request):
+        seen.append(request.url.path)
+        return httpx.Response(200, json={"path": request.url.path})
+
+    async def run():
+        async with make_client(handler) as client:
+            return await client.gather(client.status(), client.profit(), client.balance())
+
+    status, profit, balance = asyncio.run(run())
+    assert status == {"path": "/api/v1/status"}
+    assert profit == {"path": "/api/v1/profit"}
+    assert balance == {"path": "/api/v1/balance"}
+    assert sorted(seen) == ["/api/v1/balance", "/api/v1/profit", "/api/v1/status"]
+
+
+def test_query_params_are_sent():
+    def handler(request):
+        return httpx.Response(200, json=dict(request.url.params))
+
+    async def run():
+        async with make_client(handler) as client:
+            return await client.daily(7)
+
+    assert asyncio.run(run()) == {"timescale": "7"}
+
+
+def test_with_timeout_overrides_call_timeout():
+    timeouts = []
+
+    def handler(request):
+        timeouts.append(request.extensions["timeout"]["read"])
+        return httpx.Response(200, json={"status": "ok"})
+
+    async def run():
+        async with make_client(handler, timeout=10) as client:
+            await client.with_timeout(30).status()
+            await client.status()
+
+    asyncio.run(run())
+    assert timeouts == [30, 10]
+
+
+def test_retries_idempotent_calls_on_unavailable():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) < 3:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"status": "ok"})
+
+    async def run():
+        async with make_client(handler, retries=3) as client:
+            return await client.health()
+
+    assert asyncio.run(run()) == {"status": "ok"}
+    assert len(calls) == 3
+
+
+def test_raises_structured_error_after_retries():
+    def handler(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    async def run():
+        async with make_client(handler, retries=2) as client:
+            return await client.status()
+
+    with pytest.raises(FtRestClientError) as excinfo:
+        asyncio.run(run())
+    assert excinfo.value.method == "GET"
+    assert excinfo.value.url == "http://bot/api/v1/status"
+    assert excinfo.value.status_code is None
+
+
+def test_post_is_not_retried_on_server_error():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503, json={"detail": "busy"})
+
+    async def run():
+        async with make_client(handler, retries=3) as client:
+            return await client.forceexit(1)
+
+    with pytest.raises(FtRestClientError) as excinfo:
+        asyncio.run(run())
+    assert excinfo.value.status_code == 503
+    assert excinfo.value.payload == {"detail": "busy"}
+    assert len(calls) == 1
+
+
+def test_ping_reports_not_running_on_error():
+    def handler(request):
+        return httpx.Response(401, json={"detail": "Unauthorized"})
+
+    async def run():
+        async with make_client(handler) as client:
+            return await client.ping()
+
+    assert asyncio.run(run()) == {"status": "not_running"}
+
+
+def test_pair_candles_as_dataframe():
+    pd = pytest.importorskip("pandas")
+    pa = pytest.importorskip("pyarrow")
+
+    df = pd.DataFrame({"date": pd.to_datetime([1, 2], unit="s", utc=True), "close": [1.0, 2.0]})
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata({b"freqtrade": b'{"pair": "BTC/USDT"}'})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    body = sink.getvalue().to_pybytes()
+
+    def handler(request):
+        assert request.headers["accept"] == "application/vnd.apache.arrow.stream"
+        return httpx.Response(
+            200, content=body, headers={"Content-Type": "application/vnd.apache.arrow.stream"}
+        )
+
+    async def run():
+        async with make_client(handler) as client:
+            return await client.pair_candles("BTC/USDT", "5m", as_dataframe=True)
+
+    result = asyncio.run(run())
+    assert result["close"].tolist() == [1.0, 2.0]
+    assert result.attrs["pair"] == "BTC/USDT"
+
+
+def test_pair_candles_as_dataframe_json_fallback():
+    pytest.importorskip("pandas")
+
+    def handler(request):
+        return httpx.Response(
+            200,
+            json={
+                "pair": "BTC/USDT",
+                "columns": ["date", "close"],
+                "data": [["2024-01-01T00:00:00Z", 1.0]],
+            },
+        )
+
+    async def run():
+        async with make_client(handler) as client:
+            return await client.pair_candles("BTC/USDT", "5m", as_dataframe=True)
+
+    result = asyncio.run(run())
+    assert list(result.columns) == ["date", "close"]
+    assert str(result["date"].dtype) == "datetime64[ns, UTC]"
+    assert result.attrs["pair"] == "BTC/USDT"
@@ -0,0 +1,216 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from pymongo import UpdateOne
+
+from app.models.freqtrade_history import FreqtradeHistory
+from app.models.investment import Investment
+from app.services.profit_attribution import (
+    POOL_PROJECTION,
+    SellCallbackError,
+    SellEvent,
+    parse_sell_event,
+    plan_attribution,
+    pool_filter,
+    process_sell_events,
+    process_sell_events_async,
+)
+
+
+def _investment(_id, risk_level, coin_type, initial_amount, current_profit=0.0):
+    return {
+        '_id': _id,
+        'risk_level': risk_level,
+        'coin_type': coin_type,
+        'initial_amount': initial_amount,
+        'current_profit': current_profit,
+    }
+
+
+def test_parse_sell_event_defaults_to_btc_pair():
+    event = parse_sell_event({'risk_level': 'low', 'profit_usd': '1.5', 'stake_amount': '100'})
+    assert event == SellEvent('low', 'BTC/USDT', 1.5, 100.0)
+
+    event = parse_sell_event(
+        {'risk_level': 'high', 'pair': 'ETH/USDT', 'profit_usd': 2, 'stake_amount': 50}
+    )
+    assert event.pool_key == ('high', 'ETH/USDT')
+
+
+@pytest.mark.parametrize('params,message', [
+    ({'risk_level': 'extreme'}, 'Invalid risk level'),
+    ({'risk_level': 'low', 'stake_amount': 'unlimited'}, 'Stake amount is unlimited'),
+    ({'risk_level': 'low', 'stake_amount': '0', 'profit_usd': '1'},
+     'Invalid profit_usd or stake_amount'),
+    ({'risk_level': 'low', 'stake_amount': '10'}, 'Invalid profit_usd or stake_amount'),
+])
+def test_parse_sell_event_invalid(params, message):
+    with pytest.raises(SellCallbackError, match=message) as exc:
+        parse_sell_event(params)
+    assert exc.value.status_code == 400
+
+
+def test_pool_filter_only_matches_touched_pools():
+    events = [
+        SellEvent('low', 'BTC/USDT', 1, 100),
+        SellEvent('low', 'BTC/USDT:USDT', 1, 100),
+        SellEvent('high', 'ETH/USDT', 1, 100),
+        SellEvent('high', 'DOGE/USDT', 1, 100),
+    ]
+    assert pool_filter(events) == {'$or': [
+        {'risk_level': 'high', 'coin_type': 'ETH'},
+        {'risk_level': 'low', 'coin_type': 'BTC'},
+    ]}
+    assert pool_filter([SellEvent('low', 'DOGE/USDT', 1, 100)]) is None
+
+
+def test_plan_attribution_mixed_pairs():
+    investments = [
+        _investment(1, 'low', 'BTC', 100),
+        _investment(2, 'low', 'BTC', 50, current_profit=50),
+        _investment(3, 'low', 'ETH', 200),
+        _investment(4, 'high', 'BTC', 100),
+    ]
+    events = [
+        SellEvent('low', 'BTC/USDT', 10, 1000),
+        SellEvent('low', 'ETH/USDT', -20, 400),
+        SellEvent('low', 'BTC/USDT', 10, 1000),
+    ]
+    plan = plan_attribution(events, investments)
+
+    # Exits are only attributed to the matching (risk level, pair) pool
+    assert 4 not in plan.investment_profits
+    assert plan.investment_profits[3] == [-10.0]
+    # Later events are based on the balance including earlier profits of the batch
+    assert plan.investment_profits[1] == [1.0, pytest.approx(1.01)]
+    assert plan.investment_profits[2] == [1.0, pytest.approx(1.01)]
+    assert plan.pool_sizes == {('low', 'BTC/USDT'): 2, ('low', 'ETH/USDT'): 1}
+
+
+def test_plan_attribution_empty_pool():
+    plan = plan_attribution([SellEvent('medium', 'SOL/USDT', 5, 100)], [])
+    assert plan.investment_profits == {}
+    assert plan.pool_sizes == {('medium', 'SOL/USDT'): 0}
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    async def to_list(self, length):
+        return list(self.docs)
+
+
+class FakeCollection:
+    """Records the calls process_sell_events_async makes on an async collection"""
+
+    def __init__(self, docs=()):
+        self.docs = list(docs)
+        self.finds = []
+        self.inserted = []
+        self.bulk_writes = []
+
+    def find(self, query, projection=None):
+        self.finds.append((query, projection))
+        return FakeCursor(self.docs)
+
+    async def insert_many(self, docs):
+        ids = [f'{self.name}-{len(self.inserted) + i}' for i in range(len(docs))]
+        self.inserted.extend(docs)
+        return SimpleNamespace(inserted_ids=ids)
+
+    async def bulk_write(self, requests, ordered=True):
+        self.bulk_writes.append((requests, ordered))
+
+
+def _fake_db(investments):
+    db = SimpleNamespace(
+        investments=FakeCollection(investments),
+        investment_trade_histories=FakeCollection(),
+        freqtrade_history=FakeCollection(),
+    )
+    for name, collection in vars(db).items():
+        collection.name = name
+    return db
+
+
+def test_process_sell_events_async_persists_in_bulk():
+    db = _fake_db([
+        _investment(1, 'low', 'BTC', 100),
+        _investment(2, 'high', 'ETH', 200),
+    ])
+    events = [
+        SellEvent('low', 'BTC/USDT', 10, 1000),
+        SellEvent('high', 'ETH/USDT', -20, 400),
+        SellEvent('low', 'BTC/USDT', 10, 1000),
+    ]
+    plan = asyncio.run(process_sell_events_async(db, events))
+
+    # One query for all touched pools
+    assert db.investments.finds == [(pool_filter(events), POOL_PROJECTION)]
+    assert plan.investment_profits == {1: [1.0, pytest.approx(1.01)], 2: [-10.0]}
+
+    # One insert per collection, one bulk write for the investments
+    histories = db.investment_trade_histories.inserted
+    assert [h['profit_amount'] for h in histories] == [1.0, pytest.approx(1.01), -10.0]
+    now = histories[0]['created_at']
+    assert db.investments.bulk_writes == [([
+        UpdateOne({'_id': 1}, {
+            '$inc': {'current_profit': pytest.approx(2.01)},
+            '$push': {'trade_history': {'$each': [
+                'investment_trade_histories-0', 'investment_trade_histories-1'
+            ]}},
+            '$set': {'updated_at': now},
+        }),
+        UpdateOne({'_id': 2}, {
+            '$inc': {'current_profit': -10.0},
+            '$push': {'trade_history': {'$each': ['investment_trade_histories-2']}},
+            '$set': {'updated_at': now},
+        }),
+    ], False)]
+    assert [
+        (h['risk_level'], h['pair'], h['real_profit_in_this_sell'])
+        for h in db.freqtrade_history.inserted
+    ] == [('low', 'BTC/USDT', 10), ('high', 'ETH/USDT', -20), ('low', 'BTC/USDT', 10)]
+
+
+def test_process_sell_events_async_without_pool():
+    db = _fake_db([])
+    plan = asyncio.run(process_sell_events_async(db, [SellEvent('low', 'DOGE/USDT', 1, 10)]))
+    assert plan.investment_profits == {}
+    # Nothing to query or attribute - the exit itself is still recorded
+    assert db.investments.finds == []
+    assert db.investment_trade_histories.inserted == []
+    assert db.investments.bulk_writes == []
+    assert len(db.freqtrade_history.inserted) == 1
+
+
+def test_process_sell_events_persists(auth_user):
+    user, _ = auth_user
+    investments = []
+    for position, (risk_level, coin_type) in enumerate([('low', 'BTC'), ('high', 'ETH')]):
+        investment = Investment(
+            name=f'{risk_level} {coin_type}',
+            coin_type=coin_type,
+            risk_level=risk_level,
+            initial_amount=100.0,
+            entry_price_usdt=50000.0,
+            internal_position=position,
+        ).save()
+        investments.append(investment)
+    user.investments = investments
+    user.save()
+
+    process_sell_events([
+        SellEvent('low', 'BTC/USDT', 10, 1000),
+        SellEvent('high', 'ETH/USDT', -20, 400),
+        SellEvent('low', 'BTC/USDT', 10, 1000),
+    ])
+
+    low_btc, high_eth = [investment.reload() for investment in investments]
+    assert low_btc.current_profit == pytest.approx(2.01)
+    assert [th.profit_amount for th in low_btc.trade_history] == [1.0, pytest.approx(1.01)]
+    assert high_eth.current_profit == -5.0
+    assert [th.profit_amount for th in high_eth.trade_history] == [-5.0]
+    assert FreqtradeHistory.objects(created_at__gte=user.created_at).count() == 3